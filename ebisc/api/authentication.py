@@ -0,0 +1,162 @@
+import time
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from tastypie.authentication import ApiKeyAuthentication
+from tastypie.models import ApiKey
+from tastypie.throttle import BaseThrottle
+
+
+'''
+API key authentication and throttling without database queries on the hot
+path.
+
+CachedApiKeyAuthentication keeps the users of validated username/key pairs in
+a bounded in-process LRU cache (API_KEY_CACHE_SIZE entries) for
+API_KEY_CACHE_TIMEOUT seconds. Changing or deleting a key or a user calls
+invalidate(), which bumps a version stored in the cache, so with a shared
+cache backend a revoked key is refused by all processes at once, otherwise
+at the latest after the timeout. Failed lookups are not cached.
+
+KeyThrottle counts the requests of each API user in fixed windows of
+API_THROTTLE_TIMEFRAME seconds in the cache (one counter, incremented
+atomically by memcached and Redis) and refuses requests beyond
+API_THROTTLE_AT with 429 Too Many Requests. The counters are per process with
+the local memory cache backend.
+'''
+
+
+VERSION_KEY = 'api-key-version'
+
+
+# -----------------------------------------------------------------------------
+# Authentication
+
+class KeyCache(object):
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()
+
+    def get(self, credentials, version):
+
+        with self.lock:
+            entry = self.entries.pop(credentials, None)
+            if entry is None:
+                return None
+
+            (user, stored, entry_version) = entry
+            if entry_version != version or time.time() - stored >= settings.API_KEY_CACHE_TIMEOUT:
+                return None
+
+            # Most recently used last
+            self.entries[credentials] = entry
+            return user
+
+    def set(self, credentials, version, user):
+
+        with self.lock:
+            self.entries.pop(credentials, None)
+            self.entries[credentials] = (user, time.time(), version)
+            while len(self.entries) > settings.API_KEY_CACHE_SIZE:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+keys = KeyCache()
+
+
+class CachedApiKeyAuthentication(ApiKeyAuthentication):
+
+    def is_authenticated(self, request, **kwargs):
+
+        try:
+            credentials = self.extract_credentials(request)
+        except ValueError:
+            return self._unauthorized()
+
+        if not all(credentials):
+            return self._unauthorized()
+
+        version = cache.get(VERSION_KEY)
+        user = keys.get(credentials, version)
+
+        if user is not None:
+            request.user = user
+            return True
+
+        authenticated = super(CachedApiKeyAuthentication, self).is_authenticated(request, **kwargs)
+
+        if authenticated is True:
+            keys.set(credentials, version, request.user)
+
+        return authenticated
+
+
+def invalidate():
+    cache.set(VERSION_KEY, time.time(), None)
+    keys.clear()
+
+
+@receiver(post_save, sender=ApiKey)
+@receiver(post_delete, sender=ApiKey)
+def api_key_changed(sender, **kwargs):
+    invalidate()
+
+
+@receiver(post_save, sender=get_user_model())
+@receiver(post_delete, sender=get_user_model())
+def user_changed(sender, update_fields=None, **kwargs):
+    # Logins only update last_login
+    if update_fields is None or set(update_fields) != {'last_login'}:
+        invalidate()
+
+
+# -----------------------------------------------------------------------------
+# Throttling
+
+class KeyThrottle(BaseThrottle):
+
+    def __init__(self, throttle_at=None, timeframe=None):
+        super(KeyThrottle, self).__init__(
+            throttle_at=throttle_at or settings.API_THROTTLE_AT,
+            timeframe=timeframe or settings.API_THROTTLE_TIMEFRAME,
+        )
+
+    def window(self):
+        return int(time.time()) // self.timeframe
+
+    def key(self, identifier, window):
+        return 'api-throttle:%s:%d' % (self.convert_identifier_to_key(identifier), window)
+
+    def should_be_throttled(self, identifier, **kwargs):
+
+        window = self.window()
+
+        if (cache.get(self.key(identifier, window)) or 0) < self.throttle_at:
+            return False
+
+        # Seconds until the next window
+        return (window + 1) * self.timeframe - int(time.time())
+
+    def accessed(self, identifier, **kwargs):
+
+        key = self.key(identifier, self.window())
+
+        # add() only sets a missing key, the window then expires with the counter
+        if not cache.add(key, 1, self.timeframe + 1):
+            try:
+                cache.incr(key)
+            except ValueError:
+                # Expired between add() and incr()
+                cache.add(key, 1, self.timeframe + 1)
+
+# -----------------------------------------------------------------------------
@@ -1,13 +1,24 @@
 import re
+import datetime
 
+from django.conf import settings
+from django.conf.urls import url
 from django.http import Http404
+from django.db.models import Count, Max, Prefetch
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime, parse_date
 from tastypie.resources import ModelResource
-from tastypie.authentication import ApiKeyAuthentication
 from tastypie.authorization import ReadOnlyAuthorization
+from tastypie.exceptions import BadRequest
+from tastypie.utils import trailing_slash
 from tastypie import fields
 
+from ebisc import conditional
+from ebisc.celllines.prefetch import modification_prefetches
+
 from . import IndentedJSONSerializer
-from ..celllines.models import Donor, DonorDisease, DonorDiseaseVariant, DonorGenomeAnalysis, Disease, Cellline, CelllineDisease, ModificationVariantDisease, ModificationVariantNonDisease, ModificationIsogenicDisease, ModificationIsogenicNonDisease, ModificationTransgeneExpressionDisease, ModificationTransgeneExpressionNonDisease, ModificationGeneKnockOutDisease, ModificationGeneKnockOutNonDisease, ModificationGeneKnockInDisease, ModificationGeneKnockInNonDisease, CelllineStatus, CelllineCultureConditions, CultureMediumOther, CelllineCultureMediumSupplement, CelllineDerivation, CelllineCharacterization, CelllineCharacterizationPluritest, CelllineKaryotype, CelllineGenomeAnalysis, Organization, CelllineBatch, CelllineBatchImages, BatchCultureConditions, CelllineAliquot, CelllinePublication, CelllineInformationPack
+from .authentication import CachedApiKeyAuthentication, KeyThrottle
+from ..celllines.models import Donor, DonorDisease, DonorDiseaseVariant, DonorGenomeAnalysis, Disease, Cellline, CelllineDisease, ModificationVariantDisease, ModificationVariantNonDisease, ModificationIsogenicDisease, ModificationIsogenicNonDisease, ModificationTransgeneExpressionDisease, ModificationTransgeneExpressionNonDisease, ModificationGeneKnockOutDisease, ModificationGeneKnockOutNonDisease, ModificationGeneKnockInDisease, ModificationGeneKnockInNonDisease, CelllineStatus, CelllineCultureConditions, CultureMediumOther, CelllineCultureMediumSupplement, CelllineDerivation, CelllineCharacterization, CelllineCharacterizationPluritest, CelllineKaryotype, CelllineGenomeAnalysis, Organization, CelllineBatch, CelllineBatchImages, BatchCultureConditions, CelllineAliquot, CelllinePublication, CelllineInformationPack, Tombstone
 
 
 # -----------------------------------------------------------------------------
@@ -798,10 +809,223 @@ class CelllineAliquotResource(ModelResource):
         fields = ('biosamples_id', 'name')
 
 
+# -----------------------------------------------------------------------------
+# Change feed
+
+class ChangeFeedMixin(object):
+
+    '''
+    Change feed of a resource. With updated_since=<time> a list returns only
+    the objects changed since then, oldest change first; clients keep the
+    largest 'updated' they have seen and pass it on their next sync (objects
+    changed at exactly that time are returned again). <resource>/tombstones/
+    with since=<time> lists the objects deleted (or withdrawn) since then.
+    '''
+
+    # Field holding the change time of an object, Tombstone kind of the resource
+    updated_field = None
+    tombstone_kind = None
+
+    def prepend_urls(self):
+        return [
+            url(r'^(?P<resource_name>%s)/tombstones%s$' % (self._meta.resource_name, trailing_slash), self.wrap_view('get_tombstones'), name='api_get_tombstones'),
+        ]
+
+    def get_object_list(self, request):
+
+        objects = super(ChangeFeedMixin, self).get_object_list(request)
+        since = parse_time(request.GET, 'updated_since')
+
+        if since is not None:
+            objects = objects.filter(**{'%s__gte' % self.updated_field: since}).order_by(self.updated_field, 'pk')
+
+        return objects
+
+    def get_tombstones(self, request, **kwargs):
+
+        self.method_check(request, allowed=['get'])
+        self.is_authenticated(request)
+        self.throttle_check(request)
+
+        since = parse_time(request.GET, 'since')
+
+        tombstones = Tombstone.objects.filter(kind=self.tombstone_kind)
+        if since is not None:
+            tombstones = tombstones.filter(deleted__gte=since)
+
+        objects = [{
+            'biosamples_id': tombstone.biosamples_id,
+            'name': tombstone.name,
+            'reason': 'deleted',
+            'time': tombstone.deleted,
+        } for tombstone in tombstones] + self.get_withdrawn(since)
+
+        self.log_throttled_access(request)
+
+        return self.create_response(request, {'objects': sorted(objects, key=lambda tombstone: tombstone['time'])})
+
+    def get_withdrawn(self, since):
+        return []
+
+
+def parse_time(params, name):
+
+    '''Time in the query parameter name (ISO 8601 date or date and time, default time zone if none is given), or None.'''
+
+    value = params.get(name)
+
+    if not value:
+        return None
+
+    # A '+' of the UTC offset arrives as a space when it is not URL encoded
+    value = value.replace(' ', '+')
+
+    try:
+        time = parse_datetime(value)
+        if time is None:
+            date = parse_date(value)
+            time = datetime.datetime.combine(date, datetime.time()) if date else None
+    except ValueError:
+        time = None
+
+    if time is None:
+        raise BadRequest('%s must be an ISO 8601 date or date and time, e.g. 2017-05-01T12:00:00Z' % name)
+
+    if timezone.is_naive(time):
+        time = timezone.make_aware(time)
+
+    return time
+
+
+# -----------------------------------------------------------------------------
+# Multiple objects
+
+class MultipleMixin(object):
+
+    '''
+    <resource>/set/<id>;<id>;... returns the objects with the given ids
+    (detail_uri_name), loaded with one query and the prefetches of the
+    resource's queryset, in the requested order; ids without object are
+    listed in not_found.
+    '''
+
+    def get_multiple(self, request, **kwargs):
+
+        self.method_check(request, allowed=['get'])
+        self.is_authenticated(request)
+        self.throttle_check(request)
+
+        identifiers = []
+        for identifier in kwargs.get('%s_list' % self._meta.detail_uri_name, '').split(';'):
+            if identifier and identifier not in identifiers:
+                identifiers.append(identifier)
+
+        if len(identifiers) > settings.API_MULTIPLE_LIMIT:
+            raise BadRequest('At most %d objects can be requested at once' % settings.API_MULTIPLE_LIMIT)
+
+        response = self.get_multiple_objects(request, identifiers)
+
+        self.log_throttled_access(request)
+
+        return response
+
+    def get_multiple_objects(self, request, identifiers):
+
+        base_bundle = self.build_bundle(request=request)
+        objects = self.get_object_list(request).filter(**{'%s__in' % self._meta.detail_uri_name: identifiers})
+        objects = dict((getattr(obj, self._meta.detail_uri_name), obj) for obj in self.authorized_read_list(objects, base_bundle))
+
+        data = {
+            self._meta.collection_name: [self.full_dehydrate(self.build_bundle(obj=objects[identifier], request=request), for_list=True) for identifier in identifiers if identifier in objects],
+        }
+
+        not_found = [identifier for identifier in identifiers if identifier not in objects]
+        if not_found:
+            data['not_found'] = not_found
+
+        return self.create_response(request, data)
+
+
+# -----------------------------------------------------------------------------
+# Conditional GET
+
+class ConditionalMixin(object):
+
+    '''
+    ETag and Last-Modified of lists, sets and objects, from the updated_field
+    of the objects (one aggregate query for a list, one column of the rows of
+    a set or object), checked before the objects are loaded; 304 Not Modified
+    when the client has the current version.
+    '''
+
+    # Query parameters that don't change the response
+    ignored_params = ('username', 'api_key')
+
+    def get_list(self, request, **kwargs):
+
+        base_bundle = self.build_bundle(request=request)
+        objects = self.obj_get_list(bundle=base_bundle, **self.remove_api_resource_names(kwargs))
+        versions = objects.order_by().aggregate(count=Count('pk'), updated=Max(self.updated_field))
+
+        params = sorted((name, value) for (name, value) in request.GET.items() if name not in self.ignored_params)
+
+        return self.conditional(
+            request,
+            super(ConditionalMixin, self).get_list,
+            kwargs,
+            conditional.make_etag(self._meta.resource_name, params, versions['count'], versions['updated']),
+            versions['updated'],
+        )
+
+    def get_detail(self, request, **kwargs):
+
+        updated = list(self.get_object_list(request).filter(**self.remove_api_resource_names(kwargs)).values_list(self.updated_field, flat=True)[:2])
+
+        if len(updated) != 1:
+            # Not found (or not unique), answered by get_detail
+            return super(ConditionalMixin, self).get_detail(request, **kwargs)
+
+        return self.conditional(
+            request,
+            super(ConditionalMixin, self).get_detail,
+            kwargs,
+            conditional.make_etag(self._meta.resource_name, sorted(kwargs.items()), updated[0]),
+            updated[0],
+        )
+
+    def get_multiple_objects(self, request, identifiers):
+
+        versions = dict(self.get_object_list(request).filter(**{'%s__in' % self._meta.detail_uri_name: identifiers}).values_list(self._meta.detail_uri_name, self.updated_field))
+        updated = [version for version in versions.values() if version is not None]
+
+        return self.conditional(
+            request,
+            super(ConditionalMixin, self).get_multiple_objects,
+            {'identifiers': identifiers},
+            conditional.make_etag(self._meta.resource_name, identifiers, sorted(versions.items())),
+            max(updated) if updated else None,
+        )
+
+    def conditional(self, request, view, kwargs, etag, last_modified):
+
+        validators = {
+            'etag': etag,
+            'last_modified': last_modified,
+            'cache_control': conditional.private(),
+            'vary': ['Authorization'],
+        }
+
+        response = conditional.not_modified(request, **validators)
+        if response is not None:
+            return response
+
+        return conditional.set_validators(view(request, **kwargs), **validators)
+
+
 # -----------------------------------------------------------------------------
 # Batch
 
-class CelllineBatchResource(ModelResource):
+class CelllineBatchResource(ConditionalMixin, MultipleMixin, ChangeFeedMixin, ModelResource):
 
     biosamples_id = fields.CharField('biosamples_id', unique=True)
     batch_id = fields.CharField('batch_id')
@@ -820,15 +1044,26 @@ class CelllineBatchResource(ModelResource):
 
     vials = fields.ToManyField(CelllineAliquotResource, 'aliquots', null=True, full=True)
 
+    updated = fields.DateTimeField('updated', null=True)
+
+    updated_field = 'updated'
+    tombstone_kind = 'batch'
+
     class Meta:
-        queryset = CelllineBatch.objects.all()
+        queryset = CelllineBatch.objects.all().select_related(
+            'batchcultureconditions',
+        ).prefetch_related(
+            'images',
+            'aliquots',
+        )
         resource_name = 'batches'
         list_allowed_methods = ['get']
         detail_allowed_methods = ['get']
 
         detail_uri_name = 'biosamples_id'
 
-        authentication = ApiKeyAuthentication()
+        authentication = CachedApiKeyAuthentication()
+        throttle = KeyThrottle()
         authorization = ReadOnlyAuthorization()
 
         serializer = IndentedJSONSerializer()
@@ -880,7 +1115,7 @@ class CelllineInformationPackResource(ModelResource):
 # -----------------------------------------------------------------------------
 # Cellline
 
-class CelllineResource(ModelResource):
+class CelllineResource(ConditionalMixin, MultipleMixin, ChangeFeedMixin, ModelResource):
 
     # IDs
     biosamples_id = fields.CharField('biosamples_id', unique=True)
@@ -959,6 +1194,12 @@ class CelllineResource(ModelResource):
     # Batches
     batches = fields.ToManyField(CelllineBatchResource, 'batches', null=True, full=True)
 
+    # Change feed
+    updated = fields.DateTimeField('data_updated', null=True)
+
+    updated_field = 'data_updated'
+    tombstone_kind = 'cellline'
+
     class Meta:
         queryset = Cellline.objects.all().select_related(
             'donor__gender',
@@ -971,21 +1212,26 @@ class CelllineResource(ModelResource):
             'generator',
             'celllinecultureconditions__culture_medium_other',
             'integrating_vector__virus',
+            'current_status',
+            'celllinecharacterizationpluritest',
 
         ).prefetch_related(
-            'diseases',
-            'donor__diseases',
+            Prefetch('diseases', queryset=CelllineDisease.objects.select_related('disease').prefetch_related(*modification_prefetches('genetic_modification_cellline_disease'))),
+            Prefetch('donor__diseases', queryset=DonorDisease.objects.select_related('disease').prefetch_related(
+                Prefetch('donor_disease_variants', queryset=DonorDiseaseVariant.objects.select_related('gene')))),
+            'donor__donor_genome_analysis',
+            'statuses',
             'clips',
             'batches__batchcultureconditions',
             'batches__images',
+            'batches__aliquots',
             'publications',
+            'genome_analysis',
             'celllinecultureconditions__medium_supplements__unit',
-            'genetic_modification_cellline_variants',
-            'genetic_modification_cellline_transgene_expression',
-            'genetic_modification_cellline_isogenic',
-            'genetic_modification_cellline_gene_knock_out',
-            'genetic_modification_cellline_gene_knock_in',
-            'derivation_vector_free_reprogramming_factors',
+            'derivation_vector_free_reprogramming_factors__factor',
+            'integrating_vector__genes',
+            'non_integrating_vector__genes',
+            *modification_prefetches('genetic_modification_cellline')
         )
 
         resource_name = 'cell-lines'
@@ -995,7 +1241,8 @@ class CelllineResource(ModelResource):
 
         detail_uri_name = 'biosamples_id'
 
-        authentication = ApiKeyAuthentication()
+        authentication = CachedApiKeyAuthentication()
+        throttle = KeyThrottle()
         authorization = ReadOnlyAuthorization()
 
         serializer = IndentedJSONSerializer()
@@ -1005,6 +1252,20 @@ class CelllineResource(ModelResource):
     def get_schema(self, request, **kwargs):
         raise Http404
 
+    def get_withdrawn(self, since):
+
+        # Withdrawn at the time of the withdrawal status, later changes of the line don't move it
+        lines = Cellline.objects.filter(status='withdrawn').select_related('current_status')
+        if since is not None:
+            lines = lines.filter(current_status__updated__gte=since)
+
+        return [{
+            'biosamples_id': line.biosamples_id,
+            'name': line.name,
+            'reason': 'withdrawn',
+            'time': line.current_status.updated,
+        } for line in lines]
+
     def dehydrate_alternative_names(self, bundle):
         return value_list_of_string(bundle.obj.alternative_names)
 
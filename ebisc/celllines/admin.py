@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from .models import Cellline, CelllineAliquot, CelllineBatch, CelllineInformationPack
+from .models import Cellline, CelllineAliquot, CelllineBatch, CelllineInformationPack, ImportRun, ImportRunStage
 
 
 # -----------------------------------------------------------------------------
@@ -24,8 +24,8 @@ class OneToOneStackedInline(admin.StackedInline):
 # CellLine
 
 class CelllineAdmin(admin.ModelAdmin):
-    list_display = ['name', 'biosamples_id', 'alternative_names', 'current_status', 'available_for_sale_at_ecacc']
-    list_filter = ['current_status__status', 'available_for_sale_at_ecacc', 'generator__name']
+    list_display = ['name', 'biosamples_id', 'alternative_names', 'status', 'available_for_sale_at_ecacc']
+    list_filter = ['status', 'available_for_sale_at_ecacc', 'generator__name']
     search_fields = ['name', 'biosamples_id', 'ecacc_id']
 
     fieldsets = (
@@ -69,3 +69,22 @@ class CelllineInformationPackAdmin(admin.ModelAdmin):
 
 
 admin.site.register(CelllineInformationPack, CelllineInformationPackAdmin)
+
+
+# -----------------------------------------------------------------------------
+# Import runs
+
+class ImportRunStageInline(TabularInline):
+    model = ImportRunStage
+    readonly_fields = ['name', 'calls', 'seconds', 'max_seconds']
+    can_delete = False
+
+
+class ImportRunAdmin(admin.ModelAdmin):
+    list_display = ['importer', 'status', 'started', 'seconds', 'created', 'updated', 'skipped', 'failed']
+    list_filter = ['importer', 'status']
+    readonly_fields = ['importer', 'status', 'started', 'finished', 'seconds', 'created', 'updated', 'skipped', 'failed', 'error']
+    inlines = (ImportRunStageInline,)
+
+
+admin.site.register(ImportRun, ImportRunAdmin)
@@ -0,0 +1,421 @@
+import os
+import json
+import time
+import resource
+import itertools
+
+import logging
+logger = logging.getLogger('management.commands')
+
+from django.contrib.auth.models import User
+from django.db import connection, transaction
+from django.db.models import Q
+from django.test import Client
+from django.template.loader import render_to_string
+from django.test.utils import CaptureQueriesContext
+from tastypie.models import ApiKey
+
+from ebisc.site.views import cellline_context
+
+from ebisc.celllines.models import Cellline, CelllineDerivation, CellType, CelllineStatus, CelllineBatch, CelllineAliquot, CelllineDisease, Donor, DonorDisease, Disease, Molecule, Organization, ModificationVariantNonDisease, Tombstone, STATUS_CHOICES, AVAILABLE_STATUSES
+
+
+'''
+Benchmarks for the hot database queries and code paths. Synthetic cell lines
+(names starting with PREFIX) can be seeded into a development database and
+removed again afterwards.
+
+Scenarios (importer, indexer, API, catalogue page, dashboard, CSV exports)
+are measured for query count, wall time and peak memory and compared against
+a stored baseline. Each scenario runs in a forked process inside a
+transaction that is rolled back, so scenarios neither see each other's
+memory nor change the database.
+'''
+
+
+PREFIX = 'BENCH'
+USERNAME = 'benchmark'
+
+
+# -----------------------------------------------------------------------------
+# Synthetic data
+
+def seed(count, donors=None, batches=2, vials=5, modifications=1):
+
+    '''Seed count cell lines from donors donors (default: one per line), each with batches batches of vials vials and modifications genetic modifications.'''
+
+    donors = donors or count
+
+    logger.info('Seeding %d synthetic cell lines' % count)
+
+    with transaction.atomic():
+        organization, created = Organization.objects.get_or_create(name='Benchmark depositor', defaults={'short_name': PREFIX})
+
+        diseases = [Disease.objects.get_or_create(xpurl='http://example.org/benchmark/disease/%d' % i, defaults={'name': 'Benchmark disease %d' % i, 'synonyms': 'Benchmark synonym %d' % i})[0] for i in range(50)]
+
+        cell_types = [CellType.objects.get_or_create(name='%s cell type %d' % (PREFIX, i))[0] for i in range(10)]
+
+        for i in range(200):
+            Molecule.objects.get_or_create(name='%sGENE%d' % (PREFIX, i), kind='gene')
+
+        genes = list(Molecule.objects.filter(name__startswith=PREFIX, kind='gene'))
+
+        donors = Donor.objects.bulk_create([Donor(biosamples_id='%sD%05d' % (PREFIX, i)) for i in range(donors)])
+
+        celllines = Cellline.objects.bulk_create([Cellline(
+            name='%s%05d-A' % (PREFIX, i),
+            biosamples_id='%sC%05d' % (PREFIX, i),
+            validated='1',
+            available_for_sale_at_ecacc=(i % 3 == 0),
+            generator=organization,
+            donor=donors[i % len(donors)],
+            has_genetic_modification=bool(modifications),
+            summary_depositor=organization.name,
+        ) for i in range(count)])
+
+        CelllineDerivation.objects.bulk_create([CelllineDerivation(cell_line=cellline, primary_cell_type=cell_types[i % len(cell_types)]) for (i, cellline) in enumerate(celllines)])
+
+        CelllineDisease.objects.bulk_create([CelllineDisease(cell_line=cellline, disease=diseases[i % len(diseases)]) for (i, cellline) in enumerate(celllines)])
+
+        statuses = itertools.cycle([status for (status, label) in STATUS_CHOICES])
+        for status in CelllineStatus.objects.bulk_create([CelllineStatus(cell_line=cellline, status=next(statuses)) for cellline in celllines]):
+            Cellline.objects.filter(pk=status.cell_line_id).update(current_status=status, status=status.status)
+
+        batches = CelllineBatch.objects.bulk_create([CelllineBatch(
+            cell_line=cellline,
+            biosamples_id='%sB%05d%d' % (PREFIX, i, n),
+            batch_id='P%03d' % n,
+            number=n,
+        ) for (i, cellline) in enumerate(celllines) for n in range(1, batches + 1)])
+
+        CelllineAliquot.objects.bulk_create([CelllineAliquot(
+            batch=batch,
+            biosamples_id='%sV%s%02d' % (PREFIX, batch.biosamples_id[len(PREFIX) + 1:], n),
+            name='%s vial %02d' % (batch.batch_id, n),
+            number='%04d' % n,
+        ) for batch in batches for n in range(1, vials + 1)])
+
+        # Variants are multi-table models and can't be bulk created
+        for (i, cellline) in enumerate(celllines):
+            for n in range(modifications):
+                ModificationVariantNonDisease.objects.create(
+                    cell_line=cellline,
+                    modification_id=n,
+                    gene=genes[(i + n) % len(genes)],
+                    zygosity_status='Heterozygous',
+                )
+
+        # API and dashboard user
+        user = User.objects.create_superuser(USERNAME, '', None)
+        ApiKey.objects.create(user=user)
+
+    # Up to date planner statistics for the new rows
+    with connection.cursor() as cursor:
+        cursor.execute('ANALYZE')
+
+
+def clear():
+
+    logger.info('Removing synthetic cell lines')
+
+    with transaction.atomic():
+        Cellline.objects.filter(name__startswith=PREFIX).delete()
+        # Left by the deletes above (see models.Tombstone), not real removals for the change feeds
+        Tombstone.objects.filter(biosamples_id__startswith=PREFIX).delete()
+        Donor.objects.filter(biosamples_id__startswith=PREFIX).delete()
+        Disease.objects.filter(xpurl__startswith='http://example.org/benchmark/').delete()
+        Molecule.objects.filter(name__startswith=PREFIX).delete()
+        CellType.objects.filter(name__startswith=PREFIX).delete()
+        Organization.objects.filter(short_name=PREFIX).delete()
+        User.objects.filter(username=USERNAME).delete()
+
+
+# -----------------------------------------------------------------------------
+# Queries
+
+QUERIES = [
+    ('catalogue: cell line page', lambda: Cellline.objects.filter(name='%s00003-A' % PREFIX, available_for_sale_at_ecacc=True, status__in=AVAILABLE_STATUSES)),
+    ('catalogue: available lines', lambda: Cellline.objects.filter(available_for_sale_at_ecacc=True, status__in=AVAILABLE_STATUSES).order_by('name')),
+    ('toelastic: indexed lines', lambda: Cellline.objects.filter(available_for_sale_at_ecacc=True).exclude(status__in=['withdrawn', 'not_available', 'recalled'])),
+    ('dashboard: status count', lambda: Cellline.objects.filter(status='at_ecacc').values('id')),
+    ('dashboard: depositor filter', lambda: Cellline.objects.filter(summary_depositor='Benchmark depositor').order_by('name')[:50]),
+    ('dashboard: depositor join filter', lambda: Cellline.objects.filter(generator__name='Benchmark depositor').order_by('name')[:50]),
+    ('dashboard: disease filter', lambda: Cellline.objects.filter(Q(id__in=CelllineDisease.objects.filter(disease__name='Benchmark disease 7').values('cell_line')) | Q(donor__in=DonorDisease.objects.filter(disease__name='Benchmark disease 7').values('donor'))).order_by('name')[:50]),
+    ('importer: disease by purl', lambda: Disease.objects.filter(xpurl='http://example.org/benchmark/disease/7')),
+    ('importer: molecule by name and kind', lambda: Molecule.objects.filter(name='%sGENE7' % PREFIX, kind='gene')),
+    ('importer: donor by biosamples id', lambda: Donor.objects.filter(biosamples_id='%sD00007' % PREFIX)),
+    ('importer: batch by id', lambda: CelllineBatch.objects.filter(batch_id='P002', cell_line__name='%s00007-A' % PREFIX)),
+    ('importer: aliquot by biosamples id', lambda: CelllineAliquot.objects.filter(biosamples_id='%sV00007101' % PREFIX)),
+]
+
+
+def explain(queryset):
+
+    '''Return the executed plan of a queryset (EXPLAIN ANALYZE) as a list of lines.'''
+
+    sql, params = queryset.query.sql_with_params()
+
+    with connection.cursor() as cursor:
+        cursor.execute('EXPLAIN ANALYZE ' + sql, params)
+        return [row[0] for row in cursor.fetchall()]
+
+
+def time_queryset(queryset, repeat):
+
+    '''Return the mean wall time in ms of running the SQL of a queryset (without building model instances).'''
+
+    sql, params = queryset.query.sql_with_params()
+
+    with connection.cursor() as cursor:
+        start = time.time()
+        for i in range(repeat):
+            cursor.execute(sql, params)
+            cursor.fetchall()
+
+    return (time.time() - start) * 1000.0 / repeat
+
+
+def run_queries(repeat=20, plans=False):
+
+    results = []
+
+    for (name, query) in QUERIES:
+        queryset = query()
+        result = {
+            'name': name,
+            'ms': time_queryset(queryset, repeat),
+        }
+        if plans:
+            result['plan'] = explain(queryset)
+        results.append(result)
+
+    return results
+
+
+# -----------------------------------------------------------------------------
+# Scenarios
+
+def record(source, names):
+
+    '''Store the hPSCreg JSON of the given cell lines in the directory source, for scenario_import.'''
+
+    from django.conf import settings
+    from ebisc.celllines.importer.hpscreg import request_get
+
+    if not os.path.isdir(source):
+        os.makedirs(source)
+
+    for name in names:
+        data = request_get(settings.HPSCREG['cellline_url'] + name)
+        if data is None or type(data) is unicode:
+            logger.warn('No data for cell line %s' % name)
+            continue
+        with open(os.path.join(source, '%s.json' % name), 'w') as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+
+
+def recorded_cellline(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def scenario_import(source):
+
+    from ebisc.celllines.importer.hpscreg import import_cellline, replay, parser
+
+    if os.path.isfile(source):
+        # Snapshot archive (import hpscreg --record)
+        replay(source)
+        return
+
+    # Recorded JSON only: no ECACC check (import_cellline() gets no availability), data files are noted but not downloaded
+    with parser.deferred_downloads():
+        for filename in sorted(os.listdir(source)):
+            if filename.endswith('.json'):
+                import_cellline(recorded_cellline(os.path.join(source, filename)))
+
+
+def scenario_toelastic(source):
+    for cellline in Cellline.objects.filter(name__startswith=PREFIX, available_for_sale_at_ecacc=True):
+        cellline.to_elastic()
+
+
+def api_get(path, **params):
+
+    key = ApiKey.objects.get(user__username=USERNAME)
+    params.update(username=USERNAME, api_key=key.key)
+
+    response = Client().get(path, params)
+    assert response.status_code == 200, '%s: %s' % (path, response.status_code)
+
+
+def scenario_api_list(source):
+    api_get('/api/v0/cell-lines/', limit=50)
+
+
+def scenario_api_detail(source):
+    api_get('/api/v0/cell-lines/%sC00003/' % PREFIX)
+
+
+def scenario_cellline_page(source):
+
+    # The cell line data, rendered uncached
+    cellline = Cellline.objects.get(name='%s00003-A' % PREFIX)
+    render_to_string('catalog/__cellline_data__.html', cellline_context(cellline))
+
+
+def executive_get(path, **params):
+
+    client = Client()
+    client.force_login(User.objects.get(username=USERNAME))
+
+    response = client.get(path, params)
+    assert response.status_code == 200, '%s: %s' % (path, response.status_code)
+    # Streaming and plain responses alike
+    return b''.join(response) if response.streaming else response.content
+
+
+def scenario_dashboard(source):
+    executive_get('/executive/', depositor='Benchmark depositor', sort='-cellLineName')
+
+
+def scenario_cell_line_ids(source):
+    executive_get('/executive/cell-line-ids/')
+
+
+def scenario_batch_ids(source):
+    executive_get('/executive/batch-ids/')
+
+
+SCENARIOS = [
+    ('importer: import recorded lines', scenario_import),
+    ('toelastic: build documents', scenario_toelastic),
+    ('api: cell line list', scenario_api_list),
+    ('api: cell line detail', scenario_api_detail),
+    ('catalogue: cell line page', scenario_cellline_page),
+    ('executive: dashboard', scenario_dashboard),
+    ('executive: cell line ids csv', scenario_cell_line_ids),
+    ('executive: batch ids csv', scenario_batch_ids),
+]
+
+
+class Rollback(Exception):
+    pass
+
+
+def peak_memory():
+
+    '''Peak resident set size of this process in KB.'''
+
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def measure(scenario, source):
+
+    '''Run a scenario in this process and return its query count, wall time (ms) and peak memory growth (KB).'''
+
+    memory = peak_memory()
+
+    try:
+        with transaction.atomic():
+            with CaptureQueriesContext(connection) as queries:
+                start = time.time()
+                scenario(source)
+                ms = (time.time() - start) * 1000.0
+            raise Rollback()
+    except Rollback:
+        pass
+
+    return {
+        'queries': len(queries),
+        'ms': ms,
+        'memory': peak_memory() - memory,
+    }
+
+
+def measure_forked(scenario, source):
+
+    '''Run measure() in a child process so that the peak memory belongs to this scenario alone.'''
+
+    # Parent and child must not share the database connection
+    connection.close()
+
+    (read, write) = os.pipe()
+    pid = os.fork()
+
+    if pid == 0:
+        os.close(read)
+        try:
+            result = measure(scenario, source)
+        except Exception, e:
+            result = {'error': '%s: %s' % (e.__class__.__name__, e)}
+        connection.close()
+        with os.fdopen(write, 'w') as f:
+            json.dump(result, f)
+        os._exit(0)
+
+    os.close(write)
+    with os.fdopen(read) as f:
+        result = json.loads(f.read() or '{"error": "no result"}')
+    os.waitpid(pid, 0)
+
+    return result
+
+
+def run_scenarios(source=None, names=None):
+
+    results = []
+
+    for (name, scenario) in SCENARIOS:
+        if names and not any(n in name for n in names):
+            continue
+        if scenario is scenario_import and (source is None or not os.path.exists(source)):
+            logger.warn('Skipping %s: no recorded hPSCreg JSON or snapshot given' % name)
+            continue
+
+        result = measure_forked(scenario, source)
+        result['name'] = name
+        results.append(result)
+
+    return results
+
+
+# -----------------------------------------------------------------------------
+# Baseline
+
+def load_baseline(path):
+    with open(path) as f:
+        return dict((result['name'], result) for result in json.load(f))
+
+
+def save_baseline(path, results):
+    with open(path, 'w') as f:
+        json.dump([result for result in results if 'error' not in result], f, indent=2, sort_keys=True)
+
+
+def regressions(results, baseline, tolerance=0.2):
+
+    '''
+    Compare results with a baseline. Any increase in query count is a
+    regression, wall time and memory are allowed to grow by tolerance (a
+    fraction) to absorb noise. Return a list of (name, measure, baseline, value).
+    '''
+
+    found = []
+
+    for result in results:
+        base = baseline.get(result['name'])
+        if base is None or 'error' in result:
+            continue
+
+        if result['queries'] > base['queries']:
+            found.append((result['name'], 'queries', base['queries'], result['queries']))
+        for key in ('ms', 'memory'):
+            # Memory is in KB; ignore changes below 1 MB
+            slack = 1024 if key == 'memory' else 0
+            if result[key] > base[key] * (1 + tolerance) + slack:
+                found.append((result['name'], key, base[key], result[key]))
+
+    return found
+
+# -----------------------------------------------------------------------------
@@ -0,0 +1,110 @@
+import os
+import hashlib
+from io import BytesIO
+from PIL import Image
+
+from django.conf import settings
+from django.core.files import File
+from django.core.files.base import ContentFile
+
+
+'''
+File helpers shared by the importers and the executive dashboard.
+'''
+
+
+# -----------------------------------------------------------------------------
+# Digests
+
+class Digest(object):
+
+    '''Compute one or more hash digests (FILE_DIGEST_ALGORITHMS) over one stream of data.'''
+
+    def __init__(self, algorithms=None):
+        if algorithms is None:
+            algorithms = settings.FILE_DIGEST_ALGORITHMS
+        self.hashes = dict([(algorithm, hashlib.new(algorithm)) for algorithm in algorithms])
+
+    def update(self, data):
+        for h in self.hashes.values():
+            h.update(data)
+
+    def hexdigest(self, algorithm='md5'):
+        return self.hashes[algorithm].hexdigest()
+
+
+class DigestFile(File):
+
+    '''File wrapper that updates a Digest with every chunk read by the storage backend.'''
+
+    def __init__(self, file, name=None, algorithms=None):
+        super(DigestFile, self).__init__(file, name)
+        self.algorithms = algorithms
+        self.digest = Digest(algorithms)
+
+    def chunks(self, chunk_size=None):
+        # File.chunks() always starts from the beginning, so start a fresh digest too
+        self.digest = Digest(self.algorithms)
+        for chunk in super(DigestFile, self).chunks(chunk_size):
+            self.digest.update(chunk)
+            yield chunk
+
+
+def file_digest(f, algorithms=None):
+
+    '''Return the Digest of a file (or FieldFile) read in chunks.'''
+
+    digest = Digest(algorithms)
+
+    for chunk in f.chunks():
+        digest.update(chunk)
+
+    return digest
+
+
+def save_with_digest(field_file, algorithms=None):
+
+    '''
+    Save a not yet committed upload assigned to field_file to storage, hashing
+    it while it is written. Already stored files are hashed from storage.
+    Returns the Digest.
+    '''
+
+    if field_file._committed:
+        return file_digest(field_file, algorithms)
+
+    content = DigestFile(field_file.file, algorithms=algorithms)
+    field_file.save(field_file.name, content, save=False)
+
+    return content.digest
+
+
+# -----------------------------------------------------------------------------
+# Thumbnails
+
+def make_thumbnail(f, width):
+
+    '''Return a JPEG thumbnail of an image file scaled to width as a ContentFile.'''
+
+    f.open('rb')
+    try:
+        image = Image.open(f)
+        image.load()
+    finally:
+        f.close()
+
+    height = max(1, int(round(float(image.size[1]) * width / image.size[0])))
+
+    if image.mode not in ('RGB', 'L'):
+        image = image.convert('RGB')
+
+    image = image.resize((width, height), Image.ANTIALIAS)
+
+    data = BytesIO()
+    image.save(data, format='JPEG', quality=settings.THUMBNAIL_QUALITY)
+
+    name = '%s.thumbnail.jpg' % os.path.splitext(os.path.basename(f.name))[0]
+
+    return ContentFile(data.getvalue(), name=name)
+
+# -----------------------------------------------------------------------------
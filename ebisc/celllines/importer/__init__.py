@@ -2,3 +2,5 @@ from . import hpscreg
 from . import lims
 from . import toelastic
 from . import batches
+from . import summary
+from . import telemetry
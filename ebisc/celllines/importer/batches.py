@@ -9,6 +9,7 @@ from django.db import IntegrityError
 from ebisc.celllines.importer.hpscreg.utils import format_integrity_error
 
 from ebisc.celllines.models import Cellline, CelllineBatch, CelllineAliquot
+from ebisc.celllines.importer import telemetry
 
 
 '''Batch and vial biosamples IDs importer'''
@@ -19,6 +20,12 @@ from ebisc.celllines.models import Cellline, CelllineBatch, CelllineAliquot
 
 def run(filename):
 
+    with telemetry.run('batches'):
+        import_batches(filename)
+
+
+def import_batches(filename):
+
     with open(filename, 'rU') as csvfile:
 
         reader = csv.reader(csvfile, dialect=csv.excel_tab, delimiter=',')
@@ -32,12 +39,15 @@ def run(filename):
 
             try:
                 cell_line = Cellline.objects.get(biosamples_id=cellline_biosamples_id)
-                batch = create_batch(cell_line, batch_biosamples_id, batch_name, batch_type)
-                create_aliquot(cell_line, batch, vial_biosamples_id, vial_name)
+                with telemetry.stage('create_batch'):
+                    batch = create_batch(cell_line, batch_biosamples_id, batch_name, batch_type)
+                with telemetry.stage('create_aliquot'):
+                    create_aliquot(cell_line, batch, vial_biosamples_id, vial_name)
 
             except Cellline.DoesNotExist:
                 pass
                 logger.warn('Cell line with biosamples ID %s does not exists' % cellline_biosamples_id)
+                telemetry.count('skipped')
 
 
 # -----------------------------------------------------------------------------
@@ -58,10 +68,13 @@ def create_batch(cell_line, batch_biosamples_id, batch_name, batch_type):
         if created:
             logger.info('Created batch {} for cell line {}'.format(batch, cell_line))
 
+        telemetry.count('created' if created else 'updated')
+
         return batch
 
     except IntegrityError, e:
         logger.warn(format_integrity_error(e))
+        telemetry.count('failed')
         return None
 
 
@@ -85,10 +98,13 @@ def create_aliquot(cell_line, batch, aliquot_biosamples_id, vial_name):
         if created:
             logger.info('Created aliquot {} for cell line {} and batch {}'.format(aliquot, batch.cell_line, batch))
 
+        telemetry.count('created' if created else 'updated')
+
         return aliquot
 
     except IntegrityError, e:
         logger.warn(format_integrity_error(e))
+        telemetry.count('failed')
         return None
 
 # -----------------------------------------------------------------------------
@@ -0,0 +1,168 @@
+from contextlib import contextmanager
+
+from dirtyfields import DirtyFieldsMixin
+
+import logging
+logger = logging.getLogger('management.commands')
+
+
+'''
+Field-level changes of imported rows.
+
+The importer saves rows with save(instance): a new row is inserted, an
+existing row is updated with only the columns that changed (compared to the
+state DirtyFieldsMixin recorded when the row was loaded or last saved), an
+unchanged row is not written at all. delete(instance) deletes a row. Rows
+created with get_or_create() and then filled in are recorded as updated with
+the fields set, unless they are recorded with created().
+
+Inside collect(name) every write is added to a ChangeSet, so later stages
+(search index, caches, change feeds) can see which rows and columns an
+import changed instead of refreshing everything. Outside of collect() the
+functions still write, they just don't record.
+'''
+
+
+# -----------------------------------------------------------------------------
+# Change sets
+
+class ChangeSet(object):
+
+    '''Rows created, updated (with their changed fields) and deleted while importing one object, e.g. a cell line.'''
+
+    def __init__(self, name):
+        self.name = name
+        self.changes = []
+
+    def add(self, action, instance, fields=None):
+        self.changes.append({
+            'action': action,
+            'model': label(instance),
+            'pk': instance.pk,
+            'fields': sorted(fields) if fields is not None else None,
+        })
+
+    def __len__(self):
+        return len(self.changes)
+
+    def models(self):
+        return set(change['model'] for change in self.changes)
+
+    def fields(self, model):
+
+        '''Names of the changed fields of model, None if all of them may have changed (created, deleted or not tracked rows).'''
+
+        fields = set()
+
+        for change in self.changes:
+            if change['model'] == model:
+                if change['fields'] is None:
+                    return None
+                fields.update(change['fields'])
+
+        return fields
+
+    def as_dict(self):
+        return {'name': self.name, 'changes': self.changes}
+
+    def summary(self):
+        return u', '.join(u'%s %s %s%s' % (
+            change['action'],
+            change['model'],
+            change['pk'],
+            u' (%s)' % u', '.join(change['fields']) if change['fields'] else u'',
+        ) for change in self.changes)
+
+
+current = None
+
+
+@contextmanager
+def collect(name):
+
+    global current
+
+    change_set = current = ChangeSet(name)
+    try:
+        yield change_set
+    finally:
+        current = None
+
+
+def label(instance):
+    return instance._meta.label
+
+
+def record(action, instance, fields=None):
+    if current is not None:
+        current.add(action, instance, fields)
+
+
+def recorded():
+
+    '''Number of writes recorded so far by the current collect(), None outside of collect().'''
+
+    return len(current) if current is not None else None
+
+
+# -----------------------------------------------------------------------------
+# Writes
+
+def changed_fields(instance):
+
+    '''Names of the fields of instance that changed since it was loaded or saved, None if the model doesn't track them.'''
+
+    if not isinstance(instance, DirtyFieldsMixin):
+        return None
+
+    return instance.get_dirty_fields(check_relationship=True).keys()
+
+
+def save(instance):
+
+    '''Insert instance, or update its changed columns. Return True if anything was written.'''
+
+    if instance.pk is None:
+        instance.save()
+        record('created', instance)
+        return True
+
+    fields = changed_fields(instance)
+
+    if fields is None:
+        instance.save()
+        record('updated', instance)
+        return True
+
+    if not fields:
+        return False
+
+    # Columns the database does not compute, but Django does on every save
+    auto_now = [field.name for field in instance._meta.concrete_fields if getattr(field, 'auto_now', False)]
+
+    instance.save(update_fields=set(fields) | set(auto_now))
+    record('updated', instance, fields)
+
+    return True
+
+
+def created(instance):
+
+    '''Record a row inserted by other means (e.g. get_or_create).'''
+
+    record('created', instance)
+
+
+def updated(instance, fields):
+
+    '''Record an update of instance written by other means (e.g. a queryset update).'''
+
+    record('updated', instance, fields)
+
+
+def delete(instance):
+
+    record('deleted', instance)
+    instance.delete()
+
+# -----------------------------------------------------------------------------
@@ -4,79 +4,239 @@ hPSCreg JSON data API importer.
 
 import re
 import os
-import functools
 import requests
+import multiprocessing
 
 from django.conf import settings
+from django.db import connections, transaction, IntegrityError, OperationalError
 
 import logging
 logger = logging.getLogger('management.commands')
 
 from ebisc.celllines.models import Cellline, CelllineStatus, Country
+from ebisc.celllines.importer import telemetry, changes
 
 from . import parser
 from . import parser_characterisation
 from . import parser_genotyping
 from . import parser_derivation
+from . import snapshot
+from . import utils
 
 
 # -----------------------------------------------------------------------------
 #  Run
 
-def run(cellline=None, local=False):
+def run(cellline=None, local=False, record=None, workers=1):
 
-    if local:
+    '''Import lines from hPSCreg; return the change sets (see importer.changes) of the changed lines.'''
+
+    with telemetry.run('hpscreg'):
+        if record is not None:
+            with snapshot.record(record):
+                return import_all(cellline=cellline, local=local)
+        else:
+            return import_all(cellline=cellline, local=local, workers=workers)
+
+
+def replay(path, cellline=None, processes=1, workers=1):
+
+    '''Import from a snapshot archive (see run(record=...)), decompressing and parsing the payloads in processes processes.'''
+
+    with telemetry.run('hpscreg'):
+        with snapshot.replay(path):
+            return import_all(cellline=cellline, processes=processes, workers=workers)
+
+
+def import_all(cellline=None, local=False, processes=1, workers=1):
+
+    server = None
+
+    if local and not snapshot.replaying():
         if os.getenv("TOMCAT_URL"):
             server = os.getenv("TOMCAT_URL")
         else:
             logging.info(u'no local tomcat_url given')
-            local = False
 
-    if local:
-        logger.info(u'using ' + server + settings.HPSCREG['local_list_url'])
-        cellline_ids = request_get(server + settings.HPSCREG['local_list_url'])
-    else:
-        cellline_ids = request_get(settings.HPSCREG['list_url'])
+    with telemetry.stage('fetch list'):
+        if server:
+            logger.info(u'using ' + server + settings.HPSCREG['local_list_url'])
+            cellline_ids = snapshot.remember('list', lambda: request_get(server + settings.HPSCREG['local_list_url']))
+        else:
+            cellline_ids = snapshot.remember('list', lambda: request_get(settings.HPSCREG['list_url']))
 
     if cellline_ids is None:
-        return
+        return []
 
     # Tests
     # json = request_get(settings.HPSCREG['cellline_url'] + 'BIONi010-C-2')
     # import_cellline(json)
     # return
 
-    for cellline_id in [id for id in cellline_ids]:
-        if cellline is not None and cellline_id != cellline:
-            continue
-        else:
-            logger.info('Importing data for cell line %s' % cellline_id)
-            if local:
-                json = request_get(server + settings.HPSCREG['local_cellline_url'] + cellline_id)
-            else:
-                json = request_get(settings.HPSCREG['cellline_url'] + cellline_id)
+    cellline_ids = [id for id in cellline_ids if cellline is None or id == cellline]
 
-            if json is None:
-                continue
-            elif type(json) is unicode:
-                # hPSCreg returns 200 and error message instead of 404 NOT_FOUND
-                logger.warn('Invalid cellline data: %s' % json)
-            else:
-                import_cellline(json)
+    payloads = fetch_celllines(cellline_ids, server=server, processes=processes)
+
+    changed = []
+
+    if workers > 1:
+        (retry, changed) = import_parallel(payloads, workers)
+
+        # Lines that lost a conflict with another worker, in list order
+        if retry:
+            logger.info('Importing %d cell lines with conflicts' % len(retry))
+        payloads = fetch_celllines([id for id in cellline_ids if id in retry], server=server)
+
+    for (cellline_id, json) in payloads:
+        change_set = import_payload(cellline_id, json)
+        if change_set:
+            changed.append(change_set)
+
+    return changed
+
+
+def import_payload(cellline_id, json):
+
+    logger.info('Importing data for cell line %s' % cellline_id)
+
+    if json is None:
+        telemetry.count('failed')
+    elif type(json) is unicode:
+        # hPSCreg returns 200 and error message instead of 404 NOT_FOUND
+        logger.warn('Invalid cellline data: %s' % json)
+        telemetry.count('failed')
+    else:
+        # Requests to ECACC and hPSCreg are made outside the line's
+        # transaction, which then holds its locks only while writing
+        with telemetry.stage('check_availability_on_ecacc'):
+            available = check_availability_on_ecacc(json)
+
+        with changes.collect(cellline_id) as change_set, parser.deferred_downloads() as downloads:
+            with telemetry.stage('import_cellline'):
+                with transaction.atomic():
+                    cell_line = import_cellline(json, available)
+
+            if downloads:
+                with telemetry.stage('download_files'):
+                    if downloads.run():
+                        # The page shows the new files from now on
+                        cell_line.update_summary(bump=True, fields=[])
+
+        if change_set:
+            logger.debug(u'Changes of cell line %s: %s' % (cellline_id, change_set.summary()))
+
+        return change_set
 
 
 # -----------------------------------------------------------------------------
-# Import cell line
+# Parallel import
+
+def import_parallel(payloads, workers):
+
+    '''
+    Import lines in a pool of worker processes, each line in its own
+    transaction. Shared rows (vocabulary, donors) are locked while a line
+    creates them (see utils.lock). A line that fails on a conflict with
+    another worker (deadlock, unique constraint) is rolled back; return the
+    ids of these lines to import them again serially, and the change sets of
+    the imported lines.
+    '''
+
+    retry = set()
+    changed = []
+
+    # Workers must open their own database connections
+    connections.close_all()
+
+    pool = multiprocessing.Pool(workers, initializer=init_worker)
+
+    try:
+        for (cellline_id, result, change_set, collected) in pool.imap_unordered(import_worker, payloads):
+            telemetry.merge(collected)
+            if result == 'retry':
+                retry.add(cellline_id)
+            elif change_set:
+                changed.append(change_set)
+    finally:
+        pool.close()
+        pool.join()
+
+    return (retry, changed)
+
 
-def import_cellline(source):
+def init_worker():
+    telemetry.collect('hpscreg')
+    snapshot.reopen()
+    utils.concurrent = True
 
-    valuef = functools.partial(parser.value_of_json, source)
 
-    (generator, owner, organizations) = get_providers(valuef('providers'))
+def import_worker(payload):
+
+    (cellline_id, json) = payload
+    change_set = None
+
+    try:
+        change_set = import_payload(cellline_id, json)
+        result = 'imported'
+    except (IntegrityError, OperationalError), e:
+        logger.warn('Conflict importing cell line %s, retrying later: %s' % (cellline_id, utils.format_integrity_error(e)))
+        result = 'retry'
+    except Exception:
+        logger.exception('Failed to import cell line %s' % cellline_id)
+        telemetry.count('failed')
+        result = 'failed'
+
+    collected = telemetry.collected()
+
+    # The line is imported again, count it then
+    if result == 'retry':
+        collected['counts'] = {}
+
+    return (cellline_id, result, change_set, collected)
+
+
+# -----------------------------------------------------------------------------
+# Import cell line
+
+# Parsers for the related data of a line, each returns True if it changed
+PARSERS = [
+    parser.parse_cell_line_diseases,
+    parser.parse_genetic_modifications_non_disease,
+    parser_derivation.parse_reprogramming_vector,
+    parser_derivation.parse_derivation,
+    parser_derivation.parse_vector_free_reprogramming_factors,
+    parser.parse_culture_conditions,
+    parser.parse_publications,
+    parser_genotyping.parse_karyotyping,
+    parser_genotyping.parse_hla_typing,
+    parser_genotyping.parse_str_fingerprinting,
+    parser_genotyping.parse_genome_analysis,
+    parser_characterisation.parse_characterization,
+    parser_characterisation.parse_characterization_marker_expression,
+    parser_characterisation.parse_characterization_pluritest,
+    parser_characterisation.parse_characterization_epipluriscore,
+    parser_characterisation.parse_characterization_undiff_morphology,
+    parser_characterisation.parse_characterization_hpscscorecard,
+    parser_characterisation.parse_characterization_rna_sequencing,
+    parser_characterisation.parse_characterization_gene_expression_array,
+    parser_characterisation.parse_characterization_differentiation_potency,
+]
+
+
+def import_cellline(source, available=None):
+
+    '''Import a line; available is its ECACC availability (see check_availability_on_ecacc). Return the line, None if it was skipped.'''
+
+    # Shared by all parsers of the line
+    valuef = parser.Record(source)
+
+    with telemetry.stage('get_providers'):
+        (generator, owner, organizations) = get_providers(valuef('providers'))
 
     if valuef('biosamples_id') is None:
         logger.warn('Missing biosamples id for %s' % valuef('name'))
-        return
+        telemetry.count('skipped')
+        return None
 
     cell_line, cell_line_created = Cellline.objects.get_or_create(
         biosamples_id=valuef('biosamples_id'),
@@ -86,6 +246,7 @@ def import_cellline(source):
         })
 
     if cell_line_created:
+        changes.created(cell_line)
 
         # ECACC catalogue number assignment for new cell lines
         # 66540001 - 66541224   EBiSC1 (based on cell_line.id starting with id 647)
@@ -93,13 +254,13 @@ def import_cellline(source):
         ecacc_cat_number = str(int(cell_line.id) + 66770000 - 1324)
         if ecacc_cat_number <= '66999999':
             cell_line.ecacc_id = ecacc_cat_number
-            cell_line.save()
+            changes.save(cell_line)
         else:
             logger.warn('Ran out of ECACC catalogue numbers for cell line %s' % valuef('name'))
 
         # Set status to not available for new lines
         status = CelllineStatus(cell_line=cell_line, status='not_available', comment='Initial value at first import')
-        status.save()
+        changes.save(status)
 
         logger.info('Found new cell line %s' % valuef('name'))
 
@@ -107,7 +268,8 @@ def import_cellline(source):
     cell_line.hescreg_id = valuef('id')
     cell_line.name = valuef('name')
     cell_line.alternative_names = ', '.join(valuef('alternate_name')) if valuef('alternate_name') is not None else ''
-    cell_line.donor = parser.parse_donor(valuef('donor')) if valuef('donor') is not None else None
+    with telemetry.stage('parse_donor'):
+        cell_line.donor = parser.parse_donor(valuef('donor')) if valuef('donor') is not None else None
     cell_line.donor_age = valuef('donor_age', 'age_range')
     cell_line.generator = generator
     cell_line.owner = owner
@@ -116,41 +278,46 @@ def import_cellline(source):
     cell_line.disease_associated_phenotypes = valuef('disease_associated_phenotypes')
     cell_line.non_disease_associated_phenotypes = valuef('donor_phenotypes')
     cell_line.has_genetic_modification = valuef('genetic_modification_flag', 'nullbool')
-    cell_line.derived_from = parser.parse_derived_from(source)
+    cell_line.derived_from = parser.parse_derived_from(valuef)
     cell_line.public_notes = valuef('public_notes')
 
     dirty = [cell_line.is_dirty(check_relationship=True)]
 
-    dirty += [
-        parser.parse_cell_line_diseases(source, cell_line),
-        parser.parse_genetic_modifications_non_disease(source, cell_line),
-        parser_derivation.parse_reprogramming_vector(source, cell_line),
-        parser_derivation.parse_derivation(source, cell_line),
-        parser_derivation.parse_vector_free_reprogramming_factors(source, cell_line),
-        parser.parse_culture_conditions(source, cell_line),
-        parser.parse_publications(source, cell_line),
-        parser_genotyping.parse_karyotyping(source, cell_line),
-        parser_genotyping.parse_hla_typing(source, cell_line),
-        parser_genotyping.parse_str_fingerprinting(source, cell_line),
-        parser_genotyping.parse_genome_analysis(source, cell_line),
-        parser_characterisation.parse_characterization(source, cell_line),
-        parser_characterisation.parse_characterization_marker_expression(source, cell_line),
-        parser_characterisation.parse_characterization_pluritest(source, cell_line),
-        parser_characterisation.parse_characterization_epipluriscore(source, cell_line),
-        parser_characterisation.parse_characterization_undiff_morphology(source, cell_line),
-        parser_characterisation.parse_characterization_hpscscorecard(source, cell_line),
-        parser_characterisation.parse_characterization_rna_sequencing(source, cell_line),
-        parser_characterisation.parse_characterization_gene_expression_array(source, cell_line),
-        parser_characterisation.parse_characterization_differentiation_potency(source, cell_line),
-        check_availability_on_ecacc(cell_line),
-    ]
-
-    if True in dirty:
-        if cell_line_created:
-            logger.info('Saving new cell line %s' % cell_line.name)
-        else:
-            logger.info('Updating cell line %s' % cell_line.name)
-        cell_line.save()
+    for parse in PARSERS:
+        with telemetry.stage(parse.__name__):
+            dirty.append(parse(valuef, cell_line))
+
+    dirty.append(set_availability_on_ecacc(cell_line, available))
+
+    with telemetry.stage('save'):
+        if True in dirty:
+            if cell_line_created:
+                logger.info('Saving new cell line %s' % cell_line.name)
+            else:
+                logger.info('Updating cell line %s' % cell_line.name)
+
+        # Related rows written so far, including those the parsers don't
+        # report as changed (donor, relatives, donor diseases, ...)
+        related_changed = changes.recorded()
+        if related_changed is None:
+            related_changed = True in dirty
+
+        saved = changes.save(cell_line)
+
+        if related_changed:
+            # New summary, and a new data version if saving the line didn't write one
+            cell_line.update_summary(bump=not saved)
+            if not saved:
+                changes.updated(cell_line, ['data_updated'])
+
+    if cell_line_created:
+        telemetry.count('created')
+    elif True in dirty:
+        telemetry.count('updated')
+    else:
+        telemetry.count('skipped')
+
+    return cell_line
 
 
 # -----------------------------------------------------------------------------
@@ -175,6 +342,31 @@ def get_providers(providers):
     return (generator, owner, organizations)
 
 
+# -----------------------------------------------------------------------------
+# Fetch cell line data
+
+def fetch_celllines(cellline_ids, server=None, processes=1):
+
+    '''Yield (id, data) for the given cell lines, from hPSCreg, a local Tomcat server or the replayed snapshot.'''
+
+    keys = ['cellline/%s' % id for id in cellline_ids]
+
+    if snapshot.replaying():
+        payloads = snapshot.current.load(keys, processes=processes)
+    elif server:
+        payloads = ((key, snapshot.remember(key, lambda: request_get(server + settings.HPSCREG['local_cellline_url'] + id))) for (key, id) in zip(keys, cellline_ids))
+    else:
+        payloads = ((key, snapshot.remember(key, lambda: request_get(settings.HPSCREG['cellline_url'] + id))) for (key, id) in zip(keys, cellline_ids))
+
+    while True:
+        with telemetry.stage('fetch'):
+            payload = next(payloads, None)
+        if payload is None:
+            break
+        (key, data) = payload
+        yield (key[len('cellline/'):], data)
+
+
 # -----------------------------------------------------------------------------
 # Make an API request and return JSON
 
@@ -192,16 +384,30 @@ def request_get(url):
 # -----------------------------------------------------------------------------
 # Check if the cell line exists on ECACC
 
-def check_availability_on_ecacc(cell_line):
+def check_availability_on_ecacc(source):
+
+    '''Whether ECACC lists the line of source, None for lines without an ECACC catalogue number yet (new lines).'''
+
+    ecacc_id = Cellline.objects.filter(biosamples_id=source.get('biosamples_id')).values_list('ecacc_id', flat=True).first()
+
+    if ecacc_id is None:
+        return None
+
+    cell_line = Cellline(name=source.get('name'), ecacc_id=ecacc_id)
+
+    def check():
+        r = requests.get(cell_line.ecacc_url)
+        # Highly suspect!!!
+        return r.status_code == requests.codes.ok and re.search(cell_line.name, r.text) is not None
+
+    return snapshot.remember('ecacc/%s' % cell_line.name, check)
 
-    r = requests.get(cell_line.ecacc_url)
 
-    # Highly suspect!!!
-    available = r.status_code == requests.codes.ok and re.search(cell_line.name, r.text) is not None
+def set_availability_on_ecacc(cell_line, available):
 
     # Change ECACC availability status only if line is available (temporary fix to prevent the Catalogue from being empty in case of ECACC unavailability)
 
-    if available is False:
+    if available is None or available is False:
         return False
     else:
         if available == cell_line.available_for_sale_at_ecacc:
@@ -2,6 +2,7 @@ import re
 import os
 import requests
 import functools
+from contextlib import contextmanager
 
 import logging
 logger = logging.getLogger('management.commands')
@@ -12,7 +13,11 @@ from django.core.files.temp import NamedTemporaryFile
 
 from django.db import IntegrityError
 
-from .utils import format_integrity_error
+from .utils import format_integrity_error, lock
+from . import snapshot
+from . import utils
+
+from ebisc.celllines.importer import telemetry, changes
 
 from ebisc.celllines.models import  \
     AgeRange,  \
@@ -63,80 +68,129 @@ def get_in_json(source, path):
             return get_in_json(source[path[0]], path[1:])
 
 
-def value_of_json(source, path, cast=None):
+# Fields are compiled once per (path, cast) into an extractor: the path is
+# resolved with one flat loop over its keys and the value is cast from that
+# single lookup. Missing paths give the default of the cast.
 
-    if cast == 'bool':
-        try:
-            if get_in_json(source, path) == '1':
-                return True
-            else:
-                return False
-        except KeyError:
-            return False
+def cast_bool(value, path):
+    return value == '1'
 
-    elif cast == 'nullbool':
-        try:
-            if get_in_json(source, path) == '1':
-                return True
-            elif get_in_json(source, path) == '0':
-                return False
-            else:
-                return None
-        except KeyError:
-            return None
 
-    elif cast == 'extended_bool':
-        try:
-            if get_in_json(source, path) == '1':
-                return 'yes'
-            elif get_in_json(source, path) == '0':
-                return 'no'
-            elif get_in_json(source, path) == 'unknown':
-                return 'unknown'
-            else:
-                return 'unknown'
-        except KeyError:
-            return None
+def cast_nullbool(value, path):
+    if value == '1':
+        return True
+    elif value == '0':
+        return False
+    else:
+        return None
 
-    elif cast == 'int':
-        try:
-            return int(get_in_json(source, path))
-        except KeyError:
-            return None
-        except:
-            logger.warn('Invalid field value for int: %s=%s' % (path, get_in_json(source, path)))
-            return None
 
-    elif cast == 'gender':
-        try:
-            return Gender.objects.get(name=get_in_json(source, path))
-        except KeyError:
-            return None
-        except Gender.DoesNotExist:
-            logger.warn('Invalid donor gender: %s' % get_in_json(source, path))
-            return None
+def cast_extended_bool(value, path):
+    if value == '1':
+        return 'yes'
+    elif value == '0':
+        return 'no'
+    else:
+        return 'unknown'
+
+
+def cast_int(value, path):
+    try:
+        return int(value)
+    except:
+        logger.warn('Invalid field value for int: %s=%s' % (path, value))
+        return None
 
-    elif cast == 'age_range':
-        try:
-            value = get_in_json(source, path)
-            if value == '---':
-                return None
-            return AgeRange.objects.get(name=value)
-        except KeyError:
-            return None
-        except AgeRange.DoesNotExist:
-            logger.warn('Invalid age range: %s' % get_in_json(source, path))
-            return None
 
+def cast_gender(value, path):
+    try:
+        return Gender.objects.get(name=value)
+    except Gender.DoesNotExist:
+        logger.warn('Invalid donor gender: %s' % value)
+        return None
+
+
+def cast_age_range(value, path):
+    if value == '---':
+        return None
+    try:
+        return AgeRange.objects.get(name=value)
+    except AgeRange.DoesNotExist:
+        logger.warn('Invalid age range: %s' % value)
+        return None
+
+
+def cast_string(value, path):
+    if isinstance(value, str) or isinstance(value, unicode):
+        return value.strip()
     else:
+        return value
+
+
+CASTS = {
+    None: (cast_string, None),
+    'bool': (cast_bool, False),
+    'nullbool': (cast_nullbool, None),
+    'extended_bool': (cast_extended_bool, None),
+    'int': (cast_int, None),
+    'gender': (cast_gender, None),
+    'age_range': (cast_age_range, None),
+}
+
+
+def field_key(path):
+    return path if isinstance(path, str) else tuple(path)
+
+
+compiled_fields = {}
+
+
+def compile_field(path, cast=None):
+
+    '''Return the extractor of path with cast, a function of the JSON object.'''
+
+    key = (field_key(path), cast)
+
+    if key not in compiled_fields:
+        keys = (path,) if isinstance(path, str) else tuple(path)
+        (convert, default) = CASTS[cast]
+
+        def extract(source):
+            try:
+                for k in keys:
+                    source = source[k]
+            except KeyError:
+                return default
+            return convert(source, path)
+
+        compiled_fields[key] = extract
+
+    return compiled_fields[key]
+
+
+def value_of_json(source, path, cast=None):
+    return compile_field(path, cast)(source)
+
+
+class Record(object):
+
+    '''
+    The values of one JSON object, called as valuef(path, cast=None). Each
+    field is extracted and cast once per object, however often the parsers
+    read it.
+    '''
+
+    def __init__(self, source):
+        self.source = source
+        self.values = {}
+
+    def __call__(self, path, cast=None):
+        key = (field_key(path), cast)
         try:
-            value = get_in_json(source, path)
-            if isinstance(value, str) or isinstance(value, unicode):
-                return value.strip()
-            else:
-                return value
+            return self.values[key]
         except KeyError:
-            return None
+            value = self.values[key] = compile_field(path, cast)(self.source)
+            return value
 
 
 def term_list_value_of_json(source, source_field, model, model_field='name'):
@@ -155,14 +209,19 @@ def term_list_value(value, model, model_field='name'):
     kwargs = {}
     kwargs[model_field] = value
 
-    value, created = model.objects.get_or_create(**kwargs)
+    value, created = utils.get_or_create(model, value, **kwargs)
 
     return value
 
 
 def inject_valuef(func):
+
+    '''Call func(valuef, source, *args); source can be a Record, so parsers of the same object share its values.'''
+
+    @functools.wraps(func)
     def wrapper(source, *args):
-        args = [functools.partial(value_of_json, source), source] + list(args)
+        record = source if isinstance(source, Record) else Record(source)
+        args = [record, record.source] + list(args)
         return func(*args)
     return wrapper
 
@@ -195,10 +254,23 @@ def value_of_file(source_file_link, source_file_name, file_field, current_enc=No
         # check if file exists on local disk
         if file_field:
             # file exists already
+            snapshot.store_file(source_file_link, file_field)
             return current_enc
         else:
             logger.warn('file missing on local disk')
 
+    if pending is not None:
+        # Stored after the line's transaction (see deferred_downloads)
+        pending.append((source_file_link, source_filename, file_field))
+        return source_enc
+
+    download_file(source_file_link, source_filename, file_field)
+
+    return source_enc
+
+
+def download_file(source_file_link, source_filename, file_field):
+
     if os.getenv("TOMCAT_URL"):
         server = os.getenv("TOMCAT_URL").split("/")[2].split(":")[0]
 
@@ -209,18 +281,60 @@ def value_of_file(source_file_link, source_file_name, file_field, current_enc=No
 
     logger.info('Fetching data file from %s' % source_file_link)
 
-    response = requests.get(source_file_link, stream=True, auth=(settings.HPSCREG.get('username'), settings.HPSCREG.get('password')))
+    with telemetry.stage('download'):
+        chunks = snapshot.file_chunks(source_file_link, lambda: requests.get(source_file_link, stream=True, auth=(settings.HPSCREG.get('username'), settings.HPSCREG.get('password'))).iter_content(10240))
 
-    with NamedTemporaryFile(delete=True) as f:
-        for chunk in response.iter_content(10240):
-            f.write(chunk)
+        with NamedTemporaryFile(delete=True) as f:
+            for chunk in chunks:
+                f.write(chunk)
 
-        f.seek(0)
-        file_field.save(source_filename, File(f), save=False)
-        file_field.instance.save()
+            f.seek(0)
+            file_field.save(source_filename, File(f), save=False)
+            changes.save(file_field.instance)
 
-        f.seek(0)
-        return source_enc
+
+# Files value_of_file() found changed while importing a line, None if they are downloaded right away
+pending = None
+
+
+class Downloads(list):
+
+    def run(self):
+
+        '''Download and store the files; return True if any was stored.'''
+
+        stored = False
+
+        for (source_file_link, source_filename, file_field) in self:
+            try:
+                download_file(source_file_link, source_filename, file_field)
+                stored = True
+            except Exception:
+                logger.exception('Failed to fetch data file %s' % source_file_link)
+                # The row already has the new enc, without a file the next import fetches it again
+                setattr(file_field.instance, file_field.field.name, None)
+                changes.save(file_field.instance)
+
+        return stored
+
+
+@contextmanager
+def deferred_downloads():
+
+    '''
+    Note the files value_of_file() has to fetch instead of downloading them,
+    so the caller can run() the downloads after the line's transaction
+    committed: the transaction holds its locks only while writing, and a line
+    rolled back leaves no files behind in MEDIA_ROOT.
+    '''
+
+    global pending
+
+    downloads = pending = Downloads()
+    try:
+        yield downloads
+    finally:
+        pending = None
 
 
 # -----------------------------------------------------------------------------
@@ -250,7 +364,8 @@ def parse_validation_status(valuef, source):
 # -----------------------------------------------------------------------------
 # Cell line diseases
 
-def parse_cell_line_diseases(source, cell_line):
+@inject_valuef
+def parse_cell_line_diseases(valuef, source, cell_line):
 
     cell_line_diseases_old = list(cell_line.diseases.all().order_by('id'))
     cell_line_diseases_old_ids = set([d.id for d in cell_line_diseases_old])
@@ -270,7 +385,7 @@ def parse_cell_line_diseases(source, cell_line):
 
     for cell_line_disease in [cd for cd in cell_line_diseases_old if cd.id in to_delete]:
         logger.info('Deleting obsolete cell line disease %s' % cell_line_disease)
-        cell_line_disease.delete()
+        changes.delete(cell_line_disease)
 
     # Check for changes (dirty)
 
@@ -349,7 +464,7 @@ def parse_cell_line_disease(valuef, source, cell_line):
 
             for disease_variant in [vd for vd in list_old if vd.modification_id in to_delete]:
                 logger.info('Deleting obsolete disease variant %s' % disease_variant)
-                disease_variant.delete()
+                changes.delete(disease_variant)
 
         if created:
             logger.info('Created new cell line disease: %s' % disease)
@@ -521,6 +636,12 @@ def parse_donor(valuef, source):
 
     gender = term_list_value(valuef('gender'), Gender)
 
+    # Lines of the same donor update it one after the other
+    lock(Donor, valuef('biosamples_id'))
+
+    recorded = changes.recorded()
+    saved = False
+
     try:
         donor = Donor.objects.get(biosamples_id=valuef('biosamples_id'))
 
@@ -544,7 +665,7 @@ def parse_donor(valuef, source):
         if True in dirty:
             logger.info('Updated donor: %s' % donor)
 
-            donor.save()
+            saved = changes.save(donor)
 
     except Donor.DoesNotExist:
         donor = Donor(
@@ -558,7 +679,7 @@ def parse_donor(valuef, source):
         )
 
         try:
-            donor.save()
+            changes.save(donor)
         except IntegrityError, e:
             logger.warn(format_integrity_error(e))
             return None
@@ -567,6 +688,10 @@ def parse_donor(valuef, source):
     parse_donor_diseases(source, donor)
     parse_donor_genome_analysis(source, donor)
 
+    # The donor's other lines show it too
+    if saved or changes.recorded() != recorded:
+        donor.bump_data_version()
+
     return donor
 
 
@@ -588,7 +713,7 @@ def parse_donor_relatives(source, donor):
 
     for donor_relative in [r for r in donor_relatives_old if r.related_donor.biosamples_id in to_delete]:
         logger.info('Deleting obsolete donor relative %s' % donor_relative)
-        donor_relative.delete()
+        changes.delete(donor_relative)
 
 
 @inject_valuef
@@ -641,7 +766,7 @@ def parse_donor_diseases(source, donor):
 
     for donor_disease in [cd for cd in donor_diseases_old if cd.id in to_delete]:
         logger.info('Deleting obsolete donor disease %s' % donor_disease)
-        donor_disease.delete()
+        changes.delete(donor_disease)
 
 
 @inject_valuef
@@ -686,7 +811,7 @@ def parse_donor_disease(valuef, source, donor):
 
         for disease_variant in [vd for vd in disease_variants_old if vd.variant_id in to_delete]:
             logger.info('Deleting obsolete donor disease variant %s' % disease_variant)
-            disease_variant.delete()
+            changes.delete(disease_variant)
 
         if created:
             logger.info('Created new donor disease: %s' % disease)
@@ -753,7 +878,8 @@ def parse_disease(valuef, source):
     else:
         synonyms = valuef('synonyms')
 
-    disease, created = Disease.objects.update_or_create(
+    disease, created = utils.update_or_create(
+        Disease, valuef('purl'),
         xpurl=valuef('purl'),
         defaults={
             'name': valuef('purl_name'),
@@ -817,7 +943,7 @@ def parse_genetic_modifications_non_disease(valuef, source, cell_line):
 
             for genetic_modification in [vd for vd in list_old if vd.modification_id in to_delete]:
                 logger.info('Deleting obsolete genetic modification %s' % genetic_modification)
-                genetic_modification.delete()
+                changes.delete(genetic_modification)
 
         if (list_new != list_old):
             return True
@@ -978,7 +1104,7 @@ def parse_organization(valuef, source):
 
     # Organization
 
-    organization, created = Organization.objects.get_or_create(name=valuef('name'))
+    organization, created = utils.get_or_create(Organization, valuef('name'), name=valuef('name'))
 
     if created:
         logger.info('Found new organization: %s' % organization)
@@ -991,7 +1117,7 @@ def parse_organization(valuef, source):
 
     else:
         # Other organization roles
-        organization_role, created = CelllineOrgType.objects.get_or_create(cell_line_org_type=valuef('role'))
+        organization_role, created = utils.get_or_create(CelllineOrgType, valuef('role'), cell_line_org_type=valuef('role'))
 
         if created:
             logger.info('Found new organization type: %s' % organization_role)
@@ -1060,7 +1186,7 @@ def get_or_create_molecule(name, kind, catalog, catalog_id):
             logger.warn('Invalid molecule catalog: %s' % catalog)
             raise InvalidMoleculeDataException
 
-    molecule, created = Molecule.objects.get_or_create(name=name, kind=kind)
+    molecule, created = utils.get_or_create(Molecule, '%s:%s' % (kind, name), name=name, kind=kind)
 
     if created:
         logger.info('Created new molecule: %s' % molecule)
@@ -1144,7 +1270,7 @@ def parse_culture_conditions(valuef, source, cell_line):
             else:
                 for supplement_name in old_supplements:
                     s = CelllineCultureMediumSupplement.objects.get(cell_line_culture_conditions=cell_line_culture_conditions, supplement=supplement_name)
-                    s.delete()
+                    changes.delete(s)
                     dirty_supplements += [True]
 
         else:
@@ -1160,7 +1286,7 @@ def parse_culture_conditions(valuef, source, cell_line):
             # Delete old supplements that are not in new supplements
             for supplement_name in (old_supplements - new_supplements):
                 s = CelllineCultureMediumSupplement.objects.get(cell_line_culture_conditions=cell_line_culture_conditions, supplement=supplement_name)
-                s.delete()
+                changes.delete(s)
                 dirty_supplements += [True]
 
             for supplement in supplements:
@@ -1168,12 +1294,12 @@ def parse_culture_conditions(valuef, source, cell_line):
 
                 # Add new supplements
                 if supplement_name in (new_supplements - old_supplements):
-                    CelllineCultureMediumSupplement(
+                    changes.save(CelllineCultureMediumSupplement(
                         cell_line_culture_conditions=cell_line_culture_conditions,
                         supplement=supplement_name,
                         amount=amount,
                         unit=term_list_value(unit, Unit),
-                    ).save()
+                    ))
                     dirty_supplements += [True]
 
                 # Modify existing if data has changed
@@ -1183,7 +1309,7 @@ def parse_culture_conditions(valuef, source, cell_line):
                     cell_line_culture_medium_supplement.unit = term_list_value(unit, Unit)
 
                     if cell_line_culture_medium_supplement.is_dirty():
-                        cell_line_culture_medium_supplement.save()
+                        changes.save(cell_line_culture_medium_supplement)
                         dirty_supplements += [True]
 
         return dirty_supplements
@@ -1209,7 +1335,7 @@ def parse_culture_conditions(valuef, source, cell_line):
         cell_line_culture_medium_other.serum_concentration = valuef('culture_conditions_medium_culture_medium_other_concentration', 'int')
 
         if created or cell_line_culture_medium_other.is_dirty():
-            cell_line_culture_medium_other.save()
+            changes.save(cell_line_culture_medium_other)
             dirty += [True]
 
         # Culture medium supplements
@@ -1221,7 +1347,7 @@ def parse_culture_conditions(valuef, source, cell_line):
         else:
             logger.info('Updated cell line culture conditions: %s' % cell_line_culture_conditions)
 
-        cell_line_culture_conditions.save()
+        changes.save(cell_line_culture_conditions)
 
         return True
 
@@ -1251,7 +1377,7 @@ def parse_donor_genome_analysis(valuef, source, donor):
 
         for genome_analysis in [ga for ga in donor_genome_analysis_old if ga.id in to_delete]:
             logger.info('Deleting obsolete donor genome analysis %s' % genome_analysis)
-            genome_analysis.delete()
+            changes.delete(genome_analysis)
 
 
 @inject_valuef
@@ -1295,7 +1421,7 @@ def parse_donor_genome_analysis_item(valuef, source, donor):
         for donor_genome_analysis_file in [f for f in donor_genome_analysis_files_old if f.vcf_file_enc in to_delete]:
             logger.info('Deleting obsolete donor genome analysis file %s' % donor_genome_analysis_file)
             donor_genome_analysis_file.vcf_file.delete()
-            donor_genome_analysis_file.delete()
+            changes.delete(donor_genome_analysis_file)
 
         if created or donor_genome_analysis.is_dirty():
             if created:
@@ -1303,7 +1429,7 @@ def parse_donor_genome_analysis_item(valuef, source, donor):
             else:
                 logger.info('Updated donor genome analysis')
 
-            donor_genome_analysis.save()
+            changes.save(donor_genome_analysis)
 
         return donor_genome_analysis
 
@@ -1322,7 +1448,7 @@ def parse_donor_genome_analysis_file(valuef, source, genome_analysis):
     genome_analysis_file.vcf_file_enc = value_of_file(valuef('url'), valuef('filename'), genome_analysis_file.vcf_file, genome_analysis_file.vcf_file_enc)
 
     genome_analysis_file.vcf_file_description = valuef('description')
-    genome_analysis_file.save()
+    changes.save(genome_analysis_file)
 
     return genome_analysis_file.vcf_file_enc
 
@@ -1339,7 +1465,7 @@ def parse_publications(valuef, source, cell_line):
         cell_line_publication.reference_title = valuef('registration_reference')
 
         if created or cell_line_publication.is_dirty():
-            cell_line_publication.save()
+            changes.save(cell_line_publication)
             return True
 
         return False
@@ -1348,7 +1474,7 @@ def parse_publications(valuef, source, cell_line):
 
         if CelllinePublication.objects.filter(cell_line=cell_line):
             cell_line_publication = CelllinePublication.objects.get(cell_line=cell_line)
-            cell_line_publication.delete()
+            changes.delete(cell_line_publication)
             return True
 
         else:
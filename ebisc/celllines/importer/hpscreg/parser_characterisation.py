@@ -3,6 +3,8 @@ logger = logging.getLogger('management.commands')
 
 from .parser import inject_valuef, value_of_file
 
+from ebisc.celllines.importer import changes
+
 from ebisc.celllines.models import \
     CelllineCharacterization, \
     CelllineCharacterizationMarkerExpression, \
@@ -59,7 +61,7 @@ def parse_characterization(valuef, source, cell_line):
         else:
             logger.info('Updated cell line characterization: %s' % cell_line_characterization)
 
-        cell_line_characterization.save()
+        changes.save(cell_line_characterization)
 
         return True
 
@@ -99,7 +101,7 @@ def parse_characterization_pluritest(valuef, source, cell_line):
         for characterization_pluritest_file in [f for f in characterization_pluritest_files_old if f.file_enc in to_delete]:
             logger.info('Deleting obsolete pluritest file %s' % characterization_pluritest_file)
             characterization_pluritest_file.file_doc.delete()
-            characterization_pluritest_file.delete()
+            changes.delete(characterization_pluritest_file)
 
         if created or cell_line_characterization_pluritest.is_dirty():
             if created:
@@ -107,7 +109,7 @@ def parse_characterization_pluritest(valuef, source, cell_line):
             else:
                 logger.info('Updated cell line characterization pluritest: %s' % cell_line_characterization_pluritest)
 
-            cell_line_characterization_pluritest.save()
+            changes.save(cell_line_characterization_pluritest)
 
             return True
 
@@ -116,7 +118,7 @@ def parse_characterization_pluritest(valuef, source, cell_line):
     else:
         try:
             p = CelllineCharacterizationPluritest.objects.get(cell_line=cell_line)
-            p.delete()
+            changes.delete(p)
             return True
 
         except CelllineCharacterizationPluritest.DoesNotExist:
@@ -139,7 +141,7 @@ def parse_characterization_pluritest_file(valuef, source, characterization_pluri
     characterization_pluritest_file.file_enc = value_of_file(valuef('url'), valuef('filename'), characterization_pluritest_file.file_doc, current_enc)
 
     characterization_pluritest_file.file_description = valuef('description')
-    characterization_pluritest_file.save()
+    changes.save(characterization_pluritest_file)
 
     return characterization_pluritest_file.file_enc
 
@@ -192,7 +194,7 @@ def parse_characterization_epipluriscore(valuef, source, cell_line):
         for characterization_epipluriscore_file in [f for f in characterization_epipluriscore_files_old if f.file_enc in to_delete]:
             logger.info('Deleting obsolete epipluriscore file %s' % characterization_epipluriscore_file)
             characterization_epipluriscore_file.file_doc.delete()
-            characterization_epipluriscore_file.delete()
+            changes.delete(characterization_epipluriscore_file)
 
         if created or cell_line_characterization_epipluriscore.is_dirty():
             if created:
@@ -200,7 +202,7 @@ def parse_characterization_epipluriscore(valuef, source, cell_line):
             else:
                 logger.info('Updated cell line characterization EpiPluriScore: %s' % cell_line_characterization_epipluriscore)
 
-            cell_line_characterization_epipluriscore.save()
+            changes.save(cell_line_characterization_epipluriscore)
 
             return True
 
@@ -209,7 +211,7 @@ def parse_characterization_epipluriscore(valuef, source, cell_line):
     else:
         try:
             p = CelllineCharacterizationEpipluriscore.objects.get(cell_line=cell_line)
-            p.delete()
+            changes.delete(p)
             return True
 
         except CelllineCharacterizationEpipluriscore.DoesNotExist:
@@ -232,7 +234,7 @@ def parse_characterization_epipluriscore_file(valuef, source, characterization_e
     characterization_epipluriscore_file.file_enc = value_of_file(valuef('url'), valuef('filename'), characterization_epipluriscore_file.file_doc, current_enc)
 
     characterization_epipluriscore_file.file_description = valuef('description')
-    characterization_epipluriscore_file.save()
+    changes.save(characterization_epipluriscore_file)
 
     return characterization_epipluriscore_file.file_enc
 
@@ -266,7 +268,7 @@ def parse_characterization_undiff_morphology(valuef, source, cell_line):
         for characterization_undiff_morphology_file in [f for f in characterization_undiff_morphology_files_old if f.file_enc in to_delete]:
             logger.info('Deleting obsolete undiff morphology file %s' % characterization_undiff_morphology_file)
             characterization_undiff_morphology_file.file_doc.delete()
-            characterization_undiff_morphology_file.delete()
+            changes.delete(characterization_undiff_morphology_file)
 
         if characterization_undiff_morphology_files_old_encs != characterization_undiff_morphology_files_new_encs:
             logger.info('Updated cell line characterization morphology')
@@ -291,7 +293,7 @@ def parse_characterization_undiff_morphology_file(valuef, source, cell_line):
     characterization_undiff_morphology_file.file_enc = value_of_file(valuef('url'), valuef('filename'), characterization_undiff_morphology_file.file_doc, current_enc)
 
     characterization_undiff_morphology_file.file_description = valuef('description')
-    characterization_undiff_morphology_file.save()
+    changes.save(characterization_undiff_morphology_file)
 
     return characterization_undiff_morphology_file.file_enc
 
@@ -375,7 +377,7 @@ def parse_characterization_hpscscorecard(valuef, source, cell_line):
         for characterization_hpscscorecard_file in [f for f in characterization_hpscscorecard_files_old if f.file_enc in to_delete]:
             logger.info('Deleting obsolete hPSC Scorecard data file %s' % characterization_hpscscorecard_file)
             characterization_hpscscorecard_file.file_doc.delete()
-            characterization_hpscscorecard_file.delete()
+            changes.delete(characterization_hpscscorecard_file)
 
         # hPSC Scorecards files
         to_delete = characterization_hpscscorecard_cards_old_encs - characterization_hpscscorecard_cards_new_encs
@@ -383,7 +385,7 @@ def parse_characterization_hpscscorecard(valuef, source, cell_line):
         for characterization_hpscscorecard_card in [f for f in characterization_hpscscorecard_cards_old if f.file_enc in to_delete]:
             logger.info('Deleting obsolete hPSC Scorecard %s' % characterization_hpscscorecard_card)
             characterization_hpscscorecard_card.file_doc.delete()
-            characterization_hpscscorecard_card.delete()
+            changes.delete(characterization_hpscscorecard_card)
 
         # Save
 
@@ -393,7 +395,7 @@ def parse_characterization_hpscscorecard(valuef, source, cell_line):
             else:
                 logger.info('Updated cell line characterization hPSC Scorecard: %s' % cell_line_characterization_hpscscorecard)
 
-            cell_line_characterization_hpscscorecard.save()
+            changes.save(cell_line_characterization_hpscscorecard)
 
             return True
 
@@ -402,7 +404,7 @@ def parse_characterization_hpscscorecard(valuef, source, cell_line):
     else:
         try:
             p = CelllineCharacterizationHpscScorecard.objects.get(cell_line=cell_line)
-            p.delete()
+            changes.delete(p)
             return True
 
         except CelllineCharacterizationHpscScorecard.DoesNotExist:
@@ -425,7 +427,7 @@ def parse_characterization_hpscscorecard_file(valuef, source, characterization_h
     characterization_hpscscorecard_file.file_enc = value_of_file(valuef('url'), valuef('filename'), characterization_hpscscorecard_file.file_doc, current_enc)
 
     characterization_hpscscorecard_file.file_description = valuef('description')
-    characterization_hpscscorecard_file.save()
+    changes.save(characterization_hpscscorecard_file)
 
     return characterization_hpscscorecard_file.file_enc
 
@@ -446,7 +448,7 @@ def parse_characterization_hpscscorecard_card(valuef, source, characterization_h
     characterization_hpscscorecard_card.file_enc = value_of_file(valuef('url'), valuef('filename'), characterization_hpscscorecard_card.file_doc, current_enc)
 
     characterization_hpscscorecard_card.file_description = valuef('description')
-    characterization_hpscscorecard_card.save()
+    changes.save(characterization_hpscscorecard_card)
 
     return characterization_hpscscorecard_card.file_enc
 
@@ -472,7 +474,7 @@ def parse_characterization_marker_expression(valuef, source, cell_line):
 
     for cell_line_marker_expression in [me for me in cell_line_marker_expressions_old if me.marker_id in to_delete]:
         logger.info('Deleting obsolete cell line marker expression %s' % cell_line_marker_expression)
-        cell_line_marker_expression.delete()
+        changes.delete(cell_line_marker_expression)
 
     # Check for changes (dirty)
 
@@ -535,7 +537,7 @@ def parse_marker_expression(valuef, source, cell_line):
 
         for marker_expression_method in [m for m in list_old if m.id in to_delete]:
             logger.info('Deleting obsolete marker expression method %s' % marker_expression_method)
-            marker_expression_method.delete()
+            changes.delete(marker_expression_method)
 
         if created:
             logger.info('Created new cell line marker expression: %s' % cell_line_marker_expression)
@@ -578,7 +580,7 @@ def parse_marker_expression_method(valuef, source, cell_line_marker_expression):
         for method_file in [f for f in method_files_old if f.file_enc in to_delete]:
             logger.info('Deleting obsolete marker method file %s' % method_file)
             method_file.file_doc.delete()
-            method_file.delete()
+            changes.delete(method_file)
 
         if created:
             logger.info('Created new cell line marker expression method: %s' % cell_line_marker_expression_method)
@@ -605,7 +607,7 @@ def parse_marker_expression_method_file(valuef, source, cell_line_marker_express
     marker_method_file.file_enc = value_of_file(valuef('url'), valuef('filename'), marker_method_file.file_doc, current_enc)
 
     marker_method_file.file_description = valuef('description')
-    marker_method_file.save()
+    changes.save(marker_method_file)
 
     return marker_method_file.file_enc
 
@@ -630,7 +632,7 @@ def parse_characterization_rna_sequencing(valuef, source, cell_line):
                 else:
                     logger.info('Updated cell line RNA sequencing link')
 
-                cell_line_characterization_rna_sequencing.save()
+                changes.save(cell_line_characterization_rna_sequencing)
 
                 return True
 
@@ -640,7 +642,7 @@ def parse_characterization_rna_sequencing(valuef, source, cell_line):
         else:
             try:
                 rs = CelllineCharacterizationRNASequencing.objects.get(cell_line=cell_line)
-                rs.delete()
+                changes.delete(rs)
 
                 logger.info('Deleting cell line RNA sequencing link')
                 return True
@@ -651,7 +653,7 @@ def parse_characterization_rna_sequencing(valuef, source, cell_line):
     else:
         try:
             rs = CelllineCharacterizationRNASequencing.objects.get(cell_line=cell_line)
-            rs.delete()
+            changes.delete(rs)
 
             logger.info('Deleting cell line RNA sequencing link')
             return True
@@ -680,7 +682,7 @@ def parse_characterization_gene_expression_array(valuef, source, cell_line):
                 else:
                     logger.info('Updated cell line Gene Expression Array link')
 
-                cell_line_characterization_gene_expression_array.save()
+                changes.save(cell_line_characterization_gene_expression_array)
 
                 return True
 
@@ -690,7 +692,7 @@ def parse_characterization_gene_expression_array(valuef, source, cell_line):
         else:
             try:
                 gea = CelllineCharacterizationGeneExpressionArray.objects.get(cell_line=cell_line)
-                gea.delete()
+                changes.delete(gea)
 
                 logger.info('Deleting cell line Gene Expression Array link')
                 return True
@@ -701,7 +703,7 @@ def parse_characterization_gene_expression_array(valuef, source, cell_line):
     else:
         try:
             gea = CelllineCharacterizationGeneExpressionArray.objects.get(cell_line=cell_line)
-            gea.delete()
+            changes.delete(gea)
 
             logger.info('Deleting cell line Gene Expression Array link')
             return True
@@ -743,12 +745,12 @@ def parse_characterization_differentiation_potency(valuef, source, cell_line):
 
                 for cell_type_deleted in [ct for ct in cell_types_old if ct.name in to_delete]:
                     logger.info('Deleting obsolete cell line differentation potency cell type %s' % cell_type_deleted)
-                    cell_type_deleted.delete()
+                    changes.delete(cell_type_deleted)
 
         else:
             try:
                 d = CelllineCharacterizationDifferentiationPotency.objects.get(cell_line=cell_line, germ_layer=data[0])
-                d.delete()
+                changes.delete(d)
 
                 logger.info('Deleted cell line Differentiation potency %s' % (data[0],))
                 dirty = True
@@ -798,7 +800,7 @@ def parse_characterization_differentiation_potency_cell_type(valuef, source, ger
 
     for marker_deleted in [m for m in markers_old if m.name in to_delete]:
         logger.info('Deleting obsolete cell line differentation potency marker %s' % marker_deleted)
-        marker_deleted.delete()
+        changes.delete(marker_deleted)
 
     # Parse Morphology files and save them
 
@@ -821,7 +823,7 @@ def parse_characterization_differentiation_potency_cell_type(valuef, source, ger
     for cell_type_morphology_file in [f for f in cell_type_morphology_files_old if f.file_enc in to_delete]:
         logger.info('Deleting obsolete diff potency morphology file %s' % cell_type_morphology_file)
         cell_type_morphology_file.file_doc.delete()
-        cell_type_morphology_file.delete()
+        changes.delete(cell_type_morphology_file)
 
     # Parse Protocol files and save them
 
@@ -844,7 +846,7 @@ def parse_characterization_differentiation_potency_cell_type(valuef, source, ger
     for cell_type_protocol_file in [f for f in cell_type_protocol_files_old if f.file_enc in to_delete]:
         logger.info('Deleting obsolete diff potency protocol file %s' % cell_type_protocol_file)
         cell_type_protocol_file.file_doc.delete()
-        cell_type_protocol_file.delete()
+        changes.delete(cell_type_protocol_file)
 
     # Check if dirty and save
 
@@ -854,7 +856,7 @@ def parse_characterization_differentiation_potency_cell_type(valuef, source, ger
         else:
             logger.info('Updated cell line Differentiation potency cell type')
 
-        cell_type.save()
+        changes.save(cell_type)
 
     return cell_type
 
@@ -875,7 +877,7 @@ def parse_characterization_differentiation_potency_cell_type_morphology_file(val
     cell_type_morphology_file.file_enc = value_of_file(valuef('url'), valuef('filename'), cell_type_morphology_file.file_doc, current_enc)
 
     cell_type_morphology_file.file_description = valuef('description')
-    cell_type_morphology_file.save()
+    changes.save(cell_type_morphology_file)
 
     return cell_type_morphology_file.file_enc
 
@@ -896,7 +898,7 @@ def parse_characterization_differentiation_potency_cell_type_protocol_file(value
     cell_type_protocol_file.file_enc = value_of_file(valuef('url'), valuef('filename'), cell_type_protocol_file.file_doc, current_enc)
 
     cell_type_protocol_file.file_description = valuef('description')
-    cell_type_protocol_file.save()
+    changes.save(cell_type_protocol_file)
 
     return cell_type_protocol_file.file_enc
 
@@ -926,6 +928,6 @@ def parse_characterization_differentiation_potency_cell_type_marker(valuef, sour
         else:
             logger.info('Updated cell line Differentiation potency cell type marker')
 
-        marker.save()
+        changes.save(marker)
 
     return marker
@@ -5,9 +5,12 @@ logger = logging.getLogger('management.commands')
 from django.db import IntegrityError
 
 from .utils import format_integrity_error
+from . import utils
 
 from .parser import inject_valuef, value_of_file, term_list_value_of_json, parse_molecule
 
+from ebisc.celllines.importer import changes
+
 from ebisc.celllines.models import \
     Virus,  \
     Transposon,  \
@@ -30,7 +33,7 @@ def parse_reprogramming_vector(valuef, source, cell_line):
     if valuef('vector_type') == 'Integrating':
         try:
             v = CelllineNonIntegratingVector.objects.get(cell_line=cell_line)
-            v.delete()
+            changes.delete(v)
             return True
         except CelllineNonIntegratingVector.DoesNotExist:
             pass
@@ -39,7 +42,7 @@ def parse_reprogramming_vector(valuef, source, cell_line):
     elif valuef('vector_type') == 'Non-integrating':
         try:
             v = CelllineIntegratingVector.objects.get(cell_line=cell_line)
-            v.delete()
+            changes.delete(v)
             return True
         except CelllineIntegratingVector.DoesNotExist:
             pass
@@ -64,7 +67,7 @@ def parse_integrating_vector(valuef, source, cell_line):
         logger.warn('Missing name for integrating reprogramming vector')
         return False
 
-    vector, vector_created = IntegratingVector.objects.get_or_create(name=vector_name)
+    vector, vector_created = utils.get_or_create(IntegratingVector, vector_name, name=vector_name)
 
     if vector_created:
         logger.info('Added integrating vector: %s' % vector)
@@ -82,7 +85,7 @@ def parse_integrating_vector(valuef, source, cell_line):
     cell_line_integrating_vector.methods = valuef('reprogramming_vector_integrating_method')
     cell_line_integrating_vector.silenced_notes = valuef('reprogramming_vector_integrating_silencing_notes')
 
-    cell_line_integrating_vector.save()
+    changes.save(cell_line_integrating_vector)
 
     # Parse expressed, silenced detection file
     if cell_line_integrating_vector.expressed_silenced_file_enc:
@@ -94,7 +97,7 @@ def parse_integrating_vector(valuef, source, cell_line):
     if valuef('reprogramming_vector_integrating_silencing_file'):
         cell_line_integrating_vector.expressed_silenced_file_enc = value_of_file(valuef('reprogramming_vector_integrating_silencing_file_enc'), valuef('reprogramming_vector_integrating_silencing_file'), cell_line_integrating_vector.expressed_silenced_file, expressed_silenced_file_current_enc)
 
-        cell_line_integrating_vector.save()
+        changes.save(cell_line_integrating_vector)
 
     # Delete old file if it is no longer in the export
     elif cell_line_integrating_vector.expressed_silenced_file_enc:
@@ -112,7 +115,7 @@ def parse_integrating_vector(valuef, source, cell_line):
     if valuef('vector_map_file_enc'):
         cell_line_integrating_vector.vector_map_file_enc = value_of_file(valuef('vector_map_file_enc'), valuef('vector_map_file'), cell_line_integrating_vector.vector_map_file, vector_map_file_current_enc)
 
-        cell_line_integrating_vector.save()
+        changes.save(cell_line_integrating_vector)
 
     # Delete old file if it is no longer in the export
     elif cell_line_integrating_vector.vector_map_file_enc:
@@ -131,7 +134,7 @@ def parse_integrating_vector(valuef, source, cell_line):
         else:
             logger.info('Updated integrating vector: %s to cell line %s' % (vector, cell_line))
 
-        cell_line_integrating_vector.save()
+        changes.save(cell_line_integrating_vector)
 
         return True
 
@@ -153,7 +156,7 @@ def parse_non_integrating_vector(valuef, source, cell_line):
         logger.warn('Missing name for non integrating reprogramming vector')
         return False
 
-    vector, vector_created = NonIntegratingVector.objects.get_or_create(name=vector_name)
+    vector, vector_created = utils.get_or_create(NonIntegratingVector, vector_name, name=vector_name)
 
     if vector_created:
         logger.info('Added non-integrating vector: %s' % vector)
@@ -182,7 +185,7 @@ def parse_non_integrating_vector(valuef, source, cell_line):
     if valuef('reprogramming_vector_non_integrating_detection_file_enc'):
         cell_line_non_integrating_vector.expressed_silenced_file_enc = value_of_file(valuef('reprogramming_vector_non_integrating_detection_file_enc'), valuef('reprogramming_vector_non_integrating_detection_file'), cell_line_non_integrating_vector.expressed_silenced_file, expressed_silenced_file_current_enc)
 
-        cell_line_non_integrating_vector.save()
+        changes.save(cell_line_non_integrating_vector)
 
     # Delete old file if it is no longer in the export
     elif cell_line_non_integrating_vector.expressed_silenced_file_enc:
@@ -200,7 +203,7 @@ def parse_non_integrating_vector(valuef, source, cell_line):
     if valuef('vector_map_file_enc'):
         cell_line_non_integrating_vector.vector_map_file_enc = value_of_file(valuef('vector_map_file_enc'), valuef('vector_map_file'), cell_line_non_integrating_vector.vector_map_file, vector_map_file_current_enc)
 
-        cell_line_non_integrating_vector.save()
+        changes.save(cell_line_non_integrating_vector)
 
     # Delete old file if it is no longer in the export
     elif cell_line_non_integrating_vector.vector_map_file_enc:
@@ -214,7 +217,7 @@ def parse_non_integrating_vector(valuef, source, cell_line):
         else:
             logger.info('Updated non-integrationg vector %s to cell line %s' % (vector, cell_line))
 
-        cell_line_non_integrating_vector.save()
+        changes.save(cell_line_non_integrating_vector)
 
         return True
 
@@ -223,7 +226,7 @@ def parse_non_integrating_vector(valuef, source, cell_line):
 
 def parse_reprogramming_factor(factor):
 
-    factor, created = VectorFreeReprogrammingFactor.objects.get_or_create(name=factor)
+    factor, created = utils.get_or_create(VectorFreeReprogrammingFactor, factor, name=factor)
 
     if created:
         logger.info('Created new vector free reprogramming factor: %s' % factor)
@@ -261,7 +264,7 @@ def parse_vector_free_reprogramming_factors(valuef, source, cell_line):
 
     for factor in [f for f in cell_line.derivation_vector_free_reprogramming_factors.all() if f.id in to_delete]:
         logger.info('Deleting obsolete vector free reprogramming factor %s' % factor)
-        factor.delete()
+        changes.delete(factor)
 
     # Check if dirty
     if reprogramming_factors_old_ids != reprogramming_factors_new_ids:
@@ -315,11 +318,11 @@ def parse_vector_free_reprogramming_factor(valuef, source, cell_line, vector_fre
 
         for molecule in [m for m in cell_line_vector_free_reprogramming_factor.reprogramming_factor_molecules.all() if m.name in to_delete]:
             logger.info('Deleting obsolete vector free reprogramming molecule %s' % molecule)
-            molecule.delete()
+            changes.delete(molecule)
 
         if cell_line_vector_free_reprogramming_factor.is_dirty(check_relationship=True) or cell_line_vector_free_reprogramming_factor_created:
             try:
-                cell_line_vector_free_reprogramming_factor.save()
+                changes.save(cell_line_vector_free_reprogramming_factor)
 
                 if cell_line_vector_free_reprogramming_factor_created:
                     logger.info('Added cell line vector free reprogramming factor: %s' % cell_line_vector_free_reprogramming_factor)
@@ -352,7 +355,8 @@ def parse_cell_type(valuef, source):
         return
 
     try:
-        cell_type, created = CellType.objects.update_or_create(
+        cell_type, created = utils.update_or_create(
+            CellType, value,
             name=value,
             defaults={
                 'purl': valuef('primary_celltype_ont_id'),
@@ -389,7 +393,7 @@ def parse_derivation(valuef, source, cell_line):
 
     if cell_line_derivation_created or cell_line_derivation.is_dirty(check_relationship=True):
         try:
-            cell_line_derivation.save()
+            changes.save(cell_line_derivation)
 
             if cell_line_derivation_created:
                 logger.info('Added cell line derivation: %s' % cell_line_derivation)
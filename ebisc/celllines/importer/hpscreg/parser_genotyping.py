@@ -3,6 +3,8 @@ logger = logging.getLogger('management.commands')
 
 from .parser import inject_valuef, value_of_file
 
+from ebisc.celllines.importer import changes
+
 from ebisc.celllines.models import  \
     CelllineKaryotype,  \
     CelllineHlaTyping, \
@@ -55,7 +57,7 @@ def parse_karyotyping(valuef, source, cell_line):
                 else:
                     logger.info('Updated cell line karyotype: %s' % cell_line_karyotype)
 
-                cell_line_karyotype.save()
+                changes.save(cell_line_karyotype)
 
                 return True
 
@@ -76,7 +78,7 @@ def parse_hla_typing(valuef, source, cell_line):
             hla_typing.hla_allele_2 = valuef('hla_i_a_all2')
 
             if hla_typing_created or hla_typing.is_dirty():
-                hla_typing.save()
+                changes.save(hla_typing)
                 dirty += [True]
 
         if valuef('hla_i_b_all1') or valuef('hla_i_b_all2'):
@@ -86,7 +88,7 @@ def parse_hla_typing(valuef, source, cell_line):
             hla_typing.hla_allele_2 = valuef('hla_i_b_all2')
 
             if hla_typing_created or hla_typing.is_dirty():
-                hla_typing.save()
+                changes.save(hla_typing)
                 dirty += [True]
 
         if valuef('hla_i_c_all1') or valuef('hla_i_c_all2'):
@@ -96,7 +98,7 @@ def parse_hla_typing(valuef, source, cell_line):
             hla_typing.hla_allele_2 = valuef('hla_i_c_all2')
 
             if hla_typing_created or hla_typing.is_dirty():
-                hla_typing.save()
+                changes.save(hla_typing)
                 dirty += [True]
 
         if valuef('hla_ii_dp_all1') or valuef('hla_ii_dp_all2'):
@@ -106,7 +108,7 @@ def parse_hla_typing(valuef, source, cell_line):
             hla_typing.hla_allele_2 = valuef('hla_ii_dp_all2')
 
             if hla_typing_created or hla_typing.is_dirty():
-                hla_typing.save()
+                changes.save(hla_typing)
                 dirty += [True]
 
         if valuef('hla_ii_dm_all1') or valuef('hla_ii_dm_all2'):
@@ -116,7 +118,7 @@ def parse_hla_typing(valuef, source, cell_line):
             hla_typing.hla_allele_2 = valuef('hla_ii_dm_all2')
 
             if hla_typing_created or hla_typing.is_dirty():
-                hla_typing.save()
+                changes.save(hla_typing)
                 dirty += [True]
 
         if valuef('hla_ii_doa_all1') or valuef('hla_ii_doa_all2'):
@@ -126,7 +128,7 @@ def parse_hla_typing(valuef, source, cell_line):
             hla_typing.hla_allele_2 = valuef('hla_ii_doa_all2')
 
             if hla_typing_created or hla_typing.is_dirty():
-                hla_typing.save()
+                changes.save(hla_typing)
                 dirty += [True]
 
         if valuef('hla_ii_dq_all1') or valuef('hla_ii_dq_all2'):
@@ -136,7 +138,7 @@ def parse_hla_typing(valuef, source, cell_line):
             hla_typing.hla_allele_2 = valuef('hla_ii_dq_all2')
 
             if hla_typing_created or hla_typing.is_dirty():
-                hla_typing.save()
+                changes.save(hla_typing)
                 dirty += [True]
 
         if valuef('hla_ii_dr_all1') or valuef('hla_ii_dr_all2'):
@@ -146,7 +148,7 @@ def parse_hla_typing(valuef, source, cell_line):
             hla_typing.hla_allele_2 = valuef('hla_ii_dr_all2')
 
             if hla_typing_created or hla_typing.is_dirty():
-                hla_typing.save()
+                changes.save(hla_typing)
                 dirty += [True]
 
 
@@ -170,7 +172,7 @@ def parse_str_fingerprinting(valuef, source, cell_line):
                 str_fingerprinting.allele2 = allele2
 
                 if str_fingerprinting_created or str_fingerprinting.is_dirty():
-                    str_fingerprinting.save()
+                    changes.save(str_fingerprinting)
 
                     dirty += [True]
 
@@ -205,7 +207,7 @@ def parse_genome_analysis(valuef, source, cell_line):
 
         for genome_analysis in [ga for ga in cell_line_genome_analysis_old if ga.id in to_delete]:
             logger.info('Deleting obsolete genome analysis %s' % genome_analysis)
-            genome_analysis.delete()
+            changes.delete(genome_analysis)
 
 
 @inject_valuef
@@ -249,7 +251,7 @@ def parse_genome_analysis_item(valuef, source, cell_line):
         for genome_analysis_file in [f for f in genome_analysis_files_old if f.vcf_file_enc in to_delete]:
             logger.info('Deleting obsolete genome analysis file %s' % genome_analysis_file)
             genome_analysis_file.vcf_file.delete()
-            genome_analysis_file.delete()
+            changes.delete(genome_analysis_file)
 
         if created or cell_line_genome_analysis.is_dirty():
             if created:
@@ -257,7 +259,7 @@ def parse_genome_analysis_item(valuef, source, cell_line):
             else:
                 logger.info('Updated cell line genome analysis')
 
-            cell_line_genome_analysis.save()
+            changes.save(cell_line_genome_analysis)
 
         return cell_line_genome_analysis
 
@@ -276,6 +278,6 @@ def parse_genome_analysis_file(valuef, source, genome_analysis):
     genome_analysis_file.vcf_file_enc = value_of_file(valuef('url'), valuef('filename'), genome_analysis_file.vcf_file, genome_analysis_file.vcf_file_enc)
 
     genome_analysis_file.vcf_file_description = valuef('description')
-    genome_analysis_file.save()
+    changes.save(genome_analysis_file)
 
     return genome_analysis_file.vcf_file_enc
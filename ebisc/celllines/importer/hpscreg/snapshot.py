@@ -0,0 +1,210 @@
+import json
+import zipfile
+import urlparse
+import multiprocessing
+from contextlib import contextmanager
+
+import logging
+logger = logging.getLogger('management.commands')
+
+
+'''
+Snapshot archives of hPSCreg imports.
+
+While recording, everything the importer fetches (the line list, the line
+payloads, the ECACC availability checks and the referenced data files) is
+written to a compressed zip archive. Replaying an archive runs the import
+from it without any network access: deterministic imports for benchmarks
+and fast re-imports, e.g. after schema migrations.
+
+The importer fetches through remember() and file_chunks(); with no
+snapshot open they just call the given function.
+'''
+
+
+class SnapshotError(Exception):
+    pass
+
+
+# -----------------------------------------------------------------------------
+# Archives
+
+def json_name(key):
+    return 'json/%s.json' % key
+
+
+def file_name(url):
+    # The path identifies a file, the host differs between hPSCreg and local Tomcat
+    return 'files/%s' % urlparse.urlparse(url).path.lstrip('/')
+
+
+class Recorder(object):
+
+    replaying = False
+
+    def __init__(self, path):
+        self.archive = zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED, allowZip64=True)
+        self.names = set()
+
+    def write(self, name, data):
+        if name not in self.names:
+            self.names.add(name)
+            self.archive.writestr(name, data)
+
+    def remember(self, key, fetch):
+        value = fetch()
+        self.write(json_name(key), json.dumps(value))
+        return value
+
+    def file_chunks(self, url, fetch):
+        data = b''.join(fetch())
+        self.write(file_name(url), data)
+        return [data]
+
+    def store_file(self, url, file_field):
+        file_field.open('rb')
+        try:
+            self.write(file_name(url), file_field.read())
+        finally:
+            file_field.close()
+
+    def close(self):
+        self.archive.close()
+
+
+class Replay(object):
+
+    replaying = True
+
+    def __init__(self, path):
+        self.path = path
+        self.archive = zipfile.ZipFile(path, 'r')
+
+    def read(self, name):
+        try:
+            return self.archive.read(name)
+        except KeyError:
+            raise SnapshotError('%s is not in the snapshot %s' % (name, self.path))
+
+    def remember(self, key, fetch):
+        return json.loads(self.read(json_name(key)))
+
+    def file_chunks(self, url, fetch):
+        return [self.read(file_name(url))]
+
+    def store_file(self, url, file_field):
+        pass
+
+    def load(self, keys, processes=1):
+
+        '''Yield (key, value) for keys, decompressed and parsed by processes worker processes.'''
+
+        if processes <= 1:
+            for key in keys:
+                yield (key, self.remember(key, None))
+            return
+
+        pool = multiprocessing.Pool(processes, initializer=open_worker, initargs=(self.path,))
+        try:
+            for item in pool.imap(load_worker, keys, chunksize=8):
+                yield item
+        finally:
+            pool.terminate()
+
+    def close(self):
+        self.archive.close()
+
+
+# Replay archive of a worker process
+worker = None
+
+
+def open_worker(path):
+    global worker
+    worker = Replay(path)
+
+
+def load_worker(key):
+    return (key, worker.remember(key, None))
+
+
+# -----------------------------------------------------------------------------
+# Current snapshot
+
+current = None
+
+
+@contextmanager
+def record(path):
+
+    global current
+
+    current = Recorder(path)
+    try:
+        yield current
+    finally:
+        current.close()
+        current = None
+        logger.info('Recorded snapshot %s' % path)
+
+
+@contextmanager
+def replay(path):
+
+    global current
+
+    logger.info('Replaying snapshot %s' % path)
+    current = Replay(path)
+    try:
+        yield current
+    finally:
+        current.close()
+        current = None
+
+
+def replaying():
+    return current is not None and current.replaying
+
+
+def reopen():
+
+    '''Open the current snapshot again in a forked worker process (the archive file position is shared otherwise).'''
+
+    global current
+
+    if current is None:
+        return
+    elif current.replaying:
+        current = Replay(current.path)
+    else:
+        raise SnapshotError('Can\'t record a snapshot from several processes')
+
+
+def remember(key, fetch):
+
+    '''Return fetch() (a JSON value), recorded or replayed under key when a snapshot is open.'''
+
+    if current is None:
+        return fetch()
+    else:
+        return current.remember(key, fetch)
+
+
+def file_chunks(url, fetch):
+
+    '''Return the content of the file at url as chunks; fetch() returns them from the network.'''
+
+    if current is None:
+        return fetch()
+    else:
+        return current.file_chunks(url, fetch)
+
+
+def store_file(url, file_field):
+
+    '''Record a file the importer already has locally, so replays into other databases have it.'''
+
+    if current is not None:
+        current.store_file(url, file_field)
+
+# -----------------------------------------------------------------------------
@@ -1,6 +1,68 @@
 import re
+import zlib
+
+from django.db import transaction
+
+
+# Set in the worker processes of a parallel import
+concurrent = False
 
 
 def format_integrity_error(e):
     '''Format Django DB integrity error'''
     return re.split(r'\n', e.message)[0]
+
+
+def lock_key(value):
+    '''Signed 32 bit key for a PostgreSQL advisory lock'''
+    return zlib.crc32(value.encode('utf-8') if isinstance(value, unicode) else str(value))
+
+
+def lock(model, key):
+
+    '''
+    Serialize the creation of a shared row (vocabulary, donors) between the
+    workers of a parallel import: take a transaction level advisory lock on
+    (model, key). A worker importing the same row waits until the line
+    holding the lock is committed and then finds the row.
+    '''
+
+    connection = transaction.get_connection()
+
+    if not concurrent or not connection.in_atomic_block:
+        return
+
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT pg_advisory_xact_lock(%s, %s)', [lock_key(model._meta.label), lock_key(key)])
+
+
+def get_or_create(model, key, **kwargs):
+
+    '''
+    model.objects.get_or_create(**kwargs) for a shared row, taking the lock
+    on (model, key) only if the row is missing. Existing rows, the common
+    case, are read without waiting for the other workers.
+    '''
+
+    lookup = dict([(field, value) for (field, value) in kwargs.items() if field != 'defaults'])
+
+    try:
+        return (model.objects.get(**lookup), False)
+    except model.DoesNotExist:
+        lock(model, key)
+        return model.objects.get_or_create(**kwargs)
+
+
+def update_or_create(model, key, defaults, **kwargs):
+
+    '''model.objects.update_or_create() for a shared row, taking the lock on (model, key) only if the row is missing or changes.'''
+
+    try:
+        instance = model.objects.get(**kwargs)
+        if all(getattr(instance, field) == value for (field, value) in defaults.items()):
+            return (instance, False)
+    except model.DoesNotExist:
+        pass
+
+    lock(model, key)
+    return model.objects.update_or_create(defaults=defaults, **kwargs)
@@ -10,7 +10,9 @@ from django.conf import settings
 from django.core.files import File
 from django.core.files.temp import NamedTemporaryFile
 
+from ebisc.celllines.files import Digest
 from ebisc.celllines.models import CelllineBatch, BatchCultureConditions, CelllineBatchImages, CelllineInformationPack
+from ebisc.celllines.importer import telemetry
 
 
 '''
@@ -23,14 +25,25 @@ LIMS batch data importer.
 
 def run():
 
-    for lims_batch in query(settings.LIMS.get('url')):
+    with telemetry.run('lims'):
+        import_batches()
+
+
+def import_batches():
+
+    with telemetry.stage('fetch list'):
+        lims_batches = query(settings.LIMS.get('url'))
+
+    for lims_batch in lims_batches:
 
         logger.info('Processing batch {} for cell line {}'.format(lims_batch.batch_id, lims_batch.cell_line))
 
-        lims_batch_data = query(lims_batch.href)
+        with telemetry.stage('fetch'):
+            lims_batch_data = query(lims_batch.href)
 
         if not lims_batch_data.biosamples_batch_id:
             logger.warn('Missing biosamples ID ... skipping batch')
+            telemetry.count('skipped')
             continue
 
         try:
@@ -73,6 +86,7 @@ def run():
             for img_md5 in old_images - new_images:
                 logger.info('Deleting old image')
                 batch.images.filter(md5=img_md5).delete()
+                batch.touch()
 
             # Add new images
 
@@ -95,6 +109,7 @@ def run():
                             source_md5=image.md5,
                             current_md5=batch_image.md5,
                         )
+                        batch_image.update_thumbnail()
                         batch_image.save()
 
             # Culture conditions
@@ -117,8 +132,12 @@ def run():
 
                     culture_conditions.save()
 
+            # Changed batches, images and culture conditions mark the batch and its line as changed when saved
+            telemetry.count('updated')
+
         except CelllineBatch.DoesNotExist:
             logger.warn('Unknown batch with biosamples ID = {}'.format(lims_batch_data.biosamples_batch_id))
+            telemetry.count('skipped')
 
 
 # -----------------------------------------------------------------------------
@@ -156,17 +175,20 @@ def value_of_file(value, file_field, filename=None, source_md5=None, current_md5
 
     logger.info('Fetching data file from %s' % value)
 
-    response = requests.get(value, stream=True, auth=(settings.LIMS.get('username'), settings.LIMS.get('password')))
+    with telemetry.stage('download'):
+        response = requests.get(value, stream=True, auth=(settings.LIMS.get('username'), settings.LIMS.get('password')))
+
+        digest = Digest()
 
-    with NamedTemporaryFile(delete=True) as f:
-        for chunk in response.iter_content(10240):
-            f.write(chunk)
+        with NamedTemporaryFile(delete=True) as f:
+            for chunk in response.iter_content(10240):
+                digest.update(chunk)
+                f.write(chunk)
 
-        f.seek(0)
-        file_field.save(source_filename, File(f), save=False)
-        file_field.instance.save()
+            f.seek(0)
+            file_field.save(source_filename, File(f), save=False)
+            file_field.instance.save()
 
-        f.seek(0)
-        return hashlib.md5(f.read()).hexdigest()
+    return digest.hexdigest('md5')
 
 # -----------------------------------------------------------------------------
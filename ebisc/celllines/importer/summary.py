@@ -0,0 +1,28 @@
+import logging
+logger = logging.getLogger('management.commands')
+
+from ebisc.celllines.models import Cellline
+from ebisc.elastic.documents import prefetched
+
+
+'''
+Recompute the denormalized summary columns of all cell lines.
+
+Saves keep the columns up to date (see Cellline.save and update_summary), so
+this is a one-off: run it after adding the columns (migration 0088) or
+changing how they are computed, not on every deploy.
+'''
+
+
+# -----------------------------------------------------------------------------
+# Run
+
+def run():
+
+    celllines = prefetched(Cellline.objects.all())
+
+    for cellline in celllines:
+        if cellline.update_summary():
+            logger.info(u'Updated summary for cell line %s' % cellline.name)
+
+# -----------------------------------------------------------------------------
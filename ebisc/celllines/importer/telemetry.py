@@ -0,0 +1,164 @@
+import time
+import traceback
+from contextlib import contextmanager
+from collections import defaultdict
+
+import logging
+logger = logging.getLogger('management.commands')
+
+from django.utils import timezone
+
+from ebisc.celllines.models import ImportRun, ImportRunStage
+
+
+'''
+Importer run telemetry.
+
+An importer runs inside run(name); stage(name) times the parts of the import
+(fetch, parse_* functions, file downloads, DB writes, ...) and count()
+counts created, updated, skipped and failed rows. Stages nest, each stage is
+timed including its nested stages. Outside of a run both are no-ops,
+so the importer functions can still be called on their own.
+
+Each run is stored as an ImportRun with one ImportRunStage per stage and is
+summarised in the log when it ends.
+'''
+
+
+COUNTS = ('created', 'updated', 'skipped', 'failed')
+
+
+# -----------------------------------------------------------------------------
+# Collector
+
+class Telemetry(object):
+
+    def __init__(self, importer):
+        self.importer = importer
+        self.counts = dict((kind, 0) for kind in COUNTS)
+        self.calls = defaultdict(int)
+        self.seconds = defaultdict(float)
+        self.max_seconds = defaultdict(float)
+
+    def add(self, name, seconds, calls=1):
+        self.calls[name] += calls
+        self.seconds[name] += seconds
+        self.max_seconds[name] = max(self.max_seconds[name], seconds)
+
+
+current = None
+
+
+@contextmanager
+def run(importer):
+
+    '''Record an import run of importer (see ImportRun.IMPORTER_CHOICES).'''
+
+    global current
+
+    telemetry = current = Telemetry(importer)
+    record = ImportRun.objects.create(importer=importer, started=timezone.now())
+    start = time.time()
+
+    try:
+        yield telemetry
+        record.status = 'finished'
+    except BaseException:
+        record.status = 'failed'
+        record.error = traceback.format_exc()
+        raise
+    finally:
+        current = None
+
+        record.finished = timezone.now()
+        record.seconds = time.time() - start
+        for kind in COUNTS:
+            setattr(record, kind, telemetry.counts[kind])
+        record.save()
+
+        ImportRunStage.objects.bulk_create([ImportRunStage(
+            run=record,
+            name=name,
+            calls=telemetry.calls[name],
+            seconds=telemetry.seconds[name],
+            max_seconds=telemetry.max_seconds[name],
+        ) for name in telemetry.calls])
+
+        for line in report(record):
+            logger.info(line)
+
+
+@contextmanager
+def stage(name):
+
+    telemetry = current
+    start = time.time()
+
+    try:
+        yield
+    finally:
+        if telemetry is not None:
+            telemetry.add(name, time.time() - start)
+
+
+def count(kind, n=1):
+    if current is not None:
+        current.counts[kind] += n
+
+
+# -----------------------------------------------------------------------------
+# Worker processes
+
+def collect(importer):
+
+    '''Collect stages and counts in a worker process, to be merged into the run of the parent process.'''
+
+    global current
+    current = Telemetry(importer)
+
+
+def collected():
+
+    '''Return and reset what was collected since the last call.'''
+
+    global current
+
+    data = {
+        'counts': current.counts,
+        'stages': [(name, current.calls[name], current.seconds[name], current.max_seconds[name]) for name in current.calls],
+    }
+    current = Telemetry(current.importer)
+
+    return data
+
+
+def merge(data):
+
+    if current is None:
+        return
+
+    for (kind, n) in data['counts'].items():
+        current.counts[kind] += n
+    for (name, calls, seconds, max_seconds) in data['stages']:
+        current.add(name, seconds, calls=calls)
+        current.max_seconds[name] = max(current.max_seconds[name], max_seconds)
+
+
+# -----------------------------------------------------------------------------
+# Report
+
+def report(record):
+
+    '''Return the summary of an ImportRun as a list of lines.'''
+
+    lines = [
+        u'Import run %s (%s) %s in %.1f s' % (record.importer, timezone.localtime(record.started).strftime('%Y-%m-%d %H:%M'), record.status, record.seconds or 0),
+        u'    ' + u', '.join(u'%s: %d' % (kind, getattr(record, kind)) for kind in COUNTS),
+    ]
+
+    for stage in record.stages.all():
+        lines.append(u'    %-50s %6d calls %10.2f s total %8.3f s max' % (stage.name, stage.calls, stage.seconds, stage.max_seconds))
+
+    return lines
+
+# -----------------------------------------------------------------------------
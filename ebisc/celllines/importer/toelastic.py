@@ -1,4 +1,3 @@
-import os
 import json
 from elasticsearch import Elasticsearch
 
@@ -7,30 +6,53 @@ logger = logging.getLogger('management.commands')
 
 from django.conf import settings
 
-from ebisc.celllines.models import Cellline
+from ebisc.celllines.models import Cellline, ImportRun, Tombstone
+from ebisc.celllines.importer import telemetry
+from ebisc.elastic.documents import MAPPINGS, SETTINGS, documents
 
 
 '''ORM to ElasticSearch importer.'''
 
 
-BASEDIR = os.path.join(os.path.dirname(__file__), '../elastic/')
-MAPPINGS = {'cellline': os.path.abspath(os.path.join(BASEDIR, 'mappings/cellline.json'))}
-SETTINGS = os.path.abspath(os.path.join(BASEDIR, 'settings.json'))
-
-
 # -----------------------------------------------------------------------------
 # Run
 
-def run():
+def run(changed=None):
+
+    '''Rebuild the index, or with changed (change sets of an import, see importer.changes) reindex only the lines changed since the last finished run.'''
+
+    since = last_indexed() if changed is not None else None
+
+    with telemetry.run('toelastic'):
+        es = Elasticsearch(settings.ELASTIC_HOSTS)
+        if since is None or not es.indices.exists(index=settings.ELASTIC_INDEX) or Tombstone.objects.filter(kind='cellline', deleted__gte=since).exists():
+            # Documents of deleted lines can only be removed by rebuilding the index
+            index_all(es)
+        else:
+            # Lines changed by the import, and by anything else that moved their data version (e.g. status changes in the dashboard)
+            names = set(change_set.name for change_set in changed)
+            names.update(Cellline.objects.filter(data_updated__gte=since).values_list('name', flat=True))
+            index_changed(es, names)
+
+
+def last_indexed():
+
+    '''Start of the last finished run, None if there is none.'''
 
-    es = Elasticsearch(settings.ELASTIC_HOSTS)
+    last = ImportRun.objects.filter(importer='toelastic', status='finished').order_by('-started').first()
+
+    return last.started if last is not None else None
+
+
+def index_all(es):
 
     # Create index
 
     logger.info(u'Creating ES index')
-    es.indices.delete(index=settings.ELASTIC_INDEX, ignore=[404])
-    with open(SETTINGS) as fi:
-      es.indices.create(index=settings.ELASTIC_INDEX, body=json.load(fi))
+    with telemetry.stage('create index'):
+        es.indices.delete(index=settings.ELASTIC_INDEX, ignore=[404])
+        with open(SETTINGS) as fi:
+          es.indices.create(index=settings.ELASTIC_INDEX, body=json.load(fi))
 
     # Create mappings
 
@@ -38,14 +60,38 @@ def run():
     with open(MAPPINGS['cellline']) as fi:
         for key, value in json.load(fi).items():
             logger.info(u'Creating mapping %s' % key)
-            es.indices.put_mapping(index=settings.ELASTIC_INDEX, doc_type=key, body=value)
+            with telemetry.stage('create mapping'):
+                es.indices.put_mapping(index=settings.ELASTIC_INDEX, doc_type=key, body=value)
 
     # Import cell lines
 
     logger.info(u'Importing cell lines')
-    for cellline in Cellline.objects.filter(available_for_sale_at_ecacc=True).exclude(current_status__status__in=['withdrawn', 'not_available', 'recalled']):
-        document = cellline.to_elastic()
+    with telemetry.stage('to_elastic'):
+        celllines = list(documents())
+    for (cellline, document) in celllines:
         logger.info('Importing cell line {}'.format(cellline))
-        es.index(settings.ELASTIC_INDEX, doc_type='cellline', body=document)
+        with telemetry.stage('index'):
+            es.index(settings.ELASTIC_INDEX, doc_type='cellline', id=cellline.pk, body=document)
+        telemetry.count('created')
+
+
+def index_changed(es, names):
+
+    logger.info(u'Reindexing %d changed cell lines' % len(names))
+
+    with telemetry.stage('to_elastic'):
+        celllines = list(documents(names))
+    for (cellline, document) in celllines:
+        logger.info('Reindexing cell line {}'.format(cellline))
+        with telemetry.stage('index'):
+            es.index(settings.ELASTIC_INDEX, doc_type='cellline', id=cellline.pk, body=document)
+        telemetry.count('updated')
+
+    # Changed lines no longer in the search (withdrawn, not available, ...)
+    indexed = set(cellline.pk for (cellline, document) in celllines)
+    for pk in Cellline.objects.filter(name__in=names).exclude(pk__in=indexed).values_list('pk', flat=True):
+        with telemetry.stage('delete'):
+            es.delete(settings.ELASTIC_INDEX, doc_type='cellline', id=pk, ignore=[404])
+        telemetry.count('skipped')
 
 # -----------------------------------------------------------------------------
@@ -0,0 +1,77 @@
+from django_docopt_command import DocOptCommand
+
+import logging
+logger = logging.getLogger('management.commands')
+
+from ebisc.celllines import benchmark
+
+
+DOCS = '''
+Usage:
+    benchmark seed [--traceback] [--count=<n>] [--donors=<n>] [--batches=<n>] [--vials=<n>] [--modifications=<n>]
+    benchmark clear [--traceback]
+    benchmark queries [--traceback] [--repeat=<n>] [--explain]
+    benchmark record [--traceback] <source> <cellline>...
+    benchmark run [--traceback] [--source=<path>] [--baseline=<file>] [--save] [--tolerance=<percent>] [<scenario>...]
+
+Options:
+    --count=<n>             Number of cell lines [default: 2000]
+    --donors=<n>            Number of donors (default: one per cell line)
+    --batches=<n>           Batches per cell line [default: 2]
+    --vials=<n>             Vials per batch [default: 5]
+    --modifications=<n>     Genetic modifications per cell line [default: 1]
+    --source=<path>         Directory with recorded hPSCreg JSON (see record) or a snapshot archive
+    --baseline=<file>       Baseline to compare with (or to write with --save)
+    --tolerance=<percent>   Allowed growth of wall time and memory [default: 20]
+'''
+
+
+class Command(DocOptCommand):
+
+    docs = DOCS
+    help = 'Benchmark hot queries and code paths on synthetic data'
+
+    def handle_docopt(self, args):
+
+        if args.get('seed'):
+            benchmark.seed(
+                int(args.get('--count')),
+                donors=int(args.get('--donors')) if args.get('--donors') else None,
+                batches=int(args.get('--batches')),
+                vials=int(args.get('--vials')),
+                modifications=int(args.get('--modifications')),
+            )
+
+        if args.get('clear'):
+            benchmark.clear()
+
+        if args.get('queries'):
+            for result in benchmark.run_queries(repeat=int(args.get('--repeat') or 20), plans=args.get('--explain')):
+                logger.info('%-40s %8.2f ms' % (result['name'], result['ms']))
+                for line in result.get('plan', []):
+                    logger.info('    %s' % line)
+
+        if args.get('record'):
+            benchmark.record(args.get('<source>'), args.get('<cellline>'))
+
+        if args.get('run'):
+            results = benchmark.run_scenarios(source=args.get('--source'), names=args.get('<scenario>'))
+
+            for result in results:
+                if 'error' in result:
+                    logger.error('%-40s %s' % (result['name'], result['error']))
+                else:
+                    logger.info('%-40s %6d queries %10.2f ms %8d KB' % (result['name'], result['queries'], result['ms'], result['memory']))
+
+            baseline = args.get('--baseline')
+
+            if baseline and args.get('--save'):
+                benchmark.save_baseline(baseline, results)
+                logger.info('Saved baseline to %s' % baseline)
+
+            elif baseline:
+                regressions = benchmark.regressions(results, benchmark.load_baseline(baseline), tolerance=float(args.get('--tolerance')) / 100)
+                for (name, measure, before, after) in regressions:
+                    logger.warn('Regression in %s: %s %s -> %s' % (name, measure, before, after))
+                if regressions:
+                    raise SystemExit(1)
@@ -1,5 +1,7 @@
 from django_docopt_command import DocOptCommand
 
+from django.utils import timezone
+
 from ebisc.celllines import importer
 from ebisc.celllines.models import *
 
@@ -10,11 +12,15 @@ logger = logging.getLogger('management.commands')
 DOCS = '''
 Usage:
     import all [--traceback]
-    import hpscreg [--traceback] [--cellline=<name>]
-    import hpscreg-local [--traceback] [--cellline=<name>]
+    import hpscreg [--traceback] [--cellline=<name>] [--record=<archive> | --workers=<n>]
+    import hpscreg-local [--traceback] [--cellline=<name>] [--record=<archive> | --workers=<n>]
+    import hpscreg-replay [--traceback] <archive> [--cellline=<name>] [--processes=<n>] [--workers=<n>]
     import lims [--traceback]
     import batches [--traceback] <filename>
     import toelastic [--traceback]
+    import summary [--traceback]
+    import runs [--traceback] [--importer=<name>] [--limit=<n>]
+    import report [--traceback] [<run>]
 '''
 
 
@@ -26,14 +32,17 @@ class Command(DocOptCommand):
     def handle_docopt(self, args):
 
         if args.get('all'):
-            importer.hpscreg.run()
-            importer.toelastic.run()
+            changed = importer.hpscreg.run()
+            importer.toelastic.run(changed)
 
         if args.get('hpscreg'):
-            importer.hpscreg.run(cellline=args.get('--cellline'))
+            importer.hpscreg.run(cellline=args.get('--cellline'), record=args.get('--record'), workers=int(args.get('--workers') or 1))
 
         if args.get('hpscreg-local'):
-            importer.hpscreg.run(cellline=args.get('--cellline'), local=True)
+            importer.hpscreg.run(cellline=args.get('--cellline'), local=True, record=args.get('--record'), workers=int(args.get('--workers') or 1))
+
+        if args.get('hpscreg-replay'):
+            importer.hpscreg.replay(args.get('<archive>'), cellline=args.get('--cellline'), processes=int(args.get('--processes') or 1), workers=int(args.get('--workers') or 1))
 
         if args.get('lims'):
             logger.info('Synchronizing batch data with LIMS')
@@ -42,6 +51,26 @@ class Command(DocOptCommand):
         if args.get('toelastic'):
             importer.toelastic.run()
 
+        if args.get('summary'):
+            logger.info('Updating cell line summaries')
+            importer.summary.run()
+
         if args.get('batches'):
             logger.info('Importing batches from BioSamples')
             importer.batches.run(args.get('<filename>'))
+
+        if args.get('runs'):
+            runs = ImportRun.objects.all()
+            if args.get('--importer'):
+                runs = runs.filter(importer=args.get('--importer'))
+            for run in runs[:int(args.get('--limit') or 20)]:
+                logger.info('%6d  %-10s %-9s %s %8.1f s  created %d, updated %d, skipped %d, failed %d' % (
+                    run.id, run.importer, run.status, timezone.localtime(run.started).strftime('%Y-%m-%d %H:%M'), run.seconds or 0,
+                    run.created, run.updated, run.skipped, run.failed))
+
+        if args.get('report'):
+            runs = ImportRun.objects.all()
+            run = runs.get(pk=args.get('<run>')) if args.get('<run>') else runs.first()
+            if run is not None:
+                for line in importer.telemetry.report(run):
+                    logger.info(line)
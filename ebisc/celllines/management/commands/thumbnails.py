@@ -0,0 +1,36 @@
+from django_docopt_command import DocOptCommand
+
+import logging
+logger = logging.getLogger('management.commands')
+
+from django.db.models import Q
+
+from ebisc.celllines.models import CelllineBatchImages
+
+
+DOCS = '''
+Usage:
+    thumbnails batch-images [--traceback] [--all]
+'''
+
+
+class Command(DocOptCommand):
+
+    docs = DOCS
+    help = 'Render stored thumbnails for batch images'
+
+    def handle_docopt(self, args):
+
+        if args.get('batch-images'):
+            images = CelllineBatchImages.objects.exclude(image='')
+
+            if not args.get('--all'):
+                images = images.filter(Q(thumbnail__isnull=True) | Q(thumbnail=''))
+
+            for image in images:
+                logger.info('Rendering thumbnail for batch image %s' % image)
+                try:
+                    image.update_thumbnail()
+                    image.save()
+                except IOError, e:
+                    logger.warn('Can\'t render thumbnail for batch image %s: %s' % (image, e))
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import ebisc.celllines.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('celllines', '0085_celllinederivation_tissue_collection_year'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='celllinebatchimages',
+            name='thumbnail',
+            field=models.ImageField(blank=True, height_field=b'thumbnail_height', null=True, upload_to=ebisc.celllines.models.upload_to, verbose_name='Thumbnail', width_field=b'thumbnail_width'),
+        ),
+        migrations.AddField(
+            model_name='celllinebatchimages',
+            name='thumbnail_height',
+            field=models.PositiveIntegerField(blank=True, null=True, verbose_name='Thumbnail height'),
+        ),
+        migrations.AddField(
+            model_name='celllinebatchimages',
+            name='thumbnail_width',
+            field=models.PositiveIntegerField(blank=True, null=True, verbose_name='Thumbnail width'),
+        ),
+    ]
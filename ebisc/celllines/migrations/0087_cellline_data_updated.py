@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('celllines', '0086_celllinebatchimages_thumbnail'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cellline',
+            name='data_updated',
+            field=models.DateTimeField(blank=True, editable=False, null=True, verbose_name='Data updated'),
+        ),
+    ]
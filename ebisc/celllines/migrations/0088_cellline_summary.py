@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('celllines', '0087_cellline_data_updated'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cellline',
+            name='latest_batch',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='celllines.CelllineBatch', verbose_name='Latest batch'),
+        ),
+        migrations.AddField(
+            model_name='cellline',
+            name='latest_clip',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='celllines.CelllineInformationPack', verbose_name='Latest CLIP'),
+        ),
+        migrations.AddField(
+            model_name='cellline',
+            name='summary_depositor',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=500, null=True, verbose_name='Depositor'),
+        ),
+        migrations.AddField(
+            model_name='cellline',
+            name='summary_donor_age',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=10, null=True, verbose_name='Donor age'),
+        ),
+        migrations.AddField(
+            model_name='cellline',
+            name='summary_donor_sex',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=10, null=True, verbose_name='Donor sex'),
+        ),
+        migrations.AddField(
+            model_name='cellline',
+            name='summary_primary_cell_type',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=300, null=True, verbose_name='Primary cell type'),
+        ),
+        migrations.AddField(
+            model_name='cellline',
+            name='summary_primary_disease',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=200, null=True, verbose_name='Primary disease'),
+        ),
+    ]
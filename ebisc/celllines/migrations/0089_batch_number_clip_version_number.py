@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+
+# Copies of the helpers in celllines.models at the time of this migration
+
+def batch_number(batch_id):
+    if not batch_id or batch_id.startswith('SAME'):
+        return None
+    try:
+        return int(batch_id[1:])
+    except ValueError:
+        return None
+
+
+def clip_version_number(version):
+    try:
+        return int(version.lower().replace('v', ''))
+    except (AttributeError, ValueError):
+        return None
+
+
+def fill_sort_keys(apps, schema_editor):
+
+    CelllineBatch = apps.get_model('celllines', 'CelllineBatch')
+    CelllineInformationPack = apps.get_model('celllines', 'CelllineInformationPack')
+
+    for batch in CelllineBatch.objects.all():
+        CelllineBatch.objects.filter(pk=batch.pk).update(number=batch_number(batch.batch_id))
+
+    for clip in CelllineInformationPack.objects.all():
+        CelllineInformationPack.objects.filter(pk=clip.pk).update(version_number=clip_version_number(clip.version))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('celllines', '0088_cellline_summary'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='celllinebatch',
+            name='number',
+            field=models.IntegerField(blank=True, editable=False, null=True, verbose_name='Batch number'),
+        ),
+        migrations.AddField(
+            model_name='celllineinformationpack',
+            name='version_number',
+            field=models.IntegerField(blank=True, editable=False, null=True, verbose_name='CLIP version number'),
+        ),
+        migrations.RunPython(fill_sort_keys, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+def fill_status(apps, schema_editor):
+
+    Cellline = apps.get_model('celllines', 'Cellline')
+
+    for cellline in Cellline.objects.exclude(current_status=None).select_related('current_status'):
+        Cellline.objects.filter(pk=cellline.pk).update(status=cellline.current_status.status)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('celllines', '0089_batch_number_clip_version_number'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cellline',
+            name='status',
+            field=models.CharField(blank=True, choices=[(b'not_available', 'Not available'), (b'at_ecacc', 'Stocked by ECACC'), (b'expand_to_order', 'Expand to order'), (b'restricted_distribution', 'Restricted distribution'), (b'recalled', 'Recalled'), (b'withdrawn', 'Withdrawn')], db_index=True, editable=False, max_length=50, null=True, verbose_name='Current status'),
+        ),
+        migrations.RunPython(fill_status, migrations.RunPython.noop),
+    ]
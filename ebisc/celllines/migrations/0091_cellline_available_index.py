@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    '''
+    Partial index over the lines available at ECACC (about a third of all
+    lines), ordered by name. Used by the catalogue and the ES indexer, which
+    otherwise scan the whole cell line table.
+    '''
+
+    dependencies = [
+        ('celllines', '0090_cellline_status'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            'CREATE INDEX celllines_cellline_available ON celllines_cellline (name) WHERE available_for_sale_at_ecacc',
+            'DROP INDEX celllines_cellline_available',
+        ),
+    ]
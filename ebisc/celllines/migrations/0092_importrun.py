@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('celllines', '0091_cellline_available_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ImportRun',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('importer', models.CharField(choices=[(b'hpscreg', 'hPSCreg'), (b'lims', 'LIMS'), (b'batches', 'Batches'), (b'toelastic', 'Elasticsearch')], db_index=True, max_length=20, verbose_name='Importer')),
+                ('status', models.CharField(choices=[(b'running', 'Running'), (b'finished', 'Finished'), (b'failed', 'Failed')], default=b'running', max_length=20, verbose_name='Status')),
+                ('started', models.DateTimeField(db_index=True, verbose_name='Started')),
+                ('finished', models.DateTimeField(blank=True, null=True, verbose_name='Finished')),
+                ('seconds', models.FloatField(blank=True, null=True, verbose_name='Duration (s)')),
+                ('created', models.PositiveIntegerField(default=0, verbose_name='Created')),
+                ('updated', models.PositiveIntegerField(default=0, verbose_name='Updated')),
+                ('skipped', models.PositiveIntegerField(default=0, verbose_name='Skipped')),
+                ('failed', models.PositiveIntegerField(default=0, verbose_name='Failed')),
+                ('error', models.TextField(blank=True, null=True, verbose_name='Error')),
+            ],
+            options={
+                'ordering': ['-started'],
+                'verbose_name': 'Import run',
+                'verbose_name_plural': 'Import runs',
+            },
+        ),
+        migrations.CreateModel(
+            name='ImportRunStage',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, verbose_name='Stage')),
+                ('calls', models.PositiveIntegerField(default=0, verbose_name='Calls')),
+                ('seconds', models.FloatField(default=0, verbose_name='Total time (s)')),
+                ('max_seconds', models.FloatField(default=0, verbose_name='Slowest call (s)')),
+                ('run', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='stages', to='celllines.ImportRun', verbose_name='Import run')),
+            ],
+            options={
+                'ordering': ['-seconds'],
+                'verbose_name': 'Import run stage',
+                'verbose_name_plural': 'Import run stages',
+            },
+        ),
+        migrations.AlterUniqueTogether(
+            name='importrunstage',
+            unique_together=set([('run', 'name')]),
+        ),
+    ]
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+from django.utils import timezone
+import django.utils.timezone
+
+
+def fill_timestamps(apps, schema_editor):
+
+    Cellline = apps.get_model('celllines', 'Cellline')
+    CelllineBatch = apps.get_model('celllines', 'CelllineBatch')
+
+    now = timezone.now()
+
+    Cellline.objects.filter(data_updated=None).update(data_updated=now)
+    CelllineBatch.objects.filter(updated=None).update(updated=now)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('celllines', '0092_importrun'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Tombstone',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[(b'cellline', 'Cell line'), (b'batch', 'Batch')], max_length=20, verbose_name='Kind')),
+                ('biosamples_id', models.CharField(max_length=100, verbose_name='Biosamples ID')),
+                ('name', models.CharField(blank=True, max_length=100, null=True, verbose_name='Name')),
+                ('deleted', models.DateTimeField(db_index=True, default=django.utils.timezone.now, verbose_name='Deleted')),
+            ],
+            options={
+                'ordering': ['deleted'],
+                'verbose_name': 'Tombstone',
+                'verbose_name_plural': 'Tombstones',
+            },
+        ),
+        migrations.AddField(
+            model_name='celllinebatch',
+            name='updated',
+            field=models.DateTimeField(blank=True, db_index=True, editable=False, null=True, verbose_name='Updated'),
+        ),
+        migrations.AlterField(
+            model_name='cellline',
+            name='data_updated',
+            field=models.DateTimeField(blank=True, db_index=True, editable=False, null=True, verbose_name='Data updated'),
+        ),
+        migrations.RunPython(fill_timestamps, migrations.RunPython.noop),
+    ]
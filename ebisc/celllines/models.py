@@ -3,12 +3,19 @@ import uuid
 import datetime
 from dirtyfields import DirtyFieldsMixin
 
-from django.db import models
+from django.db import models, transaction
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+from django.conf import settings
+from django.utils import timezone
+from django.utils.functional import cached_property
 from django.utils.translation import ugettext as _
 from django.contrib.auth.models import User
 from django.contrib.postgres.fields import ArrayField
 from django.core.validators import RegexValidator
 
+from .files import make_thumbnail
+
 # -----------------------------------------------------------------------------
 # Utilities
 
@@ -24,6 +31,24 @@ def upload_to(instance, filename):
     return os.path.join('celllines', '%d/%02d/%02d' % (date.year, date.month, date.day), str(uuid.uuid4()), filename)
 
 
+def batch_number(batch_id):
+    '''Sort key of a batch ID like "P001": its number, None for BioSamples IDs and other IDs.'''
+    if not batch_id or batch_id.startswith('SAME'):
+        return None
+    try:
+        return int(batch_id[1:])
+    except ValueError:
+        return None
+
+
+def clip_version_number(version):
+    '''Sort key of a CLIP version like "v2".'''
+    try:
+        return int(version.lower().replace('v', ''))
+    except (AttributeError, ValueError):
+        return None
+
+
 # -----------------------------------------------------------------------------
 # Indexes
 
@@ -164,6 +189,19 @@ class Unit(models.Model):
 # -----------------------------------------------------------------------------
 # Cell line
 
+STATUS_CHOICES = (
+    ('not_available', _(u'Not available')),
+    ('at_ecacc', _(u'Stocked by ECACC')),
+    ('expand_to_order', _(u'Expand to order')),
+    ('restricted_distribution', _(u'Restricted distribution')),
+    ('recalled', _(u'Recalled')),
+    ('withdrawn', _(u'Withdrawn')),
+)
+
+# Statuses of lines shown in the public catalogue
+AVAILABLE_STATUSES = ['at_ecacc', 'expand_to_order', 'restricted_distribution']
+
+
 class Cellline(DirtyFieldsMixin, models.Model):
 
     VALIDATION_CHOICES = (
@@ -177,6 +215,7 @@ class Cellline(DirtyFieldsMixin, models.Model):
     available_for_sale = models.NullBooleanField(_(u'Available for sale'))
     available_for_sale_at_ecacc = models.BooleanField(_(u'Available for sale on ECACC'), default=False)
     current_status = models.ForeignKey('CelllineStatus', null=True, blank=True)
+    status = models.CharField(_(u'Current status'), max_length=50, choices=STATUS_CHOICES, null=True, blank=True, db_index=True, editable=False)
 
     name = models.CharField(_(u'Cell line name'), unique=True, max_length=16)
     alternative_names = models.CharField(_(u'Cell line alternative names'), max_length=500, null=True, blank=True)
@@ -202,6 +241,19 @@ class Cellline(DirtyFieldsMixin, models.Model):
 
     public_notes = models.TextField(_(u'Public notes'), null=True, blank=True)
 
+    # Changed whenever data shown on the catalogue page or in the API changes;
+    # part of the page cache key and the API change feed (updated_since)
+    data_updated = models.DateTimeField(_(u'Data updated'), null=True, blank=True, editable=False, db_index=True)
+
+    # Summary of related data for list views, filters and exports (see update_summary)
+    summary_primary_disease = models.CharField(_(u'Primary disease'), max_length=200, null=True, blank=True, db_index=True, editable=False)
+    summary_donor_sex = models.CharField(_(u'Donor sex'), max_length=10, null=True, blank=True, db_index=True, editable=False)
+    summary_donor_age = models.CharField(_(u'Donor age'), max_length=10, null=True, blank=True, db_index=True, editable=False)
+    summary_primary_cell_type = models.CharField(_(u'Primary cell type'), max_length=300, null=True, blank=True, db_index=True, editable=False)
+    summary_depositor = models.CharField(_(u'Depositor'), max_length=500, null=True, blank=True, db_index=True, editable=False)
+    latest_batch = models.ForeignKey('CelllineBatch', verbose_name=_(u'Latest batch'), null=True, blank=True, on_delete=models.SET_NULL, related_name='+', editable=False)
+    latest_clip = models.ForeignKey('CelllineInformationPack', verbose_name=_(u'Latest CLIP'), null=True, blank=True, on_delete=models.SET_NULL, related_name='+', editable=False)
+
     class Meta:
         verbose_name = _(u'Cell line')
         verbose_name_plural = _(u'Cell lines')
@@ -210,283 +262,302 @@ class Cellline(DirtyFieldsMixin, models.Model):
     def __unicode__(self):
         return u'%s' % (self.biosamples_id,)
 
-    @property
-    def biosamples_url(self):
-        return 'https://www.ebi.ac.uk/biosamples/samples/%s' % self.biosamples_id
-
-    @property
-    def hpscreg_url(self):
-        return 'https://hpscreg.eu/cell-line/%s' % self.name
-
-    @property
-    def ecacc_url(self):
-        return 'http://www.phe-culturecollections.org.uk/products/celllines/ipsc/detail.jsp?refId=%s&collection=ecacc_ipsc' % self.ecacc_id
+    # Summary columns computed from columns of the line itself, the others
+    # follow related rows and are written by update_summary()
+    SUMMARY_SOURCES = {
+        'donor': ['summary_donor_sex'],
+        'donor_age': ['summary_donor_age'],
+        'generator': ['summary_depositor'],
+    }
 
-    @property
-    def primary_disease(self):
-        diseases = []
+    def save(self, *args, **kwargs):
+        summary = {}
+        if self.pk is None:
+            self.data_updated = timezone.now()
+        else:
+            dirty = self.get_dirty_fields(check_relationship=True)
+            if dirty:
+                summary = self.get_summary(sum([self.SUMMARY_SOURCES.get(field, []) for field in dirty], []))
+                for (field, value) in summary.items():
+                    setattr(self, field, value)
+                self.data_updated = timezone.now()
+                if kwargs.get('update_fields') is not None:
+                    # Saving some fields (see importer.changes) still writes the summary and data version
+                    kwargs['update_fields'] = set(kwargs['update_fields']) | set(summary) | set(['data_updated'])
+        super(Cellline, self).save(*args, **kwargs)
+        self.__dict__.pop('_derived', None)
+
+    def refresh_from_db(self, *args, **kwargs):
+        super(Cellline, self).refresh_from_db(*args, **kwargs)
+        self.__dict__.pop('_derived', None)
+
+    def set_current_status(self, status, **fields):
+
+        '''Point the line at its current status (and set other fields) with one UPDATE.'''
+
+        fields.update({
+            'current_status': status,
+            'status': status.status if status else None,
+            'data_updated': timezone.now(),
+        })
+
+        for (field, value) in fields.items():
+            setattr(self, field, value)
+
+        Cellline.objects.filter(pk=self.pk).update(**fields)
+
+    def get_summary(self, fields=None):
+
+        '''Values of the summary columns (all, or the given ones) computed from the related objects.'''
+
+        self.__dict__.pop('_derived', None)
+
+        values = {
+            'summary_primary_disease': lambda: self.primary_disease.disease.name if self.primary_disease and self.primary_disease.disease else None,
+            'summary_donor_sex': lambda: self.donor.gender.name if self.donor and self.donor.gender else None,
+            'summary_donor_age': lambda: self.donor_age.name if self.donor_age else None,
+            'summary_primary_cell_type': lambda: self.derivation.primary_cell_type.name if hasattr(self, 'derivation') and self.derivation.primary_cell_type else None,
+            'summary_depositor': lambda: self.generator.name if self.generator_id else None,
+            'latest_batch_id': lambda: getattr(self.find_latest_batch(), 'id', None),
+            'latest_clip_id': lambda: getattr(self.find_latest_clip(), 'id', None),
+        }
 
-        # Check if any donor/cell line diseases are primary
-        if self.donor:
-            for disease in self.donor.diseases.all():
-                if disease.primary_disease is True:
-                    return disease
-                else:
-                    diseases.append(disease)
+        return dict([(field, values[field]()) for field in (values if fields is None else fields)])
 
-        for disease in self.diseases.all():
-            if disease.primary_disease is True:
-                return disease
-            else:
-                diseases.append(disease)
+    def update_summary(self, bump=False, fields=None):
 
-        # If not, return the first one that is not 'normal' on the list
-        if diseases == []:
-            return None
-        else:
-            for ds in diseases:
-                if ds.disease and ds.disease.xpurl != 'http://purl.obolibrary.org/obo/PATO_0000461':
-                    return ds
-            return diseases[0]
+        '''
+        Recompute the summary columns (all, or the given ones) and write the
+        changed ones, together with a new data version, in one UPDATE (bump:
+        write the data version even if the summary did not change). Returns
+        True if anything was written.
+        '''
 
-    @property
-    def donor_diseases(self):
+        changed = dict([(field, value) for (field, value) in self.get_summary(fields).items() if getattr(self, field) != value])
 
-        donor_diseases = []
+        if changed or bump:
+            changed['data_updated'] = timezone.now()
+            for (field, value) in changed.items():
+                setattr(self, field, value)
+            Cellline.objects.filter(pk=self.pk).update(**changed)
+            return True
 
-        if self.donor:
-            for disease in self.donor.diseases.all():
-                if disease.disease:
-                    donor_diseases.append(disease.disease.name)
-                else:
-                    donor_diseases.append(disease.disease_not_normalised)
+        return False
 
-        return donor_diseases
+    def bump_data_version(self):
+        '''Mark related data (batches, CLIPs, ...) as changed without saving the whole line.'''
+        self.update_summary(bump=True)
 
     @property
-    def cellline_diseases(self):
+    def data_version(self):
+        return self.data_updated.strftime('%Y%m%d%H%M%S%f') if self.data_updated else '0'
 
-        cellline_diseases = []
-
-        for disease in self.diseases.all():
-            if disease.disease:
-                cellline_diseases.append(disease.disease.name)
-            else:
-                cellline_diseases.append(disease.disease_not_normalised)
+    @property
+    def biosamples_url(self):
+        return 'https://www.ebi.ac.uk/biosamples/samples/%s' % self.biosamples_id
 
-        return cellline_diseases
+    @property
+    def hpscreg_url(self):
+        return 'https://hpscreg.eu/cell-line/%s' % self.name
 
     @property
-    def cellline_diseases_genes(self):
+    def ecacc_url(self):
+        return 'http://www.phe-culturecollections.org.uk/products/celllines/ipsc/detail.jsp?refId=%s&collection=ecacc_ipsc' % self.ecacc_id
 
-        cellline_diseases_genes = []
+    @cached_property
+    def _derived(self):
 
-        # disease modification
-        for disease in self.diseases.all():
-            genes = []
-            variants = []
-            mods_isogenic = []
-            mods_transgene_expression = []
-            mods_gene_ko = []
-            mods_gene_ki = []
-            disease_info = None
+        '''
+        Disease, genetics and derivation data derived from related objects,
+        collected in one walk over the relations and memoized per instance
+        (reset on save). Works with prefetched relations.
+        '''
 
-            if disease.disease:
-                mods_gene_ko.extend(disease.genetic_modification_cellline_disease_gene_knock_out.all())
-                mods_gene_ki.extend(disease.genetic_modification_cellline_disease_gene_knock_in.all())
-                mods_transgene_expression.extend(disease.genetic_modification_cellline_disease_transgene_expression.all())
-                mods_isogenic.extend(disease.genetic_modification_cellline_disease_isogenic.all())
-                variants.extend(disease.genetic_modification_cellline_disease_variants.all())
+        NORMAL = 'http://purl.obolibrary.org/obo/PATO_0000461'
 
-                for variant in variants:
-                    if variant.gene and variant.gene.name:
-                        genes.append(variant.gene.name)
+        def modification_genes(variants, mods_isogenic, mods_transgene_expression, mods_gene_ko, mods_gene_ki):
+            genes = []
+            for mod in variants + mods_isogenic + mods_transgene_expression + mods_gene_ko:
+                if mod.gene and mod.gene.name:
+                    genes.append(mod.gene.name)
+            for mod in mods_gene_ki:
+                if mod.target_gene and mod.target_gene.name:
+                    genes.append(mod.target_gene.name)
+            return genes
 
-                for mod in mods_isogenic:
-                    if mod.gene and mod.gene.name:
-                        genes.append(mod.gene.name)
+        donor_diseases = list(self.donor.diseases.all()) if self.donor else []
+        diseases = list(self.diseases.all())
 
-                for mod in mods_transgene_expression:
-                    if mod.gene and mod.gene.name:
-                        genes.append(mod.gene.name)
+        # Diseases
 
-                for mod in mods_gene_ko:
-                    if mod.gene and mod.gene.name:
-                        genes.append(mod.gene.name)
+        primary_disease = None
 
-                for mod in mods_gene_ki:
-                    if mod.target_gene and mod.target_gene.name:
-                        genes.append(mod.target_gene.name)
+        for disease in donor_diseases + diseases:
+            if disease.primary_disease is True:
+                primary_disease = disease
+                break
+
+        if primary_disease is None and (donor_diseases or diseases):
+            for disease in donor_diseases + diseases:
+                if disease.disease and disease.disease.xpurl != NORMAL:
+                    primary_disease = disease
+                    break
+            else:
+                primary_disease = (donor_diseases + diseases)[0]
 
-                if not genes:
-                    disease_info = disease.disease.name
-                else:
-                    disease_info = "%s (%s)" % (disease.disease.name, ", ".join(genes))
+        # Genetic modifications
 
-                cellline_diseases_genes.append(disease_info)
+        cellline_diseases_genes = []
 
-        # non-disease modification
-        genes = []
         variants = []
         mods_isogenic = []
         mods_transgene_expression = []
         mods_gene_ko = []
         mods_gene_ki = []
-        gene_info = None
-        mods_gene_ko.extend(self.genetic_modification_cellline_gene_knock_out.all())
-        mods_gene_ki.extend(self.genetic_modification_cellline_gene_knock_in.all())
-        mods_transgene_expression.extend(self.genetic_modification_cellline_transgene_expression.all())
-        mods_isogenic.extend(self.genetic_modification_cellline_isogenic.all())
-        variants.extend(self.genetic_modification_cellline_variants.all())
 
-        for variant in variants:
-            if variant.gene and variant.gene.name:
-                genes.append(variant.gene.name)
+        for disease in diseases:
+            disease_variants = list(disease.genetic_modification_cellline_disease_variants.all())
+            disease_mods_isogenic = list(disease.genetic_modification_cellline_disease_isogenic.all())
+            disease_mods_transgene_expression = list(disease.genetic_modification_cellline_disease_transgene_expression.all())
+            disease_mods_gene_ko = list(disease.genetic_modification_cellline_disease_gene_knock_out.all())
+            disease_mods_gene_ki = list(disease.genetic_modification_cellline_disease_gene_knock_in.all())
 
-        for mod in mods_isogenic:
-            if mod.gene and mod.gene.name:
-                genes.append(mod.gene.name)
+            if disease.disease:
+                genes = modification_genes(disease_variants, disease_mods_isogenic, disease_mods_transgene_expression, disease_mods_gene_ko, disease_mods_gene_ki)
+                if not genes:
+                    cellline_diseases_genes.append(disease.disease.name)
+                else:
+                    cellline_diseases_genes.append("%s (%s)" % (disease.disease.name, ", ".join(genes)))
 
-        for mod in mods_transgene_expression:
-            if mod.gene and mod.gene.name:
-                genes.append(mod.gene.name)
+            variants.extend(disease_variants)
+            mods_isogenic.extend(disease_mods_isogenic)
+            mods_transgene_expression.extend(disease_mods_transgene_expression)
+            mods_gene_ko.extend(disease_mods_gene_ko)
+            mods_gene_ki.extend(disease_mods_gene_ki)
 
-        for mod in mods_gene_ko:
-            if mod.gene and mod.gene.name:
-                genes.append(mod.gene.name)
+        for disease in donor_diseases:
+            variants.extend(disease.donor_disease_variants.all())
 
-        for mod in mods_gene_ki:
-            if mod.target_gene and mod.target_gene.name:
-                genes.append(mod.target_gene.name)
+        cellline_variants = list(self.genetic_modification_cellline_variants.all())
+        cellline_mods_isogenic = list(self.genetic_modification_cellline_isogenic.all())
+        cellline_mods_transgene_expression = list(self.genetic_modification_cellline_transgene_expression.all())
+        cellline_mods_gene_ko = list(self.genetic_modification_cellline_gene_knock_out.all())
+        cellline_mods_gene_ki = list(self.genetic_modification_cellline_gene_knock_in.all())
 
+        genes = modification_genes(cellline_variants, cellline_mods_isogenic, cellline_mods_transgene_expression, cellline_mods_gene_ko, cellline_mods_gene_ki)
         if genes:
             cellline_diseases_genes.append(", ".join(genes))
 
-
-        return cellline_diseases_genes
-
-    @property
-    def search_terms_genetics(self):
+        variants.extend(cellline_variants)
+        mods_isogenic.extend(cellline_mods_isogenic)
+        mods_transgene_expression.extend(cellline_mods_transgene_expression)
+        mods_gene_ko.extend(cellline_mods_gene_ko)
+        mods_gene_ki.extend(cellline_mods_gene_ki)
 
         genetics = []
-        variants = []
-        mods_isogenic = []
-        mods_transgene_expression = []
-        mods_gene_ko = []
-        mods_gene_ki = []
-
-        for disease in self.diseases.all():
-            mods_gene_ko.extend(disease.genetic_modification_cellline_disease_gene_knock_out.all())
-            mods_gene_ki.extend(disease.genetic_modification_cellline_disease_gene_knock_in.all())
-            mods_transgene_expression.extend(disease.genetic_modification_cellline_disease_transgene_expression.all())
-            mods_isogenic.extend(disease.genetic_modification_cellline_disease_isogenic.all())
-            variants.extend(disease.genetic_modification_cellline_disease_variants.all())
-        if self.donor:
-            for disease in self.donor.diseases.all():
-                variants.extend(disease.donor_disease_variants.all())
-        mods_gene_ko.extend(self.genetic_modification_cellline_gene_knock_out.all())
-        mods_gene_ki.extend(self.genetic_modification_cellline_gene_knock_in.all())
-        mods_transgene_expression.extend(self.genetic_modification_cellline_transgene_expression.all())
-        mods_isogenic.extend(self.genetic_modification_cellline_isogenic.all())
-        variants.extend(self.genetic_modification_cellline_variants.all())
 
         for variant in variants:
             if variant.gene:
                 genetics.append(variant.gene.name)
-            if variant.chromosome_location:
-                genetics.append(variant.chromosome_location)
-            if variant.nucleotide_sequence_hgvs:
-                genetics.append(variant.nucleotide_sequence_hgvs)
-            if variant.protein_sequence_hgvs:
-                genetics.append(variant.protein_sequence_hgvs)
-            if variant.zygosity_status:
-                genetics.append(variant.zygosity_status)
-            if variant.clinvar_id:
-                genetics.append(variant.clinvar_id)
-            if variant.dbsnp_id:
-                genetics.append(variant.dbsnp_id)
-            if variant.dbvar_id:
-                genetics.append(variant.dbvar_id)
-            if variant.publication_pmid:
-                genetics.append(variant.publication_pmid)
+            genetics.extend([v for v in (
+                variant.chromosome_location,
+                variant.nucleotide_sequence_hgvs,
+                variant.protein_sequence_hgvs,
+                variant.zygosity_status,
+                variant.clinvar_id,
+                variant.dbsnp_id,
+                variant.dbvar_id,
+                variant.publication_pmid,
+            ) if v])
 
         for mod in mods_isogenic:
             if mod.gene and mod.gene.name:
                 genetics.append(mod.gene.name)
-            if mod.chromosome_location:
-                genetics.append(mod.chromosome_location)
-            if mod.nucleotide_sequence_hgvs:
-                genetics.append(mod.nucleotide_sequence_hgvs)
-            if mod.protein_sequence_hgvs:
-                genetics.append(mod.protein_sequence_hgvs)
-            if mod.zygosity_status:
-                genetics.append(mod.zygosity_status)
-            if mod.modification_type:
-                genetics.append(mod.modification_type)
-
-        for mod in mods_transgene_expression:
+            genetics.extend([v for v in (
+                mod.chromosome_location,
+                mod.nucleotide_sequence_hgvs,
+                mod.protein_sequence_hgvs,
+                mod.zygosity_status,
+                mod.modification_type,
+            ) if v])
+
+        for mod in mods_transgene_expression + mods_gene_ko:
             if mod.gene and mod.gene.name:
                 genetics.append(mod.gene.name)
             if mod.chromosome_location:
                 genetics.append(mod.chromosome_location)
 
-        for mod in mods_gene_ko:
-            if mod.gene and mod.gene.name:
-                genetics.append(mod.gene.name)
-            if mod.chromosome_location:
-                genetics.append(mod.chromosome_location)
         for mod in mods_gene_ki:
             if mod.target_gene and mod.target_gene.name:
                 genetics.append(mod.target_gene.name)
             if mod.chromosome_location:
                 genetics.append(mod.chromosome_location)
 
-        return genetics
+        # Derivation
 
-    @property
-    def search_terms_derivation(self):
+        search_terms_derivation = []
+        filter_derivation = []
+        vector_genes = []
 
-        derivation = []
-        genes = []
         if hasattr(self, 'non_integrating_vector'):
             if self.non_integrating_vector.vector:
-                derivation.append(self.non_integrating_vector.vector.name)
-            genes.extend(self.non_integrating_vector.genes.all())
+                search_terms_derivation.append(self.non_integrating_vector.vector.name)
+                filter_derivation.append(self.non_integrating_vector.vector.name)
+            vector_genes.extend(self.non_integrating_vector.genes.all())
         if hasattr(self, 'integrating_vector'):
-            if self.integrating_vector.vector:
-                derivation.append(self.integrating_vector.vector.name)
-            if self.integrating_vector.virus:
-                derivation.append(self.integrating_vector.virus.name)
-            if self.integrating_vector.transposon:
-                derivation.append(self.integrating_vector.transposon.name)
-            genes.extend(self.integrating_vector.genes.all())
+            vector = self.integrating_vector
+            search_terms_derivation.extend([v.name for v in (vector.vector, vector.virus, vector.transposon) if v])
+            if vector.virus:
+                filter_derivation.append(vector.virus.name)
+            elif vector.transposon:
+                filter_derivation.append(vector.transposon.name)
+            elif vector.vector:
+                filter_derivation.append(vector.vector.name)
+            vector_genes.extend(vector.genes.all())
         if hasattr(self, 'derivation_vector_free_reprogramming_factors'):
             for factor in self.derivation_vector_free_reprogramming_factors.all():
-                derivation.append(factor.factor.name)
+                search_terms_derivation.append(factor.factor.name)
+                filter_derivation.append(factor.factor.name)
 
-        for gene in genes:
-            derivation.append(gene.name)
-        return derivation
+        search_terms_derivation.extend([gene.name for gene in vector_genes])
+
+        return {
+            'primary_disease': primary_disease,
+            'donor_diseases': [d.disease.name if d.disease else d.disease_not_normalised for d in donor_diseases],
+            'cellline_diseases': [d.disease.name if d.disease else d.disease_not_normalised for d in diseases],
+            'cellline_diseases_genes': cellline_diseases_genes,
+            'search_terms_genetics': genetics,
+            'search_terms_derivation': search_terms_derivation,
+            'filter_derivation': filter_derivation,
+        }
 
     @property
-    def filter_derivation(self):
+    def primary_disease(self):
+        return self._derived['primary_disease']
 
-        derivation = []
-        if hasattr(self, 'non_integrating_vector'):
-            if self.non_integrating_vector.vector:
-                derivation.append(self.non_integrating_vector.vector.name)
-        if hasattr(self, 'integrating_vector'):
-            if self.integrating_vector.virus:
-                derivation.append(self.integrating_vector.virus.name)
-            elif self.integrating_vector.transposon:
-                derivation.append(self.integrating_vector.transposon.name)
-            elif self.integrating_vector.vector:
-                derivation.append(self.integrating_vector.vector.name)
-        if hasattr(self, 'derivation_vector_free_reprogramming_factors'):
-            for factor in self.derivation_vector_free_reprogramming_factors.all():
-                derivation.append(factor.factor.name)
+    @property
+    def donor_diseases(self):
+        return self._derived['donor_diseases']
 
-        return derivation
+    @property
+    def cellline_diseases(self):
+        return self._derived['cellline_diseases']
+
+    @property
+    def cellline_diseases_genes(self):
+        return self._derived['cellline_diseases_genes']
+
+    @property
+    def search_terms_genetics(self):
+        return self._derived['search_terms_genetics']
+
+    @property
+    def search_terms_derivation(self):
+        return self._derived['search_terms_derivation']
+
+    @property
+    def filter_derivation(self):
+        return self._derived['filter_derivation']
 
     @property
     def all_diseases(self):
@@ -535,56 +606,25 @@ class Cellline(DirtyFieldsMixin, models.Model):
         }
 
     def get_latest_batch(self):
-        batches = self.batches.all()
-        active_batch_ids = []
-
-        if batches:
-            for batch in batches:
-                if batch.batch_id and not batch.batch_id.startswith('SAME'):
-                    active_batch_ids.append(batch.batch_id)
-
-            if active_batch_ids:
-                latest_batch_id = sorted(active_batch_ids, lambda a, b: cmp(int(b[1:]), int(a[1:])) != 0 or cmp(a[0], b[0]))[0]
-                return self.batches.get(batch_id=latest_batch_id)
-            else:
-                return None
-
-        else:
-            return None
+        '''Latest batch, maintained in latest_batch (use select_related to avoid the query).'''
+        return self.latest_batch
 
     def get_latest_clip(self):
-        clips = self.clips.all()
-        clips_versions = []
+        '''Latest CLIP, maintained in latest_clip (use select_related to avoid the query).'''
+        return self.latest_clip
 
-        def __vcmp(a, b):
-            x = int(a.lower().replace("v", ""));
-            y = int(b.lower().replace("v", ""));
-            return cmp(x, y)
+    def find_latest_batch(self):
+        return self.batches.exclude(number=None).order_by('-number', 'batch_id').first()
 
-        if clips:
-            for clip in clips:
-                clips_versions.append(clip.version)
-
-            if clips_versions:
-                latest_version = sorted(clips_versions, __vcmp, reverse=True)[0]
-                return self.clips.get(version=latest_version)
-            else:
-                return None
-
-        else:
-            return None
+    def find_latest_clip(self):
+        return self.clips.exclude(version_number=None).order_by('-version_number').first()
 
 
 class CelllineStatus(models.Model):
 
-    STATUS_CHOICES = (
-        ('not_available', _(u'Not available')),
-        ('at_ecacc', _(u'Stocked by ECACC')),
-        ('expand_to_order', _(u'Expand to order')),
-        ('restricted_distribution', _(u'Restricted distribution')),
-        ('recalled', _(u'Recalled')),
-        ('withdrawn', _(u'Withdrawn')),
-    )
+    '''Status log of a cell line. The latest entry is the line's current status.'''
+
+    STATUS_CHOICES = STATUS_CHOICES
 
     cell_line = models.ForeignKey('Cellline', verbose_name=_(u'Cell line'), related_name='statuses')
 
@@ -603,15 +643,17 @@ class CelllineStatus(models.Model):
         return self.status
 
     def save(self, *args, **kwargs):
-        super(CelllineStatus, self).save(*args, **kwargs)
-        self.cell_line.current_status = self
-        self.cell_line.save()
+        # Extra cell line fields to write together with the current status
+        cell_line_fields = kwargs.pop('cell_line_fields', {})
+        with transaction.atomic():
+            super(CelllineStatus, self).save(*args, **kwargs)
+            self.cell_line.set_current_status(self, **cell_line_fields)
 
     def delete(self, *args, **kwargs):
-        if self.cell_line.current_status == self:
-            self.cell_line.current_status = None
-            self.cell_line.save()
-        super(CelllineStatus, self).delete(*args, **kwargs)
+        with transaction.atomic():
+            if self.cell_line.current_status_id == self.pk:
+                self.cell_line.set_current_status(self.cell_line.statuses.exclude(pk=self.pk).first())
+            super(CelllineStatus, self).delete(*args, **kwargs)
 
 
 class CelllineInformationPack(models.Model):
@@ -619,6 +661,7 @@ class CelllineInformationPack(models.Model):
     cell_line = models.ForeignKey('Cellline', verbose_name=_(u'Cell line'), related_name='clips')
 
     version = models.CharField(_(u'CLIP version'), max_length=10, help_text='e.g. "v1"', validators=[RegexValidator('^v[0-9]+$', message='version needs the form v1, v2, ...')])
+    version_number = models.IntegerField(_(u'CLIP version number'), null=True, blank=True, editable=False)
     created = models.DateTimeField(u'Created', auto_now_add=True)
     updated = models.DateTimeField(u'Updated', auto_now=True)
 
@@ -634,6 +677,15 @@ class CelllineInformationPack(models.Model):
     def __unicode__(self):
         return u'%s' % (self.id,)
 
+    def save(self, *args, **kwargs):
+        self.version_number = clip_version_number(self.version)
+        super(CelllineInformationPack, self).save(*args, **kwargs)
+        self.cell_line.update_summary(bump=True, fields=['latest_clip_id'])
+
+    def delete(self, *args, **kwargs):
+        super(CelllineInformationPack, self).delete(*args, **kwargs)
+        self.cell_line.update_summary(bump=True, fields=['latest_clip_id'])
+
     def filename(self):
         return os.path.basename(self.clip_file.name)
 
@@ -641,7 +693,7 @@ class CelllineInformationPack(models.Model):
 # -----------------------------------------------------------------------------
 # Batch: Cellline -> Batch(es) -> Aliquot(s)
 
-class CelllineBatch(models.Model):
+class CelllineBatch(DirtyFieldsMixin, models.Model):
 
     BATCH_TYPE_CHOICES = (
         ('depositor', _(u'Depositor Expansion')),
@@ -655,6 +707,7 @@ class CelllineBatch(models.Model):
     biosamples_id = models.CharField(_(u'Biosamples ID'), max_length=100, unique=True)
 
     batch_id = models.CharField(_(u'Batch ID'), max_length=12)
+    number = models.IntegerField(_(u'Batch number'), null=True, blank=True, editable=False)
     batch_type = models.CharField(_(u'Batch type'), max_length=50, choices=BATCH_TYPE_CHOICES, default='unknown')
 
     vials_at_roslin = models.IntegerField(_(u'Vials at Central facility'), null=True, blank=True)
@@ -664,6 +717,9 @@ class CelllineBatch(models.Model):
     certificate_of_analysis = models.FileField(_(u'Certificate of analysis'), upload_to=upload_to, null=True, blank=True)
     certificate_of_analysis_md5 = models.CharField(_(u'Certificate of analysis md5'), max_length=100, null=True, blank=True)
 
+    # Changed whenever the batch or its vials, images or culture conditions change (API change feed)
+    updated = models.DateTimeField(_(u'Updated'), null=True, blank=True, editable=False, db_index=True)
+
     class Meta:
         verbose_name = _(u'Cell line batch')
         verbose_name_plural = _(u'Cell line batches')
@@ -673,6 +729,27 @@ class CelllineBatch(models.Model):
     def __unicode__(self):
         return u'%s' % (self.biosamples_id,)
 
+    def save(self, *args, **kwargs):
+        self.number = batch_number(self.batch_id)
+        changed = self.is_dirty(check_relationship=True)
+        if changed:
+            self.updated = timezone.now()
+        super(CelllineBatch, self).save(*args, **kwargs)
+        if changed:
+            self.cell_line.update_summary(bump=True, fields=['latest_batch_id'])
+
+    def delete(self, *args, **kwargs):
+        super(CelllineBatch, self).delete(*args, **kwargs)
+        self.cell_line.update_summary(bump=True, fields=['latest_batch_id'])
+
+    def touch(self):
+
+        '''Mark the batch and its line as changed, for writes to the batch's vials, images and culture conditions.'''
+
+        now = timezone.now()
+        CelllineBatch.objects.filter(pk=self.pk).update(updated=now)
+        Cellline.objects.filter(pk=self.cell_line_id).update(data_updated=now)
+
 
 class CelllineBatchImages(models.Model):
 
@@ -682,6 +759,10 @@ class CelllineBatchImages(models.Model):
     magnification = models.CharField(_(u'Magnification'), max_length=10, null=True, blank=True)
     time_point = models.CharField(_(u'Time point'), max_length=100, null=True, blank=True)
 
+    thumbnail = models.ImageField(_(u'Thumbnail'), upload_to=upload_to, width_field='thumbnail_width', height_field='thumbnail_height', null=True, blank=True)
+    thumbnail_width = models.PositiveIntegerField(_(u'Thumbnail width'), null=True, blank=True)
+    thumbnail_height = models.PositiveIntegerField(_(u'Thumbnail height'), null=True, blank=True)
+
     class Meta:
         verbose_name = _(u'Cell line batch image')
         verbose_name_plural = _(u'Cell line batch images')
@@ -690,6 +771,23 @@ class CelllineBatchImages(models.Model):
     def __unicode__(self):
         return u'%s' % (self.id,)
 
+    def save(self, *args, **kwargs):
+        super(CelllineBatchImages, self).save(*args, **kwargs)
+        self.batch.touch()
+
+    def delete(self, *args, **kwargs):
+        super(CelllineBatchImages, self).delete(*args, **kwargs)
+        self.batch.touch()
+
+    def update_thumbnail(self):
+
+        '''Render the catalogue/dashboard thumbnail of the image. Call before saving.'''
+
+        if self.image:
+            self.thumbnail = make_thumbnail(self.image, settings.BATCH_IMAGE_THUMBNAIL_WIDTH)
+        else:
+            self.thumbnail = None
+
 
 class CelllineAliquot(models.Model):
 
@@ -707,6 +805,14 @@ class CelllineAliquot(models.Model):
     def __unicode__(self):
         return u'%s' % (self.biosamples_id,)
 
+    def save(self, *args, **kwargs):
+        super(CelllineAliquot, self).save(*args, **kwargs)
+        self.batch.touch()
+
+    def delete(self, *args, **kwargs):
+        super(CelllineAliquot, self).delete(*args, **kwargs)
+        self.batch.touch()
+
 
 # -----------------------------------------------------------------------------
 # Donor
@@ -736,6 +842,10 @@ class Donor(DirtyFieldsMixin, models.Model):
     def __unicode__(self):
         return u'%s' % (self.biosamples_id,)
 
+    def bump_data_version(self):
+        '''Mark the data of all lines of the donor as changed (the donor is shown with each of them) with one UPDATE.'''
+        self.cellline_set.update(data_updated=timezone.now(), summary_donor_sex=self.gender.name if self.gender else None)
+
 
 class DonorRelatives(DirtyFieldsMixin, models.Model):
 
@@ -768,7 +878,7 @@ class DonorGenomeAnalysis(DirtyFieldsMixin, models.Model):
         return u'%s' % (self.id,)
 
 
-class DonorGenomeAnalysisFile(models.Model):
+class DonorGenomeAnalysisFile(DirtyFieldsMixin, models.Model):
 
     genome_analysis = models.ForeignKey('DonorGenomeAnalysis', verbose_name=_(u'Donor genome analysis'), related_name='donor_genome_analysis_files')
     vcf_file = models.FileField(_(u'VCF File'), upload_to=upload_to)
@@ -1171,6 +1281,10 @@ class BatchCultureConditions(DirtyFieldsMixin, models.Model):
     def __unicode__(self):
         return u'%s' % (self.id,)
 
+    def save(self, *args, **kwargs):
+        super(BatchCultureConditions, self).save(*args, **kwargs)
+        self.batch.touch()
+
 
 class CultureMediumOther(DirtyFieldsMixin, models.Model):
 
@@ -1402,7 +1516,7 @@ class CelllineCharacterization(DirtyFieldsMixin, models.Model):
 # Analysis of Undifferentiated Cells
 
 # Depositor provided files
-class DepositorDataFile(models.Model):
+class DepositorDataFile(DirtyFieldsMixin, models.Model):
 
     file_doc = models.FileField(_(u'File'), upload_to=upload_to, null=True, blank=True)
     file_enc = models.CharField(_(u'File enc'), max_length=300, null=True, blank=True)
@@ -1866,7 +1980,7 @@ class CelllineGenomeAnalysis(DirtyFieldsMixin, models.Model):
         return u'%s' % (self.id,)
 
 
-class CelllineGenomeAnalysisFile(models.Model):
+class CelllineGenomeAnalysisFile(DirtyFieldsMixin, models.Model):
 
     genome_analysis = models.ForeignKey('CelllineGenomeAnalysis', verbose_name=_(u'Cell line genome analysis'), related_name='genome_analysis_files')
     vcf_file = models.FileField(_(u'VCF File'), upload_to=upload_to)
@@ -1883,3 +1997,96 @@ class CelllineGenomeAnalysisFile(models.Model):
 
 
 # -----------------------------------------------------------------------------
+# Import runs (see importer.telemetry)
+
+class ImportRun(models.Model):
+
+    IMPORTER_CHOICES = (
+        ('hpscreg', _(u'hPSCreg')),
+        ('lims', _(u'LIMS')),
+        ('batches', _(u'Batches')),
+        ('toelastic', _(u'Elasticsearch')),
+    )
+
+    STATUS_CHOICES = (
+        ('running', _(u'Running')),
+        ('finished', _(u'Finished')),
+        ('failed', _(u'Failed')),
+    )
+
+    importer = models.CharField(_(u'Importer'), max_length=20, choices=IMPORTER_CHOICES, db_index=True)
+    status = models.CharField(_(u'Status'), max_length=20, choices=STATUS_CHOICES, default='running')
+    started = models.DateTimeField(_(u'Started'), db_index=True)
+    finished = models.DateTimeField(_(u'Finished'), null=True, blank=True)
+    seconds = models.FloatField(_(u'Duration (s)'), null=True, blank=True)
+
+    created = models.PositiveIntegerField(_(u'Created'), default=0)
+    updated = models.PositiveIntegerField(_(u'Updated'), default=0)
+    skipped = models.PositiveIntegerField(_(u'Skipped'), default=0)
+    failed = models.PositiveIntegerField(_(u'Failed'), default=0)
+
+    error = models.TextField(_(u'Error'), null=True, blank=True)
+
+    class Meta:
+        verbose_name = _(u'Import run')
+        verbose_name_plural = _(u'Import runs')
+        ordering = ['-started']
+
+    def __unicode__(self):
+        return u'%s %s' % (self.importer, self.started)
+
+
+class ImportRunStage(models.Model):
+
+    run = models.ForeignKey('ImportRun', verbose_name=_(u'Import run'), related_name='stages')
+    name = models.CharField(_(u'Stage'), max_length=100)
+    calls = models.PositiveIntegerField(_(u'Calls'), default=0)
+    seconds = models.FloatField(_(u'Total time (s)'), default=0)
+    max_seconds = models.FloatField(_(u'Slowest call (s)'), default=0)
+
+    class Meta:
+        verbose_name = _(u'Import run stage')
+        verbose_name_plural = _(u'Import run stages')
+        unique_together = ('run', 'name')
+        ordering = ['-seconds']
+
+    def __unicode__(self):
+        return u'%s' % (self.name,)
+
+
+# -----------------------------------------------------------------------------
+# Tombstones of deleted cell lines and batches (API change feed)
+
+class Tombstone(models.Model):
+
+    KIND_CHOICES = (
+        ('cellline', _(u'Cell line')),
+        ('batch', _(u'Batch')),
+    )
+
+    kind = models.CharField(_(u'Kind'), max_length=20, choices=KIND_CHOICES)
+    biosamples_id = models.CharField(_(u'Biosamples ID'), max_length=100)
+    name = models.CharField(_(u'Name'), max_length=100, null=True, blank=True)
+    deleted = models.DateTimeField(_(u'Deleted'), default=timezone.now, db_index=True)
+
+    class Meta:
+        verbose_name = _(u'Tombstone')
+        verbose_name_plural = _(u'Tombstones')
+        ordering = ['deleted']
+
+    def __unicode__(self):
+        return u'%s %s' % (self.kind, self.biosamples_id)
+
+
+# Signals, so rows deleted by cascades and queryset deletes get their tombstones too
+
+@receiver(post_delete, sender=Cellline)
+def cellline_deleted(sender, instance, **kwargs):
+    Tombstone.objects.create(kind='cellline', biosamples_id=instance.biosamples_id, name=instance.name)
+
+
+@receiver(post_delete, sender=CelllineBatch)
+def batch_deleted(sender, instance, **kwargs):
+    Tombstone.objects.create(kind='batch', biosamples_id=instance.biosamples_id, name=instance.batch_id)
+
+# -----------------------------------------------------------------------------
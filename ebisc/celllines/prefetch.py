@@ -0,0 +1,59 @@
+from django.db.models import Prefetch
+
+from .models import (
+    ModificationVariantDisease,
+    ModificationVariantNonDisease,
+    ModificationIsogenicDisease,
+    ModificationIsogenicNonDisease,
+    ModificationTransgeneExpressionDisease,
+    ModificationTransgeneExpressionNonDisease,
+    ModificationGeneKnockOutDisease,
+    ModificationGeneKnockOutNonDisease,
+    ModificationGeneKnockInDisease,
+    ModificationGeneKnockInNonDisease,
+)
+
+
+'''
+Prefetch plans shared by the cell line page (site.views), the API
+(api.celllines) and the search documents (elastic.documents).
+'''
+
+
+# -----------------------------------------------------------------------------
+# Genetic modifications of lines and line diseases
+
+MODIFICATION_RELATED = {
+    'variants': ('gene',),
+    'isogenic': ('gene',),
+    'transgene_expression': ('gene', 'virus', 'transposon'),
+    'gene_knock_out': ('gene', 'virus', 'transposon'),
+    'gene_knock_in': ('target_gene', 'transgene', 'virus', 'transposon'),
+}
+
+
+MODIFICATION_MODELS = {
+    'genetic_modification_cellline': {
+        'variants': ModificationVariantNonDisease,
+        'isogenic': ModificationIsogenicNonDisease,
+        'transgene_expression': ModificationTransgeneExpressionNonDisease,
+        'gene_knock_out': ModificationGeneKnockOutNonDisease,
+        'gene_knock_in': ModificationGeneKnockInNonDisease,
+    },
+    'genetic_modification_cellline_disease': {
+        'variants': ModificationVariantDisease,
+        'isogenic': ModificationIsogenicDisease,
+        'transgene_expression': ModificationTransgeneExpressionDisease,
+        'gene_knock_out': ModificationGeneKnockOutDisease,
+        'gene_knock_in': ModificationGeneKnockInDisease,
+    },
+}
+
+
+def modification_prefetches(prefix):
+    return [
+        Prefetch('%s_%s' % (prefix, modification), queryset=MODIFICATION_MODELS[prefix][modification].objects.select_related(*related))
+        for (modification, related) in sorted(MODIFICATION_RELATED.items())
+    ]
+
+# -----------------------------------------------------------------------------
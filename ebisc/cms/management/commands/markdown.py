@@ -0,0 +1,31 @@
+from django_docopt_command import DocOptCommand
+
+import logging
+logger = logging.getLogger('management.commands')
+
+from ebisc.cms.models import Page, Faq, render_markdown
+
+
+DOCS = '''
+Usage:
+    markdown render [--traceback]
+'''
+
+
+class Command(DocOptCommand):
+
+    docs = DOCS
+    help = 'Render the stored HTML of pages and FAQs again (e.g. after changing MARKDOWN_DEUX_STYLES)'
+
+    def handle_docopt(self, args):
+
+        if args.get('render'):
+
+            # Updated directly, so the pages' and FAQs' last update stays
+            for page in Page.objects.all():
+                logger.info('Rendering page %s' % page.path)
+                Page.objects.filter(pk=page.pk).update(body_html=render_markdown(page.body))
+
+            for faq in Faq.objects.all():
+                logger.info('Rendering FAQ %s' % faq.slug)
+                Faq.objects.filter(pk=faq.pk).update(answer_html=render_markdown(faq.answer))
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+import markdown_deux
+
+
+# Copy of render_markdown in cms.models at the time of this migration
+
+def render_markdown(text):
+    return unicode(markdown_deux.markdown(text))
+
+
+def render_html(apps, schema_editor):
+
+    Page = apps.get_model('cms', 'Page')
+    Faq = apps.get_model('cms', 'Faq')
+
+    for page in Page.objects.all():
+        Page.objects.filter(pk=page.pk).update(body_html=render_markdown(page.body))
+
+    for faq in Faq.objects.all():
+        Faq.objects.filter(pk=faq.pk).update(answer_html=render_markdown(faq.answer))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cms', '0002_auto_20170425_1748'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='faq',
+            name='answer_html',
+            field=models.TextField(blank=True, default='', editable=False, verbose_name='Answer HTML'),
+        ),
+        migrations.AddField(
+            model_name='page',
+            name='body_html',
+            field=models.TextField(blank=True, default='', editable=False, verbose_name='Body HTML'),
+        ),
+        migrations.RunPython(render_html, migrations.RunPython.noop),
+    ]
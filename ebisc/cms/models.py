@@ -2,6 +2,15 @@ from django.db import models
 
 from django.utils.text import slugify
 
+import markdown_deux
+
+
+def render_markdown(text):
+
+    '''HTML of Markdown text, rendered with the default MARKDOWN_DEUX_STYLES style (as the markdown template filter).'''
+
+    return unicode(markdown_deux.markdown(text))
+
 
 class Page(models.Model):
 
@@ -11,6 +20,7 @@ class Page(models.Model):
     path = models.CharField(u'Path', max_length=500, unique=True)
     title = models.CharField(u'Title', max_length=200)
     body = models.TextField(u'Body', null=True, blank=True)
+    body_html = models.TextField(u'Body HTML', blank=True, default='', editable=False)
 
     class Meta:
         verbose_name = u'Page'
@@ -20,6 +30,13 @@ class Page(models.Model):
     def __unicode__(self):
         return self.title
 
+    def save(self, *args, **kwargs):
+        self.render()
+        super(Page, self).save(*args, **kwargs)
+
+    def render(self):
+        self.body_html = render_markdown(self.body)
+
 
 class Document(models.Model):
 
@@ -60,6 +77,7 @@ class Faq(models.Model):
     category = models.ForeignKey(FaqCategory, verbose_name=u'Category', related_name='faqs')
     question = models.CharField(u'Question', max_length=1000)
     answer = models.TextField(u'Answer')
+    answer_html = models.TextField(u'Answer HTML', blank=True, default='', editable=False)
 
     class Meta:
         verbose_name = u'FAQ'
@@ -70,6 +88,13 @@ class Faq(models.Model):
     def __unicode__(self):
         return self.question
 
+    def save(self, *args, **kwargs):
+        self.render()
+        super(Faq, self).save(*args, **kwargs)
+
+    def render(self):
+        self.answer_html = render_markdown(self.answer)
+
     @property
     def slug(self):
         return slugify(self.question)
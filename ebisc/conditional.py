@@ -0,0 +1,83 @@
+import hashlib
+from calendar import timegm
+
+from django.conf import settings
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date
+
+
+'''
+Conditional GET.
+
+Views compute validators for a response from the data versions of what it
+shows (Cellline.data_updated, CelllineBatch.updated, Page.updated, the last
+search index run, ...) before loading or rendering anything else:
+not_modified() answers 304 Not Modified when they match the request's
+If-None-Match/If-Modified-Since, otherwise the view renders its response and
+set_validators() adds ETag, Last-Modified and Cache-Control to it.
+
+HTTP_CACHE_VERSION is part of every ETag, bump it when a deployment changes
+responses without changing data (templates, API fields).
+'''
+
+
+# -----------------------------------------------------------------------------
+# Validators
+
+def make_etag(*parts):
+    key = u':'.join(unicode(part) for part in (settings.HTTP_CACHE_VERSION,) + parts)
+    return '"%s"' % hashlib.md5(key.encode('utf-8')).hexdigest()
+
+
+def timestamp(time):
+    return timegm(time.utctimetuple()) if time is not None else None
+
+
+def user_key(request):
+
+    '''Part of the ETag of pages that show the user (menu, login state).'''
+
+    return request.user.pk if request.user.is_authenticated() else 'anonymous'
+
+
+# -----------------------------------------------------------------------------
+# Responses
+
+def not_modified(request, etag=None, last_modified=None, cache_control=None, vary=None):
+
+    '''A 304 (or 412) response if the request's validators match, None otherwise.'''
+
+    response = get_conditional_response(request, etag=etag, last_modified=timestamp(last_modified))
+
+    if response is not None:
+        set_validators(response, etag, last_modified, cache_control, vary)
+
+    return response
+
+
+def set_validators(response, etag=None, last_modified=None, cache_control=None, vary=None):
+
+    if response.status_code not in (200, 304):
+        return response
+
+    if etag is not None:
+        response['ETag'] = etag
+    if last_modified is not None:
+        response['Last-Modified'] = http_date(timestamp(last_modified))
+    if cache_control:
+        patch_cache_control(response, **cache_control)
+    if vary:
+        patch_vary_headers(response, vary)
+
+    return response
+
+
+def public(max_age):
+    return {'public': True, 'max_age': max_age}
+
+
+def private():
+    # Clients keep the response, but check with the server before using it
+    return {'private': True, 'max_age': 0, 'must_revalidate': True}
+
+# -----------------------------------------------------------------------------
@@ -0,0 +1,76 @@
+import threading
+
+from elasticsearch import Elasticsearch
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+from ebisc.celllines.models import ImportRun
+
+
+'''
+Search backends of the catalogue search proxy (elastic.views).
+
+SEARCH_BACKEND selects the backend of a deployment: ElasticsearchBackend
+forwards searches to the cluster in ELASTIC_HOSTS, elastic.memory.MemoryBackend
+answers them in-process from the database (for small installs and
+development, no cluster needed). A backend has
+
+    search(query) -> response
+    msearch([query, ...]) -> {'responses': [response, ...]}
+    version() -> time of the indexed data (None if unknown), for conditional GETs
+
+and raises BadSearch for searches it can't run. The backend is created on
+first use, once per process.
+'''
+
+
+class BadSearch(ValueError):
+    pass
+
+
+# -----------------------------------------------------------------------------
+# Backend of the process
+
+backend = None
+lock = threading.Lock()
+
+
+def get_backend():
+
+    global backend
+
+    if backend is None:
+        with lock:
+            if backend is None:
+                backend = import_string(settings.SEARCH_BACKEND)()
+
+    return backend
+
+
+# -----------------------------------------------------------------------------
+# Elasticsearch
+
+class ElasticsearchBackend(object):
+
+    def __init__(self):
+        # The connection pool of the client is shared by the request threads
+        self.es = Elasticsearch(settings.ELASTIC_HOSTS, **settings.ELASTIC_CLIENT)
+
+    def search(self, query):
+        return self.es.search(index=settings.ELASTIC_INDEX, doc_type='cellline', body=query)
+
+    def msearch(self, queries):
+
+        # Empty headers, the index and type are the proxy's
+        body = []
+        for query in queries:
+            body.extend([{}, query])
+
+        return self.es.msearch(index=settings.ELASTIC_INDEX, doc_type='cellline', body=body)
+
+    def version(self):
+        # The index is only written by the search index importer
+        return ImportRun.objects.filter(importer='toelastic', status='finished').order_by('-started').values_list('finished', flat=True).first()
+
+# -----------------------------------------------------------------------------
@@ -0,0 +1,77 @@
+import os
+import json
+
+from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import Prefetch
+
+import logging
+logger = logging.getLogger('management.commands')
+
+from ebisc.celllines.models import Cellline, CelllineDisease, DonorDisease, DonorDiseaseVariant, CelllineVectorFreeReprogrammingFactor
+from ebisc.celllines.prefetch import modification_prefetches
+
+
+'''
+Cell line documents of the catalogue search (Cellline.to_elastic()), for the
+Elasticsearch index (see celllines.importer.toelastic) and the in-process
+search backend (see elastic.memory).
+'''
+
+
+BASEDIR = os.path.join(os.path.dirname(__file__), '../celllines/elastic/')
+MAPPINGS = {'cellline': os.path.abspath(os.path.join(BASEDIR, 'mappings/cellline.json'))}
+SETTINGS = os.path.abspath(os.path.join(BASEDIR, 'settings.json'))
+
+
+# -----------------------------------------------------------------------------
+# Documents
+
+def celllines(names=None):
+
+    '''Lines shown in the catalogue search (all, or those of the given names), with everything to_elastic() reads (the number of queries does not depend on the number of lines).'''
+
+    queryset = Cellline.objects.all() if names is None else Cellline.objects.filter(name__in=names)
+
+    return prefetched(queryset.filter(available_for_sale_at_ecacc=True).exclude(status__in=['withdrawn', 'not_available', 'recalled']))
+
+
+def prefetched(queryset):
+
+    '''The lines of queryset with everything to_elastic() and get_summary() read.'''
+
+    return queryset.select_related(
+        'generator',
+        'donor__gender',
+        'donor_age',
+        'derivation__primary_cell_type',
+        'integrating_vector__vector',
+        'integrating_vector__virus',
+        'integrating_vector__transposon',
+        'non_integrating_vector__vector',
+    ).prefetch_related(
+        Prefetch('diseases', queryset=CelllineDisease.objects.select_related('disease').prefetch_related(*modification_prefetches('genetic_modification_cellline_disease'))),
+        Prefetch('donor__diseases', queryset=DonorDisease.objects.select_related('disease').prefetch_related(
+            Prefetch('donor_disease_variants', queryset=DonorDiseaseVariant.objects.select_related('gene')))),
+        Prefetch('derivation_vector_free_reprogramming_factors', queryset=CelllineVectorFreeReprogrammingFactor.objects.select_related('factor')),
+        'integrating_vector__genes',
+        'non_integrating_vector__genes',
+        *modification_prefetches('genetic_modification_cellline')
+    )
+
+
+def documents(names=None):
+
+    '''Yield (cell line, document) for the lines in the search (all, or those of the given names); lines with incomplete data are logged and skipped.'''
+
+    for cellline in celllines(names):
+        try:
+            yield (cellline, cellline.to_elastic())
+        except ObjectDoesNotExist, e:
+            logger.warn(u'Cell line %s can\'t be searched: %s' % (cellline.name, e))
+
+
+def mapping(doc_type='cellline'):
+    with open(MAPPINGS[doc_type]) as fi:
+        return json.load(fi)[doc_type]
+
+# -----------------------------------------------------------------------------
@@ -0,0 +1,455 @@
+import re
+import time
+import threading
+from collections import defaultdict
+
+from django.conf import settings
+from django.db.models import Max
+
+from ebisc.celllines.models import Cellline, Tombstone
+
+from .backends import BadSearch
+from .documents import documents, mapping
+
+
+'''
+In-process search backend (SEARCH_BACKEND = 'ebisc.elastic.memory.MemoryBackend').
+
+The documents of the searchable lines (see elastic.documents) are indexed in
+memory, following the Elasticsearch mapping: not analyzed fields map each
+value to the bitmap (an int, one bit per document) of the documents that
+have it, analyzed fields map the edge n-grams of their tokens (as the
+*_autocomplete analyzers index them) to bitmaps. Queries and facet counts
+are then ANDs, ORs and bit counts of bitmaps.
+
+It answers the subset of the query DSL the catalogue search uses:
+match_all, match, multi_match, filtered, bool, term(s) and query filters,
+global, filter and terms aggregations, sort and from/size; other searches
+are refused with BadSearch. Scores are simpler than Elasticsearch's (a
+whole word matching counts more than a prefix), so the order of hits with
+equal relevance can differ.
+
+Each process builds its own index on first use, and rebuilds it when the
+data version of the lines changed, checked at most every
+SEARCH_MEMORY_INDEX_TIMEOUT seconds. While one thread rebuilds the index,
+the others keep using the previous one.
+'''
+
+
+MAX_GRAM = 20
+
+ALPHANUMERIC = re.compile(r'[^A-Za-z0-9\s]+')
+WORD = re.compile(r'[^\W_]+', re.UNICODE)
+
+
+# -----------------------------------------------------------------------------
+# Analyzers (settings.json of the Elasticsearch index)
+
+def standard(text):
+    return [token.lower() for token in WORD.findall(text)]
+
+
+def name_index(text):
+    return standard(ALPHANUMERIC.sub(u'', text))
+
+
+def name_query(text):
+    return ALPHANUMERIC.sub(u'', text).lower().split()
+
+
+INDEX_ANALYZERS = {
+    'text_autocomplete': standard,
+    'name_autocomplete': name_index,
+}
+
+SEARCH_ANALYZERS = {
+    'standard': standard,
+    'name_query': name_query,
+}
+
+
+def edge_grams(token):
+    return [token[:n] for n in range(1, min(len(token), MAX_GRAM) + 1)]
+
+
+# -----------------------------------------------------------------------------
+# Bitmaps
+
+def bits(bitmap):
+
+    '''Positions of the set bits of bitmap, lowest first.'''
+
+    while bitmap:
+        lowest = bitmap & -bitmap
+        yield lowest.bit_length() - 1
+        bitmap ^= lowest
+
+
+def count(bitmap):
+    return bin(bitmap).count('1')
+
+
+def union(bitmaps):
+    result = 0
+    for bitmap in bitmaps:
+        result |= bitmap
+    return result
+
+
+def as_list(value):
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+def values_of(document, field):
+    return [unicode(value) for value in as_list(document.get(field)) if value is not None]
+
+
+# -----------------------------------------------------------------------------
+# Index
+
+class Index(object):
+
+    def __init__(self, documents, mapping):
+
+        self.ids = []
+        self.sources = []
+
+        # field -> value -> bitmap, analyzed field -> edge n-gram/token -> bitmap
+        self.terms = defaultdict(lambda: defaultdict(int))
+        self.grams = defaultdict(lambda: defaultdict(int))
+        self.tokens = defaultdict(lambda: defaultdict(int))
+
+        # analyzed field -> (source field, index analyzer, search analyzer)
+        self.analyzed = {}
+
+        for (name, field) in mapping['properties'].items():
+            if field.get('index') == 'analyzed':
+                self.analyzed[name] = (name, INDEX_ANALYZERS[field['index_analyzer']], SEARCH_ANALYZERS[field['search_analyzer']])
+            for (subname, subfield) in field.get('fields', {}).items():
+                self.analyzed['%s.%s' % (name, subname)] = (name, INDEX_ANALYZERS[subfield['index_analyzer']], SEARCH_ANALYZERS[subfield['search_analyzer']])
+
+        not_analyzed = [name for (name, field) in mapping['properties'].items() if field.get('index') == 'not_analyzed']
+
+        for (doc_id, document) in documents:
+            bit = 1 << len(self.ids)
+            self.ids.append(doc_id)
+            self.sources.append(document)
+
+            for name in not_analyzed:
+                for value in values_of(document, name):
+                    self.terms[name][value] |= bit
+
+            for (name, (source, index_analyzer, search_analyzer)) in self.analyzed.items():
+                for value in values_of(document, source):
+                    for token in index_analyzer(value):
+                        self.tokens[name][token] |= bit
+                        for gram in edge_grams(token):
+                            self.grams[name][gram] |= bit
+
+        self.all = (1 << len(self.ids)) - 1
+
+        # Read only from here on, lookups of unknown fields must not add them
+        self.terms = dict(self.terms)
+        self.grams = dict(self.grams)
+        self.tokens = dict(self.tokens)
+
+    # Queries and filters
+
+    def query(self, query):
+
+        '''Bitmap of the documents matching a query or filter.'''
+
+        if not query:
+            return self.all
+
+        if not isinstance(query, dict) or len(query) != 1:
+            raise BadSearch('Unsupported query: %s' % query)
+
+        ((kind, args),) = query.items()
+
+        method = getattr(self, 'query_%s' % kind, None)
+        if method is None:
+            raise BadSearch('Unsupported query: %s' % kind)
+
+        return method(args)
+
+    def query_match_all(self, args):
+        return self.all
+
+    def query_filtered(self, args):
+        return self.query(args.get('query')) & self.query(args.get('filter'))
+
+    def query_query(self, args):
+        # A query used as filter
+        return self.query(args)
+
+    def query_bool(self, args):
+
+        result = self.all
+
+        for query in as_list(args.get('must')) + as_list(args.get('filter')):
+            result &= self.query(query)
+        for query in as_list(args.get('must_not')):
+            result &= ~self.query(query)
+
+        if args.get('should') and not (args.get('must') or args.get('filter')):
+            result &= union(self.query(query) for query in as_list(args['should']))
+
+        return result & self.all
+
+    def query_match(self, args):
+        ((field, value),) = args.items()
+        return self.match(field, value['query'] if isinstance(value, dict) else value)
+
+    def query_multi_match(self, args):
+        return union(self.match(field, args['query']) for field in args.get('fields', []))
+
+    def query_term(self, args):
+        ((field, value),) = args.items()
+        return self.terms.get(field, {}).get(unicode(value['value'] if isinstance(value, dict) else value), 0)
+
+    def query_terms(self, args):
+        return union(
+            union(self.terms.get(field, {}).get(unicode(value), 0) for value in values)
+            for (field, values) in args.items() if field not in ('execution', '_cache')
+        )
+
+    def match(self, field, text):
+
+        field = field.split('^')[0]
+
+        if field in self.analyzed:
+            search_analyzer = self.analyzed[field][2]
+            return union(self.grams.get(field, {}).get(token, 0) for token in search_analyzer(unicode(text)) if len(token) <= MAX_GRAM)
+        else:
+            return self.terms.get(field, {}).get(unicode(text), 0)
+
+    # Scores
+
+    def matches(self, query):
+
+        '''(field list, text) of the match and multi_match queries of query, the ones that score.'''
+
+        if not isinstance(query, dict):
+            return []
+
+        result = []
+
+        for (kind, args) in query.items():
+            if kind == 'multi_match':
+                result.append((args.get('fields', []), args['query']))
+            elif kind == 'match':
+                ((field, value),) = args.items()
+                result.append(([field], value['query'] if isinstance(value, dict) else value))
+            elif kind == 'filtered':
+                result.extend(self.matches(args.get('query')))
+            elif kind == 'bool':
+                for clause in ('must', 'should'):
+                    for subquery in as_list(args.get(clause)):
+                        result.extend(self.matches(subquery))
+
+        return result
+
+    def scores(self, query, hits):
+
+        '''Score of each hit: per match query the best field, 2 if it has a whole word of the query, 1 if it has a word starting with one.'''
+
+        scores = dict((i, 0.0) for i in bits(hits))
+
+        for (fields, text) in self.matches(query):
+            best = dict((i, 0.0) for i in bits(hits))
+            for field in [field.split('^')[0] for field in fields]:
+                if field not in self.analyzed:
+                    continue
+                for token in self.analyzed[field][2](unicode(text)):
+                    whole = self.tokens.get(field, {}).get(token, 0)
+                    for i in bits(hits & self.grams.get(field, {}).get(token, 0)):
+                        best[i] = max(best[i], 2.0 if whole >> i & 1 else 1.0)
+            for (i, score) in best.items():
+                scores[i] += score
+
+        # match_all scores 1
+        return dict((i, score or 1.0) for (i, score) in scores.items())
+
+    # Aggregations
+
+    def aggregations(self, aggregations, context):
+
+        result = {}
+
+        for (name, aggregation) in aggregations.items():
+
+            subaggregations = aggregation.get('aggs') or aggregation.get('aggregations') or {}
+            kinds = [kind for kind in aggregation if kind not in ('aggs', 'aggregations', 'meta')]
+
+            if len(kinds) != 1:
+                raise BadSearch('Unsupported aggregation: %s' % name)
+
+            kind = kinds[0]
+
+            if kind == 'global':
+                documents = self.all
+            elif kind == 'filter':
+                documents = context & self.query(aggregation['filter'])
+            elif kind == 'terms':
+                result[name] = self.terms_aggregation(aggregation['terms'], context, subaggregations)
+                continue
+            else:
+                raise BadSearch('Unsupported aggregation: %s' % kind)
+
+            result[name] = {'doc_count': count(documents)}
+            result[name].update(self.aggregations(subaggregations, documents))
+
+        return result
+
+    def terms_aggregation(self, args, context, subaggregations):
+
+        buckets = []
+        for (value, bitmap) in self.terms.get(args['field'], {}).items():
+            documents = bitmap & context
+            if count(documents) >= args.get('min_doc_count', 1):
+                buckets.append((value, documents))
+
+        order = args.get('order', {'_count': 'desc'})
+        ((key, direction),) = order.items()
+
+        if key == '_term':
+            buckets.sort(key=lambda bucket: bucket[0], reverse=direction == 'desc')
+        elif key == '_count':
+            buckets.sort(key=lambda bucket: bucket[0])
+            buckets.sort(key=lambda bucket: count(bucket[1]), reverse=direction == 'desc')
+        else:
+            raise BadSearch('Unsupported order: %s' % key)
+
+        size = args.get('size', 10)
+        shown = buckets[:size] if size else buckets
+
+        result = []
+        for (value, documents) in shown:
+            bucket = {'key': value, 'doc_count': count(documents)}
+            bucket.update(self.aggregations(subaggregations, documents))
+            result.append(bucket)
+
+        return {
+            'doc_count_error_upper_bound': 0,
+            'sum_other_doc_count': sum(count(documents) for (value, documents) in buckets[len(shown):]),
+            'buckets': result,
+        }
+
+    # Search
+
+    def search(self, body):
+
+        start = time.time()
+
+        query = body.get('query')
+        hits = self.query(query)
+        scores = self.scores(query, hits)
+
+        order = list(bits(hits))
+
+        sort = [sort_order(spec) for spec in as_list(body.get('sort'))] or [('_score', 'desc')]
+        for (field, direction) in reversed(sort):
+            if field == '_score':
+                order.sort(key=lambda i: scores[i], reverse=direction == 'desc')
+            else:
+                pick = min if direction == 'asc' else max
+                values = dict((i, values_of(self.sources[i], field)) for i in order)
+                if direction == 'asc':
+                    order.sort(key=lambda i: (not values[i], pick(values[i]) if values[i] else None))
+                else:
+                    order.sort(key=lambda i: (bool(values[i]), pick(values[i]) if values[i] else None), reverse=True)
+
+        offset = body.get('from', 0)
+        size = body.get('size', 10)
+        scored = sort == [('_score', 'desc')]
+
+        response = {
+            'timed_out': False,
+            '_shards': {'total': 1, 'successful': 1, 'failed': 0},
+            'hits': {
+                'total': len(order),
+                'max_score': max(scores.values()) if scores and scored else None,
+                'hits': [{
+                    '_index': settings.ELASTIC_INDEX,
+                    '_type': 'cellline',
+                    '_id': self.ids[i],
+                    '_score': scores[i] if scored else None,
+                    '_source': self.sources[i],
+                } for i in order[offset:offset + size]],
+            },
+        }
+
+        if body.get('aggs') or body.get('aggregations'):
+            response['aggregations'] = self.aggregations(body.get('aggs') or body.get('aggregations'), hits)
+
+        response['took'] = int((time.time() - start) * 1000)
+
+        return response
+
+
+def sort_order(spec):
+
+    '''(field, direction) of a sort specification.'''
+
+    if not isinstance(spec, dict):
+        return (spec, 'desc' if spec == '_score' else 'asc')
+
+    ((field, order),) = spec.items()
+    direction = order.get('order', 'asc') if isinstance(order, dict) else order
+
+    return (field, direction)
+
+
+# -----------------------------------------------------------------------------
+# Backend
+
+class MemoryBackend(object):
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.index = None
+        self.indexed = None
+        self.checked = None
+
+    def current(self):
+
+        if self.index is not None and time.time() - self.checked < settings.SEARCH_MEMORY_INDEX_TIMEOUT:
+            return self.index
+
+        # Wait only if there is no index yet
+        if not self.lock.acquire(self.index is None):
+            return self.index
+
+        try:
+            if self.index is None or time.time() - self.checked >= settings.SEARCH_MEMORY_INDEX_TIMEOUT:
+                version = self.version()
+                if self.index is None or version != self.indexed:
+                    self.index = Index(((str(cellline.pk), document) for (cellline, document) in documents()), mapping())
+                    self.indexed = version
+                self.checked = time.time()
+        finally:
+            self.lock.release()
+
+        return self.index
+
+    def search(self, query):
+        return self.current().search(query)
+
+    def msearch(self, queries):
+        index = self.current()
+        return {'responses': [index.search(query) for query in queries]}
+
+    def version(self):
+
+        # Changes of lines (including leaving the search) bump data_updated, deleted lines leave a tombstone
+        times = [
+            Cellline.objects.aggregate(updated=Max('data_updated'))['updated'],
+            Tombstone.objects.filter(kind='cellline').aggregate(deleted=Max('deleted'))['deleted'],
+        ]
+
+        return max([t for t in times if t is not None] or [None])
+
+# -----------------------------------------------------------------------------
@@ -1,19 +1,62 @@
 import json
-from functools import partial
-from elasticsearch import Elasticsearch, ElasticsearchException
+from elasticsearch import ElasticsearchException
 
 from django.http import Http404, JsonResponse, HttpResponseNotAllowed
 from django.conf import settings
 from django.views.decorators.csrf import csrf_exempt
 
-es = Elasticsearch(settings.ELASTIC_HOSTS)
+from ebisc import conditional
+from ebisc.instrumentation import timed
+
+from .backends import BadSearch, get_backend
+
+
+'''
+Searches are POSTed with the query as body, or sent with GET and the query in
+the source parameter (as Elasticsearch itself accepts them). GET responses can
+be cached by browsers and nginx: they are validated by the version of the
+searched data (see backends). The catalogue page sends its searches with GET.
+
+_msearch takes several searches in one request (newline separated header and
+query lines, as Elasticsearch does) and runs them with one round-trip to the
+backend. The headers can't select other indexes: they are ignored, the
+proxy's index and type are searched. It is not cached, and the catalogue page
+doesn't use it: it runs one search per change of the filters.
+'''
+
+
+def parse_search(source):
+    try:
+        return json.loads(source)
+    except ValueError:
+        raise BadSearch('The search is not valid JSON')
+
+
+def parse_msearch(source):
+
+    '''Queries of an _msearch body (the lines after the headers).'''
+
+    lines = [line for line in source.splitlines() if line.strip()]
+
+    if len(lines) % 2:
+        raise BadSearch('Each search needs a header and a query line')
+    if len(lines) // 2 > settings.ELASTIC_MSEARCH_LIMIT:
+        raise BadSearch('At most %d searches can be sent at once' % settings.ELASTIC_MSEARCH_LIMIT)
+
+    return [parse_search(query) for query in lines[1::2]]
 
 
 ENDPOINTS = {
     'ebisc/cellline/_search': {
+        'methods': ['GET', 'POST'],
+        'parse': parse_search,
+        'action': lambda body: get_backend().search(body),
+    },
+    'ebisc/cellline/_msearch': {
         'methods': ['POST'],
-        'action': partial(es.search, index='ebisc', doc_type='cellline')
-    }
+        'parse': parse_msearch,
+        'action': lambda body: get_backend().msearch(body),
+    },
 }
 
 
@@ -28,11 +71,37 @@ def endpoint(request, path):
     if endpoint.get('methods', None) and request.method not in endpoint.get('methods', []):
         return HttpResponseNotAllowed(endpoint.get('methods'))
 
+    validators = {}
+
+    if request.method == 'GET':
+        source = request.GET.get('source', '{}')
+        indexed = get_backend().version()
+
+        if indexed is not None:
+            validators = {
+                'etag': conditional.make_etag('search', path, source, indexed),
+                'last_modified': indexed,
+                'cache_control': conditional.public(settings.CATALOG_HTTP_MAX_AGE),
+            }
+            response = conditional.not_modified(request, **validators)
+            if response is not None:
+                return response
+    else:
+        source = request.body
+
+    try:
+        body = endpoint['parse'](source)
+    except BadSearch, e:
+        return JsonResponse({'error': unicode(e)}, status=400)
+
     try:
-        res = endpoint['action'](body=json.loads(request.body))
+        with timed('elastic'):
+            res = endpoint['action'](body)
+    except BadSearch, e:
+        return JsonResponse({'error': unicode(e)}, status=400)
     except ElasticsearchException, e:
         return JsonResponse(e.info, status=e.status_code)
     except Exception:
         return JsonResponse({}, status=500)
 
-    return JsonResponse(res)
+    return conditional.set_validators(JsonResponse(res), **validators)
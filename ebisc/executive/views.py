@@ -1,5 +1,4 @@
 import csv
-import hashlib
 import requests
 from datetime import datetime
 
@@ -21,7 +20,8 @@ from django.db.models import Q
 from django.db.models.functions import Lower
 
 from ebisc.site.views import render
-from ebisc.celllines.models import Cellline, CelllineStatus, CelllineBatch, CelllineInformationPack, CelllineAliquot, Disease, Organization, BatchCultureConditions, CelllineBatchImages
+from ebisc.celllines.files import save_with_digest
+from ebisc.celllines.models import Cellline, CelllineStatus, CelllineBatch, CelllineInformationPack, CelllineAliquot, CelllineDisease, Disease, DonorDisease, Organization, BatchCultureConditions, CelllineBatchImages
 
 
 class BiosamplesError(Exception):
@@ -35,12 +35,12 @@ def dashboard(request):
 
     COLUMNS = [
         ('cellLineName', 'Cell line Name', 'name'),
-        ('disease', 'Disease', 'diseases'),
-        ('depositor', 'Depositor', 'generator__name'),
+        ('disease', 'Disease', 'summary_primary_disease'),
+        ('depositor', 'Depositor', 'summary_depositor'),
         ('validated', 'Validated', 'validated'),
         ('batches', 'Batches', None),
         ('quantity', 'QTY', None),
-        ('status', 'Status', 'current_status__status'),
+        ('status', 'Status', 'status'),
         ('forSale', 'For Sale', 'available_for_sale_at_ecacc'),
     ]
 
@@ -66,16 +66,19 @@ def dashboard(request):
     diseases = Disease.objects.filter(name__isnull=False).order_by(Lower('name'))
 
     if filters['status']:
-        cellline_objects = cellline_objects.filter(current_status__status=request.GET.get('status', None))
+        cellline_objects = cellline_objects.filter(status=request.GET.get('status', None))
 
     if filters['depositor']:
-        cellline_objects = cellline_objects.filter(generator__name=request.GET.get('depositor', None))
+        cellline_objects = cellline_objects.filter(summary_depositor=request.GET.get('depositor', None))
 
     if filters['disease']:
-        cellline_objects = cellline_objects.filter(Q(diseases__disease__name=request.GET.get('disease', None)) | Q(donor__diseases__disease__name=request.GET.get('disease', None)))
+        # Subqueries instead of joins: no duplicate rows and no join over all diseases
+        cellline_objects = cellline_objects.filter(
+            Q(id__in=CelllineDisease.objects.filter(disease__name=filters['disease']).values('cell_line')) |
+            Q(donor__in=DonorDisease.objects.filter(disease__name=filters['disease']).values('donor')))
 
     # Select related
-    cellline_objects = cellline_objects.select_related('generator', 'donor')
+    cellline_objects = cellline_objects.select_related('donor', 'current_status')
     cellline_objects = cellline_objects.prefetch_related('batches', 'diseases', 'diseases__disease', 'donor__diseases', 'donor__diseases__disease')
 
     # Sorting
@@ -118,11 +121,11 @@ def dashboard(request):
         'celllines': celllines,
         'celllines_registered': Cellline.objects.count(),
         'celllines_validated': Cellline.objects.filter(validated__lt=3).count(),
-        'celllines_at_ecacc': Cellline.objects.filter(current_status__status='at_ecacc').count(),
-        'celllines_expand_to_order': Cellline.objects.filter(current_status__status='expand_to_order').count(),
-        'celllines_restricted_distribution': Cellline.objects.filter(current_status__status='restricted_distribution').count(),
-        'celllines_recalled': Cellline.objects.filter(current_status__status='recalled').count(),
-        'celllines_withdrawn': Cellline.objects.filter(current_status__status='withdrawn').count(),
+        'celllines_at_ecacc': Cellline.objects.filter(status='at_ecacc').count(),
+        'celllines_expand_to_order': Cellline.objects.filter(status='expand_to_order').count(),
+        'celllines_restricted_distribution': Cellline.objects.filter(status='restricted_distribution').count(),
+        'celllines_recalled': Cellline.objects.filter(status='recalled').count(),
+        'celllines_withdrawn': Cellline.objects.filter(status='withdrawn').count(),
     })
 
 
@@ -175,7 +178,7 @@ def cellline(request, name):
             if clip_form.is_valid():
                 clip = clip_form.save(commit=False)
                 clip.cell_line = cellline
-                clip.md5 = hashlib.md5(clip.clip_file.read()).hexdigest()
+                clip.md5 = save_with_digest(clip.clip_file).hexdigest('md5')
                 try:
                     clip.save()
                     messages.success(request, format_html(u'A new CLIP <code>{0}</code> has been sucessfully added.', clip.version))
@@ -191,16 +194,13 @@ def cellline(request, name):
             status_form = CelllineStatusForm(request.POST, prefix='status')
             if status_form.is_valid():
                 new_status = status_form.cleaned_data['status']
-                if new_status == 'withdrawn' or new_status == 'not_available':
-                    cellline.available_for_sale = False
-                else:
-                    cellline.available_for_sale = True
-                cellline.save()
 
                 status = status_form.save(commit=False)
                 status.cell_line = cellline
                 status.user = request.user
-                status.save()
+                status.save(cell_line_fields={
+                    'available_for_sale': new_status not in ('withdrawn', 'not_available'),
+                })
 
                 messages.success(request, format_html(u'Status for cell line <code>{0}</code> has been sucessfully changed to <code>{1}</code>.', cellline.name, cellline.current_status.status))
                 return redirect('.')
@@ -379,20 +379,30 @@ def update_batch(request, name, batch_biosample_id):
             batch.batch_id = batch.batch_id
             batch.batch_type = batch.batch_type
             if batch.certificate_of_analysis:
-                batch.certificate_of_analysis_md5 = hashlib.md5(batch.certificate_of_analysis.read()).hexdigest()
+                if 'certificate_of_analysis' in update_batch_form.changed_data or not batch.certificate_of_analysis_md5:
+                    batch.certificate_of_analysis_md5 = save_with_digest(batch.certificate_of_analysis).hexdigest('md5')
             else:
                 batch.certificate_of_analysis_md5 = None
             batch.save()
 
-            # Save images
-            instances = image_formset.save()
+            # Save images (new uploads are hashed while they are written to storage)
+            instances = image_formset.save(commit=False)
+            for instance in image_formset.deleted_objects:
+                instance.delete()
             for instance in instances:
                 if instance.image:
-                    instance.md5 = hashlib.md5(instance.image.read()).hexdigest()
+                    image_changed = not instance.image._committed
+                    if image_changed or not instance.md5:
+                        instance.md5 = save_with_digest(instance.image).hexdigest('md5')
+                    if image_changed or not instance.thumbnail:
+                        instance.update_thumbnail()
                 else:
                     instance.md5 = None
+                    instance.thumbnail = None
                 instance.save()
 
+            cellline.bump_data_version()
+
             messages.success(request, format_html(u'Batch data for batch <code><strong>{0}</strong></code> / <code><strong>{1}</strong></code> has been successfuly updated.', cellline.name, batch.batch_id))
             return redirect('executive:cellline', name)
 
@@ -459,7 +469,7 @@ def cell_line_ids(request):
 
         if cell_line.donor:
             donor_biosamples_id = cell_line.donor.biosamples_id
-            donor_sex = cell_line.donor.gender
+            donor_sex = cell_line.summary_donor_sex or ''
 
             if cell_line.donor.provider_donor_ids:
                 donor_depositor_names = '; '.join([str(n) for n in cell_line.donor.provider_donor_ids])
@@ -485,10 +495,7 @@ def cell_line_ids(request):
         else:
             genetics = ''
 
-        if hasattr(cell_line, "derivation") and cell_line.derivation.primary_cell_type:
-            primary_cell_type = cell_line.derivation.primary_cell_type.name
-        else:
-            primary_cell_type = ''
+        primary_cell_type = cell_line.summary_primary_cell_type or ''
 
         if cell_line.search_terms_derivation:
             derivation = "; ".join(cell_line.search_terms_derivation).encode('utf-8')
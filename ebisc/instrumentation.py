@@ -0,0 +1,198 @@
+import time
+import json
+import random
+import threading
+from contextlib import contextmanager
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import connections
+from django.http import HttpResponse, HttpResponseForbidden
+
+import logging
+logger = logging.getLogger('ebisc.requests')
+
+
+'''
+Per-request instrumentation that is cheap enough to run in production.
+
+InstrumentationMiddleware (ebisc.middleware) records for every request the
+wall time, the number and time of SQL queries, the time spent in calls timed
+with timed() (e.g. Elasticsearch) and the response size. Each request is
+written as one JSON line to the ebisc.requests logger and added to the
+in-process metrics, exported in the Prometheus text format by the metrics
+view. Requests slower than INSTRUMENTATION_SLOW_REQUEST_MS are sampled
+(INSTRUMENTATION_TRACE_SAMPLE_RATE) and logged with their slowest queries.
+
+Metrics are kept per process; with several application server workers each
+scrape sees the worker that answered it, the request log covers all of them.
+'''
+
+
+# Upper bounds (seconds) of the request duration histogram
+BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, float('inf'))
+
+
+# -----------------------------------------------------------------------------
+# Timers
+
+state = threading.local()
+
+
+def start_request():
+    state.timers = defaultdict(float)
+
+
+def timers():
+    return getattr(state, 'timers', None) or {}
+
+
+@contextmanager
+def timed(kind):
+
+    '''Add the time spent in the block to the current request's timer kind (e.g. 'elastic').'''
+
+    start = time.time()
+    try:
+        yield
+    finally:
+        if getattr(state, 'timers', None) is not None:
+            state.timers[kind] += time.time() - start
+
+
+def stop_request():
+    state.timers = None
+
+
+# -----------------------------------------------------------------------------
+# SQL queries
+
+def capture_queries():
+
+    '''
+    Record the queries of all database connections (also without DEBUG).
+    Return a marker to pass to captured_queries().
+    '''
+
+    marker = []
+
+    for connection in connections.all():
+        marker.append((connection, connection.force_debug_cursor, len(connection.queries_log)))
+        connection.force_debug_cursor = True
+
+    return marker
+
+
+def captured_queries(marker):
+
+    queries = []
+
+    for (connection, force_debug_cursor, start) in marker:
+        connection.force_debug_cursor = force_debug_cursor
+        queries.extend(list(connection.queries_log)[start:])
+
+    return queries
+
+
+# -----------------------------------------------------------------------------
+# Metrics
+
+class Metrics(object):
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counters = defaultdict(float)
+        self.histogram = defaultdict(int)
+
+    def add(self, record):
+
+        labels = (record['view'], record['method'], '%dxx' % (record['status'] // 100))
+        seconds = record['ms'] / 1000.0
+
+        with self.lock:
+            self.counters[('ebisc_requests_total',) + labels] += 1
+            self.counters[('ebisc_request_seconds_count',) + labels] += 1
+            self.counters[('ebisc_request_seconds_sum',) + labels] += seconds
+            self.counters[('ebisc_request_sql_queries_total',) + labels] += record['sql_queries']
+            self.counters[('ebisc_request_sql_seconds_total',) + labels] += record['sql_ms'] / 1000.0
+            self.counters[('ebisc_request_elastic_seconds_total',) + labels] += record['elastic_ms'] / 1000.0
+            self.counters[('ebisc_response_bytes_total',) + labels] += max(record['bytes'], 0)
+            for bucket in BUCKETS:
+                if seconds <= bucket:
+                    self.histogram[labels + (bucket,)] += 1
+
+    def render(self):
+
+        lines = []
+
+        with self.lock:
+            for key in sorted(self.counters):
+                (name, view, method, status) = key
+                lines.append('%s{view="%s",method="%s",status="%s"} %s' % (name, view, method, status, repr(self.counters[key])))
+            for key in sorted(self.histogram):
+                (view, method, status, bucket) = key
+                le = '+Inf' if bucket == float('inf') else repr(bucket)
+                lines.append('ebisc_request_seconds_bucket{view="%s",method="%s",status="%s",le="%s"} %d' % (view, method, status, le, self.histogram[key]))
+
+        return '\n'.join(lines) + '\n'
+
+
+metrics = Metrics()
+
+
+def view_name(request):
+
+    '''Label for a request: the URL name, with the resource for API views.'''
+
+    match = getattr(request, 'resolver_match', None)
+
+    if match is None:
+        return 'unresolved'
+    elif match.kwargs.get('resource_name'):
+        return '%s:%s' % (match.url_name, match.kwargs['resource_name'])
+    else:
+        return match.view_name or match.func.__name__
+
+
+def response_size(response):
+    if response.streaming:
+        return int(response.get('Content-Length', -1))
+    else:
+        return len(response.content)
+
+
+def record(request, response, ms, queries):
+
+    entry = {
+        'view': view_name(request),
+        'method': request.method,
+        'path': request.path,
+        'status': response.status_code,
+        'ms': round(ms, 2),
+        'sql_queries': len(queries),
+        'sql_ms': round(sum(float(query['time']) for query in queries) * 1000, 2),
+        'elastic_ms': round(timers().get('elastic', 0) * 1000, 2),
+        'bytes': response_size(response),
+    }
+
+    metrics.add(entry)
+    logger.info(json.dumps(entry, sort_keys=True))
+
+    if ms >= settings.INSTRUMENTATION_SLOW_REQUEST_MS and random.random() < settings.INSTRUMENTATION_TRACE_SAMPLE_RATE:
+        slowest = sorted(queries, key=lambda query: float(query['time']), reverse=True)[:settings.INSTRUMENTATION_TRACE_QUERIES]
+        logger.warn(json.dumps(dict(entry, trace=[{'sql': query['sql'], 'ms': round(float(query['time']) * 1000, 2)} for query in slowest]), sort_keys=True))
+
+    return entry
+
+
+# -----------------------------------------------------------------------------
+# Metrics view
+
+def metrics_view(request):
+
+    if request.META.get('REMOTE_ADDR') not in settings.INSTRUMENTATION_METRICS_IPS:
+        return HttpResponseForbidden()
+
+    return HttpResponse(metrics.render(), content_type='text/plain; version=0.0.4')
+
+# -----------------------------------------------------------------------------
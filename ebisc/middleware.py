@@ -1,5 +1,37 @@
 from django.http import HttpResponse
 import json
+import time
+
+from ebisc import instrumentation
+
+
+class InstrumentationMiddleware(object):
+    """
+    Record wall time, SQL queries, Elasticsearch time and response size of
+    every request (see ebisc.instrumentation). Should be listed first so the
+    time spent in the other middleware is included.
+    """
+
+    @staticmethod
+    def process_request(request):
+        request._instrumentation = (time.time(), instrumentation.capture_queries())
+        instrumentation.start_request()
+
+    @staticmethod
+    def process_response(request, response):
+        if not hasattr(request, '_instrumentation'):
+            return response
+
+        (start, marker) = request._instrumentation
+        del request._instrumentation
+
+        try:
+            instrumentation.record(request, response, (time.time() - start) * 1000, instrumentation.captured_queries(marker))
+        finally:
+            instrumentation.stop_request()
+
+        return response
+
 
 
 class NonHtmlDebugToolbarMiddleware(object):
@@ -13,10 +45,10 @@ class NonHtmlDebugToolbarMiddleware(object):
 
     @staticmethod
     def process_response(request, response):
-        if response['Content-Type'] in ['application/octet-stream', 'application/vnd.ms-excel']:
+        if response.get('Content-Type') in ['application/octet-stream', 'application/vnd.ms-excel']:
             new_content = '<html><body>Binary Data, Length: {}</body></html>'.format(len(response.content))
             response = HttpResponse(new_content)
-        elif request.GET.get('debug') and response['Content-Type'] == 'application/json':
+        elif request.GET.get('debug') and response.get('Content-Type') == 'application/json':
             content = response.content
             try:
                 json_ = json.loads(content)
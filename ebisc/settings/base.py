@@ -61,6 +61,7 @@ INSTALLED_APPS = (
 )
 
 MIDDLEWARE_CLASSES = (
+    'ebisc.middleware.InstrumentationMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -134,11 +135,92 @@ TASTYPIE_DEFAULT_FORMATS = ['json']
 TASTYPIE_ALLOW_MISSING_SLASH = True
 API_LIMIT_PER_PAGE = 50
 
+# Objects per request of <resource>/set/<id>;<id>;...
+API_MULTIPLE_LIMIT = 200
+
+# Validated API keys are cached in each process (see ebisc.api.authentication)
+API_KEY_CACHE_SIZE = 1000
+API_KEY_CACHE_TIMEOUT = 60
+
+# Requests per API user and timeframe (seconds), counted in the cache
+API_THROTTLE_AT = 600
+API_THROTTLE_TIMEFRAME = 60
+
+# -----------------------------------------------------------------------------
+# Elasticsearch
+
+# Options of the search proxy's client: request timeout (seconds), connections
+# kept open per node (at least the uWSGI threads), retries on other nodes and
+# sniffing of the cluster's nodes (turn it off when the nodes publish
+# addresses the web servers can't reach)
+ELASTIC_CLIENT = {
+    'timeout': 10,
+    'maxsize': 4,
+    'max_retries': 2,
+    'retry_on_timeout': True,
+    'sniff_on_connection_fail': True,
+    'sniffer_timeout': 300,
+}
+
+# Searches per _msearch request
+ELASTIC_MSEARCH_LIMIT = 20
+
+# Backend of the catalogue search: the Elasticsearch cluster, or the
+# in-process index ('ebisc.elastic.memory.MemoryBackend', no cluster needed)
+SEARCH_BACKEND = 'ebisc.elastic.backends.ElasticsearchBackend'
+
+# Seconds the in-process index is used before the data version is checked
+SEARCH_MEMORY_INDEX_TIMEOUT = 60
+
+# -----------------------------------------------------------------------------
+# Caches
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+}
+
+# Cached catalogue pages are keyed by the line's data version; the timeout
+# bounds how long data taken from other lines (related lines) can be stale
+CATALOG_CELLLINE_CACHE_TIMEOUT = 60 * 60
+
+# Part of all ETags, bump it when a deployment changes responses (templates,
+# API fields) without changing data (see ebisc.conditional)
+HTTP_CACHE_VERSION = 1
+
+# Seconds browsers and nginx may use catalogue pages shown to anonymous users
+# without asking again (then they revalidate with the ETag)
+CATALOG_HTTP_MAX_AGE = 60
+
+# Maximum age in seconds of the in-process index of cell line and page paths
+SITE_ROUTING_INDEX_TIMEOUT = 60
+
+# -----------------------------------------------------------------------------
+# File digests computed while files are stored (md5 is stored for CLIPs, CoAs
+# and batch images, add algorithms only together with a field to keep them)
+
+FILE_DIGEST_ALGORITHMS = ('md5',)
+
 # -----------------------------------------------------------------------------
 # Sorl thumbnails
 
 THUMBNAIL_QUALITY = 80
 
+# Batch image thumbnails are rendered once on upload/import, not per request
+BATCH_IMAGE_THUMBNAIL_WIDTH = 250
+
+# -----------------------------------------------------------------------------
+# Request instrumentation (see ebisc.instrumentation)
+
+# Slow requests are logged with their slowest queries, sampled at this rate
+INSTRUMENTATION_SLOW_REQUEST_MS = 1000
+INSTRUMENTATION_TRACE_SAMPLE_RATE = 0.1
+INSTRUMENTATION_TRACE_QUERIES = 20
+
+# Clients allowed to scrape /metrics/ (comma separated IPs)
+INSTRUMENTATION_METRICS_IPS = tuple(os.getenv('METRICS_IPS', '127.0.0.1').split(','))
+
 # -----------------------------------------------------------------------------
 # Logging
 
@@ -149,6 +231,9 @@ LOGGING = {
         'simple': {
             'format': '%(levelname)-10s %(message)s'
         },
+        'structured': {
+            'format': '%(message)s'
+        },
     },
     'handlers': {
         'console': {
@@ -156,12 +241,22 @@ LOGGING = {
             'class': 'logging.StreamHandler',
             'formatter': 'simple'
         },
+        'requests': {
+            'level': 'INFO',
+            'class': 'logging.StreamHandler',
+            'formatter': 'structured'
+        },
     },
     'loggers': {
         'management.commands': {
             'handlers': ['console'],
             'level': 'DEBUG',
         },
+        'ebisc.requests': {
+            'handlers': ['requests'],
+            'level': 'INFO',
+            'propagate': False,
+        },
     }
 }
 
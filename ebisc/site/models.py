@@ -1,4 +1,11 @@
 import django.contrib.auth.models
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+
+from ebisc.celllines.models import Cellline
+from ebisc.cms.models import Page
+
+from . import routing
 
 
 class AccessPermission(django.contrib.auth.models.Permission):
@@ -7,3 +14,28 @@ class AccessPermission(django.contrib.auth.models.Permission):
         proxy = True
         verbose_name = u'Access permission'
         verbose_name_plural = u'Access permissions'
+
+
+# -----------------------------------------------------------------------------
+# Routing index (see routing), invalidated when lines or pages are added,
+# renamed or removed
+
+@receiver(pre_save, sender=Cellline)
+def cellline_saving(sender, instance, **kwargs):
+    # The dirty fields are reset by the time post_save runs
+    instance._routing_changed = instance.pk is None or 'name' in instance.get_dirty_fields()
+
+
+@receiver(post_save, sender=Cellline)
+def cellline_saved(sender, instance, **kwargs):
+    if instance.__dict__.pop('_routing_changed', True):
+        routing.invalidate()
+
+
+@receiver(post_save, sender=Page)
+@receiver(post_delete, sender=Page)
+@receiver(post_delete, sender=Cellline)
+def routing_changed(sender, **kwargs):
+    routing.invalidate()
+
+# -----------------------------------------------------------------------------
@@ -0,0 +1,83 @@
+import time
+import threading
+
+from django.conf import settings
+from django.core.cache import cache
+
+from ebisc.cms.models import Page
+from ebisc.celllines.models import Cellline
+
+
+'''
+In-memory index of the paths served by site.views.page: cell line names and
+published CMS page paths. It lets the catch-all page view route a request
+(or answer 404) without probing the cell line table first.
+
+Each process keeps its own index. It is rebuilt when it is older than
+SITE_ROUTING_INDEX_TIMEOUT or when the routing version stored in the cache
+changes (see invalidate(), called by the receivers in site.models when lines
+or pages are added, renamed or removed). With a shared cache backend changes
+are seen by all processes at once, otherwise at the latest after the timeout.
+'''
+
+
+VERSION_KEY = 'site-routing-version'
+
+
+# -----------------------------------------------------------------------------
+# Index
+
+class RoutingIndex(object):
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.built = None
+        self.version = None
+        self.celllines = frozenset()
+        self.pages = frozenset()
+
+    def is_fresh(self, version):
+        return self.built is not None and self.version == version and time.time() - self.built < settings.SITE_ROUTING_INDEX_TIMEOUT
+
+    def refresh(self):
+
+        version = cache.get(VERSION_KEY)
+
+        if self.is_fresh(version):
+            return
+
+        with self.lock:
+            if self.is_fresh(version):
+                return
+
+            self.celllines = frozenset(Cellline.objects.values_list('name', flat=True))
+            self.pages = frozenset(Page.objects.filter(published=True).values_list('path', flat=True))
+            self.version = version
+            self.built = time.time()
+
+    def resolve(self, path):
+
+        '''Return 'cellline', 'page' or None (not found) for a page view path.'''
+
+        self.refresh()
+
+        if path.rstrip('/') in self.celllines:
+            return 'cellline'
+        elif '/' + path in self.pages:
+            return 'page'
+        else:
+            return None
+
+
+index = RoutingIndex()
+
+
+def resolve(path):
+    return index.resolve(path)
+
+
+def invalidate():
+    cache.set(VERSION_KEY, time.time(), None)
+    index.built = None
+
+# -----------------------------------------------------------------------------
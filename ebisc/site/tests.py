@@ -1,3 +1,73 @@
 from django.test import TestCase
+from django.template.loader import render_to_string
 
-# Create your tests here.
+from ebisc.celllines.models import Cellline, CelllineStatus, CelllineBatch, CelllineCultureConditions, CelllineCultureMediumSupplement, CelllineDisease, CelllinePublication, Disease, Donor, Gender, Organization, Unit
+
+from .views import cellline_context, cellline_page_version
+
+
+# Queries of the cell line page's data fragment: the line with its prefetch
+# plan (see CELLLINE_PAGE_RELATED and CELLLINE_PAGE_PREFETCH) and the lines of
+# the same donor. Rendering runs none, however much data the line has.
+CELLLINE_PAGE_QUERIES = 26
+
+
+class CelllinePageTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+
+        cls.generator = Organization.objects.create(name='Test depositor', short_name='TEST')
+        cls.gender = Gender.objects.create(name='female')
+        cls.unit = Unit.objects.create(name='mM')
+
+        cls.small = cls.create_cellline('TEST001-A', 1)
+        cls.large = cls.create_cellline('TEST002-A', 5)
+
+    @classmethod
+    def create_cellline(cls, name, count):
+
+        '''A line at ECACC with count diseases, batches, medium supplements and publications.'''
+
+        donor = Donor.objects.create(biosamples_id='SAMD%s' % name, gender=cls.gender)
+        cellline = Cellline.objects.create(name=name, biosamples_id='SAME%s' % name, generator=cls.generator, donor=donor, available_for_sale_at_ecacc=True)
+        CelllineStatus.objects.create(cell_line=cellline, status='at_ecacc')
+
+        culture_conditions = CelllineCultureConditions.objects.create(cell_line=cellline)
+
+        for i in range(count):
+            disease = Disease.objects.create(xpurl='http://example.org/%s/disease/%d' % (name, i), name='Disease %d' % i)
+            CelllineDisease.objects.create(cell_line=cellline, disease=disease, primary_disease=(i == 0))
+            CelllineBatch.objects.create(cell_line=cellline, biosamples_id='SAMB%s%d' % (name, i), batch_id='P%03d' % (i + 1))
+            CelllineCultureMediumSupplement.objects.create(cell_line_culture_conditions=culture_conditions, supplement='Supplement %d' % i, amount='1', unit=cls.unit)
+            CelllinePublication.objects.create(cell_line=cellline, reference_type='pubmed', reference_url='http://example.org/%s/%d' % (name, i), reference_title='Publication %d' % i)
+
+        return Cellline.objects.get(pk=cellline.pk)
+
+    def render(self, cellline):
+        return render_to_string('catalog/__cellline_data__.html', cellline_context(cellline))
+
+    def test_queries(self):
+        with self.assertNumQueries(CELLLINE_PAGE_QUERIES):
+            self.render(self.small)
+
+    def test_queries_independent_of_data(self):
+        with self.assertNumQueries(CELLLINE_PAGE_QUERIES):
+            html = self.render(self.large)
+
+        self.assertIn('Supplement 4', html)
+
+    def test_version_follows_shown_lines(self):
+
+        version = cellline_page_version(self.small)
+
+        sibling = Cellline.objects.create(name='TEST001-B', biosamples_id='SAMETEST001-B', generator=self.generator, donor=self.small.donor)
+        self.assertNotEqual(cellline_page_version(self.small), version)
+        version = cellline_page_version(self.small)
+
+        self.small.donor.bump_data_version()
+        self.assertNotEqual(cellline_page_version(self.small), version)
+        version = cellline_page_version(self.small)
+
+        sibling.delete()
+        self.assertNotEqual(cellline_page_version(self.small), version)
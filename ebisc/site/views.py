@@ -1,14 +1,33 @@
 # -*- coding: utf-8 -*-
 
 import django.shortcuts
+from django.conf import settings
+from django.core.cache import cache
 from django.http import Http404
+from django.template.loader import render_to_string
+from django.utils.safestring import mark_safe
 from django.template import TemplateDoesNotExist
 from django.core.urlresolvers import reverse
 from django.shortcuts import get_object_or_404
-from django.db.models import Q
+from django.db.models import Q, Prefetch, Max, Count
 
 from ebisc.cms.models import Page, Faq, FaqCategory
-from ebisc.celllines.models import Cellline, CelllineCharacterizationMarkerExpression
+from ebisc.celllines.models import (
+    Cellline,
+    AVAILABLE_STATUSES,
+    CelllineDisease,
+    DonorDisease,
+    DonorDiseaseVariant,
+    DonorRelatives,
+    CelllineVectorFreeReprogrammingFactor,
+    CelllineCultureMediumSupplement,
+    CelllineCharacterizationMarkerExpression,
+)
+from ebisc.celllines.prefetch import modification_prefetches
+
+from ebisc import conditional
+
+from . import routing
 
 
 # -----------------------------------------------------------------------------
@@ -98,70 +117,233 @@ def get_menu(request):
 
 def page(request, path):
 
-    try:
-        name = path.rstrip('/')
-        cellline = Cellline.objects.get(name=name, available_for_sale_at_ecacc=True, current_status__status__in=['at_ecacc', 'expand_to_order', 'restricted_distribution'])
+    target = routing.resolve(path)
 
-        # Subclones from this line
-        subclones = []
-        if cellline.derived_cell_lines.all():
-            subclones = [subclone for subclone in cellline.derived_cell_lines.all() if subclone.available_for_sale_at_ecacc]
+    if target == 'cellline':
+        try:
+            name = path.rstrip('/')
+            cellline = Cellline.objects.select_related('latest_batch', 'latest_clip').get(name=name, available_for_sale_at_ecacc=True, status__in=AVAILABLE_STATUSES)
+
+            (updated, version) = cellline_page_version(cellline)
 
-        # All subclones from the line this line was derived from
-        available_subclones_from_parent = []
-        if cellline.derived_from and cellline.derived_from.derived_cell_lines.all():
-            available_subclones_from_parent = [subclone for subclone in cellline.derived_from.derived_cell_lines.all() if subclone.available_for_sale_at_ecacc]
+            validators = page_validators(request, 'cellline', cellline.name, version, last_modified=updated)
+            response = conditional.not_modified(request, **validators)
+            if response is not None:
+                return response
 
-        # Lines from the same donor, subclones excluded
-        same_donor_lines = Cellline.objects.filter(donor=cellline.donor, available_for_sale_at_ecacc=True).exclude(name=cellline.name).exclude(name__regex='(-\d+)$').order_by('name')
+            # Cell line data is the same for all users, render it once per data version
+            cache_key = 'catalog-cellline:%s:%s' % (cellline.name, version)
+            cellline_data = cache.get(cache_key)
 
-        if cellline.derived_from:
-            same_donor_lines = same_donor_lines.exclude(name=cellline.derived_from.name)
+            if cellline_data is None:
+                cellline_data = render_to_string('catalog/__cellline_data__.html', cellline_context(cellline))
+                cache.set(cache_key, cellline_data, settings.CATALOG_CELLLINE_CACHE_TIMEOUT)
 
-        # Relatives
-        relatives = [related_donor for related_donor in cellline.donor.relatives.all()]
+            return conditional.set_validators(render(request, 'catalog/cellline.html', {
+                'cellline': cellline,
+                'cellline_data': mark_safe(cellline_data),
+            }), **validators)
+        except Cellline.DoesNotExist:
+            try:
+                # try to get unavailable (but known) cell line
+                cellline = Cellline.objects.get(name=name)
+                cellline.available_for_sale = False
+                return render(request, 'catalog/cellline.html', {
+                    'cellline': cellline,
+                })
+            except Cellline.DoesNotExist:
+                pass
+
+    elif target is None:
+        raise Http404
 
-        # Characterization data - undifferentiated marker expression
-        import collections
+    page = get_object_or_404(Page, path='/' + path, published=True)
+
+    validators = page_validators(request, 'page', page.pk, page.updated.isoformat(), last_modified=page.updated)
+    response = conditional.not_modified(request, **validators)
+    if response is not None:
+        return response
+
+    return conditional.set_validators(render(request, 'page.html', {
+        'page': page,
+    }), **validators)
+
+
+def page_validators(request, *parts, **kwargs):
+
+    '''Validators of a page showing the data identified by parts; anonymous users get publicly cacheable pages.'''
+
+    return {
+        'etag': conditional.make_etag(*(parts + (conditional.user_key(request),))),
+        'last_modified': kwargs.get('last_modified'),
+        'cache_control': conditional.private() if request.user.is_authenticated() else conditional.public(settings.CATALOG_HTTP_MAX_AGE),
+        'vary': ['Cookie'],
+    }
+
+
+# Everything the cell line data templates show, loaded with one query for the
+# line and its one-to-one data and one query per related set; the number of
+# queries does not depend on the number of diseases, modifications, files, ...
+
+CELLLINE_PAGE_RELATED = (
+    'current_status',
+    'donor__gender',
+    'donor__country_of_origin',
+    'donor_age',
+    'generator',
+    'owner',
+    'derivation_country',
+    'derived_from',
+    'latest_batch__batchcultureconditions',
+    'latest_clip',
+    'derivation__primary_cell_type',
+    'integrating_vector__vector',
+    'integrating_vector__virus',
+    'integrating_vector__transposon',
+    'non_integrating_vector__vector',
+    'karyotype',
+    'celllinecultureconditions__culture_medium_other',
+    'celllinecharacterization',
+    'celllinecharacterizationpluritest',
+    'celllinecharacterizationepipluriscore',
+    'celllinecharacterizationhpscscorecard',
+    'celllinecharacterizationrnasequencing',
+    'celllinecharacterizationgeneexpressionarray',
+)
+
+
+CELLLINE_PAGE_PREFETCH = [
+    Prefetch('diseases', queryset=CelllineDisease.objects.select_related('disease').prefetch_related(*modification_prefetches('genetic_modification_cellline_disease'))),
+    Prefetch('donor__diseases', queryset=DonorDisease.objects.select_related('disease').prefetch_related(
+        Prefetch('donor_disease_variants', queryset=DonorDiseaseVariant.objects.select_related('gene')))),
+    Prefetch('donor__relatives', queryset=DonorRelatives.objects.select_related('related_donor')),
+    Prefetch('donor__relatives__related_donor__diseases', queryset=DonorDisease.objects.select_related('disease')),
+    'donor__relatives__related_donor__cellline_set',
+    'donor__donor_genome_analysis__donor_genome_analysis_files',
+    'derived_cell_lines',
+    'derived_from__derived_cell_lines',
+    'latest_batch__images',
+    'genome_analysis__genome_analysis_files',
+    'str_fingerprinting',
+    'publications',
+    Prefetch('derivation_vector_free_reprogramming_factors', queryset=CelllineVectorFreeReprogrammingFactor.objects.select_related('factor')),
+    'derivation_vector_free_reprogramming_factors__reprogramming_factor_molecules',
+    'integrating_vector__genes',
+    'non_integrating_vector__genes',
+    Prefetch('celllinecultureconditions__medium_supplements', queryset=CelllineCultureMediumSupplement.objects.select_related('unit')),
+    Prefetch('undifferentiated_marker_expression', queryset=CelllineCharacterizationMarkerExpression.objects.order_by('marker', 'id')),
+    'undifferentiated_marker_expression__marker_expression_method__marker_expression_method_files',
+    'undifferentiated_morphology_files',
+    'celllinecharacterizationpluritest__pluritest_files',
+    'celllinecharacterizationepipluriscore__epipluriscore_files',
+    'celllinecharacterizationhpscscorecard__hpsc_scorecard_reports',
+    'celllinecharacterizationhpscscorecard__hpsc_scorecard_files',
+    'differentiation_potency_germ_layers__germ_layer_cell_types__germ_layer_cell_type_markers',
+    'differentiation_potency_germ_layers__germ_layer_cell_types__germ_layer_cell_type_morphology_files',
+    'differentiation_potency_germ_layers__germ_layer_cell_types__germ_layer_cell_type_protocol_files',
+] + modification_prefetches('genetic_modification_cellline')
+
+
+def cellline_page_queryset():
+    return Cellline.objects.select_related(*CELLLINE_PAGE_RELATED).prefetch_related(*CELLLINE_PAGE_PREFETCH)
+
+
+def cellline_page_version(cellline):
+
+    '''
+    Return (last modified, version) of the data the cell line page shows. The
+    page shows other lines too (same donor, parent and subclones, relatives'
+    lines), so the version holds the latest data version of all of them and
+    their number (a deleted line changes it as well).
+    '''
+
+    lines = Q(pk=cellline.pk) | Q(derived_from=cellline.pk)
+    if cellline.donor_id:
+        lines |= Q(donor=cellline.donor_id) | Q(donor__relative_of__donor=cellline.donor_id)
+    if cellline.derived_from_id:
+        lines |= Q(pk=cellline.derived_from_id) | Q(derived_from=cellline.derived_from_id)
+
+    shown = Cellline.objects.filter(lines).aggregate(updated=Max('data_updated'), count=Count('pk', distinct=True))
+
+    return (shown['updated'], u'%s:%d' % (shown['updated'].isoformat() if shown['updated'] else '0', shown['count']))
+
+
+def cellline_context(cellline):
+
+    '''
+    Return the context of the cell line data templates. The line is loaded
+    again with the page's prefetch plan and everything else is built in
+    Python from the prefetched data, so that rendering the templates does not
+    run any queries.
+    '''
+
+    cellline = cellline_page_queryset().get(pk=cellline.pk)
+
+    # Subclones from this line
+    subclones = [subclone for subclone in cellline.derived_cell_lines.all() if subclone.available_for_sale_at_ecacc]
+
+    # All subclones from the line this line was derived from
+    available_subclones_from_parent = []
+    if cellline.derived_from:
+        available_subclones_from_parent = [subclone for subclone in cellline.derived_from.derived_cell_lines.all() if subclone.available_for_sale_at_ecacc]
+
+    # Lines from the same donor, subclones excluded
+    same_donor_lines = list(Cellline.objects.filter(donor=cellline.donor, available_for_sale_at_ecacc=True).exclude(name=cellline.name).exclude(name__regex='(-\d+)$').order_by('name'))
+
+    if cellline.derived_from:
+        same_donor_lines = [line for line in same_donor_lines if line.name != cellline.derived_from.name]
+
+    # Relatives
+    relatives = list(cellline.donor.relatives.all()) if cellline.donor else []
+
+    # Characterization data - undifferentiated marker expression
+    undiff_marker_expression = marker_expression_matrix(cellline)
+
+    return {
+        'cellline': cellline,
+        'same_donor_lines': same_donor_lines,
+        'subclones': subclones,
+        'available_subclones_from_parent': available_subclones_from_parent,
+        'relatives': relatives,
+        'undiff_marker_expression': undiff_marker_expression,
+        'marker_expression_methods': MARKER_EXPRESSION_METHODS,
+    }
+
+
+MARKER_EXPRESSION_METHODS = ['Immunostaining', 'RT-PCR', 'FACS', 'Enzymatic Assay', 'Expression Profiles']
+
+
+def marker_expression_matrix(cellline):
+
+    '''
+    Return the marker expression table as a list of rows, one per marker with
+    known expression, ordered by marker. Each row has one column per method in
+    MARKER_EXPRESSION_METHODS holding a list of file lists, one per method
+    entry (an empty column means the method was not used). Marker expressions,
+    methods and files are taken from the prefetch of CELLLINE_PAGE_PREFETCH.
+    '''
 
-        undiff_marker_expression = collections.OrderedDict()
+    columns = dict([(method, i) for (i, method) in enumerate(MARKER_EXPRESSION_METHODS)])
 
-        marker_expression_query = CelllineCharacterizationMarkerExpression.objects.filter(cell_line=cellline).order_by('marker')
+    matrix = []
 
-        marker_expression_methods = ['Immunostaining', 'RT-PCR', 'FACS', 'Enzymatic Assay', 'Expression Profiles']
+    for marker_expression in cellline.undifferentiated_marker_expression.all():
+        if marker_expression.expressed is None:
+            continue
 
-        for marker_exp in sorted(set([m for m in marker_expression_query])):
-            undiff_marker_expression[marker_exp] = collections.OrderedDict()
-            for method in marker_expression_methods:
-                undiff_marker_expression[marker_exp][method] = []
+        methods = [[] for method in MARKER_EXPRESSION_METHODS]
 
-        for marker_expression in marker_expression_query:
-            for method in marker_expression.marker_expression_method.all():
-                undiff_marker_expression[marker_expression][method.name].append(method)
+        for method in marker_expression.marker_expression_method.all():
+            if method.name in columns:
+                methods[columns[method.name]].append(list(method.marker_expression_method_files.all()))
 
-        return render(request, 'catalog/cellline.html', {
-            'cellline': cellline,
-            'same_donor_lines': same_donor_lines,
-            'subclones': subclones,
-            'available_subclones_from_parent': available_subclones_from_parent,
-            'relatives': relatives,
-            'undiff_marker_expression': undiff_marker_expression,
-            'marker_expression_methods': marker_expression_methods,
+        matrix.append({
+            'marker': marker_expression.marker,
+            'expressed': marker_expression.expressed,
+            'methods': methods,
         })
-    except Cellline.DoesNotExist:
-        try:
-            # try to get unavailable (but known) cell line
-            cellline = Cellline.objects.get(name=name)
-            cellline.available_for_sale = False
-            return render(request, 'catalog/cellline.html', {
-                'cellline': cellline,
-            })
-        except Cellline.DoesNotExist:
-            pass
 
-    return render(request, 'page.html', {
-        'page': get_object_or_404(Page, path='/' + path, published=True)
-    })
+    return matrix
 
 
 def render(request, path, context={}):
@@ -1,4 +1,4 @@
-!function(){function e(t,F,A){function n(i,E){if(!F[i]){if(!t[i]){var o="function"==typeof require&&require;if(!E&&o)return o(i,!0);if(r)return r(i,!0);var a=new Error("Cannot find module '"+i+"'");throw a.code="MODULE_NOT_FOUND",a}var C=F[i]={exports:{}};t[i][0].call(C.exports,function(e){var F=t[i][1][e];return n(F||e)},C,C.exports,e,t,F,A)}return F[i].exports}for(var r="function"==typeof require&&require,i=0;i<A.length;i++)n(A[i]);return n}return e}()({1:[function(e,t,F){var A,n,r,i,E,o,a,C,s;n=e("./state"),A=e("./config"),r=function(){return n.select("filter").set("facets",A.facets)},a=function(e){return n.set("filter",e)},i=function(){return a(JSON.parse(sessionStorage.getItem("filter")))},o=function(){return sessionStorage.setItem("filter",JSON.stringify(n.select("filter").get()))},s=function(e){return n.select("filter","query").edit(e)},C=function(e,t,F){var A;return A=n.select("filter","facets",_.findIndex(n.select("filter","facets").get(),{name:e}),"selectedTerms"),A.set(t,F)},E=function(e){return n.select("filter").set("orderBy",e)},t.exports={initFilter:r,setFilter:a,loadFilter:i,saveFilter:o,updateQueryFilter:s,updateFacetTermFilter:C,orderBy:E}},{"./config":8,"./state":11}],2:[function(e,t,F){var A,n,r,i,E;r=e("../config"),i=e("../state"),E=e("./table"),A=e("../actions"),n=React.createClass({displayName:"Celllines",mixins:[i.mixin],cursors:{isLoaded:["isLoaded"],celllines:["celllines"],orderBy:["filter","orderBy"]},render:function(){var e,t,F,n;return e=function(e,t){var F;return F=t._source[e],"name"===e?React.createElement("a",{href:"./"+F+"/"},F):"donor_disease"===e?null!==F?F.join(", "):React.createElement("span",{"class":"comment"},"/"):"cellline_diseases_genes"===e?null!==F?F.join(", "):React.createElement("span",{"class":"comment"},"/"):"derivation"===e?null!==F?F.join(", "):React.createElement("span",{"class":"comment"},"/"):F},t=function(t,F){var A,n,r,i;for(i=[],n=0,r=F.length;n<r;n++)A=F[n],i.push(e(A.name,t));return i},n=function(){var e,A,n,i;for(n=this.state.cursors.celllines,i=[],e=0,A=n.length;e<A;e++)F=n[e],i.push(t(F,r.fields));return i}.call(this),React.createElement("div",null,this.state.cursors.isLoaded?React.createElement(E,{cols:r.fields,rows:n,orderBy:this.state.cursors.orderBy,onOrderBy:A.orderBy}):void 0)}}),t.exports=n},{"../actions":1,"../config":8,"../state":11,"./table":6}],3:[function(e,t,F){var A,n,r;r=e("classnames"),A=React.createClass({displayName:"DropdownMultiSelect",getInitialState:function(){return{showMenu:!1}},showMenu:function(){return this.setState({showMenu:!0}),window.addEventListener("click",this.hideMenu,!0)},hideMenu:function(e){return e.target===$(".dropdown-button",this.getDOMNode())[0]?(e.stopPropagation(),this.setState({showMenu:!1}),window.removeEventListener("click",this.hideMenu,!0)):$(this.getDOMNode()).has($(e.target)).length?void 0:(this.setState({showMenu:!1}),window.removeEventListener("click",this.hideMenu,!0))},componentWillUnmount:function(){return window.removeEventListener("click",this.hideMenu,!0)},render:function(){var e;return React.createElement("div",{className:r({dropdown:!0,"two-cols":this.props.items.length>=15,"has-selection":this.props.hasSelection})},React.createElement("div",{className:"dropdown-container"},React.createElement("div",{className:"dropdown-button",onClick:this.showMenu},this.props.label),React.createElement("ul",{className:r({"dropdown-menu":!0,checkbox:!0,"show-menu":this.state.showMenu})},function(){var t,F,A,r;for(A=this.props.items,r=[],t=0,F=A.length;t<F;t++)e=A[t],r.push(React.createElement(n,{key:e.name,item:e,action:this.props.action}));return r}.call(this))))}}),n=React.createClass({displayName:"Item",handleOnClick:function(){return this.props.action(this.props.item.name,!this.props.item.selected)},render:function(){return React.createElement("li",{onClick:this.handleOnClick,className:r({selected:void 0!==this.props.item.selected&&this.props.item.selected||!1})},React.createElement("div",{className:"checkbox"}),React.createElement("label",null,this.props.item.label))}}),t.exports=A},{classnames:22}],4:[function(e,t,F){var A,n,r,i,E,o,a=[].indexOf||function(e){for(var t=0,F=this.length;t<F;t++)if(t in this&&this[t]===e)return t;return-1};i=React.addons.CSSTransitionGroup,o=e("../state"),A=e("../actions"),n=e("./dropdown-multi-select"),r=React.createClass({displayName:"Facets",mixins:[o.mixin],cursors:{facets:["filter","facets"],facetTerms:["facetTerms"]},render:function(){var e,t,F;return React.createElement("span",null,React.createElement("span",null,_.size(this.state.cursors.facetTerms)?React.createElement("div",{className:"filter-group"},function(){var r,i,o,a;for(o=this.state.cursors.facets,a=[],t=r=0,i=o.length;r<i;t=++r)e=o[t],F=this.getSelectedTerms(e.name),a.push(React.createElement("div",{key:e.name,className:"filter"},React.createElement(n,{name:e.name,label:e.label,hasSelection:F.length>0,items:this.getFacetTerms(e.name,F),action:_.partial(A.updateFacetTermFilter,e.name)}),React.createElement(E,{facet:e,terms:F})));return a}.call(this)):void 0),React.createElement("span",null,_.size(this.state.cursors.facetTerms)&&a.call(function(){var t,F,A,n;for(A=this.state.cursors.facets,n=[],t=0,F=A.length;t<F;t++)e=A[t],n.push(this.getSelectedTerms(e.name).length>0);return n}.call(this),!0)>=0?React.createElement("div",{className:"clear-all-filters",onClick:this.clearFilters},React.createElement("span",{className:"glyphicon glyphicon-remove-sign"})," Clear all filters"):void 0))},clearFilters:function(){return A.initFilter()},getSelectedTerms:function(e){var t,F,A;return F=this.state.cursors.facets[_.findIndex(this.state.cursors.facets,{name:e})].selectedTerms,function(){var e;e=[];for(t in F)A=F[t],A===!0&&e.push(t);return e}().sort()},getFacetTerms:function(e,t){var F,A,n,r,i,E;E="buckets"in this.state.cursors.facetTerms[e]?this.state.cursors.facetTerms[e].buckets:this.state.cursors.facetTerms[e].facet.buckets,r=[];for(F=0,A=E.length;F<A;F++)i=E[F],r.push({name:i.key,label:i.key+" ("+i.doc_count+")",selected:(n=i.key,a.call(t,n)>=0)});return r}}),E=React.createClass({displayName:"SelectedTerms",render:function(){var e;return React.createElement("ul",{className:"selected-terms"},React.createElement(i,{transitionName:"transition-opacity"},function(){var t,F,A,n;for(A=this.props.terms,n=[],t=0,F=A.length;t<F;t++)e=A[t],n.push(React.createElement("li",{key:e,className:"term"},React.createElement("span",{className:"remove glyphicon glyphicon-remove-sign",onClick:this.createHandleOnRemove(e)})," ",e));return n}.call(this)))},createHandleOnRemove:function(e){return function(t){return function(){return A.updateFacetTermFilter(t.props.facet.name,e,!1)}}(this)}}),t.exports=r},{"../actions":1,"../state":11,"./dropdown-multi-select":3}],5:[function(e,t,F){var A,n,r,i;i=e("../state"),A=e("../actions"),r=React.createClass({displayName:"Search",mixins:[i.mixin],cursors:{isLoaded:["isLoaded"],query:["filter","query"]},render:function(){return React.createElement("div",null,this.state.cursors.isLoaded?React.createElement(n,{query:this.state.cursors.query}):void 0)}}),n=React.createClass({displayName:"Input",getInitialState:function(){return{query:this.props.query}},render:function(){return React.createElement("input",{type:"text",placeholder:"Search cell lines",value:this.state.query,onChange:this.handleChange})},handleChange:function(e){return this.setState({query:e.target.value}),A.updateQueryFilter(e.target.value)}}),t.exports=r},{"../actions":1,"../state":11}],6:[function(e,t,F){var A,n,r,i;A=React.createClass({displayName:"Table",render:function(){return React.createElement("table",{className:"listing"},React.createElement(i,{cols:this.props.cols,orderBy:this.props.orderBy,onOrderBy:this.props.onOrderBy}),React.createElement(n,{cols:this.props.cols,rows:this.props.rows}))}}),i=React.createClass({displayName:"Thead",render:function(){var e;return React.createElement("thead",null,React.createElement("tr",null,function(){var t,F,A,n;for(A=this.props.cols,n=[],t=0,F=A.length;t<F;t++)e=A[t],n.push(React.createElement(r,{key:e.name,col:e,orderBy:this.props.orderBy,onOrderBy:this.props.onOrderBy}));return n}.call(this)))},renderTh:function(e,t){}}),r=React.createClass({displayName:"Th",render:function(){return null!==this.props.orderBy&&this.props.col.name===this.props.orderBy.field?React.createElement("th",{onClick:this.handleOnClick,className:"order-by "+this.props.orderBy.direction},React.createElement("span",{className:"sort"},this.props.col.label)):React.createElement("th",{onClick:this.handleOnClick},React.createElement("span",{className:"sort"},this.props.col.label))},handleOnClick:function(){return null!==this.props.orderBy&&this.props.orderBy.field===this.props.col.name?"asc"===this.props.orderBy.direction?this.props.onOrderBy({field:this.props.col.name,direction:"desc"}):this.props.onOrderBy(null):this.props.onOrderBy({field:this.props.col.name,direction:"asc"})}}),n=React.createClass({displayName:"Tbody",render:function(){var e,t,F;return React.createElement("tbody",null,function(){var A,n,r,i;for(r=this.props.rows,i=[],t=A=0,n=r.length;A<n;t=++A)F=r[t],i.push(React.createElement("tr",{key:t},function(){var A,n,r;for(r=[],t=A=0,n=F.length;A<n;t=++A)e=F[t],r.push(React.createElement("td",{key:t},e));return r}()));return i}.call(this))}}),t.exports=A},{}],7:[function(e,t,F){var A,n,r=function(e,t){return(+e%(t=+t)+t)%t};A=e("../state"),n=React.createClass({displayName:"TotalCount",mixins:[A.mixin],cursors:{isLoaded:["isLoaded"],celllines:["celllines"]},render:function(){return React.createElement("div",null,this.state.cursors.isLoaded?React.createElement("div",null,React.createElement("span",{className:"count"},this.state.cursors.celllines.length),React.createElement("span",{className:"unit"},1===r(this.state.cursors.celllines.length,100)&&"cell line"||"cell lines")):void 0)}}),t.exports=n},{"../state":11}],8:[function(e,t,F){var A;A={fields:[{name:"name",label:"Name"},{name:"donor_disease",label:"Donor disease status"},{name:"cellline_diseases_genes",label:"Genetic modification"},{name:"donor_sex",label:"Donor sex"},{name:"donor_age",label:"Donor age"},{name:"derivation",label:"Derivation"}],query_fields:["biosamples_id.analyzed","name.analyzed","alternative_names.analyzed","depositor.analyzed","primary_cell_type.analyzed","donor_disease.analyzed","genetic_modification_disease.analyzed","primary_disease_synonyms","disease_associated_phenotypes.analyzed","non_disease_associated_phenotypes.analyzed","donor_sex.analyzed","donor_age.analyzed","donor_ethnicity.analyzed","derivation.analyzed","all_genetics.analyzed","all_derivation.analyzed"],facets:[{name:"all_diseases",label:"Disease",selectedTerms:{}},{name:"donor_sex",label:"Donor sex",selectedTerms:{}},{name:"donor_age",label:"Donor age",selectedTerms:{}},{name:"derivation",label:"Derivation",selectedTerms:{}}]},t.exports=A},{}],9:[function(e,t,F){var A,n,r,i,E,o,a,C,s,B,D,l=[].indexOf||function(e){for(var t=0,F=this.length;t<F;t++)if(t in this&&this[t]===e)return t;return-1};r=e("xregexp").XRegExp,n=e("./state"),A=e("./config"),B=window.elasticsearch.Client({host:{protocol:window.location.protocol,host:window.location.hostname,port:window.location.port&&window.location.port||"https:"===window.location.protocol&&443||80,path:"/es"}}),D=function(){var e,t,F;return e={size:1e3,query:C(),aggs:E()},F=n.select("filter","orderBy").get(),null!==F&&(e.sort=[(t={},t[""+F.field]={order:F.direction},t)]),B.search({index:"ebisc",type:"cellline",body:e}).then(function(e){var t,F,A,r,i,E,o,a,C,s,B;for(n.set("celllines",e.hits.hits),e.aggregations&&n.set("facetTerms",e.aggregations.facets),n.set("isLoaded",!0),F=!1,r=n.select("filter","facets").get(),i=E=0,o=r.length;E<o;i=++E){A=r[i],a=e.aggregations.facets[A.name].buckets?function(){var F,n,r,i;for(r=e.aggregations.facets[A.name].buckets,i=[],F=0,n=r.length;F<n;F++)t=r[F],i.push(t.key);return i}():function(){var F,n,r,i;for(r=e.aggregations.facets[A.name].facet.buckets,i=[],F=0,n=r.length;F<n;F++)t=r[F],i.push(t.key);return i}(),C=A.selectedTerms;for(B in C)s=C[B],s&&l.call(a,B)<0&&(F=!0,A.selectedTerms[B]=!1)}if(F)return n.select("filter").set("facets",r)}).error(function(e){return console.error(JSON.stringify(e,null,"  ")),alert("Error loading data.")})},C=function(){return{filtered:{query:s(),filter:a()}}},s=function(){var e,t,F,i,E;return t=_.trim(n.select("filter","query").get().toLowerCase()),t=r.replace(t,r("[^(\\p{L}|\\d|\\p{Z})]"),"","all"),t?(E=function(){var e,A,n,i;for(n=r.split(t,r("\\p{Z}")),i=[],e=0,A=n.length;e<A;e++)F=n[e],""!==F&&i.push(F);return i}(),e=function(e,t){return{multi_match:{query:e,type:"best_fields",fields:t}}},{bool:{must:function(){var t,F,n;for(n=[],t=0,F=E.length;t<F;t++)i=E[t],n.push(e(i,A.query_fields));return n}()}}):{match_all:{}}},a=function(){var e;return e=o(),e?{bool:{must:e}}:{}},o=function(){var e,t,F,A,r,i,E;for(e=function(e){var t,F,A;t=[];for(A in e)F=e[A],F===!0&&t.push(A);return t},i=n.select("filter","facets").get(),E=[],F=0,A=i.length;F<A;F++)t=i[F],e(t.selectedTerms).length&&E.push({terms:(r={},r[""+t.name]=e(t.selectedTerms),r)});return E},E=function(){var e,t,F;return t=n.select("filter","facets").get(),t.length?(F=o(),{facets:{global:{},aggs:_.object(function(){var A,n,r;for(r=[],A=0,n=t.length;A<n;A++)e=t[A],r.push([e.name,i(e,F)]);return r}())}}):{}},i=function(e,t){var F,A,n,r,i,E,o,a;if(i=function(){var A,n,r;for(r=[],A=0,n=t.length;A<n;A++)F=t[A],e.name in F.terms||r.push(F);return r}(),E=s(),"bool"in E)for(o=E.bool.must,A=0,n=o.length;A<n;A++)r=o[A],i.push({query:r});return a={field:e.name,order:{_term:"asc"},min_doc_count:1,size:0},i.length?{filter:{bool:{must:i}},aggs:{facet:{terms:a}}}:{terms:a}},t.exports={search:D}},{"./config":8,"./state":11,xregexp:25}],10:[function(e,t,F){var A,n,r,i,E,o,a,C;r=e("./elastic"),o=e("./state"),A=e("./actions"),i=e("./components/filter"),E=e("./components/search"),n=e("./components/celllines"),a=e("./components/total-count"),sessionStorage.getItem("filter")?A.loadFilter():A.initFilter(),C=function(){return A.saveFilter(),r.search()},o.select("filter").on("update",_.debounce(C,150)),React.render(React.createElement(a,null),document.getElementById("total-count")),React.render(React.createElement(i,null),document.getElementById("filter")),React.render(React.createElement(E,null),document.getElementById("search")),React.render(React.createElement(n,null),document.getElementById("celllines"))},{"./actions":1,"./components/celllines":2,"./components/filter":4,"./components/search":5,"./components/total-count":7,"./elastic":9,"./state":11}],11:[function(e,t,F){var A,n,r;A=e("baobab"),r={filter:{query:"",facets:[],orderBy:null},facetTerms:{},celllines:[],isLoaded:!1},n={shiftReferences:!0,mixins:[React.addons.PureRenderMixin]},t.exports=new A(r,n)},{baobab:13}],12:[function(e,t,F){t.exports={autoCommit:!0,asynchronous:!0,clone:!1,cloningFunction:null,cursorSingletons:!0,maxHistory:0,mixins:[],shiftReferences:!1,typology:null,validate:null}},{}],13:[function(e,t,F){var A=e("./src/baobab.js"),n=e("./src/helpers.js");Object.defineProperty(A,"version",{value:"0.4.4"}),A.getIn=n.getIn,t.exports=A},{"./src/baobab.js":14,"./src/helpers.js":17}],14:[function(e,t,F){function A(e){return e+"$"+(new Date).getTime()+(""+Math.random()).replace("0.","")}function n(e,t){if(arguments.length<1&&(e={}),!(this instanceof n))return new n(e,t);if(!D.Object(e)&&!D.Array(e))throw Error("Baobab: invalid data.");if(i.call(this),this.options=o.shallowMerge(B,t),this._cloner=this.options.cloningFunction||o.deepClone,this._transaction={},this._future=void 0,this._history=[],this._cursors={},this.typology=this.options.typology?this.options.typology instanceof E?this.options.typology:new E(this.options.typology):new E,this.validate=this.options.validate||null,this.validate)try{this.typology.check(e,this.validate,!0)}catch(F){throw F.message="/"+F.path.join("/")+": "+F.message,F}this.data=this._cloner(e),this.mixin=s.baobab(this)}var r=e("./cursor.js"),i=e("emmett"),E=e("typology"),o=e("./helpers.js"),a=e("./update.js"),C=e("./merge.js"),s=e("./mixins.js"),B=e("../defaults.js"),D=e("./type.js");o.inherits(n,i),n.prototype._archive=function(){if(!(this.options.maxHistory<=0)){var e={data:this._cloner(this.data)};return this._history.length===this.options.maxHistory&&this._history.pop(),this._history.unshift(e),e}},n.prototype.commit=function(e){var t;if(e)this.data=e.data,t=e.log;else{this.options.shiftReferences&&(this.data=o.shallowClone(this.data));var F=this._archive();t=a(this.data,this._transaction,this.options),F&&(F.log=t)}if(this.validate){var A,n,r=[],i=t.length;for(n=0;n<i;n++)if(A=o.getIn(this.validate,t[n]))try{this.typology.check(this.get(t[n]),A,!0)}catch(E){E.path=t[n].concat(E.path||[]),r.push(E)}r.length&&this.emit("invalid",{errors:r})}return this._transaction={},this._future&&(this._future=clearTimeout(this._future)),this.emit("update",{log:t}),this},n.prototype.select=function(e){if(!e)throw Error("Baobab.select: invalid path.");if(arguments.length>1&&(e=o.arrayOf(arguments)),!D.Path(e))throw Error("Baobab.select: invalid path.");e=D.Array(e)?e:[e];var t,F=D.ComplexPath(e);if(F&&(t=o.solvePath(this.data,e)),this.options.cursorSingletons){var n=e.map(function(e){return D.Function(e)?A("fn"):D.Object(e)?A("ob"):e}).join("λ");if(this._cursors[n])return this._cursors[n];var i=new r(this,e,t,n);return this._cursors[n]=i,i}return new r(this,e)},n.prototype.root=function(){return this.select([])},n.prototype.reference=function(e){if(arguments.length>1&&(e=o.arrayOf(arguments)),!D.Path(e))throw Error("Baobab.get: invalid path.");return o.getIn(this.data,D.String(e)||D.Number(e)?[e]:e)},n.prototype.get=function(){var e=this.reference.apply(this,arguments);return this.options.clone?this._cloner(e):e},n.prototype.clone=function(e){return this._cloner(this.reference.apply(this,arguments))},n.prototype.set=function(e,t){if(arguments.length<2)throw Error("Baobab.set: expects a key and a value.");var F={};if(D.Array(e)){var A=o.solvePath(this.data,e);if(!A)throw Error("Baobab.set: could not solve dynamic path.");F=o.pathObject(A,{$set:t})}else F[e]={$set:t};return this.update(F)},n.prototype.unset=function(e){if(!e&&0!==e)throw Error("Baobab.unset: expects a valid key to unset.");var t={};return t[e]={$unset:!0},this.update(t)},n.prototype.update=function(e){var t=this;if(!D.Object(e))throw Error("Baobab.update: wrong specification.");return this._transaction=C(e,this._transaction),this.options.autoCommit?this.options.asynchronous?(this._future||(this._future=setTimeout(t.commit.bind(t,null),0)),this):this.commit():this},n.prototype.hasHistory=function(){return!!this._history.length},n.prototype.getHistory=function(){return this._history},n.prototype.undo=function(){if(!this.hasHistory())throw Error("Baobab.undo: no history recorded, cannot undo.");var e=this._history.shift();this.commit(e)},n.prototype.release=function(){delete this.data,delete this._transaction,delete this._history;for(var e in this._cursors)this._cursors[e].release();delete this._cursors,this.kill()},n.prototype.toJSON=function(){return this.reference()},t.exports=n},{"../defaults.js":12,"./cursor.js":16,"./helpers.js":17,"./merge.js":18,"./mixins.js":19,"./type.js":20,"./update.js":21,emmett:23,typology:24}],15:[function(e,t,F){function A(e,t){t.on("update",e.cursorListener),e.tree.off("update",e.treeListener),e.tree.on("update",e.treeListener)}function n(e){var t=this;if(arguments.length<2)throw Error("baobab.Combination: not enough arguments.");var F=arguments[1],n=E.arrayOf(arguments).slice(2);if(F instanceof Array&&(n=F.slice(1),F=F[0]),!o.Cursor(F))throw Error("baobab.Combination: argument should be a cursor.");if("or"!==e&&"and"!==e)throw Error("baobab.Combination: invalid operator.");i.call(this),this.cursors=[F],this.operators=[],this.tree=F.tree,this.updates=new Array(this.cursors.length),this.cursorListener=function(){t.updates[t.cursors.indexOf(this)]=!0},this.treeListener=function(){var e,F,A=t.updates[0];for(e=1,F=t.cursors.length;e<F;e++)A="or"===t.operators[e-1]?A||t.updates[e]:A&&t.updates[e];A&&t.emit("update"),t.updates=new Array(t.cursors.length)},this.bound=!1;var r=this.on,a=this.once,C=function(){t.bound||(t.bound=!0,t.cursors.forEach(function(e){A(t,e)}))};this.on=function(){return C(),r.apply(this,arguments)},this.once=function(){return C(),a.apply(this,arguments)},n.forEach(function(t){this[e](t)},this)}function r(e){n.prototype[e]=function(t){if(!o.Cursor(t))throw this.release(),Error("baobab.Combination."+e+": argument should be a cursor.");if(~this.cursors.indexOf(t))throw this.release(),Error("baobab.Combination."+e+": cursor already in combination.");return this.cursors.push(t),this.operators.push(e),this.updates.length++,this.bound&&A(this,t),this}}var i=e("emmett"),E=e("./helpers.js"),o=e("./type.js");E.inherits(n,i),r("or"),r("and"),n.prototype.release=function(){this.cursors.forEach(function(e){e.off("update",this.cursorListener)},this),this.tree.off("update",this.treeListener),this.cursors=null,this.operators=null,this.tree=null,this.updates=null,this.kill()},t.exports=n},{"./helpers.js":17,"./type.js":20,emmett:23}],16:[function(e,t,F){function A(e,t,F,A){var r=this;n.call(this),t=t||[],this.tree=e,this.path=t,this.hash=A,this.relevant=void 0!==this.reference(),this.complexPath=!!F,this.solvedPath=this.complexPath?F:this.path,this.updateHandler=function(e){var t,F,A,n,i,o,a=e.data.log,C=!1;if(r.complexPath&&(r.solvedPath=E.solvePath(r.tree.data,r.path)),!r.path.length)return r.emit("update");e:for(i=0,A=a.length;i<A;i++)for(t=a[i],o=0,n=t.length;o<n&&(F=t[o],F===""+r.solvedPath[o]);o++)if(o+1===n||o+1===r.solvedPath.length){C=!0;break e}var s=void 0!==r.reference();r.relevant?s&&C?r.emit("update"):s||(r.emit("irrelevant"),r.relevant=!1):s&&C&&(r.emit("relevant"),r.emit("update"),r.relevant=!0)},this.mixin=i.cursor(this);var o=!1,a=this.on,C=this.once,s=function(){o||(o=!0,r.tree.on("update",r.updateHandler))};this.on=function(){return s(),a.apply(this,arguments)},this.once=function(){return s(),C.apply(this,arguments)}}var n=e("emmett"),r=e("./combination.js"),i=e("./mixins.js"),E=e("./helpers.js"),o=e("./type.js");E.inherits(A,n),A.prototype.isRoot=function(){return!this.path.length},A.prototype.isLeaf=function(){return o.Primitive(this.reference())},A.prototype.isBranch=function(){return!this.isLeaf()&&!this.isRoot()},A.prototype.root=function(){return this.tree.root()},A.prototype.select=function(e){if(arguments.length>1&&(e=E.arrayOf(arguments)),!o.Path(e))throw Error("baobab.Cursor.select: invalid path.");return this.tree.select(this.path.concat(e))},A.prototype.up=function(){return this.solvedPath&&this.solvedPath.length?this.tree.select(this.path.slice(0,-1)):null},A.prototype.left=function(){var e=+this.solvedPath[this.solvedPath.length-1];if(isNaN(e))throw Error("baobab.Cursor.left: cannot go left on a non-list type.");return e?this.tree.select(this.solvedPath.slice(0,-1).concat(e-1)):null},A.prototype.leftmost=function(){var e=+this.solvedPath[this.solvedPath.length-1];if(isNaN(e))throw Error("baobab.Cursor.leftmost: cannot go left on a non-list type.");return this.tree.select(this.solvedPath.slice(0,-1).concat(0))},A.prototype.right=function(){var e=+this.solvedPath[this.solvedPath.length-1];if(isNaN(e))throw Error("baobab.Cursor.right: cannot go right on a non-list type.");return e+1===this.up().reference().length?null:this.tree.select(this.solvedPath.slice(0,-1).concat(e+1))},A.prototype.rightmost=function(){var e=+this.solvedPath[this.solvedPath.length-1];if(isNaN(e))throw Error("baobab.Cursor.right: cannot go right on a non-list type.");var t=this.up().reference();return this.tree.select(this.solvedPath.slice(0,-1).concat(t.length-1))},A.prototype.down=function(){+this.solvedPath[this.solvedPath.length-1];return this.reference()instanceof Array?this.tree.select(this.solvedPath.concat(0)):null},A.prototype.get=function(e){return arguments.length>1&&(e=E.arrayOf(arguments)),o.Step(e)?this.tree.get(this.solvedPath.concat(e)):this.tree.get(this.solvedPath)},A.prototype.reference=function(e){return arguments.length>1&&(e=E.arrayOf(arguments)),o.Step(e)?this.tree.reference(this.solvedPath.concat(e)):this.tree.reference(this.solvedPath)},A.prototype.clone=function(e){return arguments.length>1&&(e=E.arrayOf(arguments)),o.Step(e)?this.tree.clone(this.solvedPath.concat(e)):this.tree.clone(this.solvedPath)},A.prototype.set=function(e,t){if(arguments.length<2)throw Error("baobab.Cursor.set: expecting at least key/value.");var F=this.reference();if("object"!=typeof F)throw Error("baobab.Cursor.set: trying to set key to a non-object.");var A={};if(o.Array(e)){var n=E.solvePath(F,e);if(!n)throw Error("baobab.Cursor.set: could not solve dynamic path.");A=E.pathObject(n,{$set:t})}else A[e]={$set:t};return this.update(A)},A.prototype.edit=function(e){return this.update({$set:e})},A.prototype.unset=function(e){if(!e&&0!==e)throw Error("baobab.Cursor.unset: expects a valid key to unset.");if("object"!=typeof this.reference())throw Error("baobab.Cursor.set: trying to set key to a non-object.");var t={};return t[e]={$unset:!0},this.update(t)},A.prototype.remove=function(){if(this.isRoot())throw Error("baobab.Cursor.remove: cannot remove root node.");return this.update({$unset:!0})},A.prototype.apply=function(e){if("function"!=typeof e)throw Error("baobab.Cursor.apply: argument is not a function.");return this.update({$apply:e})},A.prototype.chain=function(e){if("function"!=typeof e)throw Error("baobab.Cursor.chain: argument is not a function.");return this.update({$chain:e})},A.prototype.push=function(e){if(!(this.reference()instanceof Array))throw Error("baobab.Cursor.push: trying to push to non-array value.");return arguments.length>1?this.update({$push:E.arrayOf(arguments)}):this.update({$push:e})},A.prototype.unshift=function(e){if(!(this.reference()instanceof Array))throw Error("baobab.Cursor.push: trying to push to non-array value.");return arguments.length>1?this.update({$unshift:E.arrayOf(arguments)}):this.update({$unshift:e})},A.prototype.merge=function(e){if(!o.Object(e))throw Error("baobab.Cursor.merge: trying to merge a non-object.");if(!o.Object(this.reference()))throw Error("baobab.Cursor.merge: trying to merge into a non-object.");this.update({$merge:e})},A.prototype.update=function(e){return this.tree.update(E.pathObject(this.solvedPath,e)),this},A.prototype.or=function(e){return new r("or",this,e)},A.prototype.and=function(e){return new r("and",this,e)},A.prototype.release=function(){this.tree.off("update",this.updateHandler),this.hash&&delete this.tree._cursors[this.hash],delete this.tree,delete this.path,delete this.solvedPath,this.kill()},A.prototype.toJSON=function(){return this.reference()},o.Cursor=function(e){return e instanceof A},t.exports=A},{"./combination.js":15,"./helpers.js":17,"./mixins.js":19,"./type.js":20,emmett:23}],17:[function(e,t,F){(function(F){function A(e){return Array.prototype.slice.call(e)}function n(e,t){var F,A={};for(F in e)A[F]=e[F];for(F in t)A[F]=t[F];return A}function r(e){var t=e.source,F="";return e.global&&(F+="g"),e.multiline&&(F+="m"),e.ignoreCase&&(F+="i"),e.sticky&&(F+="y"),e.unicode&&(F+="u"),new RegExp(t,F)}function i(e,t){if(!t||"object"!=typeof t||t instanceof Error||"ArrayBuffer"in F&&t instanceof ArrayBuffer)return t;if(h.Array(t)){if(e){var A,n,i=[];for(A=0,n=t.length;A<n;A++)i.push(p(t[A]));return i}return t.slice(0)}if(h.Date(t))return new Date(t.getTime());if(t instanceof RegExp)return r(t);if(h.Object(t)){var E,o={};t.constructor&&t.constructor!==Object&&(o=Object.create(t.constructor.prototype));for(E in t)t.hasOwnProperty(E)&&(o[E]=e?p(t[E]):t[E]);return o}return t}function E(e,t){return function(F){return t(e(F))}}function o(e,t){var F,A;for(F=0,A=e.length;F<A;F++)if(t(e[F]))return e[F]}function a(e,t){var F,A;for(F=0,A=e.length;F<A;F++)if(t(e[F]))return F;return-1}function C(e,t){var F,A=!0;if(!e)return!1;for(F in t)if(h.Object(t[F]))A=A&&C(e[F],t[F]);else if(h.Array(t[F]))A=A&&!!~t[F].indexOf(e[F]);else if(e[F]!==t[F])return!1;return A}function s(e,t){return o(e,function(e){return C(e,t)})}function B(e,t){return a(e,function(e){return C(e,t)})}function D(e,t){t=t||[];var F,A,n=e;for(F=0,A=t.length;F<A;F++){if(!n)return;if("function"==typeof t[F]){if(!h.Array(n))return;n=o(n,t[F])}else if("object"==typeof t[F]){if(!h.Array(n))return;n=s(n,t[F])}else n=n[t[F]]}return n}function l(e,t){var F,A,n,r=[],i=e;for(A=0,n=t.length;A<n;A++){if(!i)return null;if("function"==typeof t[A]){if(!h.Array(i))return;F=a(i,t[A]),r.push(F),i=i[F]}else if("object"==typeof t[A]){if(!h.Array(i))return;F=B(i,t[A]),r.push(F),i=i[F]}else r.push(t[A]),i=i[t[A]]||{}}return r}function c(e,t){var F,A=e.length,n={},r=n;for(A||(n=t),F=0;F<A;F++)r[e[F]]=F+1===A?t:{},r=r[e[F]];return n}function u(e,t){e.super_=t;var F=function(){};F.prototype=t.prototype,e.prototype=new F,e.prototype.constructor=e}var h=e("./type.js"),f=i.bind(null,!1),p=i.bind(null,!0);t.exports={arrayOf:A,deepClone:p,shallowClone:f,shallowMerge:n,compose:E,getIn:D,inherits:u,pathObject:c,solvePath:l}}).call(this,"undefined"!=typeof global?global:"undefined"!=typeof self?self:"undefined"!=typeof window?window:{})},{"./type.js":20}],18:[function(e,t,F){function A(e,t){return t in(e||{})}function n(e,t,F){return A(e,F)&&A(t,F)}function r(){var e,t,F,A,o={},a=arguments.length;for(F=a-1;F>=0;F--){if(arguments[F].$unset)delete o.$set,delete o.$apply,delete o.$merge,o.$unset=arguments[F].$unset;else{if(arguments[F].$set){delete o.$apply,delete o.$merge,delete o.$unset,o.$set=arguments[F].$set;continue}if(arguments[F].$merge){delete o.$set,delete o.$apply,delete o.$unset,o.$merge=arguments[F].$merge;continue}if(arguments[F].$apply){delete o.$set,delete o.$merge,delete o.$unset,o.$apply=arguments[F].$apply;continue}if(arguments[F].$chain){delete o.$set,delete o.$merge,delete o.$unset,o.$apply?o.$apply=i.compose(o.$apply,arguments[F].$chain):o.$apply=arguments[F].$chain;continue}}for(A in arguments[F])e=o[A],t=arguments[F][A],e&&E.Object(t)?n(e,t,"$push")?E.Array(e.$push)?e.$push=e.$push.concat(t.$push):e.$push=[e.$push].concat(t.$push):n(e,t,"$unshift")?E.Array(t.$unshift)?e.$unshift=t.$unshift.concat(e.$unshift):e.$unshift=[t.$unshift].concat(e.$unshift):o[A]=r(t,e):o[A]=t}return o}var i=e("./helpers.js"),E=e("./type.js");t.exports=r},{"./helpers.js":17,"./type.js":20}],19:[function(e,t,F){var A=e("./combination.js"),n=e("./type.js");t.exports={baobab:function(e){return{mixins:[{getInitialState:function(){if(this.tree=e,!this.cursor&&!this.cursors)return{};if(this.cursor&&this.cursors)throw Error("baobab.mixin: you cannot have both `component.cursor` and `component.cursors`. Please make up your mind.");if(this.__type=null,this.__updateHandler=function(){this.setState(this.__getCursorData())}.bind(this),this.cursor){if(!n.MixinCursor(this.cursor))throw Error("baobab.mixin.cursor: invalid data (cursor, string, array or function).");n.Function(this.cursor)&&(this.cursor=this.cursor()),n.Cursor(this.cursor)||(this.cursor=e.select(this.cursor)),this.__getCursorData=function(){return{cursor:this.cursor.get()}}.bind(this),this.__type="single"}else if(this.cursors){if(!n.MixinCursors(this.cursors))throw Error("baobab.mixin.cursor: invalid data (object, array or function).");if(n.Function(this.cursors)&&(this.cursors=this.cursors()),n.Array(this.cursors))this.cursors=this.cursors.map(function(t){return n.Cursor(t)?t:e.select(t)}),this.__getCursorData=function(){return{cursors:this.cursors.map(function(e){return e.get()})}}.bind(this),this.__type="array";else{for(var t in this.cursors)n.Cursor(this.cursors[t])||(this.cursors[t]=e.select(this.cursors[t]));this.__getCursorData=function(){var e={};for(t in this.cursors)e[t]=this.cursors[t].get();return{cursors:e}}.bind(this),this.__type="object"}}return this.__getCursorData()},componentDidMount:function(){"single"===this.__type?(this.__combination=new A("or",[this.cursor]),this.__combination.on("update",this.__updateHandler)):"array"===this.__type?(this.__combination=new A("or",this.cursors),
+!function(){function e(t,F,A){function n(i,E){if(!F[i]){if(!t[i]){var o="function"==typeof require&&require;if(!E&&o)return o(i,!0);if(r)return r(i,!0);var a=new Error("Cannot find module '"+i+"'");throw a.code="MODULE_NOT_FOUND",a}var C=F[i]={exports:{}};t[i][0].call(C.exports,function(e){var F=t[i][1][e];return n(F||e)},C,C.exports,e,t,F,A)}return F[i].exports}for(var r="function"==typeof require&&require,i=0;i<A.length;i++)n(A[i]);return n}return e}()({1:[function(e,t,F){var A,n,r,i,E,o,a,C,s;n=e("./state"),A=e("./config"),r=function(){return n.select("filter").set("facets",A.facets)},a=function(e){return n.set("filter",e)},i=function(){return a(JSON.parse(sessionStorage.getItem("filter")))},o=function(){return sessionStorage.setItem("filter",JSON.stringify(n.select("filter").get()))},s=function(e){return n.select("filter","query").edit(e)},C=function(e,t,F){var A;return A=n.select("filter","facets",_.findIndex(n.select("filter","facets").get(),{name:e}),"selectedTerms"),A.set(t,F)},E=function(e){return n.select("filter").set("orderBy",e)},t.exports={initFilter:r,setFilter:a,loadFilter:i,saveFilter:o,updateQueryFilter:s,updateFacetTermFilter:C,orderBy:E}},{"./config":8,"./state":11}],2:[function(e,t,F){var A,n,r,i,E;r=e("../config"),i=e("../state"),E=e("./table"),A=e("../actions"),n=React.createClass({displayName:"Celllines",mixins:[i.mixin],cursors:{isLoaded:["isLoaded"],celllines:["celllines"],orderBy:["filter","orderBy"]},render:function(){var e,t,F,n;return e=function(e,t){var F;return F=t._source[e],"name"===e?React.createElement("a",{href:"./"+F+"/"},F):"donor_disease"===e?null!==F?F.join(", "):React.createElement("span",{"class":"comment"},"/"):"cellline_diseases_genes"===e?null!==F?F.join(", "):React.createElement("span",{"class":"comment"},"/"):"derivation"===e?null!==F?F.join(", "):React.createElement("span",{"class":"comment"},"/"):F},t=function(t,F){var A,n,r,i;for(i=[],n=0,r=F.length;n<r;n++)A=F[n],i.push(e(A.name,t));return i},n=function(){var e,A,n,i;for(n=this.state.cursors.celllines,i=[],e=0,A=n.length;e<A;e++)F=n[e],i.push(t(F,r.fields));return i}.call(this),React.createElement("div",null,this.state.cursors.isLoaded?React.createElement(E,{cols:r.fields,rows:n,orderBy:this.state.cursors.orderBy,onOrderBy:A.orderBy}):void 0)}}),t.exports=n},{"../actions":1,"../config":8,"../state":11,"./table":6}],3:[function(e,t,F){var A,n,r;r=e("classnames"),A=React.createClass({displayName:"DropdownMultiSelect",getInitialState:function(){return{showMenu:!1}},showMenu:function(){return this.setState({showMenu:!0}),window.addEventListener("click",this.hideMenu,!0)},hideMenu:function(e){return e.target===$(".dropdown-button",this.getDOMNode())[0]?(e.stopPropagation(),this.setState({showMenu:!1}),window.removeEventListener("click",this.hideMenu,!0)):$(this.getDOMNode()).has($(e.target)).length?void 0:(this.setState({showMenu:!1}),window.removeEventListener("click",this.hideMenu,!0))},componentWillUnmount:function(){return window.removeEventListener("click",this.hideMenu,!0)},render:function(){var e;return React.createElement("div",{className:r({dropdown:!0,"two-cols":this.props.items.length>=15,"has-selection":this.props.hasSelection})},React.createElement("div",{className:"dropdown-container"},React.createElement("div",{className:"dropdown-button",onClick:this.showMenu},this.props.label),React.createElement("ul",{className:r({"dropdown-menu":!0,checkbox:!0,"show-menu":this.state.showMenu})},function(){var t,F,A,r;for(A=this.props.items,r=[],t=0,F=A.length;t<F;t++)e=A[t],r.push(React.createElement(n,{key:e.name,item:e,action:this.props.action}));return r}.call(this))))}}),n=React.createClass({displayName:"Item",handleOnClick:function(){return this.props.action(this.props.item.name,!this.props.item.selected)},render:function(){return React.createElement("li",{onClick:this.handleOnClick,className:r({selected:void 0!==this.props.item.selected&&this.props.item.selected||!1})},React.createElement("div",{className:"checkbox"}),React.createElement("label",null,this.props.item.label))}}),t.exports=A},{classnames:22}],4:[function(e,t,F){var A,n,r,i,E,o,a=[].indexOf||function(e){for(var t=0,F=this.length;t<F;t++)if(t in this&&this[t]===e)return t;return-1};i=React.addons.CSSTransitionGroup,o=e("../state"),A=e("../actions"),n=e("./dropdown-multi-select"),r=React.createClass({displayName:"Facets",mixins:[o.mixin],cursors:{facets:["filter","facets"],facetTerms:["facetTerms"]},render:function(){var e,t,F;return React.createElement("span",null,React.createElement("span",null,_.size(this.state.cursors.facetTerms)?React.createElement("div",{className:"filter-group"},function(){var r,i,o,a;for(o=this.state.cursors.facets,a=[],t=r=0,i=o.length;r<i;t=++r)e=o[t],F=this.getSelectedTerms(e.name),a.push(React.createElement("div",{key:e.name,className:"filter"},React.createElement(n,{name:e.name,label:e.label,hasSelection:F.length>0,items:this.getFacetTerms(e.name,F),action:_.partial(A.updateFacetTermFilter,e.name)}),React.createElement(E,{facet:e,terms:F})));return a}.call(this)):void 0),React.createElement("span",null,_.size(this.state.cursors.facetTerms)&&a.call(function(){var t,F,A,n;for(A=this.state.cursors.facets,n=[],t=0,F=A.length;t<F;t++)e=A[t],n.push(this.getSelectedTerms(e.name).length>0);return n}.call(this),!0)>=0?React.createElement("div",{className:"clear-all-filters",onClick:this.clearFilters},React.createElement("span",{className:"glyphicon glyphicon-remove-sign"})," Clear all filters"):void 0))},clearFilters:function(){return A.initFilter()},getSelectedTerms:function(e){var t,F,A;return F=this.state.cursors.facets[_.findIndex(this.state.cursors.facets,{name:e})].selectedTerms,function(){var e;e=[];for(t in F)A=F[t],A===!0&&e.push(t);return e}().sort()},getFacetTerms:function(e,t){var F,A,n,r,i,E;E="buckets"in this.state.cursors.facetTerms[e]?this.state.cursors.facetTerms[e].buckets:this.state.cursors.facetTerms[e].facet.buckets,r=[];for(F=0,A=E.length;F<A;F++)i=E[F],r.push({name:i.key,label:i.key+" ("+i.doc_count+")",selected:(n=i.key,a.call(t,n)>=0)});return r}}),E=React.createClass({displayName:"SelectedTerms",render:function(){var e;return React.createElement("ul",{className:"selected-terms"},React.createElement(i,{transitionName:"transition-opacity"},function(){var t,F,A,n;for(A=this.props.terms,n=[],t=0,F=A.length;t<F;t++)e=A[t],n.push(React.createElement("li",{key:e,className:"term"},React.createElement("span",{className:"remove glyphicon glyphicon-remove-sign",onClick:this.createHandleOnRemove(e)})," ",e));return n}.call(this)))},createHandleOnRemove:function(e){return function(t){return function(){return A.updateFacetTermFilter(t.props.facet.name,e,!1)}}(this)}}),t.exports=r},{"../actions":1,"../state":11,"./dropdown-multi-select":3}],5:[function(e,t,F){var A,n,r,i;i=e("../state"),A=e("../actions"),r=React.createClass({displayName:"Search",mixins:[i.mixin],cursors:{isLoaded:["isLoaded"],query:["filter","query"]},render:function(){return React.createElement("div",null,this.state.cursors.isLoaded?React.createElement(n,{query:this.state.cursors.query}):void 0)}}),n=React.createClass({displayName:"Input",getInitialState:function(){return{query:this.props.query}},render:function(){return React.createElement("input",{type:"text",placeholder:"Search cell lines",value:this.state.query,onChange:this.handleChange})},handleChange:function(e){return this.setState({query:e.target.value}),A.updateQueryFilter(e.target.value)}}),t.exports=r},{"../actions":1,"../state":11}],6:[function(e,t,F){var A,n,r,i;A=React.createClass({displayName:"Table",render:function(){return React.createElement("table",{className:"listing"},React.createElement(i,{cols:this.props.cols,orderBy:this.props.orderBy,onOrderBy:this.props.onOrderBy}),React.createElement(n,{cols:this.props.cols,rows:this.props.rows}))}}),i=React.createClass({displayName:"Thead",render:function(){var e;return React.createElement("thead",null,React.createElement("tr",null,function(){var t,F,A,n;for(A=this.props.cols,n=[],t=0,F=A.length;t<F;t++)e=A[t],n.push(React.createElement(r,{key:e.name,col:e,orderBy:this.props.orderBy,onOrderBy:this.props.onOrderBy}));return n}.call(this)))},renderTh:function(e,t){}}),r=React.createClass({displayName:"Th",render:function(){return null!==this.props.orderBy&&this.props.col.name===this.props.orderBy.field?React.createElement("th",{onClick:this.handleOnClick,className:"order-by "+this.props.orderBy.direction},React.createElement("span",{className:"sort"},this.props.col.label)):React.createElement("th",{onClick:this.handleOnClick},React.createElement("span",{className:"sort"},this.props.col.label))},handleOnClick:function(){return null!==this.props.orderBy&&this.props.orderBy.field===this.props.col.name?"asc"===this.props.orderBy.direction?this.props.onOrderBy({field:this.props.col.name,direction:"desc"}):this.props.onOrderBy(null):this.props.onOrderBy({field:this.props.col.name,direction:"asc"})}}),n=React.createClass({displayName:"Tbody",render:function(){var e,t,F;return React.createElement("tbody",null,function(){var A,n,r,i;for(r=this.props.rows,i=[],t=A=0,n=r.length;A<n;t=++A)F=r[t],i.push(React.createElement("tr",{key:t},function(){var A,n,r;for(r=[],t=A=0,n=F.length;A<n;t=++A)e=F[t],r.push(React.createElement("td",{key:t},e));return r}()));return i}.call(this))}}),t.exports=A},{}],7:[function(e,t,F){var A,n,r=function(e,t){return(+e%(t=+t)+t)%t};A=e("../state"),n=React.createClass({displayName:"TotalCount",mixins:[A.mixin],cursors:{isLoaded:["isLoaded"],celllines:["celllines"]},render:function(){return React.createElement("div",null,this.state.cursors.isLoaded?React.createElement("div",null,React.createElement("span",{className:"count"},this.state.cursors.celllines.length),React.createElement("span",{className:"unit"},1===r(this.state.cursors.celllines.length,100)&&"cell line"||"cell lines")):void 0)}}),t.exports=n},{"../state":11}],8:[function(e,t,F){var A;A={fields:[{name:"name",label:"Name"},{name:"donor_disease",label:"Donor disease status"},{name:"cellline_diseases_genes",label:"Genetic modification"},{name:"donor_sex",label:"Donor sex"},{name:"donor_age",label:"Donor age"},{name:"derivation",label:"Derivation"}],query_fields:["biosamples_id.analyzed","name.analyzed","alternative_names.analyzed","depositor.analyzed","primary_cell_type.analyzed","donor_disease.analyzed","genetic_modification_disease.analyzed","primary_disease_synonyms","disease_associated_phenotypes.analyzed","non_disease_associated_phenotypes.analyzed","donor_sex.analyzed","donor_age.analyzed","donor_ethnicity.analyzed","derivation.analyzed","all_genetics.analyzed","all_derivation.analyzed"],facets:[{name:"all_diseases",label:"Disease",selectedTerms:{}},{name:"donor_sex",label:"Donor sex",selectedTerms:{}},{name:"donor_age",label:"Donor age",selectedTerms:{}},{name:"derivation",label:"Derivation",selectedTerms:{}}]},t.exports=A},{}],9:[function(e,t,F){var A,n,r,i,E,o,a,C,s,B,D,l=[].indexOf||function(e){for(var t=0,F=this.length;t<F;t++)if(t in this&&this[t]===e)return t;return-1};r=e("xregexp").XRegExp,n=e("./state"),A=e("./config"),B="/es/ebisc/cellline/_search",D=function(){var e,t,F;return e={size:1e3,query:C(),aggs:E()},F=n.select("filter","orderBy").get(),null!==F&&(e.sort=[(t={},t[""+F.field]={order:F.direction},t)]),$.getJSON(B,{source:JSON.stringify(e)}).then(function(e){var t,F,A,r,i,E,o,a,C,s,B;for(n.set("celllines",e.hits.hits),e.aggregations&&n.set("facetTerms",e.aggregations.facets),n.set("isLoaded",!0),F=!1,r=n.select("filter","facets").get(),i=E=0,o=r.length;E<o;i=++E){A=r[i],a=e.aggregations.facets[A.name].buckets?function(){var F,n,r,i;for(r=e.aggregations.facets[A.name].buckets,i=[],F=0,n=r.length;F<n;F++)t=r[F],i.push(t.key);return i}():function(){var F,n,r,i;for(r=e.aggregations.facets[A.name].facet.buckets,i=[],F=0,n=r.length;F<n;F++)t=r[F],i.push(t.key);return i}(),C=A.selectedTerms;for(B in C)s=C[B],s&&l.call(a,B)<0&&(F=!0,A.selectedTerms[B]=!1)}if(F)return n.select("filter").set("facets",r)}).fail(function(e){return console.error(JSON.stringify(e,null,"  ")),alert("Error loading data.")})},C=function(){return{filtered:{query:s(),filter:a()}}},s=function(){var e,t,F,i,E;return t=_.trim(n.select("filter","query").get().toLowerCase()),t=r.replace(t,r("[^(\\p{L}|\\d|\\p{Z})]"),"","all"),t?(E=function(){var e,A,n,i;for(n=r.split(t,r("\\p{Z}")),i=[],e=0,A=n.length;e<A;e++)F=n[e],""!==F&&i.push(F);return i}(),e=function(e,t){return{multi_match:{query:e,type:"best_fields",fields:t}}},{bool:{must:function(){var t,F,n;for(n=[],t=0,F=E.length;t<F;t++)i=E[t],n.push(e(i,A.query_fields));return n}()}}):{match_all:{}}},a=function(){var e;return e=o(),e?{bool:{must:e}}:{}},o=function(){var e,t,F,A,r,i,E;for(e=function(e){var t,F,A;t=[];for(A in e)F=e[A],F===!0&&t.push(A);return t},i=n.select("filter","facets").get(),E=[],F=0,A=i.length;F<A;F++)t=i[F],e(t.selectedTerms).length&&E.push({terms:(r={},r[""+t.name]=e(t.selectedTerms),r)});return E},E=function(){var e,t,F;return t=n.select("filter","facets").get(),t.length?(F=o(),{facets:{global:{},aggs:_.object(function(){var A,n,r;for(r=[],A=0,n=t.length;A<n;A++)e=t[A],r.push([e.name,i(e,F)]);return r}())}}):{}},i=function(e,t){var F,A,n,r,i,E,o,a;if(i=function(){var A,n,r;for(r=[],A=0,n=t.length;A<n;A++)F=t[A],e.name in F.terms||r.push(F);return r}(),E=s(),"bool"in E)for(o=E.bool.must,A=0,n=o.length;A<n;A++)r=o[A],i.push({query:r});return a={field:e.name,order:{_term:"asc"},min_doc_count:1,size:0},i.length?{filter:{bool:{must:i}},aggs:{facet:{terms:a}}}:{terms:a}},t.exports={search:D}},{"./config":8,"./state":11,xregexp:25}],10:[function(e,t,F){var A,n,r,i,E,o,a,C;r=e("./elastic"),o=e("./state"),A=e("./actions"),i=e("./components/filter"),E=e("./components/search"),n=e("./components/celllines"),a=e("./components/total-count"),sessionStorage.getItem("filter")?A.loadFilter():A.initFilter(),C=function(){return A.saveFilter(),r.search()},o.select("filter").on("update",_.debounce(C,150)),React.render(React.createElement(a,null),document.getElementById("total-count")),React.render(React.createElement(i,null),document.getElementById("filter")),React.render(React.createElement(E,null),document.getElementById("search")),React.render(React.createElement(n,null),document.getElementById("celllines"))},{"./actions":1,"./components/celllines":2,"./components/filter":4,"./components/search":5,"./components/total-count":7,"./elastic":9,"./state":11}],11:[function(e,t,F){var A,n,r;A=e("baobab"),r={filter:{query:"",facets:[],orderBy:null},facetTerms:{},celllines:[],isLoaded:!1},n={shiftReferences:!0,mixins:[React.addons.PureRenderMixin]},t.exports=new A(r,n)},{baobab:13}],12:[function(e,t,F){t.exports={autoCommit:!0,asynchronous:!0,clone:!1,cloningFunction:null,cursorSingletons:!0,maxHistory:0,mixins:[],shiftReferences:!1,typology:null,validate:null}},{}],13:[function(e,t,F){var A=e("./src/baobab.js"),n=e("./src/helpers.js");Object.defineProperty(A,"version",{value:"0.4.4"}),A.getIn=n.getIn,t.exports=A},{"./src/baobab.js":14,"./src/helpers.js":17}],14:[function(e,t,F){function A(e){return e+"$"+(new Date).getTime()+(""+Math.random()).replace("0.","")}function n(e,t){if(arguments.length<1&&(e={}),!(this instanceof n))return new n(e,t);if(!D.Object(e)&&!D.Array(e))throw Error("Baobab: invalid data.");if(i.call(this),this.options=o.shallowMerge(B,t),this._cloner=this.options.cloningFunction||o.deepClone,this._transaction={},this._future=void 0,this._history=[],this._cursors={},this.typology=this.options.typology?this.options.typology instanceof E?this.options.typology:new E(this.options.typology):new E,this.validate=this.options.validate||null,this.validate)try{this.typology.check(e,this.validate,!0)}catch(F){throw F.message="/"+F.path.join("/")+": "+F.message,F}this.data=this._cloner(e),this.mixin=s.baobab(this)}var r=e("./cursor.js"),i=e("emmett"),E=e("typology"),o=e("./helpers.js"),a=e("./update.js"),C=e("./merge.js"),s=e("./mixins.js"),B=e("../defaults.js"),D=e("./type.js");o.inherits(n,i),n.prototype._archive=function(){if(!(this.options.maxHistory<=0)){var e={data:this._cloner(this.data)};return this._history.length===this.options.maxHistory&&this._history.pop(),this._history.unshift(e),e}},n.prototype.commit=function(e){var t;if(e)this.data=e.data,t=e.log;else{this.options.shiftReferences&&(this.data=o.shallowClone(this.data));var F=this._archive();t=a(this.data,this._transaction,this.options),F&&(F.log=t)}if(this.validate){var A,n,r=[],i=t.length;for(n=0;n<i;n++)if(A=o.getIn(this.validate,t[n]))try{this.typology.check(this.get(t[n]),A,!0)}catch(E){E.path=t[n].concat(E.path||[]),r.push(E)}r.length&&this.emit("invalid",{errors:r})}return this._transaction={},this._future&&(this._future=clearTimeout(this._future)),this.emit("update",{log:t}),this},n.prototype.select=function(e){if(!e)throw Error("Baobab.select: invalid path.");if(arguments.length>1&&(e=o.arrayOf(arguments)),!D.Path(e))throw Error("Baobab.select: invalid path.");e=D.Array(e)?e:[e];var t,F=D.ComplexPath(e);if(F&&(t=o.solvePath(this.data,e)),this.options.cursorSingletons){var n=e.map(function(e){return D.Function(e)?A("fn"):D.Object(e)?A("ob"):e}).join("λ");if(this._cursors[n])return this._cursors[n];var i=new r(this,e,t,n);return this._cursors[n]=i,i}return new r(this,e)},n.prototype.root=function(){return this.select([])},n.prototype.reference=function(e){if(arguments.length>1&&(e=o.arrayOf(arguments)),!D.Path(e))throw Error("Baobab.get: invalid path.");return o.getIn(this.data,D.String(e)||D.Number(e)?[e]:e)},n.prototype.get=function(){var e=this.reference.apply(this,arguments);return this.options.clone?this._cloner(e):e},n.prototype.clone=function(e){return this._cloner(this.reference.apply(this,arguments))},n.prototype.set=function(e,t){if(arguments.length<2)throw Error("Baobab.set: expects a key and a value.");var F={};if(D.Array(e)){var A=o.solvePath(this.data,e);if(!A)throw Error("Baobab.set: could not solve dynamic path.");F=o.pathObject(A,{$set:t})}else F[e]={$set:t};return this.update(F)},n.prototype.unset=function(e){if(!e&&0!==e)throw Error("Baobab.unset: expects a valid key to unset.");var t={};return t[e]={$unset:!0},this.update(t)},n.prototype.update=function(e){var t=this;if(!D.Object(e))throw Error("Baobab.update: wrong specification.");return this._transaction=C(e,this._transaction),this.options.autoCommit?this.options.asynchronous?(this._future||(this._future=setTimeout(t.commit.bind(t,null),0)),this):this.commit():this},n.prototype.hasHistory=function(){return!!this._history.length},n.prototype.getHistory=function(){return this._history},n.prototype.undo=function(){if(!this.hasHistory())throw Error("Baobab.undo: no history recorded, cannot undo.");var e=this._history.shift();this.commit(e)},n.prototype.release=function(){delete this.data,delete this._transaction,delete this._history;for(var e in this._cursors)this._cursors[e].release();delete this._cursors,this.kill()},n.prototype.toJSON=function(){return this.reference()},t.exports=n},{"../defaults.js":12,"./cursor.js":16,"./helpers.js":17,"./merge.js":18,"./mixins.js":19,"./type.js":20,"./update.js":21,emmett:23,typology:24}],15:[function(e,t,F){function A(e,t){t.on("update",e.cursorListener),e.tree.off("update",e.treeListener),e.tree.on("update",e.treeListener)}function n(e){var t=this;if(arguments.length<2)throw Error("baobab.Combination: not enough arguments.");var F=arguments[1],n=E.arrayOf(arguments).slice(2);if(F instanceof Array&&(n=F.slice(1),F=F[0]),!o.Cursor(F))throw Error("baobab.Combination: argument should be a cursor.");if("or"!==e&&"and"!==e)throw Error("baobab.Combination: invalid operator.");i.call(this),this.cursors=[F],this.operators=[],this.tree=F.tree,this.updates=new Array(this.cursors.length),this.cursorListener=function(){t.updates[t.cursors.indexOf(this)]=!0},this.treeListener=function(){var e,F,A=t.updates[0];for(e=1,F=t.cursors.length;e<F;e++)A="or"===t.operators[e-1]?A||t.updates[e]:A&&t.updates[e];A&&t.emit("update"),t.updates=new Array(t.cursors.length)},this.bound=!1;var r=this.on,a=this.once,C=function(){t.bound||(t.bound=!0,t.cursors.forEach(function(e){A(t,e)}))};this.on=function(){return C(),r.apply(this,arguments)},this.once=function(){return C(),a.apply(this,arguments)},n.forEach(function(t){this[e](t)},this)}function r(e){n.prototype[e]=function(t){if(!o.Cursor(t))throw this.release(),Error("baobab.Combination."+e+": argument should be a cursor.");if(~this.cursors.indexOf(t))throw this.release(),Error("baobab.Combination."+e+": cursor already in combination.");return this.cursors.push(t),this.operators.push(e),this.updates.length++,this.bound&&A(this,t),this}}var i=e("emmett"),E=e("./helpers.js"),o=e("./type.js");E.inherits(n,i),r("or"),r("and"),n.prototype.release=function(){this.cursors.forEach(function(e){e.off("update",this.cursorListener)},this),this.tree.off("update",this.treeListener),this.cursors=null,this.operators=null,this.tree=null,this.updates=null,this.kill()},t.exports=n},{"./helpers.js":17,"./type.js":20,emmett:23}],16:[function(e,t,F){function A(e,t,F,A){var r=this;n.call(this),t=t||[],this.tree=e,this.path=t,this.hash=A,this.relevant=void 0!==this.reference(),this.complexPath=!!F,this.solvedPath=this.complexPath?F:this.path,this.updateHandler=function(e){var t,F,A,n,i,o,a=e.data.log,C=!1;if(r.complexPath&&(r.solvedPath=E.solvePath(r.tree.data,r.path)),!r.path.length)return r.emit("update");e:for(i=0,A=a.length;i<A;i++)for(t=a[i],o=0,n=t.length;o<n&&(F=t[o],F===""+r.solvedPath[o]);o++)if(o+1===n||o+1===r.solvedPath.length){C=!0;break e}var s=void 0!==r.reference();r.relevant?s&&C?r.emit("update"):s||(r.emit("irrelevant"),r.relevant=!1):s&&C&&(r.emit("relevant"),r.emit("update"),r.relevant=!0)},this.mixin=i.cursor(this);var o=!1,a=this.on,C=this.once,s=function(){o||(o=!0,r.tree.on("update",r.updateHandler))};this.on=function(){return s(),a.apply(this,arguments)},this.once=function(){return s(),C.apply(this,arguments)}}var n=e("emmett"),r=e("./combination.js"),i=e("./mixins.js"),E=e("./helpers.js"),o=e("./type.js");E.inherits(A,n),A.prototype.isRoot=function(){return!this.path.length},A.prototype.isLeaf=function(){return o.Primitive(this.reference())},A.prototype.isBranch=function(){return!this.isLeaf()&&!this.isRoot()},A.prototype.root=function(){return this.tree.root()},A.prototype.select=function(e){if(arguments.length>1&&(e=E.arrayOf(arguments)),!o.Path(e))throw Error("baobab.Cursor.select: invalid path.");return this.tree.select(this.path.concat(e))},A.prototype.up=function(){return this.solvedPath&&this.solvedPath.length?this.tree.select(this.path.slice(0,-1)):null},A.prototype.left=function(){var e=+this.solvedPath[this.solvedPath.length-1];if(isNaN(e))throw Error("baobab.Cursor.left: cannot go left on a non-list type.");return e?this.tree.select(this.solvedPath.slice(0,-1).concat(e-1)):null},A.prototype.leftmost=function(){var e=+this.solvedPath[this.solvedPath.length-1];if(isNaN(e))throw Error("baobab.Cursor.leftmost: cannot go left on a non-list type.");return this.tree.select(this.solvedPath.slice(0,-1).concat(0))},A.prototype.right=function(){var e=+this.solvedPath[this.solvedPath.length-1];if(isNaN(e))throw Error("baobab.Cursor.right: cannot go right on a non-list type.");return e+1===this.up().reference().length?null:this.tree.select(this.solvedPath.slice(0,-1).concat(e+1))},A.prototype.rightmost=function(){var e=+this.solvedPath[this.solvedPath.length-1];if(isNaN(e))throw Error("baobab.Cursor.right: cannot go right on a non-list type.");var t=this.up().reference();return this.tree.select(this.solvedPath.slice(0,-1).concat(t.length-1))},A.prototype.down=function(){+this.solvedPath[this.solvedPath.length-1];return this.reference()instanceof Array?this.tree.select(this.solvedPath.concat(0)):null},A.prototype.get=function(e){return arguments.length>1&&(e=E.arrayOf(arguments)),o.Step(e)?this.tree.get(this.solvedPath.concat(e)):this.tree.get(this.solvedPath)},A.prototype.reference=function(e){return arguments.length>1&&(e=E.arrayOf(arguments)),o.Step(e)?this.tree.reference(this.solvedPath.concat(e)):this.tree.reference(this.solvedPath)},A.prototype.clone=function(e){return arguments.length>1&&(e=E.arrayOf(arguments)),o.Step(e)?this.tree.clone(this.solvedPath.concat(e)):this.tree.clone(this.solvedPath)},A.prototype.set=function(e,t){if(arguments.length<2)throw Error("baobab.Cursor.set: expecting at least key/value.");var F=this.reference();if("object"!=typeof F)throw Error("baobab.Cursor.set: trying to set key to a non-object.");var A={};if(o.Array(e)){var n=E.solvePath(F,e);if(!n)throw Error("baobab.Cursor.set: could not solve dynamic path.");A=E.pathObject(n,{$set:t})}else A[e]={$set:t};return this.update(A)},A.prototype.edit=function(e){return this.update({$set:e})},A.prototype.unset=function(e){if(!e&&0!==e)throw Error("baobab.Cursor.unset: expects a valid key to unset.");if("object"!=typeof this.reference())throw Error("baobab.Cursor.set: trying to set key to a non-object.");var t={};return t[e]={$unset:!0},this.update(t)},A.prototype.remove=function(){if(this.isRoot())throw Error("baobab.Cursor.remove: cannot remove root node.");return this.update({$unset:!0})},A.prototype.apply=function(e){if("function"!=typeof e)throw Error("baobab.Cursor.apply: argument is not a function.");return this.update({$apply:e})},A.prototype.chain=function(e){if("function"!=typeof e)throw Error("baobab.Cursor.chain: argument is not a function.");return this.update({$chain:e})},A.prototype.push=function(e){if(!(this.reference()instanceof Array))throw Error("baobab.Cursor.push: trying to push to non-array value.");return arguments.length>1?this.update({$push:E.arrayOf(arguments)}):this.update({$push:e})},A.prototype.unshift=function(e){if(!(this.reference()instanceof Array))throw Error("baobab.Cursor.push: trying to push to non-array value.");return arguments.length>1?this.update({$unshift:E.arrayOf(arguments)}):this.update({$unshift:e})},A.prototype.merge=function(e){if(!o.Object(e))throw Error("baobab.Cursor.merge: trying to merge a non-object.");if(!o.Object(this.reference()))throw Error("baobab.Cursor.merge: trying to merge into a non-object.");this.update({$merge:e})},A.prototype.update=function(e){return this.tree.update(E.pathObject(this.solvedPath,e)),this},A.prototype.or=function(e){return new r("or",this,e)},A.prototype.and=function(e){return new r("and",this,e)},A.prototype.release=function(){this.tree.off("update",this.updateHandler),this.hash&&delete this.tree._cursors[this.hash],delete this.tree,delete this.path,delete this.solvedPath,this.kill()},A.prototype.toJSON=function(){return this.reference()},o.Cursor=function(e){return e instanceof A},t.exports=A},{"./combination.js":15,"./helpers.js":17,"./mixins.js":19,"./type.js":20,emmett:23}],17:[function(e,t,F){(function(F){function A(e){return Array.prototype.slice.call(e)}function n(e,t){var F,A={};for(F in e)A[F]=e[F];for(F in t)A[F]=t[F];return A}function r(e){var t=e.source,F="";return e.global&&(F+="g"),e.multiline&&(F+="m"),e.ignoreCase&&(F+="i"),e.sticky&&(F+="y"),e.unicode&&(F+="u"),new RegExp(t,F)}function i(e,t){if(!t||"object"!=typeof t||t instanceof Error||"ArrayBuffer"in F&&t instanceof ArrayBuffer)return t;if(h.Array(t)){if(e){var A,n,i=[];for(A=0,n=t.length;A<n;A++)i.push(p(t[A]));return i}return t.slice(0)}if(h.Date(t))return new Date(t.getTime());if(t instanceof RegExp)return r(t);if(h.Object(t)){var E,o={};t.constructor&&t.constructor!==Object&&(o=Object.create(t.constructor.prototype));for(E in t)t.hasOwnProperty(E)&&(o[E]=e?p(t[E]):t[E]);return o}return t}function E(e,t){return function(F){return t(e(F))}}function o(e,t){var F,A;for(F=0,A=e.length;F<A;F++)if(t(e[F]))return e[F]}function a(e,t){var F,A;for(F=0,A=e.length;F<A;F++)if(t(e[F]))return F;return-1}function C(e,t){var F,A=!0;if(!e)return!1;for(F in t)if(h.Object(t[F]))A=A&&C(e[F],t[F]);else if(h.Array(t[F]))A=A&&!!~t[F].indexOf(e[F]);else if(e[F]!==t[F])return!1;return A}function s(e,t){return o(e,function(e){return C(e,t)})}function B(e,t){return a(e,function(e){return C(e,t)})}function D(e,t){t=t||[];var F,A,n=e;for(F=0,A=t.length;F<A;F++){if(!n)return;if("function"==typeof t[F]){if(!h.Array(n))return;n=o(n,t[F])}else if("object"==typeof t[F]){if(!h.Array(n))return;n=s(n,t[F])}else n=n[t[F]]}return n}function l(e,t){var F,A,n,r=[],i=e;for(A=0,n=t.length;A<n;A++){if(!i)return null;if("function"==typeof t[A]){if(!h.Array(i))return;F=a(i,t[A]),r.push(F),i=i[F]}else if("object"==typeof t[A]){if(!h.Array(i))return;F=B(i,t[A]),r.push(F),i=i[F]}else r.push(t[A]),i=i[t[A]]||{}}return r}function c(e,t){var F,A=e.length,n={},r=n;for(A||(n=t),F=0;F<A;F++)r[e[F]]=F+1===A?t:{},r=r[e[F]];return n}function u(e,t){e.super_=t;var F=function(){};F.prototype=t.prototype,e.prototype=new F,e.prototype.constructor=e}var h=e("./type.js"),f=i.bind(null,!1),p=i.bind(null,!0);t.exports={arrayOf:A,deepClone:p,shallowClone:f,shallowMerge:n,compose:E,getIn:D,inherits:u,pathObject:c,solvePath:l}}).call(this,"undefined"!=typeof global?global:"undefined"!=typeof self?self:"undefined"!=typeof window?window:{})},{"./type.js":20}],18:[function(e,t,F){function A(e,t){return t in(e||{})}function n(e,t,F){return A(e,F)&&A(t,F)}function r(){var e,t,F,A,o={},a=arguments.length;for(F=a-1;F>=0;F--){if(arguments[F].$unset)delete o.$set,delete o.$apply,delete o.$merge,o.$unset=arguments[F].$unset;else{if(arguments[F].$set){delete o.$apply,delete o.$merge,delete o.$unset,o.$set=arguments[F].$set;continue}if(arguments[F].$merge){delete o.$set,delete o.$apply,delete o.$unset,o.$merge=arguments[F].$merge;continue}if(arguments[F].$apply){delete o.$set,delete o.$merge,delete o.$unset,o.$apply=arguments[F].$apply;continue}if(arguments[F].$chain){delete o.$set,delete o.$merge,delete o.$unset,o.$apply?o.$apply=i.compose(o.$apply,arguments[F].$chain):o.$apply=arguments[F].$chain;continue}}for(A in arguments[F])e=o[A],t=arguments[F][A],e&&E.Object(t)?n(e,t,"$push")?E.Array(e.$push)?e.$push=e.$push.concat(t.$push):e.$push=[e.$push].concat(t.$push):n(e,t,"$unshift")?E.Array(t.$unshift)?e.$unshift=t.$unshift.concat(e.$unshift):e.$unshift=[t.$unshift].concat(e.$unshift):o[A]=r(t,e):o[A]=t}return o}var i=e("./helpers.js"),E=e("./type.js");t.exports=r},{"./helpers.js":17,"./type.js":20}],19:[function(e,t,F){var A=e("./combination.js"),n=e("./type.js");t.exports={baobab:function(e){return{mixins:[{getInitialState:function(){if(this.tree=e,!this.cursor&&!this.cursors)return{};if(this.cursor&&this.cursors)throw Error("baobab.mixin: you cannot have both `component.cursor` and `component.cursors`. Please make up your mind.");if(this.__type=null,this.__updateHandler=function(){this.setState(this.__getCursorData())}.bind(this),this.cursor){if(!n.MixinCursor(this.cursor))throw Error("baobab.mixin.cursor: invalid data (cursor, string, array or function).");n.Function(this.cursor)&&(this.cursor=this.cursor()),n.Cursor(this.cursor)||(this.cursor=e.select(this.cursor)),this.__getCursorData=function(){return{cursor:this.cursor.get()}}.bind(this),this.__type="single"}else if(this.cursors){if(!n.MixinCursors(this.cursors))throw Error("baobab.mixin.cursor: invalid data (object, array or function).");if(n.Function(this.cursors)&&(this.cursors=this.cursors()),n.Array(this.cursors))this.cursors=this.cursors.map(function(t){return n.Cursor(t)?t:e.select(t)}),this.__getCursorData=function(){return{cursors:this.cursors.map(function(e){return e.get()})}}.bind(this),this.__type="array";else{for(var t in this.cursors)n.Cursor(this.cursors[t])||(this.cursors[t]=e.select(this.cursors[t]));this.__getCursorData=function(){var e={};for(t in this.cursors)e[t]=this.cursors[t].get();return{cursors:e}}.bind(this),this.__type="object"}}return this.__getCursorData()},componentDidMount:function(){"single"===this.__type?(this.__combination=new A("or",[this.cursor]),this.__combination.on("update",this.__updateHandler)):"array"===this.__type?(this.__combination=new A("or",this.cursors),
 this.__combination.on("update",this.__updateHandler)):"object"===this.__type&&(this.__combination=new A("or",Object.keys(this.cursors).map(function(e){return this.cursors[e]},this)),this.__combination.on("update",this.__updateHandler))},componentWillUnmount:function(){this.__combination&&this.__combination.release()}}].concat(e.options.mixins)}},cursor:function(e){return{mixins:[{getInitialState:function(){return this.cursor=e,this.__updateHandler=function(){this.setState({cursor:this.cursor.get()})}.bind(this),{cursor:this.cursor.get()}},componentDidMount:function(){this.cursor.on("update",this.__updateHandler)},componentWillUnmount:function(){this.cursor.off("update",this.__updateHandler)}}].concat(e.tree.options.mixins)}}}},{"./combination.js":15,"./type.js":20}],20:[function(e,t,F){var A=function(e){return Array.isArray(e)?"array":"object"==typeof e&&null!==e?"object":"string"==typeof e?"string":"number"==typeof e?"number":"boolean"==typeof e?"boolean":"function"==typeof e?"function":null===e?"null":void 0===e?"undefined":e instanceof Date?"date":"invalid"};A.Array=function(e){return Array.isArray(e)},A.Object=function(e){return!Array.isArray(e)&&"object"==typeof e&&null!==e},A.String=function(e){return"string"==typeof e},A.Number=function(e){return"number"==typeof e},A.Boolean=function(e){return"boolean"==typeof e},A.Function=function(e){return"function"==typeof e},A.Primitive=function(e){return"string"==typeof e||"number"==typeof e||"boolean"==typeof e},A.Date=function(e){return e instanceof Date},A.Step=function(e){var t=A(e),F=["null","undefined","invalid","date"];return F.indexOf(t)===-1},A.Path=function(e){var t=["object","string","number","function","undefined"];if(!A.Array(e))return t.indexOf(A(e))>=0;for(var F=0;F<e.length;F++)if(t.indexOf(A(e[F]))===-1)return!1;return!0},A.MixinCursor=function(e){var t=["string","number","array","function"];return t.indexOf(A(e))>=0||A.Cursor(e)},A.MixinCursors=function(e){var t=["array","object","function"];return t.indexOf(A(e))>=0},A.ComplexPath=function(e){for(var t=["object","function"],F=0;F<e.length;F++)if(t.indexOf(A(e[F]))>=0)return!0;return!1},t.exports=A},{}],21:[function(e,t,F){function A(e,t){var F=new Error("baobab.update: "+t+" at path /"+e.toString());return F.path=e,F}function n(e,t,F){F=F||{shiftReferences:!1};var n={};return function o(e,t,a,C){a=a||[];var s,B,D,l,c=a.join("λ");for(D in t)if(E[D])switch(l=t[D],n[c]=!0,D){case"$push":if(!i.Array(e))throw A(a,"using command $push to a non array");i.Array(l)?e.push.apply(e,l):e.push(l);break;case"$unshift":if(!i.Array(e))throw A(a,"using command $unshift to a non array");i.Array(l)?e.unshift.apply(e,l):e.unshift(l)}else if(B=c?c+"λ"+D:D,"$unset"in(t[D]||{}))n[B]=!0,i.Array(e)?F.shiftReferences?C[a[a.length-1]]=e.slice(0,+D).concat(e.slice(+D+1)):e.splice(D,1):delete e[D];else if("$set"in(t[D]||{}))l=t[D].$set,n[B]=!0,e[D]=l;else if("$apply"in(t[D]||{})||"$chain"in(t[D]||{})){if(s=t[D].$apply||t[D].$chain,"function"!=typeof s)throw A(a.concat(D),"using command $apply with a non function");n[B]=!0,e[D]=s.call(null,e[D])}else if("$merge"in(t[D]||{})){if(l=t[D].$merge,!i.Object(e[D]))throw A(a.concat(D),"using command $merge on a non-object");n[B]=!0,e[D]=r.shallowMerge(e[D],l)}else if(F.shiftReferences&&("$push"in(t[D]||{})||"$unshift"in(t[D]||{}))){if("$push"in(t[D]||{})){if(l=t[D].$push,!i.Array(e[D]))throw A(a.concat(D),"using command $push to a non array");e[D]=e[D].concat(l)}if("$unshift"in(t[D]||{})){if(l=t[D].$unshift,!i.Array(e[D]))throw A(a.concat(D),"using command $unshift to a non array");e[D]=(l instanceof Array?l:[l]).concat(e[D])}n[B]=!0}else"undefined"==typeof e[D]&&(e[D]={}),F.shiftReferences&&(e[D]=r.shallowClone(e[D])),o(e[D],t[D],a.concat(D),e)}(e,t),Object.keys(n).map(function(e){return e.split("λ")})}var r=e("./helpers.js"),i=e("./type.js"),E={};["$set","$push","$unshift","$apply","$merge"].forEach(function(e){E[e]=!0}),t.exports=n},{"./helpers.js":17,"./type.js":20}],22:[function(e,t,F){function A(){for(var e,t="",F=0;F<arguments.length;F++)if(e=arguments[F])if("string"==typeof e||"number"==typeof e)t+=" "+e;else if("[object Array]"===Object.prototype.toString.call(e))t+=" "+A.apply(null,e);else if("object"==typeof e)for(var n in e)e.hasOwnProperty(n)&&e[n]&&(t+=" "+n);return t.substr(1)}"undefined"!=typeof t&&t.exports&&(t.exports=A),"undefined"!=typeof define&&define.amd&&define("classnames",[],function(){return A})},{}],23:[function(e,t,F){(function(){"use strict";function e(e){var t,F,A=[];for(t=0,F=e.length;t<F;t++)A.push(e[t].handler);return A}var A={once:"boolean",scope:"object"},n=function(){this._enabled=!0,this._children=[],this._handlers={},this._handlersAll=[]};n.prototype.on=function(e,t,F){var r,i,E,o,a,C;if("function"==typeof t){for(a="string"==typeof e?[e]:e,r=0,i=a.length;r!==i;r+=1)if(o=a[r]){this._handlers[o]||(this._handlers[o]=[]),C={handler:t};for(E in F||{}){if(!A[E])throw new Error('The option "'+E+'" is not recognized by Emmett.');C[E]=F[E]}this._handlers[o].push(C)}}else if(e&&"object"==typeof e&&!Array.isArray(e))for(o in e)n.prototype.on.call(this,o,e[o],t);else{if("function"!=typeof e)throw new Error("Wrong arguments.");C={handler:e};for(E in F||{}){if(!A[E])throw new Error('The option "'+E+'" is not recognized by Emmett.');C[E]=F[E]}this._handlersAll.push(C)}return this},n.prototype.once=function(e,t,F){if("function"==typeof t)F=F||{},F.once=!0,this.on(e,t,F);else{if((!e||"object"!=typeof e||Array.isArray(e))&&"function"!=typeof e)throw new Error("Wrong arguments.");t=t||{},t.once=!0,this.on(e,t)}return this},n.prototype.off=function(e,t){var F,A,n,r,i,E,o,a="string"==typeof e?[e]:e;if(1===arguments.length&&"function"==typeof a){t=arguments[0];for(i in this._handlers){for(E=[],F=0,A=this._handlers[i].length;F!==A;F+=1)this._handlers[i][F].handler!==t&&E.push(this._handlers[i][F]);this._handlers[i]=E}for(E=[],F=0,A=this._handlersAll.length;F!==A;F+=1)this._handlersAll[F].handler!==t&&E.push(this._handlersAll[F]);this._handlersAll=E}else if(2===arguments.length)for(F=0,A=a.length;F!==A;F+=1){if(o=a[F],this._handlers[o]){for(E=[],n=0,r=this._handlers[o].length;n!==r;n+=1)this._handlers[o][n].handler!==t&&E.push(this._handlers[o][n]);this._handlers[o]=E}this._handlers[o]&&0===this._handlers[o].length&&delete this._handlers[o]}return this},n.prototype.unbindAll=function(){var e;this._handlersAll=[];for(e in this._handlers)delete this._handlers[e];return this},n.prototype.emit=function(e,t){var F,A,n,r,i,E,o,a,C,s,B="string"==typeof e?[e]:e;if(!this._enabled)return this;for(t=void 0===t?{}:t,F=0,A=B.length;F!==A;F+=1)if(s=B[F],C=(this._handlers[s]||[]).concat(this._handlersAll),C.length){for(o={type:s,data:t||{},target:this},E=[],n=0,r=C.length;n!==r;n+=1)(this._handlers[s]&&this._handlers[s].indexOf(C[n])>=0||this._handlersAll.indexOf(C[n])>=0)&&(C[n].handler.call("scope"in C[n]?C[n].scope:this,o),C[n].once&&E.push(C[n]));for(i=0;i<E.length;i++)this._handlers[s].splice(E.indexOf(E[i]),1)}for(F=0,A=this._children.length;F!==A;F+=1)a=this._children[F],a.emit.apply(a,arguments);return this},n.prototype.child=function(){var e=this,t=new n;return t.on("emmett:kill",function(){if(e._children)for(var F=0,A=e._children.length;F<A;F++)if(e._children[F]===t){e._children.splice(F,1);break}}),this._children.push(t),t},n.prototype.listeners=function(t){var F,A,n,r=[];if(t)for(r=e(this._handlers[t]),A=0,n=this._children.length;A<n;A++)r=r.concat(this._children[A].listeners(t));else{r=e(this._handlersAll);for(F in this._handlers)r=r.concat(e(this._handlers[F]));for(A=0,n=this._children.length;A<n;A++)r=r.concat(this._children[A].listeners())}return r},n.prototype.kill=function(){if(this.emit("emmett:kill"),this.unbindAll(),this._handlers=null,this._handlersAll=null,this._enabled=!1,this._children)for(var e=0,t=this._children.length;e<t;e++)this._children[e].kill();this._children=null},n.prototype.disable=function(){return this._enabled=!1,this},n.prototype.enable=function(){return this._enabled=!0,this},n.version="2.1.2","undefined"!=typeof F?("undefined"!=typeof t&&t.exports&&(F=t.exports=n),F.Emitter=n):"function"==typeof define&&define.amd?define("emmett",[],function(){return n}):this.Emitter=n}).call(this)},{}],24:[function(e,t,F){!function(e){"use strict";function A(e){function t(e,n){var i,E,o,a,C,s,B,D,l=!1,c=!1,u=F.get(e);if("string"===F.get(n)){for(i=n.replace(/^[\?\!]/,"").split(/\|/),o=i.length,E=0;E<o;E++)if(r.indexOf(i[E])<0&&!(i[E]in A))throw new Error("Invalid type.");if(n.match(/^\?/)&&(l=!0),n.replace(/^\?/,"").match(/^\!/)&&(c=!0),c&&l)throw new Error("Invalid type.");for(E in i)if(A[i[E]]&&("function"==typeof A[i[E]].type?A[i[E]].type.call(F,e)===!0:!t(e,A[i[E]].type)))return c?(C=new Error,C.message='Expected a "'+n+'" but found a "'+i[E]+'".',C.expected=n,C.type=i[E],C.value=e,C):null;return null===e||void 0===e?c||l?null:(C=new Error,C.message='Expected a "'+n+'" but found a "'+u+'".',C.expected=n,C.type=u,C.value=e,C):(B=~i.indexOf("*"),D=~i.indexOf(u),c&&(B||D)?(C=new Error,C.message='Expected a "'+n+'" but found a "'+(D?u:"*")+'".',C.type=D?u:"*",C.expected=n,C.value=e,C):c||B||D?null:(C=new Error,C.message='Expected a "'+n+'" but found a "'+u+'".',C.expected=n,C.type=u,C.value=e,C))}if("object"===F.get(n)){if("object"!==u)return C=new Error,C.message='Expected an object but found a "'+u+'".',C.expected=n,C.type=u,C.value=e,C;for(a in n)if(s=t(e[a],n[a]))return C=s,C.path=C.path?[a].concat(C.path):[a],C;for(a in e)if(void 0===n[a])return C=new Error,C.message='Unexpected key "'+a+'".',C.type=u,C.value=e,C;return null}if("array"===F.get(n)){if(1!==n.length)throw new Error("Invalid type.");if("array"!==u)return C=new Error,C.message='Expected an array but found a "'+u+'".',C.expected=n,C.type=u,C.value=e,C;for(o=e.length,E=0;E<o;E++)if(s=t(e[E],n[0]))return C=s,C.path=C.path?[E].concat(C.path):[E],C;return null}throw new Error("Invalid type.")}var F=this,A={};if(this.add=function(e,t){var F,n,i,E,o,a;if(1===arguments.length){if("object"!==this.get(e))throw new Error("If types.add is called with one argument, this one has to be an object.");F=e,E=F.id,a=F.type}else{if(2!==arguments.length)throw new Error("types.add has to be called with one or two arguments.");if("string"!=typeof e||!e)throw new Error("If types.add is called with more than one argument, the first one must be the string id.");E=e,a=t}if("string"!==this.get(E)||0===E.length)throw new Error("A type requires an string id.");if(void 0!==A[E]&&"proto"!==A[E])throw new Error('The type "'+E+'" already exists.');if(~r.indexOf(E))throw new Error('"'+E+'" is a reserved type name.');A[E]=1,i=(F||{}).proto||[],i=Array.isArray(i)?i:[i],o={};for(n in i)void 0===A[i[n]]&&(A[i[n]]=1,o[i[n]]=1);if("function"!==this.get(a)&&!this.isValid(a))throw new Error("A type requires a valid definition. This one can be a preexistant type or else a function testing given objects.");if(A[E]=void 0===F?{id:E,type:a}:{},void 0!==F)for(n in F)A[E][n]=F[n];for(n in o)n!==E&&delete A[n];return this},this.has=function(e){return!!A[e]},this.get=function(e){return null===e||void 0===e?String(e):n[Object.prototype.toString.call(e)]||"object"},this.check=function(e,F,A){var n=t(e,F);if(A&&n)throw n;return!n},this.isValid=function(e){var t,F,n;if("string"===this.get(e)){t=e.replace(/^[\?\!]/,"").split(/\|/);for(n in t)if(r.indexOf(t[n])<0&&!(t[n]in A))return!1;return!0}if("object"===this.get(e)){for(F in e)if(!this.isValid(e[F]))return!1;return!0}return"array"===this.get(e)&&(1===e.length&&this.isValid(e[0]))},this.add("type",function(e){return this.isValid(e)}.bind(this)),this.add("primitive",function(e){return!e||!(e instanceof Object||"object"==typeof e)}),e=e||{},"object"!==this.get(e))throw Error("Invalid argument.");for(var i in e)this.add(i,e[i])}var n={},r=["*"];!function(){var e,t,F=["Arguments","Boolean","Number","String","Function","Array","Date","RegExp","Object"];for(e in F)t=F[e],r.push(t.toLowerCase()),n["[object "+t+"]"]=t.toLowerCase()}();var i=A;A.call(i),Object.defineProperty(i,"version",{value:"0.3.1"}),"undefined"!=typeof F?("undefined"!=typeof t&&t.exports&&(F=t.exports=i),F.types=i):"function"==typeof define&&define.amd?define("typology",[],function(){return i}):this.types=i}(this)},{}],25:[function(e,t,F){var A;A=A||function(e){"use strict";function t(e,t,F){var A;for(A in s.prototype)s.prototype.hasOwnProperty(A)&&(e[A]=s.prototype[A]);return e.xregexp={captureNames:t,isNative:!!F},e}function A(e){return(e.global?"g":"")+(e.ignoreCase?"i":"")+(e.multiline?"m":"")+(e.extended?"x":"")+(e.sticky?"y":"")}function n(e,F,n){if(!s.isRegExp(e))throw new TypeError("type RegExp expected");var r=c.replace.call(A(e)+(F||""),y,"");return n&&(r=c.replace.call(r,new RegExp("["+n+"]+","g"),"")),e=e.xregexp&&!e.xregexp.isNative?t(s(e.source,r),e.xregexp.captureNames?e.xregexp.captureNames.slice(0):null):t(new RegExp(e.source,r),null,!0)}function r(e,t){var F=e.length;if(Array.prototype.lastIndexOf)return e.lastIndexOf(t);for(;F--;)if(e[F]===t)return F;return-1}function i(e,t){return Object.prototype.toString.call(e).toLowerCase()==="[object "+t+"]"}function E(e){return e=e||{},"all"===e||e.all?e={natives:!0,extensibility:!0}:i(e,"string")&&(e=s.forEach(e,/[^\s,]+/,function(e){this[e]=!0},{})),e}function o(e,t,F,A){var n,r,i=f.length,E=null;x=!0;try{for(;i--;)if(r=f[i],("all"===r.scope||r.scope===F)&&(!r.trigger||r.trigger.call(A))&&(r.pattern.lastIndex=t,n=u.exec.call(r.pattern,e),n&&n.index===t)){E={output:r.handler.call(A,n,F),match:n};break}}catch(o){throw o}finally{x=!1}return E}function a(e){s.addToken=B[e?"on":"off"],l.extensibility=e}function C(e){RegExp.prototype.exec=(e?u:c).exec,RegExp.prototype.test=(e?u:c).test,String.prototype.match=(e?u:c).match,String.prototype.replace=(e?u:c).replace,String.prototype.split=(e?u:c).split,l.natives=e}var s,B,D,l={natives:!1,extensibility:!1},c={exec:RegExp.prototype.exec,test:RegExp.prototype.test,match:String.prototype.match,replace:String.prototype.replace,split:String.prototype.split},u={},h={},f=[],p="default",d="class",g={"default":/^(?:\\(?:0(?:[0-3][0-7]{0,2}|[4-7][0-7]?)?|[1-9]\d*|x[\dA-Fa-f]{2}|u[\dA-Fa-f]{4}|c[A-Za-z]|[\s\S])|\(\?[:=!]|[?*+]\?|{\d+(?:,\d*)?}\??)/,"class":/^(?:\\(?:[0-3][0-7]{0,2}|[4-7][0-7]?|x[\dA-Fa-f]{2}|u[\dA-Fa-f]{4}|c[A-Za-z]|[\s\S]))/},m=/\$(?:{([\w$]+)}|(\d\d?|[\s\S]))/g,y=/([\s\S])(?=[\s\S]*\1)/g,_=/^(?:[?*+]|{\d+(?:,\d*)?})\??/,b=c.exec.call(/()??/,"")[1]===e,v=RegExp.prototype.sticky!==e,x=!1,w="gim"+(v?"y":"");return s=function(F,A){if(s.isRegExp(F)){if(A!==e)throw new TypeError("can't supply flags when constructing one RegExp from another");return n(F)}if(x)throw new Error("can't call the XRegExp constructor within token definition functions");var r,i,E,a=[],C=p,B={hasNamedCapture:!1,captureNames:[],hasFlag:function(e){return A.indexOf(e)>-1}},D=0;if(F=F===e?"":String(F),A=A===e?"":String(A),c.match.call(A,y))throw new SyntaxError("invalid duplicate regular expression flag");for(F=c.replace.call(F,/^\(\?([\w$]+)\)/,function(e,t){if(c.test.call(/[gy]/,t))throw new SyntaxError("can't use flag g or y in mode modifier");return A=c.replace.call(A+t,y,""),""}),s.forEach(A,/[\s\S]/,function(e){if(w.indexOf(e[0])<0)throw new SyntaxError("invalid regular expression flag "+e[0])});D<F.length;)r=o(F,D,C,B),r?(a.push(r.output),D+=r.match[0].length||1):(i=c.exec.call(g[C],F.slice(D)),i?(a.push(i[0]),D+=i[0].length):(E=F.charAt(D),"["===E?C=d:"]"===E&&(C=p),a.push(E),++D));return t(new RegExp(a.join(""),c.replace.call(A,/[^gimy]+/g,"")),B.hasNamedCapture?B.captureNames:null)},B={on:function(e,t,F){F=F||{},e&&f.push({pattern:n(e,"g"+(v?"y":"")),handler:t,scope:F.scope||p,trigger:F.trigger||null}),F.customFlags&&(w=c.replace.call(w+F.customFlags,y,""))},off:function(){throw new Error("extensibility must be installed before using addToken")}},s.addToken=B.off,s.cache=function(e,t){var F=e+"/"+(t||"");return h[F]||(h[F]=s(e,t))},s.escape=function(e){return c.replace.call(e,/[-[\]{}()*+?.,\\^$|#\s]/g,"\\$&")},s.exec=function(e,t,F,A){var r,i=n(t,"g"+(A&&v?"y":""),A===!1?"y":"");return i.lastIndex=F=F||0,r=u.exec.call(i,e),A&&r&&r.index!==F&&(r=null),t.global&&(t.lastIndex=r?i.lastIndex:0),r},s.forEach=function(e,t,F,A){for(var n,r=0,i=-1;n=s.exec(e,t,r);)F.call(A,n,++i,e,t),r=n.index+(n[0].length||1);return A},s.globalize=function(e){return n(e,"g")},s.install=function(e){e=E(e),!l.natives&&e.natives&&C(!0),!l.extensibility&&e.extensibility&&a(!0)},s.isInstalled=function(e){return!!l[e]},s.isRegExp=function(e){return i(e,"regexp")},s.matchChain=function(e,t){return function F(e,A){var n,r=t[A].regex?t[A]:{regex:t[A]},i=[],E=function(e){i.push(r.backref?e[r.backref]||"":e[0])};for(n=0;n<e.length;++n)s.forEach(e[n],r.regex,E);return A!==t.length-1&&i.length?F(i,A+1):i}([e],0)},s.replace=function(t,F,A,r){var i,E=s.isRegExp(F),o=F;return E?(r===e&&F.global&&(r="all"),o=n(F,"all"===r?"g":"","all"===r?"":"g")):"all"===r&&(o=new RegExp(s.escape(String(F)),"g")),i=u.replace.call(String(t),o,A),E&&F.global&&(F.lastIndex=0),i},s.split=function(e,t,F){return u.split.call(e,t,F)},s.test=function(e,t,F,A){return!!s.exec(e,t,F,A)},s.uninstall=function(e){e=E(e),l.natives&&e.natives&&C(!1),l.extensibility&&e.extensibility&&a(!1)},s.union=function(e,t){var F,A,n,r,E=/(\()(?!\?)|\\([1-9]\d*)|\\[\s\S]|\[(?:[^\\\]]|\\[\s\S])*]/g,o=0,a=function(e,t,n){var r=A[o-F];if(t){if(++o,r)return"(?<"+r+">"}else if(n)return"\\"+(+n+F);return e},C=[];if(!i(e,"array")||!e.length)throw new TypeError("patterns must be a nonempty array");for(r=0;r<e.length;++r)n=e[r],s.isRegExp(n)?(F=o,A=n.xregexp&&n.xregexp.captureNames||[],C.push(s(n.source).source.replace(E,a))):C.push(s.escape(n));return s(C.join("|"),t)},s.version="2.0.0",u.exec=function(t){var F,n,i,E,o;if(this.global||(E=this.lastIndex),F=c.exec.apply(this,arguments)){if(!b&&F.length>1&&r(F,"")>-1&&(i=new RegExp(this.source,c.replace.call(A(this),"g","")),c.replace.call(String(t).slice(F.index),i,function(){var t;for(t=1;t<arguments.length-2;++t)arguments[t]===e&&(F[t]=e)})),this.xregexp&&this.xregexp.captureNames)for(o=1;o<F.length;++o)n=this.xregexp.captureNames[o-1],n&&(F[n]=F[o]);this.global&&!F[0].length&&this.lastIndex>F.index&&(this.lastIndex=F.index)}return this.global||(this.lastIndex=E),F},u.test=function(e){return!!u.exec.call(this,e)},u.match=function(e){if(s.isRegExp(e)){if(e.global){var t=c.match.apply(this,arguments);return e.lastIndex=0,t}}else e=new RegExp(e);return u.exec.call(e,this)},u.replace=function(e,t){var F,A,n,E,o=s.isRegExp(e);return o?(e.xregexp&&(F=e.xregexp.captureNames),e.global||(E=e.lastIndex)):e+="",i(t,"function")?A=c.replace.call(String(this),e,function(){var A,n=arguments;if(F)for(n[0]=new String(n[0]),A=0;A<F.length;++A)F[A]&&(n[0][F[A]]=n[A+1]);return o&&e.global&&(e.lastIndex=n[n.length-2]+n[0].length),t.apply(null,n)}):(n=String(this),A=c.replace.call(n,e,function(){var e=arguments;return c.replace.call(String(t),m,function(t,A,n){var i;if(A){if(i=+A,i<=e.length-3)return e[i]||"";if(i=F?r(F,A):-1,i<0)throw new SyntaxError("backreference to undefined group "+t);return e[i+1]||""}if("$"===n)return"$";if("&"===n||0===+n)return e[0];if("`"===n)return e[e.length-1].slice(0,e[e.length-2]);if("'"===n)return e[e.length-1].slice(e[e.length-2]+e[0].length);if(n=+n,!isNaN(n)){if(n>e.length-3)throw new SyntaxError("backreference to undefined group "+t);return e[n]||""}throw new SyntaxError("invalid token "+t)})})),o&&(e.global?e.lastIndex=0:e.lastIndex=E),A},u.split=function(t,F){if(!s.isRegExp(t))return c.split.apply(this,arguments);var A,n=String(this),r=t.lastIndex,i=[],E=0;return F=(F===e?-1:F)>>>0,s.forEach(n,t,function(e){e.index+e[0].length>E&&(i.push(n.slice(E,e.index)),e.length>1&&e.index<n.length&&Array.prototype.push.apply(i,e.slice(1)),A=e[0].length,E=e.index+A)}),E===n.length?c.test.call(t,"")&&!A||i.push(""):i.push(n.slice(E)),t.lastIndex=r,i.length>F?i.slice(0,F):i},D=B.on,D(/\\([ABCE-RTUVXYZaeg-mopqyz]|c(?![A-Za-z])|u(?![\dA-Fa-f]{4})|x(?![\dA-Fa-f]{2}))/,function(e,t){if("B"===e[1]&&t===p)return e[0];throw new SyntaxError("invalid escape "+e[0])},{scope:"all"}),D(/\[(\^?)]/,function(e){return e[1]?"[\\s\\S]":"\\b\\B"}),D(/(?:\(\?#[^)]*\))+/,function(e){return c.test.call(_,e.input.slice(e.index+e[0].length))?"":"(?:)"}),D(/\\k<([\w$]+)>/,function(e){var t=isNaN(e[1])?r(this.captureNames,e[1])+1:+e[1],F=e.index+e[0].length;if(!t||t>this.captureNames.length)throw new SyntaxError("backreference to undefined group "+e[0]);return"\\"+t+(F===e.input.length||isNaN(e.input.charAt(F))?"":"(?:)")}),D(/(?:\s+|#.*)+/,function(e){return c.test.call(_,e.input.slice(e.index+e[0].length))?"":"(?:)"},{trigger:function(){return this.hasFlag("x")},customFlags:"x"}),D(/\./,function(){return"[\\s\\S]"},{trigger:function(){return this.hasFlag("s")},customFlags:"s"}),D(/\(\?P?<([\w$]+)>/,function(e){if(!isNaN(e[1]))throw new SyntaxError("can't use integer as capture name "+e[0]);return this.captureNames.push(e[1]),this.hasNamedCapture=!0,"("}),D(/\\(\d+)/,function(e,t){if(!(t===p&&/^[1-9]/.test(e[1])&&+e[1]<=this.captureNames.length)&&"0"!==e[1])throw new SyntaxError("can't use octal escape or backreference to undefined group "+e[0]);return e[0]},{scope:"all"}),D(/\((?!\?)/,function(){return this.hasFlag("n")?"(?:":(this.captureNames.push(null),"(")},{customFlags:"n"}),"undefined"!=typeof F&&(F.XRegExp=s),s}(),function(e){"use strict";function t(e){return e.replace(/[- _]+/g,"").toLowerCase()}function F(e){return e.replace(/\w{4}/g,"\\u$&")}function A(e){for(;e.length<4;)e="0"+e;return e}function n(e){return parseInt(e,16)}function r(e){return parseInt(e,10).toString(16)}function i(t){var F,i=[],E=-1;return e.forEach(t,/\\u(\w{4})(?:-\\u(\w{4}))?/,function(e){F=n(e[1]),F>E+1&&(i.push("\\u"+A(r(E+1))),F>E+2&&i.push("-\\u"+A(r(F-1)))),E=n(e[2]||e[1])}),E<65535&&(i.push("\\u"+A(r(E+1))),E<65534&&i.push("-\\uFFFF")),i.join("")}function E(e){return o["^"+e]||(o["^"+e]=i(o[e]))}var o={};e.install("extensibility"),e.addUnicodePackage=function(A,n){var r;if(!e.isInstalled("extensibility"))throw new Error("extensibility must be installed before adding Unicode packages");if(A)for(r in A)A.hasOwnProperty(r)&&(o[t(r)]=F(A[r]));if(n)for(r in n)n.hasOwnProperty(r)&&(o[t(n[r])]=o[t(r)])},e.addUnicodePackage({L:"0041-005A0061-007A00AA00B500BA00C0-00D600D8-00F600F8-02C102C6-02D102E0-02E402EC02EE0370-037403760377037A-037D03860388-038A038C038E-03A103A3-03F503F7-0481048A-05270531-055605590561-058705D0-05EA05F0-05F20620-064A066E066F0671-06D306D506E506E606EE06EF06FA-06FC06FF07100712-072F074D-07A507B107CA-07EA07F407F507FA0800-0815081A082408280840-085808A008A2-08AC0904-0939093D09500958-09610971-09770979-097F0985-098C098F09900993-09A809AA-09B009B209B6-09B909BD09CE09DC09DD09DF-09E109F009F10A05-0A0A0A0F0A100A13-0A280A2A-0A300A320A330A350A360A380A390A59-0A5C0A5E0A72-0A740A85-0A8D0A8F-0A910A93-0AA80AAA-0AB00AB20AB30AB5-0AB90ABD0AD00AE00AE10B05-0B0C0B0F0B100B13-0B280B2A-0B300B320B330B35-0B390B3D0B5C0B5D0B5F-0B610B710B830B85-0B8A0B8E-0B900B92-0B950B990B9A0B9C0B9E0B9F0BA30BA40BA8-0BAA0BAE-0BB90BD00C05-0C0C0C0E-0C100C12-0C280C2A-0C330C35-0C390C3D0C580C590C600C610C85-0C8C0C8E-0C900C92-0CA80CAA-0CB30CB5-0CB90CBD0CDE0CE00CE10CF10CF20D05-0D0C0D0E-0D100D12-0D3A0D3D0D4E0D600D610D7A-0D7F0D85-0D960D9A-0DB10DB3-0DBB0DBD0DC0-0DC60E01-0E300E320E330E40-0E460E810E820E840E870E880E8A0E8D0E94-0E970E99-0E9F0EA1-0EA30EA50EA70EAA0EAB0EAD-0EB00EB20EB30EBD0EC0-0EC40EC60EDC-0EDF0F000F40-0F470F49-0F6C0F88-0F8C1000-102A103F1050-1055105A-105D106110651066106E-10701075-1081108E10A0-10C510C710CD10D0-10FA10FC-1248124A-124D1250-12561258125A-125D1260-1288128A-128D1290-12B012B2-12B512B8-12BE12C012C2-12C512C8-12D612D8-13101312-13151318-135A1380-138F13A0-13F41401-166C166F-167F1681-169A16A0-16EA1700-170C170E-17111720-17311740-17511760-176C176E-17701780-17B317D717DC1820-18771880-18A818AA18B0-18F51900-191C1950-196D1970-19741980-19AB19C1-19C71A00-1A161A20-1A541AA71B05-1B331B45-1B4B1B83-1BA01BAE1BAF1BBA-1BE51C00-1C231C4D-1C4F1C5A-1C7D1CE9-1CEC1CEE-1CF11CF51CF61D00-1DBF1E00-1F151F18-1F1D1F20-1F451F48-1F4D1F50-1F571F591F5B1F5D1F5F-1F7D1F80-1FB41FB6-1FBC1FBE1FC2-1FC41FC6-1FCC1FD0-1FD31FD6-1FDB1FE0-1FEC1FF2-1FF41FF6-1FFC2071207F2090-209C21022107210A-211321152119-211D212421262128212A-212D212F-2139213C-213F2145-2149214E218321842C00-2C2E2C30-2C5E2C60-2CE42CEB-2CEE2CF22CF32D00-2D252D272D2D2D30-2D672D6F2D80-2D962DA0-2DA62DA8-2DAE2DB0-2DB62DB8-2DBE2DC0-2DC62DC8-2DCE2DD0-2DD62DD8-2DDE2E2F300530063031-3035303B303C3041-3096309D-309F30A1-30FA30FC-30FF3105-312D3131-318E31A0-31BA31F0-31FF3400-4DB54E00-9FCCA000-A48CA4D0-A4FDA500-A60CA610-A61FA62AA62BA640-A66EA67F-A697A6A0-A6E5A717-A71FA722-A788A78B-A78EA790-A793A7A0-A7AAA7F8-A801A803-A805A807-A80AA80C-A822A840-A873A882-A8B3A8F2-A8F7A8FBA90A-A925A930-A946A960-A97CA984-A9B2A9CFAA00-AA28AA40-AA42AA44-AA4BAA60-AA76AA7AAA80-AAAFAAB1AAB5AAB6AAB9-AABDAAC0AAC2AADB-AADDAAE0-AAEAAAF2-AAF4AB01-AB06AB09-AB0EAB11-AB16AB20-AB26AB28-AB2EABC0-ABE2AC00-D7A3D7B0-D7C6D7CB-D7FBF900-FA6DFA70-FAD9FB00-FB06FB13-FB17FB1DFB1F-FB28FB2A-FB36FB38-FB3CFB3EFB40FB41FB43FB44FB46-FBB1FBD3-FD3DFD50-FD8FFD92-FDC7FDF0-FDFBFE70-FE74FE76-FEFCFF21-FF3AFF41-FF5AFF66-FFBEFFC2-FFC7FFCA-FFCFFFD2-FFD7FFDA-FFDC"},{L:"Letter"}),e.addToken(/\\([pP]){(\^?)([^}]*)}/,function(e,F){var A="P"===e[1]||e[2]?"^":"",n=t(e[3]);if("P"===e[1]&&e[2])throw new SyntaxError("invalid double negation \\P{^");if(!o.hasOwnProperty(n))throw new SyntaxError("invalid or unknown Unicode property "+e[0]);return"class"===F?A?E(n):o[n]:"["+A+o[n]+"]"},{scope:"all"})}(A),function(e){"use strict";if(!e.addUnicodePackage)throw new ReferenceError("Unicode Base must be loaded before Unicode Categories");e.install("extensibility"),e.addUnicodePackage({Ll:"0061-007A00B500DF-00F600F8-00FF01010103010501070109010B010D010F01110113011501170119011B011D011F01210123012501270129012B012D012F01310133013501370138013A013C013E014001420144014601480149014B014D014F01510153015501570159015B015D015F01610163016501670169016B016D016F0171017301750177017A017C017E-0180018301850188018C018D019201950199-019B019E01A101A301A501A801AA01AB01AD01B001B401B601B901BA01BD-01BF01C601C901CC01CE01D001D201D401D601D801DA01DC01DD01DF01E101E301E501E701E901EB01ED01EF01F001F301F501F901FB01FD01FF02010203020502070209020B020D020F02110213021502170219021B021D021F02210223022502270229022B022D022F02310233-0239023C023F0240024202470249024B024D024F-02930295-02AF037103730377037B-037D039003AC-03CE03D003D103D5-03D703D903DB03DD03DF03E103E303E503E703E903EB03ED03EF-03F303F503F803FB03FC0430-045F04610463046504670469046B046D046F04710473047504770479047B047D047F0481048B048D048F04910493049504970499049B049D049F04A104A304A504A704A904AB04AD04AF04B104B304B504B704B904BB04BD04BF04C204C404C604C804CA04CC04CE04CF04D104D304D504D704D904DB04DD04DF04E104E304E504E704E904EB04ED04EF04F104F304F504F704F904FB04FD04FF05010503050505070509050B050D050F05110513051505170519051B051D051F05210523052505270561-05871D00-1D2B1D6B-1D771D79-1D9A1E011E031E051E071E091E0B1E0D1E0F1E111E131E151E171E191E1B1E1D1E1F1E211E231E251E271E291E2B1E2D1E2F1E311E331E351E371E391E3B1E3D1E3F1E411E431E451E471E491E4B1E4D1E4F1E511E531E551E571E591E5B1E5D1E5F1E611E631E651E671E691E6B1E6D1E6F1E711E731E751E771E791E7B1E7D1E7F1E811E831E851E871E891E8B1E8D1E8F1E911E931E95-1E9D1E9F1EA11EA31EA51EA71EA91EAB1EAD1EAF1EB11EB31EB51EB71EB91EBB1EBD1EBF1EC11EC31EC51EC71EC91ECB1ECD1ECF1ED11ED31ED51ED71ED91EDB1EDD1EDF1EE11EE31EE51EE71EE91EEB1EED1EEF1EF11EF31EF51EF71EF91EFB1EFD1EFF-1F071F10-1F151F20-1F271F30-1F371F40-1F451F50-1F571F60-1F671F70-1F7D1F80-1F871F90-1F971FA0-1FA71FB0-1FB41FB61FB71FBE1FC2-1FC41FC61FC71FD0-1FD31FD61FD71FE0-1FE71FF2-1FF41FF61FF7210A210E210F2113212F21342139213C213D2146-2149214E21842C30-2C5E2C612C652C662C682C6A2C6C2C712C732C742C76-2C7B2C812C832C852C872C892C8B2C8D2C8F2C912C932C952C972C992C9B2C9D2C9F2CA12CA32CA52CA72CA92CAB2CAD2CAF2CB12CB32CB52CB72CB92CBB2CBD2CBF2CC12CC32CC52CC72CC92CCB2CCD2CCF2CD12CD32CD52CD72CD92CDB2CDD2CDF2CE12CE32CE42CEC2CEE2CF32D00-2D252D272D2DA641A643A645A647A649A64BA64DA64FA651A653A655A657A659A65BA65DA65FA661A663A665A667A669A66BA66DA681A683A685A687A689A68BA68DA68FA691A693A695A697A723A725A727A729A72BA72DA72F-A731A733A735A737A739A73BA73DA73FA741A743A745A747A749A74BA74DA74FA751A753A755A757A759A75BA75DA75FA761A763A765A767A769A76BA76DA76FA771-A778A77AA77CA77FA781A783A785A787A78CA78EA791A793A7A1A7A3A7A5A7A7A7A9A7FAFB00-FB06FB13-FB17FF41-FF5A",Lu:"0041-005A00C0-00D600D8-00DE01000102010401060108010A010C010E01100112011401160118011A011C011E01200122012401260128012A012C012E01300132013401360139013B013D013F0141014301450147014A014C014E01500152015401560158015A015C015E01600162016401660168016A016C016E017001720174017601780179017B017D018101820184018601870189-018B018E-0191019301940196-0198019C019D019F01A001A201A401A601A701A901AC01AE01AF01B1-01B301B501B701B801BC01C401C701CA01CD01CF01D101D301D501D701D901DB01DE01E001E201E401E601E801EA01EC01EE01F101F401F6-01F801FA01FC01FE02000202020402060208020A020C020E02100212021402160218021A021C021E02200222022402260228022A022C022E02300232023A023B023D023E02410243-02460248024A024C024E03700372037603860388-038A038C038E038F0391-03A103A3-03AB03CF03D2-03D403D803DA03DC03DE03E003E203E403E603E803EA03EC03EE03F403F703F903FA03FD-042F04600462046404660468046A046C046E04700472047404760478047A047C047E0480048A048C048E04900492049404960498049A049C049E04A004A204A404A604A804AA04AC04AE04B004B204B404B604B804BA04BC04BE04C004C104C304C504C704C904CB04CD04D004D204D404D604D804DA04DC04DE04E004E204E404E604E804EA04EC04EE04F004F204F404F604F804FA04FC04FE05000502050405060508050A050C050E05100512051405160518051A051C051E05200522052405260531-055610A0-10C510C710CD1E001E021E041E061E081E0A1E0C1E0E1E101E121E141E161E181E1A1E1C1E1E1E201E221E241E261E281E2A1E2C1E2E1E301E321E341E361E381E3A1E3C1E3E1E401E421E441E461E481E4A1E4C1E4E1E501E521E541E561E581E5A1E5C1E5E1E601E621E641E661E681E6A1E6C1E6E1E701E721E741E761E781E7A1E7C1E7E1E801E821E841E861E881E8A1E8C1E8E1E901E921E941E9E1EA01EA21EA41EA61EA81EAA1EAC1EAE1EB01EB21EB41EB61EB81EBA1EBC1EBE1EC01EC21EC41EC61EC81ECA1ECC1ECE1ED01ED21ED41ED61ED81EDA1EDC1EDE1EE01EE21EE41EE61EE81EEA1EEC1EEE1EF01EF21EF41EF61EF81EFA1EFC1EFE1F08-1F0F1F18-1F1D1F28-1F2F1F38-1F3F1F48-1F4D1F591F5B1F5D1F5F1F68-1F6F1FB8-1FBB1FC8-1FCB1FD8-1FDB1FE8-1FEC1FF8-1FFB21022107210B-210D2110-211221152119-211D212421262128212A-212D2130-2133213E213F214521832C00-2C2E2C602C62-2C642C672C692C6B2C6D-2C702C722C752C7E-2C802C822C842C862C882C8A2C8C2C8E2C902C922C942C962C982C9A2C9C2C9E2CA02CA22CA42CA62CA82CAA2CAC2CAE2CB02CB22CB42CB62CB82CBA2CBC2CBE2CC02CC22CC42CC62CC82CCA2CCC2CCE2CD02CD22CD42CD62CD82CDA2CDC2CDE2CE02CE22CEB2CED2CF2A640A642A644A646A648A64AA64CA64EA650A652A654A656A658A65AA65CA65EA660A662A664A666A668A66AA66CA680A682A684A686A688A68AA68CA68EA690A692A694A696A722A724A726A728A72AA72CA72EA732A734A736A738A73AA73CA73EA740A742A744A746A748A74AA74CA74EA750A752A754A756A758A75AA75CA75EA760A762A764A766A768A76AA76CA76EA779A77BA77DA77EA780A782A784A786A78BA78DA790A792A7A0A7A2A7A4A7A6A7A8A7AAFF21-FF3A",Lt:"01C501C801CB01F21F88-1F8F1F98-1F9F1FA8-1FAF1FBC1FCC1FFC",Lm:"02B0-02C102C6-02D102E0-02E402EC02EE0374037A0559064006E506E607F407F507FA081A0824082809710E460EC610FC17D718431AA71C78-1C7D1D2C-1D6A1D781D9B-1DBF2071207F2090-209C2C7C2C7D2D6F2E2F30053031-3035303B309D309E30FC-30FEA015A4F8-A4FDA60CA67FA717-A71FA770A788A7F8A7F9A9CFAA70AADDAAF3AAF4FF70FF9EFF9F",Lo:"00AA00BA01BB01C0-01C3029405D0-05EA05F0-05F20620-063F0641-064A066E066F0671-06D306D506EE06EF06FA-06FC06FF07100712-072F074D-07A507B107CA-07EA0800-08150840-085808A008A2-08AC0904-0939093D09500958-09610972-09770979-097F0985-098C098F09900993-09A809AA-09B009B209B6-09B909BD09CE09DC09DD09DF-09E109F009F10A05-0A0A0A0F0A100A13-0A280A2A-0A300A320A330A350A360A380A390A59-0A5C0A5E0A72-0A740A85-0A8D0A8F-0A910A93-0AA80AAA-0AB00AB20AB30AB5-0AB90ABD0AD00AE00AE10B05-0B0C0B0F0B100B13-0B280B2A-0B300B320B330B35-0B390B3D0B5C0B5D0B5F-0B610B710B830B85-0B8A0B8E-0B900B92-0B950B990B9A0B9C0B9E0B9F0BA30BA40BA8-0BAA0BAE-0BB90BD00C05-0C0C0C0E-0C100C12-0C280C2A-0C330C35-0C390C3D0C580C590C600C610C85-0C8C0C8E-0C900C92-0CA80CAA-0CB30CB5-0CB90CBD0CDE0CE00CE10CF10CF20D05-0D0C0D0E-0D100D12-0D3A0D3D0D4E0D600D610D7A-0D7F0D85-0D960D9A-0DB10DB3-0DBB0DBD0DC0-0DC60E01-0E300E320E330E40-0E450E810E820E840E870E880E8A0E8D0E94-0E970E99-0E9F0EA1-0EA30EA50EA70EAA0EAB0EAD-0EB00EB20EB30EBD0EC0-0EC40EDC-0EDF0F000F40-0F470F49-0F6C0F88-0F8C1000-102A103F1050-1055105A-105D106110651066106E-10701075-1081108E10D0-10FA10FD-1248124A-124D1250-12561258125A-125D1260-1288128A-128D1290-12B012B2-12B512B8-12BE12C012C2-12C512C8-12D612D8-13101312-13151318-135A1380-138F13A0-13F41401-166C166F-167F1681-169A16A0-16EA1700-170C170E-17111720-17311740-17511760-176C176E-17701780-17B317DC1820-18421844-18771880-18A818AA18B0-18F51900-191C1950-196D1970-19741980-19AB19C1-19C71A00-1A161A20-1A541B05-1B331B45-1B4B1B83-1BA01BAE1BAF1BBA-1BE51C00-1C231C4D-1C4F1C5A-1C771CE9-1CEC1CEE-1CF11CF51CF62135-21382D30-2D672D80-2D962DA0-2DA62DA8-2DAE2DB0-2DB62DB8-2DBE2DC0-2DC62DC8-2DCE2DD0-2DD62DD8-2DDE3006303C3041-3096309F30A1-30FA30FF3105-312D3131-318E31A0-31BA31F0-31FF3400-4DB54E00-9FCCA000-A014A016-A48CA4D0-A4F7A500-A60BA610-A61FA62AA62BA66EA6A0-A6E5A7FB-A801A803-A805A807-A80AA80C-A822A840-A873A882-A8B3A8F2-A8F7A8FBA90A-A925A930-A946A960-A97CA984-A9B2AA00-AA28AA40-AA42AA44-AA4BAA60-AA6FAA71-AA76AA7AAA80-AAAFAAB1AAB5AAB6AAB9-AABDAAC0AAC2AADBAADCAAE0-AAEAAAF2AB01-AB06AB09-AB0EAB11-AB16AB20-AB26AB28-AB2EABC0-ABE2AC00-D7A3D7B0-D7C6D7CB-D7FBF900-FA6DFA70-FAD9FB1DFB1F-FB28FB2A-FB36FB38-FB3CFB3EFB40FB41FB43FB44FB46-FBB1FBD3-FD3DFD50-FD8FFD92-FDC7FDF0-FDFBFE70-FE74FE76-FEFCFF66-FF6FFF71-FF9DFFA0-FFBEFFC2-FFC7FFCA-FFCFFFD2-FFD7FFDA-FFDC",
 M:"0300-036F0483-04890591-05BD05BF05C105C205C405C505C70610-061A064B-065F067006D6-06DC06DF-06E406E706E806EA-06ED07110730-074A07A6-07B007EB-07F30816-0819081B-08230825-08270829-082D0859-085B08E4-08FE0900-0903093A-093C093E-094F0951-0957096209630981-098309BC09BE-09C409C709C809CB-09CD09D709E209E30A01-0A030A3C0A3E-0A420A470A480A4B-0A4D0A510A700A710A750A81-0A830ABC0ABE-0AC50AC7-0AC90ACB-0ACD0AE20AE30B01-0B030B3C0B3E-0B440B470B480B4B-0B4D0B560B570B620B630B820BBE-0BC20BC6-0BC80BCA-0BCD0BD70C01-0C030C3E-0C440C46-0C480C4A-0C4D0C550C560C620C630C820C830CBC0CBE-0CC40CC6-0CC80CCA-0CCD0CD50CD60CE20CE30D020D030D3E-0D440D46-0D480D4A-0D4D0D570D620D630D820D830DCA0DCF-0DD40DD60DD8-0DDF0DF20DF30E310E34-0E3A0E47-0E4E0EB10EB4-0EB90EBB0EBC0EC8-0ECD0F180F190F350F370F390F3E0F3F0F71-0F840F860F870F8D-0F970F99-0FBC0FC6102B-103E1056-1059105E-10601062-10641067-106D1071-10741082-108D108F109A-109D135D-135F1712-17141732-1734175217531772177317B4-17D317DD180B-180D18A91920-192B1930-193B19B0-19C019C819C91A17-1A1B1A55-1A5E1A60-1A7C1A7F1B00-1B041B34-1B441B6B-1B731B80-1B821BA1-1BAD1BE6-1BF31C24-1C371CD0-1CD21CD4-1CE81CED1CF2-1CF41DC0-1DE61DFC-1DFF20D0-20F02CEF-2CF12D7F2DE0-2DFF302A-302F3099309AA66F-A672A674-A67DA69FA6F0A6F1A802A806A80BA823-A827A880A881A8B4-A8C4A8E0-A8F1A926-A92DA947-A953A980-A983A9B3-A9C0AA29-AA36AA43AA4CAA4DAA7BAAB0AAB2-AAB4AAB7AAB8AABEAABFAAC1AAEB-AAEFAAF5AAF6ABE3-ABEAABECABEDFB1EFE00-FE0FFE20-FE26",Mn:"0300-036F0483-04870591-05BD05BF05C105C205C405C505C70610-061A064B-065F067006D6-06DC06DF-06E406E706E806EA-06ED07110730-074A07A6-07B007EB-07F30816-0819081B-08230825-08270829-082D0859-085B08E4-08FE0900-0902093A093C0941-0948094D0951-095709620963098109BC09C1-09C409CD09E209E30A010A020A3C0A410A420A470A480A4B-0A4D0A510A700A710A750A810A820ABC0AC1-0AC50AC70AC80ACD0AE20AE30B010B3C0B3F0B41-0B440B4D0B560B620B630B820BC00BCD0C3E-0C400C46-0C480C4A-0C4D0C550C560C620C630CBC0CBF0CC60CCC0CCD0CE20CE30D41-0D440D4D0D620D630DCA0DD2-0DD40DD60E310E34-0E3A0E47-0E4E0EB10EB4-0EB90EBB0EBC0EC8-0ECD0F180F190F350F370F390F71-0F7E0F80-0F840F860F870F8D-0F970F99-0FBC0FC6102D-10301032-10371039103A103D103E10581059105E-10601071-1074108210851086108D109D135D-135F1712-17141732-1734175217531772177317B417B517B7-17BD17C617C9-17D317DD180B-180D18A91920-19221927192819321939-193B1A171A181A561A58-1A5E1A601A621A65-1A6C1A73-1A7C1A7F1B00-1B031B341B36-1B3A1B3C1B421B6B-1B731B801B811BA2-1BA51BA81BA91BAB1BE61BE81BE91BED1BEF-1BF11C2C-1C331C361C371CD0-1CD21CD4-1CE01CE2-1CE81CED1CF41DC0-1DE61DFC-1DFF20D0-20DC20E120E5-20F02CEF-2CF12D7F2DE0-2DFF302A-302D3099309AA66FA674-A67DA69FA6F0A6F1A802A806A80BA825A826A8C4A8E0-A8F1A926-A92DA947-A951A980-A982A9B3A9B6-A9B9A9BCAA29-AA2EAA31AA32AA35AA36AA43AA4CAAB0AAB2-AAB4AAB7AAB8AABEAABFAAC1AAECAAEDAAF6ABE5ABE8ABEDFB1EFE00-FE0FFE20-FE26",Mc:"0903093B093E-09400949-094C094E094F0982098309BE-09C009C709C809CB09CC09D70A030A3E-0A400A830ABE-0AC00AC90ACB0ACC0B020B030B3E0B400B470B480B4B0B4C0B570BBE0BBF0BC10BC20BC6-0BC80BCA-0BCC0BD70C01-0C030C41-0C440C820C830CBE0CC0-0CC40CC70CC80CCA0CCB0CD50CD60D020D030D3E-0D400D46-0D480D4A-0D4C0D570D820D830DCF-0DD10DD8-0DDF0DF20DF30F3E0F3F0F7F102B102C10311038103B103C105610571062-10641067-106D108310841087-108C108F109A-109C17B617BE-17C517C717C81923-19261929-192B193019311933-193819B0-19C019C819C91A19-1A1B1A551A571A611A631A641A6D-1A721B041B351B3B1B3D-1B411B431B441B821BA11BA61BA71BAA1BAC1BAD1BE71BEA-1BEC1BEE1BF21BF31C24-1C2B1C341C351CE11CF21CF3302E302FA823A824A827A880A881A8B4-A8C3A952A953A983A9B4A9B5A9BAA9BBA9BD-A9C0AA2FAA30AA33AA34AA4DAA7BAAEBAAEEAAEFAAF5ABE3ABE4ABE6ABE7ABE9ABEAABEC",Me:"0488048920DD-20E020E2-20E4A670-A672",N:"0030-003900B200B300B900BC-00BE0660-066906F0-06F907C0-07C90966-096F09E6-09EF09F4-09F90A66-0A6F0AE6-0AEF0B66-0B6F0B72-0B770BE6-0BF20C66-0C6F0C78-0C7E0CE6-0CEF0D66-0D750E50-0E590ED0-0ED90F20-0F331040-10491090-10991369-137C16EE-16F017E0-17E917F0-17F91810-18191946-194F19D0-19DA1A80-1A891A90-1A991B50-1B591BB0-1BB91C40-1C491C50-1C5920702074-20792080-20892150-21822185-21892460-249B24EA-24FF2776-27932CFD30073021-30293038-303A3192-31953220-32293248-324F3251-325F3280-328932B1-32BFA620-A629A6E6-A6EFA830-A835A8D0-A8D9A900-A909A9D0-A9D9AA50-AA59ABF0-ABF9FF10-FF19",Nd:"0030-00390660-066906F0-06F907C0-07C90966-096F09E6-09EF0A66-0A6F0AE6-0AEF0B66-0B6F0BE6-0BEF0C66-0C6F0CE6-0CEF0D66-0D6F0E50-0E590ED0-0ED90F20-0F291040-10491090-109917E0-17E91810-18191946-194F19D0-19D91A80-1A891A90-1A991B50-1B591BB0-1BB91C40-1C491C50-1C59A620-A629A8D0-A8D9A900-A909A9D0-A9D9AA50-AA59ABF0-ABF9FF10-FF19",Nl:"16EE-16F02160-21822185-218830073021-30293038-303AA6E6-A6EF",No:"00B200B300B900BC-00BE09F4-09F90B72-0B770BF0-0BF20C78-0C7E0D70-0D750F2A-0F331369-137C17F0-17F919DA20702074-20792080-20892150-215F21892460-249B24EA-24FF2776-27932CFD3192-31953220-32293248-324F3251-325F3280-328932B1-32BFA830-A835",P:"0021-00230025-002A002C-002F003A003B003F0040005B-005D005F007B007D00A100A700AB00B600B700BB00BF037E0387055A-055F0589058A05BE05C005C305C605F305F40609060A060C060D061B061E061F066A-066D06D40700-070D07F7-07F90830-083E085E0964096509700AF00DF40E4F0E5A0E5B0F04-0F120F140F3A-0F3D0F850FD0-0FD40FD90FDA104A-104F10FB1360-13681400166D166E169B169C16EB-16ED1735173617D4-17D617D8-17DA1800-180A194419451A1E1A1F1AA0-1AA61AA8-1AAD1B5A-1B601BFC-1BFF1C3B-1C3F1C7E1C7F1CC0-1CC71CD32010-20272030-20432045-20512053-205E207D207E208D208E2329232A2768-277527C527C627E6-27EF2983-299829D8-29DB29FC29FD2CF9-2CFC2CFE2CFF2D702E00-2E2E2E30-2E3B3001-30033008-30113014-301F3030303D30A030FBA4FEA4FFA60D-A60FA673A67EA6F2-A6F7A874-A877A8CEA8CFA8F8-A8FAA92EA92FA95FA9C1-A9CDA9DEA9DFAA5C-AA5FAADEAADFAAF0AAF1ABEBFD3EFD3FFE10-FE19FE30-FE52FE54-FE61FE63FE68FE6AFE6BFF01-FF03FF05-FF0AFF0C-FF0FFF1AFF1BFF1FFF20FF3B-FF3DFF3FFF5BFF5DFF5F-FF65",Pd:"002D058A05BE140018062010-20152E172E1A2E3A2E3B301C303030A0FE31FE32FE58FE63FF0D",Ps:"0028005B007B0F3A0F3C169B201A201E2045207D208D23292768276A276C276E27702772277427C527E627E827EA27EC27EE2983298529872989298B298D298F299129932995299729D829DA29FC2E222E242E262E283008300A300C300E3010301430163018301A301DFD3EFE17FE35FE37FE39FE3BFE3DFE3FFE41FE43FE47FE59FE5BFE5DFF08FF3BFF5BFF5FFF62",Pe:"0029005D007D0F3B0F3D169C2046207E208E232A2769276B276D276F27712773277527C627E727E927EB27ED27EF298429862988298A298C298E2990299229942996299829D929DB29FD2E232E252E272E293009300B300D300F3011301530173019301B301E301FFD3FFE18FE36FE38FE3AFE3CFE3EFE40FE42FE44FE48FE5AFE5CFE5EFF09FF3DFF5DFF60FF63",Pi:"00AB2018201B201C201F20392E022E042E092E0C2E1C2E20",Pf:"00BB2019201D203A2E032E052E0A2E0D2E1D2E21",Pc:"005F203F20402054FE33FE34FE4D-FE4FFF3F",Po:"0021-00230025-0027002A002C002E002F003A003B003F0040005C00A100A700B600B700BF037E0387055A-055F058905C005C305C605F305F40609060A060C060D061B061E061F066A-066D06D40700-070D07F7-07F90830-083E085E0964096509700AF00DF40E4F0E5A0E5B0F04-0F120F140F850FD0-0FD40FD90FDA104A-104F10FB1360-1368166D166E16EB-16ED1735173617D4-17D617D8-17DA1800-18051807-180A194419451A1E1A1F1AA0-1AA61AA8-1AAD1B5A-1B601BFC-1BFF1C3B-1C3F1C7E1C7F1CC0-1CC71CD3201620172020-20272030-2038203B-203E2041-20432047-205120532055-205E2CF9-2CFC2CFE2CFF2D702E002E012E06-2E082E0B2E0E-2E162E182E192E1B2E1E2E1F2E2A-2E2E2E30-2E393001-3003303D30FBA4FEA4FFA60D-A60FA673A67EA6F2-A6F7A874-A877A8CEA8CFA8F8-A8FAA92EA92FA95FA9C1-A9CDA9DEA9DFAA5C-AA5FAADEAADFAAF0AAF1ABEBFE10-FE16FE19FE30FE45FE46FE49-FE4CFE50-FE52FE54-FE57FE5F-FE61FE68FE6AFE6BFF01-FF03FF05-FF07FF0AFF0CFF0EFF0FFF1AFF1BFF1FFF20FF3CFF61FF64FF65",S:"0024002B003C-003E005E0060007C007E00A2-00A600A800A900AC00AE-00B100B400B800D700F702C2-02C502D2-02DF02E5-02EB02ED02EF-02FF03750384038503F60482058F0606-0608060B060E060F06DE06E906FD06FE07F609F209F309FA09FB0AF10B700BF3-0BFA0C7F0D790E3F0F01-0F030F130F15-0F170F1A-0F1F0F340F360F380FBE-0FC50FC7-0FCC0FCE0FCF0FD5-0FD8109E109F1390-139917DB194019DE-19FF1B61-1B6A1B74-1B7C1FBD1FBF-1FC11FCD-1FCF1FDD-1FDF1FED-1FEF1FFD1FFE20442052207A-207C208A-208C20A0-20B9210021012103-21062108210921142116-2118211E-2123212521272129212E213A213B2140-2144214A-214D214F2190-2328232B-23F32400-24262440-244A249C-24E92500-26FF2701-27672794-27C427C7-27E527F0-29822999-29D729DC-29FB29FE-2B4C2B50-2B592CE5-2CEA2E80-2E992E9B-2EF32F00-2FD52FF0-2FFB300430123013302030363037303E303F309B309C319031913196-319F31C0-31E33200-321E322A-324732503260-327F328A-32B032C0-32FE3300-33FF4DC0-4DFFA490-A4C6A700-A716A720A721A789A78AA828-A82BA836-A839AA77-AA79FB29FBB2-FBC1FDFCFDFDFE62FE64-FE66FE69FF04FF0BFF1C-FF1EFF3EFF40FF5CFF5EFFE0-FFE6FFE8-FFEEFFFCFFFD",Sm:"002B003C-003E007C007E00AC00B100D700F703F60606-060820442052207A-207C208A-208C21182140-2144214B2190-2194219A219B21A021A321A621AE21CE21CF21D221D421F4-22FF2308-230B23202321237C239B-23B323DC-23E125B725C125F8-25FF266F27C0-27C427C7-27E527F0-27FF2900-29822999-29D729DC-29FB29FE-2AFF2B30-2B442B47-2B4CFB29FE62FE64-FE66FF0BFF1C-FF1EFF5CFF5EFFE2FFE9-FFEC",Sc:"002400A2-00A5058F060B09F209F309FB0AF10BF90E3F17DB20A0-20B9A838FDFCFE69FF04FFE0FFE1FFE5FFE6",Sk:"005E006000A800AF00B400B802C2-02C502D2-02DF02E5-02EB02ED02EF-02FF0375038403851FBD1FBF-1FC11FCD-1FCF1FDD-1FDF1FED-1FEF1FFD1FFE309B309CA700-A716A720A721A789A78AFBB2-FBC1FF3EFF40FFE3",So:"00A600A900AE00B00482060E060F06DE06E906FD06FE07F609FA0B700BF3-0BF80BFA0C7F0D790F01-0F030F130F15-0F170F1A-0F1F0F340F360F380FBE-0FC50FC7-0FCC0FCE0FCF0FD5-0FD8109E109F1390-1399194019DE-19FF1B61-1B6A1B74-1B7C210021012103-210621082109211421162117211E-2123212521272129212E213A213B214A214C214D214F2195-2199219C-219F21A121A221A421A521A7-21AD21AF-21CD21D021D121D321D5-21F32300-2307230C-231F2322-2328232B-237B237D-239A23B4-23DB23E2-23F32400-24262440-244A249C-24E92500-25B625B8-25C025C2-25F72600-266E2670-26FF2701-27672794-27BF2800-28FF2B00-2B2F2B452B462B50-2B592CE5-2CEA2E80-2E992E9B-2EF32F00-2FD52FF0-2FFB300430123013302030363037303E303F319031913196-319F31C0-31E33200-321E322A-324732503260-327F328A-32B032C0-32FE3300-33FF4DC0-4DFFA490-A4C6A828-A82BA836A837A839AA77-AA79FDFDFFE4FFE8FFEDFFEEFFFCFFFD",Z:"002000A01680180E2000-200A20282029202F205F3000",Zs:"002000A01680180E2000-200A202F205F3000",Zl:"2028",Zp:"2029",C:"0000-001F007F-009F00AD03780379037F-0383038B038D03A20528-05300557055805600588058B-058E059005C8-05CF05EB-05EF05F5-0605061C061D06DD070E070F074B074C07B2-07BF07FB-07FF082E082F083F085C085D085F-089F08A108AD-08E308FF097809800984098D098E0991099209A909B109B3-09B509BA09BB09C509C609C909CA09CF-09D609D8-09DB09DE09E409E509FC-0A000A040A0B-0A0E0A110A120A290A310A340A370A3A0A3B0A3D0A43-0A460A490A4A0A4E-0A500A52-0A580A5D0A5F-0A650A76-0A800A840A8E0A920AA90AB10AB40ABA0ABB0AC60ACA0ACE0ACF0AD1-0ADF0AE40AE50AF2-0B000B040B0D0B0E0B110B120B290B310B340B3A0B3B0B450B460B490B4A0B4E-0B550B58-0B5B0B5E0B640B650B78-0B810B840B8B-0B8D0B910B96-0B980B9B0B9D0BA0-0BA20BA5-0BA70BAB-0BAD0BBA-0BBD0BC3-0BC50BC90BCE0BCF0BD1-0BD60BD8-0BE50BFB-0C000C040C0D0C110C290C340C3A-0C3C0C450C490C4E-0C540C570C5A-0C5F0C640C650C70-0C770C800C810C840C8D0C910CA90CB40CBA0CBB0CC50CC90CCE-0CD40CD7-0CDD0CDF0CE40CE50CF00CF3-0D010D040D0D0D110D3B0D3C0D450D490D4F-0D560D58-0D5F0D640D650D76-0D780D800D810D840D97-0D990DB20DBC0DBE0DBF0DC7-0DC90DCB-0DCE0DD50DD70DE0-0DF10DF5-0E000E3B-0E3E0E5C-0E800E830E850E860E890E8B0E8C0E8E-0E930E980EA00EA40EA60EA80EA90EAC0EBA0EBE0EBF0EC50EC70ECE0ECF0EDA0EDB0EE0-0EFF0F480F6D-0F700F980FBD0FCD0FDB-0FFF10C610C8-10CC10CE10CF1249124E124F12571259125E125F1289128E128F12B112B612B712BF12C112C612C712D7131113161317135B135C137D-137F139A-139F13F5-13FF169D-169F16F1-16FF170D1715-171F1737-173F1754-175F176D17711774-177F17DE17DF17EA-17EF17FA-17FF180F181A-181F1878-187F18AB-18AF18F6-18FF191D-191F192C-192F193C-193F1941-1943196E196F1975-197F19AC-19AF19CA-19CF19DB-19DD1A1C1A1D1A5F1A7D1A7E1A8A-1A8F1A9A-1A9F1AAE-1AFF1B4C-1B4F1B7D-1B7F1BF4-1BFB1C38-1C3A1C4A-1C4C1C80-1CBF1CC8-1CCF1CF7-1CFF1DE7-1DFB1F161F171F1E1F1F1F461F471F4E1F4F1F581F5A1F5C1F5E1F7E1F7F1FB51FC51FD41FD51FDC1FF01FF11FF51FFF200B-200F202A-202E2060-206F20722073208F209D-209F20BA-20CF20F1-20FF218A-218F23F4-23FF2427-243F244B-245F27002B4D-2B4F2B5A-2BFF2C2F2C5F2CF4-2CF82D262D28-2D2C2D2E2D2F2D68-2D6E2D71-2D7E2D97-2D9F2DA72DAF2DB72DBF2DC72DCF2DD72DDF2E3C-2E7F2E9A2EF4-2EFF2FD6-2FEF2FFC-2FFF3040309730983100-3104312E-3130318F31BB-31BF31E4-31EF321F32FF4DB6-4DBF9FCD-9FFFA48D-A48FA4C7-A4CFA62C-A63FA698-A69EA6F8-A6FFA78FA794-A79FA7AB-A7F7A82C-A82FA83A-A83FA878-A87FA8C5-A8CDA8DA-A8DFA8FC-A8FFA954-A95EA97D-A97FA9CEA9DA-A9DDA9E0-A9FFAA37-AA3FAA4EAA4FAA5AAA5BAA7C-AA7FAAC3-AADAAAF7-AB00AB07AB08AB0FAB10AB17-AB1FAB27AB2F-ABBFABEEABEFABFA-ABFFD7A4-D7AFD7C7-D7CAD7FC-F8FFFA6EFA6FFADA-FAFFFB07-FB12FB18-FB1CFB37FB3DFB3FFB42FB45FBC2-FBD2FD40-FD4FFD90FD91FDC8-FDEFFDFEFDFFFE1A-FE1FFE27-FE2FFE53FE67FE6C-FE6FFE75FEFD-FF00FFBF-FFC1FFC8FFC9FFD0FFD1FFD8FFD9FFDD-FFDFFFE7FFEF-FFFBFFFEFFFF",Cc:"0000-001F007F-009F",Cf:"00AD0600-060406DD070F200B-200F202A-202E2060-2064206A-206FFEFFFFF9-FFFB",Co:"E000-F8FF",Cs:"D800-DFFF",Cn:"03780379037F-0383038B038D03A20528-05300557055805600588058B-058E059005C8-05CF05EB-05EF05F5-05FF0605061C061D070E074B074C07B2-07BF07FB-07FF082E082F083F085C085D085F-089F08A108AD-08E308FF097809800984098D098E0991099209A909B109B3-09B509BA09BB09C509C609C909CA09CF-09D609D8-09DB09DE09E409E509FC-0A000A040A0B-0A0E0A110A120A290A310A340A370A3A0A3B0A3D0A43-0A460A490A4A0A4E-0A500A52-0A580A5D0A5F-0A650A76-0A800A840A8E0A920AA90AB10AB40ABA0ABB0AC60ACA0ACE0ACF0AD1-0ADF0AE40AE50AF2-0B000B040B0D0B0E0B110B120B290B310B340B3A0B3B0B450B460B490B4A0B4E-0B550B58-0B5B0B5E0B640B650B78-0B810B840B8B-0B8D0B910B96-0B980B9B0B9D0BA0-0BA20BA5-0BA70BAB-0BAD0BBA-0BBD0BC3-0BC50BC90BCE0BCF0BD1-0BD60BD8-0BE50BFB-0C000C040C0D0C110C290C340C3A-0C3C0C450C490C4E-0C540C570C5A-0C5F0C640C650C70-0C770C800C810C840C8D0C910CA90CB40CBA0CBB0CC50CC90CCE-0CD40CD7-0CDD0CDF0CE40CE50CF00CF3-0D010D040D0D0D110D3B0D3C0D450D490D4F-0D560D58-0D5F0D640D650D76-0D780D800D810D840D97-0D990DB20DBC0DBE0DBF0DC7-0DC90DCB-0DCE0DD50DD70DE0-0DF10DF5-0E000E3B-0E3E0E5C-0E800E830E850E860E890E8B0E8C0E8E-0E930E980EA00EA40EA60EA80EA90EAC0EBA0EBE0EBF0EC50EC70ECE0ECF0EDA0EDB0EE0-0EFF0F480F6D-0F700F980FBD0FCD0FDB-0FFF10C610C8-10CC10CE10CF1249124E124F12571259125E125F1289128E128F12B112B612B712BF12C112C612C712D7131113161317135B135C137D-137F139A-139F13F5-13FF169D-169F16F1-16FF170D1715-171F1737-173F1754-175F176D17711774-177F17DE17DF17EA-17EF17FA-17FF180F181A-181F1878-187F18AB-18AF18F6-18FF191D-191F192C-192F193C-193F1941-1943196E196F1975-197F19AC-19AF19CA-19CF19DB-19DD1A1C1A1D1A5F1A7D1A7E1A8A-1A8F1A9A-1A9F1AAE-1AFF1B4C-1B4F1B7D-1B7F1BF4-1BFB1C38-1C3A1C4A-1C4C1C80-1CBF1CC8-1CCF1CF7-1CFF1DE7-1DFB1F161F171F1E1F1F1F461F471F4E1F4F1F581F5A1F5C1F5E1F7E1F7F1FB51FC51FD41FD51FDC1FF01FF11FF51FFF2065-206920722073208F209D-209F20BA-20CF20F1-20FF218A-218F23F4-23FF2427-243F244B-245F27002B4D-2B4F2B5A-2BFF2C2F2C5F2CF4-2CF82D262D28-2D2C2D2E2D2F2D68-2D6E2D71-2D7E2D97-2D9F2DA72DAF2DB72DBF2DC72DCF2DD72DDF2E3C-2E7F2E9A2EF4-2EFF2FD6-2FEF2FFC-2FFF3040309730983100-3104312E-3130318F31BB-31BF31E4-31EF321F32FF4DB6-4DBF9FCD-9FFFA48D-A48FA4C7-A4CFA62C-A63FA698-A69EA6F8-A6FFA78FA794-A79FA7AB-A7F7A82C-A82FA83A-A83FA878-A87FA8C5-A8CDA8DA-A8DFA8FC-A8FFA954-A95EA97D-A97FA9CEA9DA-A9DDA9E0-A9FFAA37-AA3FAA4EAA4FAA5AAA5BAA7C-AA7FAAC3-AADAAAF7-AB00AB07AB08AB0FAB10AB17-AB1FAB27AB2F-ABBFABEEABEFABFA-ABFFD7A4-D7AFD7C7-D7CAD7FC-D7FFFA6EFA6FFADA-FAFFFB07-FB12FB18-FB1CFB37FB3DFB3FFB42FB45FBC2-FBD2FD40-FD4FFD90FD91FDC8-FDEFFDFEFDFFFE1A-FE1FFE27-FE2FFE53FE67FE6C-FE6FFE75FEFDFEFEFF00FFBF-FFC1FFC8FFC9FFD0FFD1FFD8FFD9FFDD-FFDFFFE7FFEF-FFF8FFFEFFFF"},{Ll:"Lowercase_Letter",Lu:"Uppercase_Letter",Lt:"Titlecase_Letter",Lm:"Modifier_Letter",Lo:"Other_Letter",M:"Mark",Mn:"Nonspacing_Mark",Mc:"Spacing_Mark",Me:"Enclosing_Mark",N:"Number",Nd:"Decimal_Number",Nl:"Letter_Number",No:"Other_Number",P:"Punctuation",Pd:"Dash_Punctuation",Ps:"Open_Punctuation",Pe:"Close_Punctuation",Pi:"Initial_Punctuation",Pf:"Final_Punctuation",Pc:"Connector_Punctuation",Po:"Other_Punctuation",S:"Symbol",Sm:"Math_Symbol",Sc:"Currency_Symbol",Sk:"Modifier_Symbol",So:"Other_Symbol",Z:"Separator",Zs:"Space_Separator",Zl:"Line_Separator",Zp:"Paragraph_Separator",C:"Other",Cc:"Control",Cf:"Format",Co:"Private_Use",Cs:"Surrogate",Cn:"Unassigned"})}(A),function(e){"use strict";if(!e.addUnicodePackage)throw new ReferenceError("Unicode Base must be loaded before Unicode Scripts");e.install("extensibility"),e.addUnicodePackage({Arabic:"0600-06040606-060B060D-061A061E0620-063F0641-064A0656-065E066A-066F0671-06DC06DE-06FF0750-077F08A008A2-08AC08E4-08FEFB50-FBC1FBD3-FD3DFD50-FD8FFD92-FDC7FDF0-FDFCFE70-FE74FE76-FEFC",Armenian:"0531-05560559-055F0561-0587058A058FFB13-FB17",Balinese:"1B00-1B4B1B50-1B7C",Bamum:"A6A0-A6F7",Batak:"1BC0-1BF31BFC-1BFF",Bengali:"0981-09830985-098C098F09900993-09A809AA-09B009B209B6-09B909BC-09C409C709C809CB-09CE09D709DC09DD09DF-09E309E6-09FB",Bopomofo:"02EA02EB3105-312D31A0-31BA",Braille:"2800-28FF",Buginese:"1A00-1A1B1A1E1A1F",Buhid:"1740-1753",Canadian_Aboriginal:"1400-167F18B0-18F5",Cham:"AA00-AA36AA40-AA4DAA50-AA59AA5C-AA5F",Cherokee:"13A0-13F4",Common:"0000-0040005B-0060007B-00A900AB-00B900BB-00BF00D700F702B9-02DF02E5-02E902EC-02FF0374037E038503870589060C061B061F06400660-066906DD096409650E3F0FD5-0FD810FB16EB-16ED173517361802180318051CD31CE11CE9-1CEC1CEE-1CF31CF51CF62000-200B200E-2064206A-20702074-207E2080-208E20A0-20B92100-21252127-2129212C-21312133-214D214F-215F21892190-23F32400-24262440-244A2460-26FF2701-27FF2900-2B4C2B50-2B592E00-2E3B2FF0-2FFB3000-300430063008-30203030-3037303C-303F309B309C30A030FB30FC3190-319F31C0-31E33220-325F327F-32CF3358-33FF4DC0-4DFFA700-A721A788-A78AA830-A839FD3EFD3FFDFDFE10-FE19FE30-FE52FE54-FE66FE68-FE6BFEFFFF01-FF20FF3B-FF40FF5B-FF65FF70FF9EFF9FFFE0-FFE6FFE8-FFEEFFF9-FFFD",Coptic:"03E2-03EF2C80-2CF32CF9-2CFF",Cyrillic:"0400-04840487-05271D2B1D782DE0-2DFFA640-A697A69F",Devanagari:"0900-09500953-09630966-09770979-097FA8E0-A8FB",Ethiopic:"1200-1248124A-124D1250-12561258125A-125D1260-1288128A-128D1290-12B012B2-12B512B8-12BE12C012C2-12C512C8-12D612D8-13101312-13151318-135A135D-137C1380-13992D80-2D962DA0-2DA62DA8-2DAE2DB0-2DB62DB8-2DBE2DC0-2DC62DC8-2DCE2DD0-2DD62DD8-2DDEAB01-AB06AB09-AB0EAB11-AB16AB20-AB26AB28-AB2E",Georgian:"10A0-10C510C710CD10D0-10FA10FC-10FF2D00-2D252D272D2D",Glagolitic:"2C00-2C2E2C30-2C5E",Greek:"0370-03730375-0377037A-037D038403860388-038A038C038E-03A103A3-03E103F0-03FF1D26-1D2A1D5D-1D611D66-1D6A1DBF1F00-1F151F18-1F1D1F20-1F451F48-1F4D1F50-1F571F591F5B1F5D1F5F-1F7D1F80-1FB41FB6-1FC41FC6-1FD31FD6-1FDB1FDD-1FEF1FF2-1FF41FF6-1FFE2126",Gujarati:"0A81-0A830A85-0A8D0A8F-0A910A93-0AA80AAA-0AB00AB20AB30AB5-0AB90ABC-0AC50AC7-0AC90ACB-0ACD0AD00AE0-0AE30AE6-0AF1",Gurmukhi:"0A01-0A030A05-0A0A0A0F0A100A13-0A280A2A-0A300A320A330A350A360A380A390A3C0A3E-0A420A470A480A4B-0A4D0A510A59-0A5C0A5E0A66-0A75",Han:"2E80-2E992E9B-2EF32F00-2FD5300530073021-30293038-303B3400-4DB54E00-9FCCF900-FA6DFA70-FAD9",Hangul:"1100-11FF302E302F3131-318E3200-321E3260-327EA960-A97CAC00-D7A3D7B0-D7C6D7CB-D7FBFFA0-FFBEFFC2-FFC7FFCA-FFCFFFD2-FFD7FFDA-FFDC",Hanunoo:"1720-1734",Hebrew:"0591-05C705D0-05EA05F0-05F4FB1D-FB36FB38-FB3CFB3EFB40FB41FB43FB44FB46-FB4F",Hiragana:"3041-3096309D-309F",Inherited:"0300-036F04850486064B-0655065F0670095109521CD0-1CD21CD4-1CE01CE2-1CE81CED1CF41DC0-1DE61DFC-1DFF200C200D20D0-20F0302A-302D3099309AFE00-FE0FFE20-FE26",Javanese:"A980-A9CDA9CF-A9D9A9DEA9DF",Kannada:"0C820C830C85-0C8C0C8E-0C900C92-0CA80CAA-0CB30CB5-0CB90CBC-0CC40CC6-0CC80CCA-0CCD0CD50CD60CDE0CE0-0CE30CE6-0CEF0CF10CF2",Katakana:"30A1-30FA30FD-30FF31F0-31FF32D0-32FE3300-3357FF66-FF6FFF71-FF9D",Kayah_Li:"A900-A92F",Khmer:"1780-17DD17E0-17E917F0-17F919E0-19FF",Lao:"0E810E820E840E870E880E8A0E8D0E94-0E970E99-0E9F0EA1-0EA30EA50EA70EAA0EAB0EAD-0EB90EBB-0EBD0EC0-0EC40EC60EC8-0ECD0ED0-0ED90EDC-0EDF",Latin:"0041-005A0061-007A00AA00BA00C0-00D600D8-00F600F8-02B802E0-02E41D00-1D251D2C-1D5C1D62-1D651D6B-1D771D79-1DBE1E00-1EFF2071207F2090-209C212A212B2132214E2160-21882C60-2C7FA722-A787A78B-A78EA790-A793A7A0-A7AAA7F8-A7FFFB00-FB06FF21-FF3AFF41-FF5A",Lepcha:"1C00-1C371C3B-1C491C4D-1C4F",Limbu:"1900-191C1920-192B1930-193B19401944-194F",Lisu:"A4D0-A4FF",Malayalam:"0D020D030D05-0D0C0D0E-0D100D12-0D3A0D3D-0D440D46-0D480D4A-0D4E0D570D60-0D630D66-0D750D79-0D7F",Mandaic:"0840-085B085E",Meetei_Mayek:"AAE0-AAF6ABC0-ABEDABF0-ABF9",Mongolian:"1800180118041806-180E1810-18191820-18771880-18AA",Myanmar:"1000-109FAA60-AA7B",New_Tai_Lue:"1980-19AB19B0-19C919D0-19DA19DE19DF",Nko:"07C0-07FA",Ogham:"1680-169C",Ol_Chiki:"1C50-1C7F",Oriya:"0B01-0B030B05-0B0C0B0F0B100B13-0B280B2A-0B300B320B330B35-0B390B3C-0B440B470B480B4B-0B4D0B560B570B5C0B5D0B5F-0B630B66-0B77",Phags_Pa:"A840-A877",Rejang:"A930-A953A95F",Runic:"16A0-16EA16EE-16F0",Samaritan:"0800-082D0830-083E",Saurashtra:"A880-A8C4A8CE-A8D9",Sinhala:"0D820D830D85-0D960D9A-0DB10DB3-0DBB0DBD0DC0-0DC60DCA0DCF-0DD40DD60DD8-0DDF0DF2-0DF4",Sundanese:"1B80-1BBF1CC0-1CC7",Syloti_Nagri:"A800-A82B",Syriac:"0700-070D070F-074A074D-074F",Tagalog:"1700-170C170E-1714",Tagbanwa:"1760-176C176E-177017721773",Tai_Le:"1950-196D1970-1974",Tai_Tham:"1A20-1A5E1A60-1A7C1A7F-1A891A90-1A991AA0-1AAD",Tai_Viet:"AA80-AAC2AADB-AADF",Tamil:"0B820B830B85-0B8A0B8E-0B900B92-0B950B990B9A0B9C0B9E0B9F0BA30BA40BA8-0BAA0BAE-0BB90BBE-0BC20BC6-0BC80BCA-0BCD0BD00BD70BE6-0BFA",Telugu:"0C01-0C030C05-0C0C0C0E-0C100C12-0C280C2A-0C330C35-0C390C3D-0C440C46-0C480C4A-0C4D0C550C560C580C590C60-0C630C66-0C6F0C78-0C7F",Thaana:"0780-07B1",Thai:"0E01-0E3A0E40-0E5B",Tibetan:"0F00-0F470F49-0F6C0F71-0F970F99-0FBC0FBE-0FCC0FCE-0FD40FD90FDA",Tifinagh:"2D30-2D672D6F2D702D7F",Vai:"A500-A62B",Yi:"A000-A48CA490-A4C6"})}(A),function(e){"use strict";if(!e.addUnicodePackage)throw new ReferenceError("Unicode Base must be loaded before Unicode Blocks");e.install("extensibility"),e.addUnicodePackage({InBasic_Latin:"0000-007F",InLatin_1_Supplement:"0080-00FF",InLatin_Extended_A:"0100-017F",InLatin_Extended_B:"0180-024F",InIPA_Extensions:"0250-02AF",InSpacing_Modifier_Letters:"02B0-02FF",InCombining_Diacritical_Marks:"0300-036F",InGreek_and_Coptic:"0370-03FF",InCyrillic:"0400-04FF",InCyrillic_Supplement:"0500-052F",InArmenian:"0530-058F",InHebrew:"0590-05FF",InArabic:"0600-06FF",InSyriac:"0700-074F",InArabic_Supplement:"0750-077F",InThaana:"0780-07BF",InNKo:"07C0-07FF",InSamaritan:"0800-083F",InMandaic:"0840-085F",InArabic_Extended_A:"08A0-08FF",InDevanagari:"0900-097F",InBengali:"0980-09FF",InGurmukhi:"0A00-0A7F",InGujarati:"0A80-0AFF",InOriya:"0B00-0B7F",InTamil:"0B80-0BFF",InTelugu:"0C00-0C7F",InKannada:"0C80-0CFF",InMalayalam:"0D00-0D7F",InSinhala:"0D80-0DFF",InThai:"0E00-0E7F",InLao:"0E80-0EFF",InTibetan:"0F00-0FFF",InMyanmar:"1000-109F",InGeorgian:"10A0-10FF",InHangul_Jamo:"1100-11FF",InEthiopic:"1200-137F",InEthiopic_Supplement:"1380-139F",InCherokee:"13A0-13FF",InUnified_Canadian_Aboriginal_Syllabics:"1400-167F",InOgham:"1680-169F",InRunic:"16A0-16FF",InTagalog:"1700-171F",InHanunoo:"1720-173F",InBuhid:"1740-175F",InTagbanwa:"1760-177F",InKhmer:"1780-17FF",InMongolian:"1800-18AF",InUnified_Canadian_Aboriginal_Syllabics_Extended:"18B0-18FF",InLimbu:"1900-194F",InTai_Le:"1950-197F",InNew_Tai_Lue:"1980-19DF",InKhmer_Symbols:"19E0-19FF",InBuginese:"1A00-1A1F",InTai_Tham:"1A20-1AAF",InBalinese:"1B00-1B7F",InSundanese:"1B80-1BBF",InBatak:"1BC0-1BFF",InLepcha:"1C00-1C4F",InOl_Chiki:"1C50-1C7F",InSundanese_Supplement:"1CC0-1CCF",InVedic_Extensions:"1CD0-1CFF",InPhonetic_Extensions:"1D00-1D7F",InPhonetic_Extensions_Supplement:"1D80-1DBF",InCombining_Diacritical_Marks_Supplement:"1DC0-1DFF",InLatin_Extended_Additional:"1E00-1EFF",InGreek_Extended:"1F00-1FFF",InGeneral_Punctuation:"2000-206F",InSuperscripts_and_Subscripts:"2070-209F",InCurrency_Symbols:"20A0-20CF",InCombining_Diacritical_Marks_for_Symbols:"20D0-20FF",InLetterlike_Symbols:"2100-214F",InNumber_Forms:"2150-218F",InArrows:"2190-21FF",InMathematical_Operators:"2200-22FF",InMiscellaneous_Technical:"2300-23FF",InControl_Pictures:"2400-243F",InOptical_Character_Recognition:"2440-245F",InEnclosed_Alphanumerics:"2460-24FF",InBox_Drawing:"2500-257F",InBlock_Elements:"2580-259F",InGeometric_Shapes:"25A0-25FF",InMiscellaneous_Symbols:"2600-26FF",InDingbats:"2700-27BF",InMiscellaneous_Mathematical_Symbols_A:"27C0-27EF",InSupplemental_Arrows_A:"27F0-27FF",InBraille_Patterns:"2800-28FF",InSupplemental_Arrows_B:"2900-297F",InMiscellaneous_Mathematical_Symbols_B:"2980-29FF",InSupplemental_Mathematical_Operators:"2A00-2AFF",InMiscellaneous_Symbols_and_Arrows:"2B00-2BFF",InGlagolitic:"2C00-2C5F",InLatin_Extended_C:"2C60-2C7F",InCoptic:"2C80-2CFF",InGeorgian_Supplement:"2D00-2D2F",InTifinagh:"2D30-2D7F",InEthiopic_Extended:"2D80-2DDF",InCyrillic_Extended_A:"2DE0-2DFF",InSupplemental_Punctuation:"2E00-2E7F",InCJK_Radicals_Supplement:"2E80-2EFF",InKangxi_Radicals:"2F00-2FDF",InIdeographic_Description_Characters:"2FF0-2FFF",InCJK_Symbols_and_Punctuation:"3000-303F",InHiragana:"3040-309F",InKatakana:"30A0-30FF",InBopomofo:"3100-312F",InHangul_Compatibility_Jamo:"3130-318F",InKanbun:"3190-319F",InBopomofo_Extended:"31A0-31BF",InCJK_Strokes:"31C0-31EF",InKatakana_Phonetic_Extensions:"31F0-31FF",InEnclosed_CJK_Letters_and_Months:"3200-32FF",InCJK_Compatibility:"3300-33FF",InCJK_Unified_Ideographs_Extension_A:"3400-4DBF",InYijing_Hexagram_Symbols:"4DC0-4DFF",InCJK_Unified_Ideographs:"4E00-9FFF",InYi_Syllables:"A000-A48F",InYi_Radicals:"A490-A4CF",InLisu:"A4D0-A4FF",InVai:"A500-A63F",InCyrillic_Extended_B:"A640-A69F",InBamum:"A6A0-A6FF",InModifier_Tone_Letters:"A700-A71F",InLatin_Extended_D:"A720-A7FF",InSyloti_Nagri:"A800-A82F",InCommon_Indic_Number_Forms:"A830-A83F",InPhags_pa:"A840-A87F",InSaurashtra:"A880-A8DF",InDevanagari_Extended:"A8E0-A8FF",InKayah_Li:"A900-A92F",InRejang:"A930-A95F",InHangul_Jamo_Extended_A:"A960-A97F",InJavanese:"A980-A9DF",InCham:"AA00-AA5F",InMyanmar_Extended_A:"AA60-AA7F",InTai_Viet:"AA80-AADF",InMeetei_Mayek_Extensions:"AAE0-AAFF",InEthiopic_Extended_A:"AB00-AB2F",InMeetei_Mayek:"ABC0-ABFF",InHangul_Syllables:"AC00-D7AF",InHangul_Jamo_Extended_B:"D7B0-D7FF",InHigh_Surrogates:"D800-DB7F",InHigh_Private_Use_Surrogates:"DB80-DBFF",InLow_Surrogates:"DC00-DFFF",InPrivate_Use_Area:"E000-F8FF",InCJK_Compatibility_Ideographs:"F900-FAFF",InAlphabetic_Presentation_Forms:"FB00-FB4F",InArabic_Presentation_Forms_A:"FB50-FDFF",InVariation_Selectors:"FE00-FE0F",InVertical_Forms:"FE10-FE1F",InCombining_Half_Marks:"FE20-FE2F",InCJK_Compatibility_Forms:"FE30-FE4F",InSmall_Form_Variants:"FE50-FE6F",InArabic_Presentation_Forms_B:"FE70-FEFF",InHalfwidth_and_Fullwidth_Forms:"FF00-FFEF",InSpecials:"FFF0-FFFF"})}(A),function(e){"use strict";if(!e.addUnicodePackage)throw new ReferenceError("Unicode Base must be loaded before Unicode Properties");e.install("extensibility"),e.addUnicodePackage({Alphabetic:"0041-005A0061-007A00AA00B500BA00C0-00D600D8-00F600F8-02C102C6-02D102E0-02E402EC02EE03450370-037403760377037A-037D03860388-038A038C038E-03A103A3-03F503F7-0481048A-05270531-055605590561-058705B0-05BD05BF05C105C205C405C505C705D0-05EA05F0-05F20610-061A0620-06570659-065F066E-06D306D5-06DC06E1-06E806ED-06EF06FA-06FC06FF0710-073F074D-07B107CA-07EA07F407F507FA0800-0817081A-082C0840-085808A008A2-08AC08E4-08E908F0-08FE0900-093B093D-094C094E-09500955-09630971-09770979-097F0981-09830985-098C098F09900993-09A809AA-09B009B209B6-09B909BD-09C409C709C809CB09CC09CE09D709DC09DD09DF-09E309F009F10A01-0A030A05-0A0A0A0F0A100A13-0A280A2A-0A300A320A330A350A360A380A390A3E-0A420A470A480A4B0A4C0A510A59-0A5C0A5E0A70-0A750A81-0A830A85-0A8D0A8F-0A910A93-0AA80AAA-0AB00AB20AB30AB5-0AB90ABD-0AC50AC7-0AC90ACB0ACC0AD00AE0-0AE30B01-0B030B05-0B0C0B0F0B100B13-0B280B2A-0B300B320B330B35-0B390B3D-0B440B470B480B4B0B4C0B560B570B5C0B5D0B5F-0B630B710B820B830B85-0B8A0B8E-0B900B92-0B950B990B9A0B9C0B9E0B9F0BA30BA40BA8-0BAA0BAE-0BB90BBE-0BC20BC6-0BC80BCA-0BCC0BD00BD70C01-0C030C05-0C0C0C0E-0C100C12-0C280C2A-0C330C35-0C390C3D-0C440C46-0C480C4A-0C4C0C550C560C580C590C60-0C630C820C830C85-0C8C0C8E-0C900C92-0CA80CAA-0CB30CB5-0CB90CBD-0CC40CC6-0CC80CCA-0CCC0CD50CD60CDE0CE0-0CE30CF10CF20D020D030D05-0D0C0D0E-0D100D12-0D3A0D3D-0D440D46-0D480D4A-0D4C0D4E0D570D60-0D630D7A-0D7F0D820D830D85-0D960D9A-0DB10DB3-0DBB0DBD0DC0-0DC60DCF-0DD40DD60DD8-0DDF0DF20DF30E01-0E3A0E40-0E460E4D0E810E820E840E870E880E8A0E8D0E94-0E970E99-0E9F0EA1-0EA30EA50EA70EAA0EAB0EAD-0EB90EBB-0EBD0EC0-0EC40EC60ECD0EDC-0EDF0F000F40-0F470F49-0F6C0F71-0F810F88-0F970F99-0FBC1000-10361038103B-103F1050-10621065-1068106E-1086108E109C109D10A0-10C510C710CD10D0-10FA10FC-1248124A-124D1250-12561258125A-125D1260-1288128A-128D1290-12B012B2-12B512B8-12BE12C012C2-12C512C8-12D612D8-13101312-13151318-135A135F1380-138F13A0-13F41401-166C166F-167F1681-169A16A0-16EA16EE-16F01700-170C170E-17131720-17331740-17531760-176C176E-1770177217731780-17B317B6-17C817D717DC1820-18771880-18AA18B0-18F51900-191C1920-192B1930-19381950-196D1970-19741980-19AB19B0-19C91A00-1A1B1A20-1A5E1A61-1A741AA71B00-1B331B35-1B431B45-1B4B1B80-1BA91BAC-1BAF1BBA-1BE51BE7-1BF11C00-1C351C4D-1C4F1C5A-1C7D1CE9-1CEC1CEE-1CF31CF51CF61D00-1DBF1E00-1F151F18-1F1D1F20-1F451F48-1F4D1F50-1F571F591F5B1F5D1F5F-1F7D1F80-1FB41FB6-1FBC1FBE1FC2-1FC41FC6-1FCC1FD0-1FD31FD6-1FDB1FE0-1FEC1FF2-1FF41FF6-1FFC2071207F2090-209C21022107210A-211321152119-211D212421262128212A-212D212F-2139213C-213F2145-2149214E2160-218824B6-24E92C00-2C2E2C30-2C5E2C60-2CE42CEB-2CEE2CF22CF32D00-2D252D272D2D2D30-2D672D6F2D80-2D962DA0-2DA62DA8-2DAE2DB0-2DB62DB8-2DBE2DC0-2DC62DC8-2DCE2DD0-2DD62DD8-2DDE2DE0-2DFF2E2F3005-30073021-30293031-30353038-303C3041-3096309D-309F30A1-30FA30FC-30FF3105-312D3131-318E31A0-31BA31F0-31FF3400-4DB54E00-9FCCA000-A48CA4D0-A4FDA500-A60CA610-A61FA62AA62BA640-A66EA674-A67BA67F-A697A69F-A6EFA717-A71FA722-A788A78B-A78EA790-A793A7A0-A7AAA7F8-A801A803-A805A807-A80AA80C-A827A840-A873A880-A8C3A8F2-A8F7A8FBA90A-A92AA930-A952A960-A97CA980-A9B2A9B4-A9BFA9CFAA00-AA36AA40-AA4DAA60-AA76AA7AAA80-AABEAAC0AAC2AADB-AADDAAE0-AAEFAAF2-AAF5AB01-AB06AB09-AB0EAB11-AB16AB20-AB26AB28-AB2EABC0-ABEAAC00-D7A3D7B0-D7C6D7CB-D7FBF900-FA6DFA70-FAD9FB00-FB06FB13-FB17FB1D-FB28FB2A-FB36FB38-FB3CFB3EFB40FB41FB43FB44FB46-FBB1FBD3-FD3DFD50-FD8FFD92-FDC7FDF0-FDFBFE70-FE74FE76-FEFCFF21-FF3AFF41-FF5AFF66-FFBEFFC2-FFC7FFCA-FFCFFFD2-FFD7FFDA-FFDC",Uppercase:"0041-005A00C0-00D600D8-00DE01000102010401060108010A010C010E01100112011401160118011A011C011E01200122012401260128012A012C012E01300132013401360139013B013D013F0141014301450147014A014C014E01500152015401560158015A015C015E01600162016401660168016A016C016E017001720174017601780179017B017D018101820184018601870189-018B018E-0191019301940196-0198019C019D019F01A001A201A401A601A701A901AC01AE01AF01B1-01B301B501B701B801BC01C401C701CA01CD01CF01D101D301D501D701D901DB01DE01E001E201E401E601E801EA01EC01EE01F101F401F6-01F801FA01FC01FE02000202020402060208020A020C020E02100212021402160218021A021C021E02200222022402260228022A022C022E02300232023A023B023D023E02410243-02460248024A024C024E03700372037603860388-038A038C038E038F0391-03A103A3-03AB03CF03D2-03D403D803DA03DC03DE03E003E203E403E603E803EA03EC03EE03F403F703F903FA03FD-042F04600462046404660468046A046C046E04700472047404760478047A047C047E0480048A048C048E04900492049404960498049A049C049E04A004A204A404A604A804AA04AC04AE04B004B204B404B604B804BA04BC04BE04C004C104C304C504C704C904CB04CD04D004D204D404D604D804DA04DC04DE04E004E204E404E604E804EA04EC04EE04F004F204F404F604F804FA04FC04FE05000502050405060508050A050C050E05100512051405160518051A051C051E05200522052405260531-055610A0-10C510C710CD1E001E021E041E061E081E0A1E0C1E0E1E101E121E141E161E181E1A1E1C1E1E1E201E221E241E261E281E2A1E2C1E2E1E301E321E341E361E381E3A1E3C1E3E1E401E421E441E461E481E4A1E4C1E4E1E501E521E541E561E581E5A1E5C1E5E1E601E621E641E661E681E6A1E6C1E6E1E701E721E741E761E781E7A1E7C1E7E1E801E821E841E861E881E8A1E8C1E8E1E901E921E941E9E1EA01EA21EA41EA61EA81EAA1EAC1EAE1EB01EB21EB41EB61EB81EBA1EBC1EBE1EC01EC21EC41EC61EC81ECA1ECC1ECE1ED01ED21ED41ED61ED81EDA1EDC1EDE1EE01EE21EE41EE61EE81EEA1EEC1EEE1EF01EF21EF41EF61EF81EFA1EFC1EFE1F08-1F0F1F18-1F1D1F28-1F2F1F38-1F3F1F48-1F4D1F591F5B1F5D1F5F1F68-1F6F1FB8-1FBB1FC8-1FCB1FD8-1FDB1FE8-1FEC1FF8-1FFB21022107210B-210D2110-211221152119-211D212421262128212A-212D2130-2133213E213F21452160-216F218324B6-24CF2C00-2C2E2C602C62-2C642C672C692C6B2C6D-2C702C722C752C7E-2C802C822C842C862C882C8A2C8C2C8E2C902C922C942C962C982C9A2C9C2C9E2CA02CA22CA42CA62CA82CAA2CAC2CAE2CB02CB22CB42CB62CB82CBA2CBC2CBE2CC02CC22CC42CC62CC82CCA2CCC2CCE2CD02CD22CD42CD62CD82CDA2CDC2CDE2CE02CE22CEB2CED2CF2A640A642A644A646A648A64AA64CA64EA650A652A654A656A658A65AA65CA65EA660A662A664A666A668A66AA66CA680A682A684A686A688A68AA68CA68EA690A692A694A696A722A724A726A728A72AA72CA72EA732A734A736A738A73AA73CA73EA740A742A744A746A748A74AA74CA74EA750A752A754A756A758A75AA75CA75EA760A762A764A766A768A76AA76CA76EA779A77BA77DA77EA780A782A784A786A78BA78DA790A792A7A0A7A2A7A4A7A6A7A8A7AAFF21-FF3A",
 Lowercase:"0061-007A00AA00B500BA00DF-00F600F8-00FF01010103010501070109010B010D010F01110113011501170119011B011D011F01210123012501270129012B012D012F01310133013501370138013A013C013E014001420144014601480149014B014D014F01510153015501570159015B015D015F01610163016501670169016B016D016F0171017301750177017A017C017E-0180018301850188018C018D019201950199-019B019E01A101A301A501A801AA01AB01AD01B001B401B601B901BA01BD-01BF01C601C901CC01CE01D001D201D401D601D801DA01DC01DD01DF01E101E301E501E701E901EB01ED01EF01F001F301F501F901FB01FD01FF02010203020502070209020B020D020F02110213021502170219021B021D021F02210223022502270229022B022D022F02310233-0239023C023F0240024202470249024B024D024F-02930295-02B802C002C102E0-02E40345037103730377037A-037D039003AC-03CE03D003D103D5-03D703D903DB03DD03DF03E103E303E503E703E903EB03ED03EF-03F303F503F803FB03FC0430-045F04610463046504670469046B046D046F04710473047504770479047B047D047F0481048B048D048F04910493049504970499049B049D049F04A104A304A504A704A904AB04AD04AF04B104B304B504B704B904BB04BD04BF04C204C404C604C804CA04CC04CE04CF04D104D304D504D704D904DB04DD04DF04E104E304E504E704E904EB04ED04EF04F104F304F504F704F904FB04FD04FF05010503050505070509050B050D050F05110513051505170519051B051D051F05210523052505270561-05871D00-1DBF1E011E031E051E071E091E0B1E0D1E0F1E111E131E151E171E191E1B1E1D1E1F1E211E231E251E271E291E2B1E2D1E2F1E311E331E351E371E391E3B1E3D1E3F1E411E431E451E471E491E4B1E4D1E4F1E511E531E551E571E591E5B1E5D1E5F1E611E631E651E671E691E6B1E6D1E6F1E711E731E751E771E791E7B1E7D1E7F1E811E831E851E871E891E8B1E8D1E8F1E911E931E95-1E9D1E9F1EA11EA31EA51EA71EA91EAB1EAD1EAF1EB11EB31EB51EB71EB91EBB1EBD1EBF1EC11EC31EC51EC71EC91ECB1ECD1ECF1ED11ED31ED51ED71ED91EDB1EDD1EDF1EE11EE31EE51EE71EE91EEB1EED1EEF1EF11EF31EF51EF71EF91EFB1EFD1EFF-1F071F10-1F151F20-1F271F30-1F371F40-1F451F50-1F571F60-1F671F70-1F7D1F80-1F871F90-1F971FA0-1FA71FB0-1FB41FB61FB71FBE1FC2-1FC41FC61FC71FD0-1FD31FD61FD71FE0-1FE71FF2-1FF41FF61FF72071207F2090-209C210A210E210F2113212F21342139213C213D2146-2149214E2170-217F218424D0-24E92C30-2C5E2C612C652C662C682C6A2C6C2C712C732C742C76-2C7D2C812C832C852C872C892C8B2C8D2C8F2C912C932C952C972C992C9B2C9D2C9F2CA12CA32CA52CA72CA92CAB2CAD2CAF2CB12CB32CB52CB72CB92CBB2CBD2CBF2CC12CC32CC52CC72CC92CCB2CCD2CCF2CD12CD32CD52CD72CD92CDB2CDD2CDF2CE12CE32CE42CEC2CEE2CF32D00-2D252D272D2DA641A643A645A647A649A64BA64DA64FA651A653A655A657A659A65BA65DA65FA661A663A665A667A669A66BA66DA681A683A685A687A689A68BA68DA68FA691A693A695A697A723A725A727A729A72BA72DA72F-A731A733A735A737A739A73BA73DA73FA741A743A745A747A749A74BA74DA74FA751A753A755A757A759A75BA75DA75FA761A763A765A767A769A76BA76DA76F-A778A77AA77CA77FA781A783A785A787A78CA78EA791A793A7A1A7A3A7A5A7A7A7A9A7F8-A7FAFB00-FB06FB13-FB17FF41-FF5A",White_Space:"0009-000D0020008500A01680180E2000-200A20282029202F205F3000",Noncharacter_Code_Point:"FDD0-FDEFFFFEFFFF",Default_Ignorable_Code_Point:"00AD034F115F116017B417B5180B-180D200B-200F202A-202E2060-206F3164FE00-FE0FFEFFFFA0FFF0-FFF8",Any:"0000-FFFF",Ascii:"0000-007F",Assigned:"0000-0377037A-037E0384-038A038C038E-03A103A3-05270531-05560559-055F0561-05870589058A058F0591-05C705D0-05EA05F0-05F40600-06040606-061B061E-070D070F-074A074D-07B107C0-07FA0800-082D0830-083E0840-085B085E08A008A2-08AC08E4-08FE0900-09770979-097F0981-09830985-098C098F09900993-09A809AA-09B009B209B6-09B909BC-09C409C709C809CB-09CE09D709DC09DD09DF-09E309E6-09FB0A01-0A030A05-0A0A0A0F0A100A13-0A280A2A-0A300A320A330A350A360A380A390A3C0A3E-0A420A470A480A4B-0A4D0A510A59-0A5C0A5E0A66-0A750A81-0A830A85-0A8D0A8F-0A910A93-0AA80AAA-0AB00AB20AB30AB5-0AB90ABC-0AC50AC7-0AC90ACB-0ACD0AD00AE0-0AE30AE6-0AF10B01-0B030B05-0B0C0B0F0B100B13-0B280B2A-0B300B320B330B35-0B390B3C-0B440B470B480B4B-0B4D0B560B570B5C0B5D0B5F-0B630B66-0B770B820B830B85-0B8A0B8E-0B900B92-0B950B990B9A0B9C0B9E0B9F0BA30BA40BA8-0BAA0BAE-0BB90BBE-0BC20BC6-0BC80BCA-0BCD0BD00BD70BE6-0BFA0C01-0C030C05-0C0C0C0E-0C100C12-0C280C2A-0C330C35-0C390C3D-0C440C46-0C480C4A-0C4D0C550C560C580C590C60-0C630C66-0C6F0C78-0C7F0C820C830C85-0C8C0C8E-0C900C92-0CA80CAA-0CB30CB5-0CB90CBC-0CC40CC6-0CC80CCA-0CCD0CD50CD60CDE0CE0-0CE30CE6-0CEF0CF10CF20D020D030D05-0D0C0D0E-0D100D12-0D3A0D3D-0D440D46-0D480D4A-0D4E0D570D60-0D630D66-0D750D79-0D7F0D820D830D85-0D960D9A-0DB10DB3-0DBB0DBD0DC0-0DC60DCA0DCF-0DD40DD60DD8-0DDF0DF2-0DF40E01-0E3A0E3F-0E5B0E810E820E840E870E880E8A0E8D0E94-0E970E99-0E9F0EA1-0EA30EA50EA70EAA0EAB0EAD-0EB90EBB-0EBD0EC0-0EC40EC60EC8-0ECD0ED0-0ED90EDC-0EDF0F00-0F470F49-0F6C0F71-0F970F99-0FBC0FBE-0FCC0FCE-0FDA1000-10C510C710CD10D0-1248124A-124D1250-12561258125A-125D1260-1288128A-128D1290-12B012B2-12B512B8-12BE12C012C2-12C512C8-12D612D8-13101312-13151318-135A135D-137C1380-139913A0-13F41400-169C16A0-16F01700-170C170E-17141720-17361740-17531760-176C176E-1770177217731780-17DD17E0-17E917F0-17F91800-180E1810-18191820-18771880-18AA18B0-18F51900-191C1920-192B1930-193B19401944-196D1970-19741980-19AB19B0-19C919D0-19DA19DE-1A1B1A1E-1A5E1A60-1A7C1A7F-1A891A90-1A991AA0-1AAD1B00-1B4B1B50-1B7C1B80-1BF31BFC-1C371C3B-1C491C4D-1C7F1CC0-1CC71CD0-1CF61D00-1DE61DFC-1F151F18-1F1D1F20-1F451F48-1F4D1F50-1F571F591F5B1F5D1F5F-1F7D1F80-1FB41FB6-1FC41FC6-1FD31FD6-1FDB1FDD-1FEF1FF2-1FF41FF6-1FFE2000-2064206A-20712074-208E2090-209C20A0-20B920D0-20F02100-21892190-23F32400-24262440-244A2460-26FF2701-2B4C2B50-2B592C00-2C2E2C30-2C5E2C60-2CF32CF9-2D252D272D2D2D30-2D672D6F2D702D7F-2D962DA0-2DA62DA8-2DAE2DB0-2DB62DB8-2DBE2DC0-2DC62DC8-2DCE2DD0-2DD62DD8-2DDE2DE0-2E3B2E80-2E992E9B-2EF32F00-2FD52FF0-2FFB3000-303F3041-30963099-30FF3105-312D3131-318E3190-31BA31C0-31E331F0-321E3220-32FE3300-4DB54DC0-9FCCA000-A48CA490-A4C6A4D0-A62BA640-A697A69F-A6F7A700-A78EA790-A793A7A0-A7AAA7F8-A82BA830-A839A840-A877A880-A8C4A8CE-A8D9A8E0-A8FBA900-A953A95F-A97CA980-A9CDA9CF-A9D9A9DEA9DFAA00-AA36AA40-AA4DAA50-AA59AA5C-AA7BAA80-AAC2AADB-AAF6AB01-AB06AB09-AB0EAB11-AB16AB20-AB26AB28-AB2EABC0-ABEDABF0-ABF9AC00-D7A3D7B0-D7C6D7CB-D7FBD800-FA6DFA70-FAD9FB00-FB06FB13-FB17FB1D-FB36FB38-FB3CFB3EFB40FB41FB43FB44FB46-FBC1FBD3-FD3FFD50-FD8FFD92-FDC7FDF0-FDFDFE00-FE19FE20-FE26FE30-FE52FE54-FE66FE68-FE6BFE70-FE74FE76-FEFCFEFFFF01-FFBEFFC2-FFC7FFCA-FFCFFFD2-FFD7FFDA-FFDCFFE0-FFE6FFE8-FFEEFFF9-FFFD"})}(A),function(e){"use strict";function t(e,t,F,A){return{value:e,name:t,start:F,end:A}}e.matchRecursive=function(F,A,n,r,i){r=r||"",i=i||{};var E,o,a,C,s,B=r.indexOf("g")>-1,D=r.indexOf("y")>-1,l=r.replace(/y/g,""),c=i.escapeChar,u=i.valueNames,h=[],f=0,p=0,d=0,g=0;if(A=e(A,l),n=e(n,l),c){if(c.length>1)throw new SyntaxError("can't use more than one escape character");c=e.escape(c),s=new RegExp("(?:"+c+"[\\S\\s]|(?:(?!"+e.union([A,n]).source+")[^"+c+"])+)+",r.replace(/[^im]+/g,""))}for(;;){if(c&&(d+=(e.exec(F,s,d,"sticky")||[""])[0].length),a=e.exec(F,A,d),C=e.exec(F,n,d),a&&C&&(a.index<=C.index?C=null:a=null),a||C)p=(a||C).index,d=p+(a||C)[0].length;else if(!f)break;if(D&&!f&&p>g)break;if(a)f||(E=p,o=d),++f;else{if(!C||!f)throw new Error("string contains unbalanced delimiters");if(!--f&&(u?(u[0]&&E>g&&h.push(t(u[0],F.slice(g,E),g,E)),u[1]&&h.push(t(u[1],F.slice(E,o),E,o)),u[2]&&h.push(t(u[2],F.slice(o,p),o,p)),u[3]&&h.push(t(u[3],F.slice(p,d),p,d))):h.push(F.slice(o,p)),g=d,!B))break}p===d&&++d}return B&&!D&&u&&u[0]&&F.length>g&&h.push(t(u[0],F.slice(g),g,F.length)),h}}(A),function(e){"use strict";function t(e){var t=/^(?:\(\?:\))?\^/,F=/\$(?:\(\?:\))?$/;return F.test(e.replace(/\\[\s\S]/g,""))?e.replace(t,"").replace(F,""):e}function F(t){return e.isRegExp(t)?t.xregexp&&!t.xregexp.isNative?t:e(t.source):e(t)}var A=/(\()(?!\?)|\\([1-9]\d*)|\\[\s\S]|\[(?:[^\\\]]|\\[\s\S])*]/g,n=e.union([/\({{([\w$]+)}}\)|{{([\w$]+)}}/,A],"g");e.build=function(r,i,E){var o,a,C,s,B=/^\(\?([\w$]+)\)/.exec(r),D={},l=0,c=0,u=[0];B&&(E=E||"",B[1].replace(/./g,function(e){E+=E.indexOf(e)>-1?"":e}));for(s in i)i.hasOwnProperty(s)&&(C=F(i[s]),D[s]={pattern:t(C.source),names:C.xregexp.captureNames||[]});return r=F(r),a=r.xregexp.captureNames||[],r=r.source.replace(n,function(e,t,F,n,r){var i,E,C=t||F;if(C){if(!D.hasOwnProperty(C))throw new ReferenceError("undefined property "+e);return t?(i=a[c],u[++c]=++l,E="(?<"+(i||C)+">"):E="(?:",o=l,E+D[C].pattern.replace(A,function(e,t,F){if(t){if(i=D[C].names[l-o],++l,i)return"(?<"+i+">"}else if(F)return"\\"+(+F+o);return e})+")"}if(n){if(i=a[c],u[++c]=++l,i)return"(?<"+i+">"}else if(r)return"\\"+u[+r];return e}),e(r,E)}}(A),function(e){"use strict";function t(e,t){for(var F in t)t.hasOwnProperty(F)&&(e[F]=t[F])}t(e.prototype,{apply:function(e,t){return this.test(t[0])},call:function(e,t){return this.test(t)},forEach:function(t,F,A){return e.forEach(t,this,F,A)},globalize:function(){return e.globalize(this)},xexec:function(t,F,A){return e.exec(t,this,F,A)},xtest:function(t,F,A){return e.test(t,this,F,A)}})}(A)},{}]},{},[10]);
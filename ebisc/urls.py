@@ -5,6 +5,8 @@ from django.contrib.auth.views import login, logout
 from django.conf.urls.static import static
 from django.utils.translation import ugettext as _
 
+from ebisc.instrumentation import metrics_view
+
 admin.site.site_header = _(u'EBiSC Administration')
 admin.site.site_title = _(u'EBiSC Administration')
 admin.site.index_title = ''
@@ -17,6 +19,9 @@ urlpatterns = [
     url(r'^login/$', login, {'template_name': 'auth/login.html'}, name='login'),
     url(r'^logout/$', logout, {'next_page': '/'}, name='logout'),
 
+    # Request metrics (Prometheus)
+    url(r'^metrics/$', metrics_view, name='metrics'),
+
     # Elastic proxy
     url(r'^es/', include('ebisc.elastic.urls', namespace='elastic')),
 